@@ -0,0 +1,69 @@
+"""Create pop_brief_cache table for shared keyword-level POP briefs.
+
+Stores merged POP 3-step responses keyed by (normalized keyword, location)
+so briefs can be reused across pages, blog posts and projects.
+
+Revision ID: 0036
+Revises: 0035
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = "0036"
+down_revision = "0035"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "pop_brief_cache",
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=False),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("cache_key", sa.String(64), nullable=False),
+        sa.Column("keyword", sa.Text(), nullable=False),
+        sa.Column("location_name", sa.String(100), nullable=False),
+        sa.Column(
+            "response_data",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'{}'::jsonb"),
+            nullable=False,
+        ),
+        sa.Column("pop_task_id", sa.String(255), nullable=True),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "hit_count", sa.Integer(), server_default=sa.text("0"), nullable=False
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_pop_brief_cache_cache_key", "pop_brief_cache", ["cache_key"], unique=True
+    )
+    op.create_index("ix_pop_brief_cache_keyword", "pop_brief_cache", ["keyword"])
+    op.create_index("ix_pop_brief_cache_expires_at", "pop_brief_cache", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_pop_brief_cache_expires_at", table_name="pop_brief_cache")
+    op.drop_index("ix_pop_brief_cache_keyword", table_name="pop_brief_cache")
+    op.drop_index("ix_pop_brief_cache_cache_key", table_name="pop_brief_cache")
+    op.drop_table("pop_brief_cache")
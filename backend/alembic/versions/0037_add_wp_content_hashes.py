@@ -0,0 +1,34 @@
+"""Add WordPress content hashes to page_contents.
+
+wp_imported_hash and wp_pushed_hash record the MD5 of the post body as
+imported from and last pushed to WordPress, so export can skip unchanged
+posts.
+
+Revision ID: 0037
+Revises: 0036
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers
+revision = "0037"
+down_revision = "0036"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "page_contents",
+        sa.Column("wp_imported_hash", sa.String(32), nullable=True),
+    )
+    op.add_column(
+        "page_contents",
+        sa.Column("wp_pushed_hash", sa.String(32), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("page_contents", "wp_pushed_hash")
+    op.drop_column("page_contents", "wp_imported_hash")
@@ -0,0 +1,179 @@
+"""Create reddit_project_counters maintained by triggers.
+
+Stores per-project post, comment and draft-comment counts for the Reddit
+dashboard. Statement-level triggers with transition tables on reddit_posts
+and reddit_comments apply each statement's net change in one UPDATE, so
+bulk upserts and cascaded deletes stay cheap and the counts stay
+transactionally consistent with the source tables.
+
+Decrements only UPDATE existing rows: during a project delete the counter
+row may already be gone, and re-inserting it would violate its FK.
+
+Revision ID: 0038
+Revises: 0037
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = "0038"
+down_revision = "0037"
+branch_labels = None
+depends_on = None
+
+
+POSTS_FUNCTION = """
+CREATE FUNCTION reddit_counters_on_posts() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO reddit_project_counters (project_id, post_count)
+        SELECT project_id, count(*) FROM new_rows GROUP BY project_id
+        ON CONFLICT (project_id) DO UPDATE
+            SET post_count = reddit_project_counters.post_count + EXCLUDED.post_count,
+                updated_at = now();
+    ELSE
+        UPDATE reddit_project_counters c
+        SET post_count = c.post_count - d.n, updated_at = now()
+        FROM (SELECT project_id, count(*) AS n FROM old_rows GROUP BY project_id) d
+        WHERE c.project_id = d.project_id;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+"""
+
+COMMENTS_FUNCTION = """
+CREATE FUNCTION reddit_counters_on_comments() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO reddit_project_counters (project_id, comment_count, draft_count)
+        SELECT project_id, count(*), count(*) FILTER (WHERE status = 'draft')
+        FROM new_rows GROUP BY project_id
+        ON CONFLICT (project_id) DO UPDATE
+            SET comment_count = reddit_project_counters.comment_count + EXCLUDED.comment_count,
+                draft_count = reddit_project_counters.draft_count + EXCLUDED.draft_count,
+                updated_at = now();
+    ELSIF TG_OP = 'UPDATE' THEN
+        INSERT INTO reddit_project_counters (project_id)
+        SELECT DISTINCT project_id FROM new_rows
+        ON CONFLICT (project_id) DO NOTHING;
+
+        UPDATE reddit_project_counters c
+        SET comment_count = c.comment_count + d.comments,
+            draft_count = c.draft_count + d.drafts,
+            updated_at = now()
+        FROM (
+            SELECT project_id, sum(comments) AS comments, sum(drafts) AS drafts
+            FROM (
+                SELECT project_id, 1 AS comments,
+                       CASE WHEN status = 'draft' THEN 1 ELSE 0 END AS drafts
+                FROM new_rows
+                UNION ALL
+                SELECT project_id, -1,
+                       CASE WHEN status = 'draft' THEN -1 ELSE 0 END
+                FROM old_rows
+            ) changes
+            GROUP BY project_id
+        ) d
+        WHERE c.project_id = d.project_id
+          AND (d.comments <> 0 OR d.drafts <> 0);
+    ELSE
+        UPDATE reddit_project_counters c
+        SET comment_count = c.comment_count - d.comments,
+            draft_count = c.draft_count - d.drafts,
+            updated_at = now()
+        FROM (
+            SELECT project_id, count(*) AS comments,
+                   count(*) FILTER (WHERE status = 'draft') AS drafts
+            FROM old_rows GROUP BY project_id
+        ) d
+        WHERE c.project_id = d.project_id;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+"""
+
+TRIGGERS = [
+    """CREATE TRIGGER reddit_posts_counters_insert AFTER INSERT ON reddit_posts
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION reddit_counters_on_posts()""",
+    """CREATE TRIGGER reddit_posts_counters_delete AFTER DELETE ON reddit_posts
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION reddit_counters_on_posts()""",
+    """CREATE TRIGGER reddit_comments_counters_insert AFTER INSERT ON reddit_comments
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION reddit_counters_on_comments()""",
+    """CREATE TRIGGER reddit_comments_counters_update AFTER UPDATE ON reddit_comments
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION reddit_counters_on_comments()""",
+    """CREATE TRIGGER reddit_comments_counters_delete AFTER DELETE ON reddit_comments
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION reddit_counters_on_comments()""",
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "reddit_project_counters",
+        sa.Column(
+            "project_id",
+            postgresql.UUID(as_uuid=False),
+            sa.ForeignKey("projects.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("post_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("comment_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("draft_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+    )
+
+    # Block writers until triggers exist so the backfill cannot miss changes
+    op.execute("LOCK TABLE reddit_posts, reddit_comments IN SHARE ROW EXCLUSIVE MODE")
+
+    op.execute(POSTS_FUNCTION)
+    op.execute(COMMENTS_FUNCTION)
+    for trigger in TRIGGERS:
+        op.execute(trigger)
+
+    op.execute(
+        """
+        INSERT INTO reddit_project_counters
+            (project_id, post_count, comment_count, draft_count)
+        SELECT project_id, sum(posts), sum(comments), sum(drafts)
+        FROM (
+            SELECT project_id, 1 AS posts, 0 AS comments, 0 AS drafts
+            FROM reddit_posts
+            UNION ALL
+            SELECT project_id, 0, 1, CASE WHEN status = 'draft' THEN 1 ELSE 0 END
+            FROM reddit_comments
+        ) counts
+        GROUP BY project_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "DROP TRIGGER IF EXISTS reddit_comments_counters_delete ON reddit_comments"
+    )
+    op.execute(
+        "DROP TRIGGER IF EXISTS reddit_comments_counters_update ON reddit_comments"
+    )
+    op.execute(
+        "DROP TRIGGER IF EXISTS reddit_comments_counters_insert ON reddit_comments"
+    )
+    op.execute("DROP TRIGGER IF EXISTS reddit_posts_counters_delete ON reddit_posts")
+    op.execute("DROP TRIGGER IF EXISTS reddit_posts_counters_insert ON reddit_posts")
+    op.execute("DROP FUNCTION IF EXISTS reddit_counters_on_comments()")
+    op.execute("DROP FUNCTION IF EXISTS reddit_counters_on_posts()")
+    op.drop_table("reddit_project_counters")
@@ -16,7 +16,6 @@ from app.core.logging import get_logger
 from app.integrations.claude import ClaudeClient, get_claude
 from app.integrations.dataforseo import DataForSEOClient, get_dataforseo
 from app.models.brand_config import BrandConfig
-from app.models.crawled_page import CrawledPage, CrawlStatus
 from app.models.keyword_cluster import ClusterPage, ClusterStatus, KeywordCluster
 from app.models.page_keywords import PageKeywords
 from app.schemas.cluster import (
@@ -28,6 +27,7 @@ from app.schemas.cluster import (
     ClusterResponse,
 )
 from app.services.cluster_keyword import ClusterKeywordService
+from app.services.page_bridge import BridgePage, bridge_crawled_pages
 from app.services.project import ProjectService
 
 logger = get_logger(__name__)
@@ -325,27 +325,23 @@ async def update_cluster_page(
             ClusterStatus.COMPLETE.value,
         }:
             # Page approved after initial bulk approve — bridge it now
-            existing_stmt = select(CrawledPage).where(
-                CrawledPage.project_id == project_id,
-                CrawledPage.normalized_url == page.url_slug,
+            url_to_page_id = await bridge_crawled_pages(
+                db,
+                project_id,
+                [
+                    BridgePage(
+                        normalized_url=page.url_slug,
+                        title=page.keyword,
+                        category="collection",
+                    )
+                ],
+                source="cluster",
+                match_any_source=True,
             )
-            existing_result = await db.execute(existing_stmt)
-            crawled_page = existing_result.scalar_one_or_none()
-
-            if crawled_page is None:
-                crawled_page = CrawledPage(
-                    project_id=project_id,
-                    normalized_url=page.url_slug,
-                    source="cluster",
-                    status=CrawlStatus.COMPLETED.value,
-                    category="collection",
-                    title=page.keyword,
-                )
-                db.add(crawled_page)
-                await db.flush()
+            crawled_page_id = url_to_page_id[page.url_slug]
 
             pk = PageKeywords(
-                crawled_page_id=crawled_page.id,
+                crawled_page_id=crawled_page_id,
                 primary_keyword=page.keyword,
                 is_approved=True,
                 is_priority=page.role == "parent",
@@ -354,11 +350,11 @@ async def update_cluster_page(
             )
             db.add(pk)
 
-            page.crawled_page_id = crawled_page.id
+            page.crawled_page_id = crawled_page_id
             logger.info(
                 "Bridged newly approved page %s → crawled_page_id=%s",
                 page.id,
-                crawled_page.id,
+                crawled_page_id,
             )
 
     await db.commit()
@@ -9,13 +9,23 @@ and fetching prompt logs.
 import re
 from datetime import UTC, datetime
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
-from sqlalchemy import func, select
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from sqlalchemy import case, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.core.database import get_session
 from app.core.logging import get_logger
+from app.core.polling import delta_floor, latest, make_etag, not_modified
 from app.models.brand_config import BrandConfig
 from app.models.crawled_page import CrawledPage
 from app.models.page_content import ContentStatus, PageContent
@@ -184,99 +194,157 @@ async def _run_generation_background(
 )
 async def get_content_generation_status(
     project_id: str,
+    request: Request,
+    response: Response,
     batch: int | None = Query(None, description="Filter by onboarding batch number"),
+    since: datetime | None = Query(
+        None,
+        description="Cursor from a previous response; only changed pages are returned",
+    ),
     db: AsyncSession = Depends(get_session),
-) -> ContentGenerationStatus:
+) -> ContentGenerationStatus | Response:
     """Get content generation status for a project.
 
     Returns overall status, progress counts, and per-page status array.
-    Designed to be polled by the frontend during generation.
+    Designed to be polled by the frontend during generation: counts come
+    from a GROUP BY query, `since` limits pages to those changed after a
+    previous cursor, and If-None-Match returns 304 when nothing changed.
     """
     # Verify project exists (raises 404 if not)
     await ProjectService.get_project(db, project_id)
 
-    # Get all pages with approved keywords and their content status
-    stmt = (
-        select(CrawledPage)
+    # Pages with approved keywords, with their content status if any
+    filters = [
+        CrawledPage.project_id == project_id,
+        PageKeywords.is_approved.is_(True),
+    ]
+    if batch is not None:
+        filters.append(CrawledPage.onboarding_batch == batch)
+
+    counts_stmt = (
+        select(
+            PageContent.status,
+            func.count(),
+            func.sum(case((PageContent.is_approved.is_(True), 1), else_=0)),
+            func.max(CrawledPage.updated_at),
+            func.max(PageKeywords.updated_at),
+            func.max(PageContent.updated_at),
+        )
+        .select_from(CrawledPage)
         .join(PageKeywords, PageKeywords.crawled_page_id == CrawledPage.id)
-        .where(
-            CrawledPage.project_id == project_id,
-            PageKeywords.is_approved.is_(True),
-        )
-        .options(
-            selectinload(CrawledPage.keywords),
-            selectinload(CrawledPage.page_content),
+        .outerjoin(PageContent, PageContent.crawled_page_id == CrawledPage.id)
+        .where(*filters)
+        .group_by(PageContent.status)
+    )
+    # Status None means no PageContent row yet
+    counts: dict[str | None, int] = {}
+    pages_approved = 0
+    last_updated: datetime | None = None
+    for content_status, count, approved, *max_updated in (
+        await db.execute(counts_stmt)
+    ).all():
+        counts[content_status] = count
+        pages_approved += approved or 0
+        last_updated = latest(last_updated, *max_updated)
+
+    pages_total = sum(counts.values())
+    pages_completed = counts.get(ContentStatus.COMPLETE.value, 0)
+    pages_failed = counts.get(ContentStatus.FAILED.value, 0)
+    is_generating = project_id in _active_generations
+
+    etag = make_etag(
+        "content-generation-status",
+        project_id,
+        batch,
+        since,
+        sorted(counts.items(), key=lambda item: item[0] or ""),
+        pages_approved,
+        last_updated,
+        is_generating,
+    )
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+    response.headers["ETag"] = etag
+
+    # Build per-page status items (only changed pages for delta requests)
+    pages_stmt = (
+        select(
+            CrawledPage.id,
+            CrawledPage.normalized_url,
+            CrawledPage.source,
+            PageKeywords.primary_keyword,
+            PageContent.id.label("content_id"),
+            PageContent.status.label("content_status"),
+            PageContent.qa_results,
+            PageContent.is_approved.label("content_is_approved"),
+            PageContent.outline_status,
         )
+        .join(PageKeywords, PageKeywords.crawled_page_id == CrawledPage.id)
+        .outerjoin(PageContent, PageContent.crawled_page_id == CrawledPage.id)
+        .where(*filters)
     )
-    if batch is not None:
-        stmt = stmt.where(CrawledPage.onboarding_batch == batch)
-    result = await db.execute(stmt)
-    pages = result.scalars().unique().all()
+    floor = delta_floor(since)
+    page_ids: list[str] | None = None
+    if floor is not None:
+        pages_stmt = pages_stmt.where(
+            or_(
+                CrawledPage.updated_at > floor,
+                PageKeywords.updated_at > floor,
+                PageContent.updated_at > floor,
+            )
+        )
+        ids_stmt = (
+            select(CrawledPage.id)
+            .join(PageKeywords, PageKeywords.crawled_page_id == CrawledPage.id)
+            .where(*filters)
+        )
+        page_ids = list((await db.execute(ids_stmt)).scalars())
 
-    # Build per-page status items
     page_items: list[PageGenerationStatusItem] = []
-    pages_completed = 0
-    pages_failed = 0
-    pages_approved = 0
-
-    for page in pages:
-        keyword = page.keywords.primary_keyword if page.keywords else ""
+    for row in (await db.execute(pages_stmt)).all():
         page_status = "pending"
         error = None
-
-        if page.page_content:
-            page_status = page.page_content.status
-            if page_status == ContentStatus.FAILED.value:
-                pages_failed += 1
-                qa = page.page_content.qa_results
-                if qa and "error" in qa:
-                    error = qa["error"]
-            elif page_status == ContentStatus.COMPLETE.value:
-                pages_completed += 1
-            if page.page_content.is_approved:
-                pages_approved += 1
-
-        # Extract QA status for review list
         qa_passed = None
         qa_issue_count = 0
         page_is_approved = False
-        if page.page_content:
-            qa = page.page_content.qa_results
+
+        if row.content_id is not None:
+            page_status = row.content_status
+            qa = row.qa_results
+            if page_status == ContentStatus.FAILED.value and qa and "error" in qa:
+                error = qa["error"]
+            # Extract QA status for review list
             if qa and "passed" in qa:
                 qa_passed = qa["passed"]
                 qa_issue_count = len(qa.get("issues", []))
-            page_is_approved = page.page_content.is_approved
-
-        outline_status = None
-        if page.page_content:
-            outline_status = page.page_content.outline_status
+            page_is_approved = row.content_is_approved
 
         page_items.append(
             PageGenerationStatusItem(
-                page_id=page.id,
-                url=page.normalized_url,
-                keyword=keyword,
-                source=page.source or "onboarding",
+                page_id=row.id,
+                url=row.normalized_url,
+                keyword=row.primary_keyword or "",
+                source=row.source or "onboarding",
                 status=page_status,
                 error=error,
                 qa_passed=qa_passed,
                 qa_issue_count=qa_issue_count,
                 is_approved=page_is_approved,
-                outline_status=outline_status,
+                outline_status=row.outline_status,
             )
         )
 
     # Determine overall status
-    pages_total = len(pages)
     if pages_total == 0:
         overall_status = "idle"
-    elif project_id in _active_generations:
+    elif is_generating:
         overall_status = "generating"
     elif pages_completed + pages_failed >= pages_total:
         overall_status = "complete" if pages_failed == 0 else "failed"
     else:
         # Has some content but generation not active — partial/idle
-        has_any_content = any(p.page_content is not None for p in pages)
+        has_any_content = pages_total - counts.get(None, 0) > 0
         overall_status = "idle" if not has_any_content else "complete"
 
     return ContentGenerationStatus(
@@ -286,6 +354,9 @@ async def get_content_generation_status(
         pages_failed=pages_failed,
         pages_approved=pages_approved,
         pages=page_items,
+        cursor=last_updated,
+        is_delta=since is not None,
+        page_ids=page_ids,
     )
 
 
@@ -13,19 +13,22 @@ from fastapi import (
     Depends,
     HTTPException,
     Query,
+    Request,
     Response,
     status,
 )
-from sqlalchemy import delete, func, select
+from sqlalchemy import String, and_, case, cast, delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 from sqlalchemy.orm.attributes import flag_modified
 
 from app.core.database import get_session
 from app.core.logging import get_logger
+from app.core.polling import delta_floor, latest, make_etag, not_modified
 from app.integrations.crawl4ai import Crawl4AIClient, get_crawl4ai
 from app.integrations.s3 import S3Client, get_s3
 from app.models.crawled_page import CrawledPage, CrawlStatus
+from app.models.page_content import PageContent
 from app.models.page_keywords import PageKeywords
 from app.models.project import Project
 from app.schemas.crawled_page import (
@@ -67,19 +70,27 @@ router = APIRouter(prefix="/projects", tags=["Projects"])
 
 @router.get("", response_model=ProjectListResponse)
 async def list_projects(
+    sort: str = Query("updated_at", pattern="^(updated_at|created_at|name)$"),
+    order: str = Query("desc", pattern="^(asc|desc)$"),
+    limit: int | None = Query(None, ge=1, le=500, description="Page size"),
+    cursor: str | None = Query(None, description="next_cursor from a previous page"),
     db: AsyncSession = Depends(get_session),
 ) -> ProjectListResponse:
-    """List all projects.
+    """List projects.
 
-    Returns projects ordered by most recently updated.
+    Returns projects ordered by most recently updated by default. Without a
+    limit all projects are returned; with one, follow next_cursor to page.
     """
-    projects = await ProjectService.list_projects(db)
-    items = await ProjectService.to_response_list(db, projects)
+    page = await ProjectService.list_projects_page(
+        db, sort=sort, order=order, limit=limit, cursor=cursor
+    )
     return ProjectListResponse(
-        items=items,
-        total=len(projects),
-        limit=max(len(projects), 1),  # Minimum of 1 to satisfy schema constraint
+        items=page.items,
+        total=page.total,
+        # Minimum of 1 to satisfy schema constraint
+        limit=limit if limit is not None else max(len(page.items), 1),
         offset=0,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -632,77 +643,69 @@ async def list_onboarding_batches(
     """List all onboarding batches for a project with per-batch pipeline status.
 
     Returns batch number, page counts, pipeline status, and creation timestamp.
+    Per-batch counts are aggregated in one GROUP BY query instead of loading
+    every page with its keywords and content.
     """
 
     await ProjectService.get_project(db, project_id)
 
-    # Load all onboarding pages with keywords and content eagerly
-    from sqlalchemy.orm import selectinload
-
+    has_keywords = (
+        select(PageKeywords.id)
+        .where(
+            PageKeywords.crawled_page_id == CrawledPage.id,
+            PageKeywords.primary_keyword.is_not(None),
+            PageKeywords.primary_keyword != "",
+        )
+        .exists()
+    )
+    has_approved_content = (
+        select(PageContent.id)
+        .where(
+            PageContent.crawled_page_id == CrawledPage.id,
+            PageContent.is_approved.is_(True),
+        )
+        .exists()
+    )
     stmt = (
-        select(CrawledPage)
+        select(
+            CrawledPage.onboarding_batch.label("batch"),
+            func.count().label("total"),
+            func.sum(
+                case((CrawledPage.status == CrawlStatus.COMPLETED.value, 1), else_=0)
+            ).label("crawled"),
+            func.sum(case((has_keywords, 1), else_=0)).label("with_keywords"),
+            func.sum(case((has_approved_content, 1), else_=0)).label("approved"),
+            func.min(CrawledPage.created_at).label("created_at"),
+        )
         .where(
             CrawledPage.project_id == project_id,
             CrawledPage.source == "onboarding",
             CrawledPage.onboarding_batch.isnot(None),
         )
-        .options(
-            selectinload(CrawledPage.keywords),
-            selectinload(CrawledPage.page_content),
-        )
-        .order_by(CrawledPage.onboarding_batch, CrawledPage.created_at)
+        .group_by(CrawledPage.onboarding_batch)
+        .order_by(CrawledPage.onboarding_batch)
     )
     result = await db.execute(stmt)
-    pages = result.scalars().unique().all()
 
-    # Group pages by batch
-    batches: dict[int, list] = {}
-    for page in pages:
-        b = page.onboarding_batch
-        if b not in batches:
-            batches[b] = []
-        batches[b].append(page)
-
-    # Compute per-batch status
     summaries = []
-    for batch_num in sorted(batches.keys()):
-        batch_pages = batches[batch_num]
-        total = len(batch_pages)
-        completed = sum(
-            1 for p in batch_pages if p.page_content and p.page_content.is_approved
-        )
-
+    for row in result.all():
         # Determine pipeline status
-        any_pending_crawl = any(
-            p.status in ("pending", "crawling") for p in batch_pages
-        )
-        all_crawled = all(p.status == "completed" for p in batch_pages)
-        all_have_keywords = all(
-            p.keywords and p.keywords.primary_keyword for p in batch_pages
-        )
-        all_approved_content = all(
-            p.page_content and p.page_content.is_approved for p in batch_pages
-        )
-
-        if any_pending_crawl or not all_crawled:
+        if row.crawled < row.total:
             pipeline_status = "crawling"
-        elif not all_have_keywords:
+        elif row.with_keywords < row.total:
             pipeline_status = "keywords"
-        elif not all_approved_content:
+        elif row.approved < row.total:
             pipeline_status = "content"
         else:
             pipeline_status = "complete"
 
-        # Earliest created_at in the batch
-        created_at = min(p.created_at for p in batch_pages).isoformat()
-
         summaries.append(
             {
-                "batch": batch_num,
-                "total_pages": total,
-                "completed_pages": completed,
+                "batch": row.batch,
+                "total_pages": row.total,
+                "completed_pages": row.approved,
                 "pipeline_status": pipeline_status,
-                "created_at": created_at,
+                "created_at": row.created_at.isoformat(),
             }
         )
 
@@ -712,19 +715,28 @@ async def list_onboarding_batches(
 @router.get("/{project_id}/crawl-status", response_model=CrawlStatusResponse)
 async def get_crawl_status(
     project_id: str,
+    request: Request,
+    response: Response,
     batch: int | None = Query(None, description="Filter by onboarding batch number"),
+    since: datetime | None = Query(
+        None,
+        description="Cursor from a previous response; only changed pages are returned",
+    ),
     db: AsyncSession = Depends(get_session),
-) -> CrawlStatusResponse:
+) -> CrawlStatusResponse | Response:
     """Get crawl status for a project.
 
     Returns the overall crawl status, progress counts by status, and a summary
     of each page including id, url, status, and extracted data summary.
 
     This endpoint is designed to be polled frequently (every 2 seconds) by the
-    frontend to track crawl progress.
+    frontend to track crawl progress. Counts come from a GROUP BY query; pass
+    the returned cursor as `since` to receive only changed pages, and send
+    If-None-Match with the returned ETag to get 304 when nothing changed.
 
     Args:
         project_id: UUID of the project.
+        since: Optional delta cursor from a previous response.
         db: AsyncSession for database operations.
 
     Returns:
@@ -736,34 +748,59 @@ async def get_crawl_status(
     # Verify project exists (raises 404 if not)
     await ProjectService.get_project(db, project_id)
 
-    # Get onboarding pages for this project (crawl status is for onboarding flow only)
-    stmt = select(CrawledPage).where(
+    # Crawl status is for the onboarding flow only
+    filters = [
         CrawledPage.project_id == project_id,
         CrawledPage.source == "onboarding",
-    )
+    ]
     if batch is not None:
-        stmt = stmt.where(CrawledPage.onboarding_batch == batch)
-    result = await db.execute(stmt)
-    pages = result.scalars().all()
+        filters.append(CrawledPage.onboarding_batch == batch)
 
     # Count pages by status
-    pending_count = 0
-    crawling_count = 0
-    completed_count = 0
-    failed_count = 0
-    has_labels = False
-
-    for page in pages:
-        if page.status == CrawlStatus.PENDING.value:
-            pending_count += 1
-        elif page.status == CrawlStatus.CRAWLING.value:
-            crawling_count += 1
-        elif page.status == CrawlStatus.COMPLETED.value:
-            completed_count += 1
-            if page.labels:
-                has_labels = True
-        elif page.status == CrawlStatus.FAILED.value:
-            failed_count += 1
+    labeled = and_(
+        CrawledPage.status == CrawlStatus.COMPLETED.value,
+        # SQL NULL, JSON null and [] all mean unlabeled
+        func.coalesce(cast(CrawledPage.labels, String), "[]").not_in(("[]", "null")),
+    )
+    counts_stmt = (
+        select(
+            CrawledPage.status,
+            func.count(),
+            func.sum(case((labeled, 1), else_=0)),
+            func.max(CrawledPage.updated_at),
+        )
+        .where(*filters)
+        .group_by(CrawledPage.status)
+    )
+    counts: dict[str, int] = {}
+    labeled_count = 0
+    last_updated: datetime | None = None
+    for page_status, count, labeled_in_status, max_updated in (
+        await db.execute(counts_stmt)
+    ).all():
+        counts[page_status] = count
+        labeled_count += labeled_in_status or 0
+        last_updated = latest(last_updated, max_updated)
+
+    pending_count = counts.get(CrawlStatus.PENDING.value, 0)
+    crawling_count = counts.get(CrawlStatus.CRAWLING.value, 0)
+    completed_count = counts.get(CrawlStatus.COMPLETED.value, 0)
+    failed_count = counts.get(CrawlStatus.FAILED.value, 0)
+    total_count = sum(counts.values())
+
+    etag = make_etag(
+        "crawl-status",
+        project_id,
+        batch,
+        since,
+        sorted(counts.items()),
+        labeled_count,
+        last_updated,
+    )
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+    response.headers["ETag"] = etag
 
     # Compute overall status
     overall_status = _compute_overall_status(
@@ -771,35 +808,56 @@ async def get_crawl_status(
         crawling=crawling_count,
         completed=completed_count,
         failed=failed_count,
-        has_labels=has_labels,
+        has_labels=labeled_count > 0,
     )
 
-    # Build page summaries
+    # Build page summaries (only the columns the summary needs)
+    pages_stmt = select(
+        CrawledPage.id,
+        CrawledPage.normalized_url,
+        CrawledPage.status,
+        CrawledPage.title,
+        CrawledPage.word_count,
+        CrawledPage.headings,
+        CrawledPage.product_count,
+        CrawledPage.labels,
+        CrawledPage.crawl_error,
+    ).where(*filters)
+    floor = delta_floor(since)
+    page_ids: list[str] | None = None
+    if floor is not None:
+        pages_stmt = pages_stmt.where(CrawledPage.updated_at > floor)
+        page_ids = list(
+            (await db.execute(select(CrawledPage.id).where(*filters))).scalars()
+        )
     page_summaries = [
         PageSummary(
-            id=page.id,
-            url=page.normalized_url,
-            status=page.status,
-            title=page.title,
-            word_count=page.word_count,
-            headings=page.headings,
-            product_count=page.product_count,
-            labels=page.labels or [],
-            crawl_error=page.crawl_error,
+            id=row.id,
+            url=row.normalized_url,
+            status=row.status,
+            title=row.title,
+            word_count=row.word_count,
+            headings=row.headings,
+            product_count=row.product_count,
+            labels=row.labels or [],
+            crawl_error=row.crawl_error,
         )
-        for page in pages
+        for row in (await db.execute(pages_stmt)).all()
     ]
 
     return CrawlStatusResponse(
         project_id=project_id,
         status=overall_status,
         progress=ProgressCounts(
-            total=len(pages),
+            total=total_count,
             completed=completed_count,
             failed=failed_count,
             pending=pending_count,
         ),
         pages=page_summaries,
+        cursor=last_updated,
+        is_delta=since is not None,
+        page_ids=page_ids,
     )
 
 
@@ -29,6 +29,7 @@ from app.models.reddit_account import RedditAccount
 from app.models.reddit_comment import RedditComment
 from app.models.reddit_config import RedditProjectConfig
 from app.models.reddit_post import RedditPost
+from app.models.reddit_project_counter import RedditProjectCounter
 from app.schemas.reddit import (
     BatchGenerateRequest,
     BulkCommentActionRequest,
@@ -216,9 +217,12 @@ async def list_reddit_projects(
     """List projects that have a RedditProjectConfig (for the Reddit dashboard).
 
     Returns project summary cards with post/comment counts, ordered by
-    most recently updated config first.
+    most recently updated config first. Counts come from the trigger-maintained
+    reddit_project_counters table, so this is one query regardless of how many
+    posts and comments exist.
     """
-    # Get all projects with Reddit config via JOIN
+    # Projects with Reddit config via JOIN; counts are absent until a
+    # project's first post or comment is stored
     stmt = (
         select(
             Project.id,
@@ -226,57 +230,26 @@ async def list_reddit_projects(
             Project.site_url,
             RedditProjectConfig.is_active,
             RedditProjectConfig.updated_at,
+            func.coalesce(RedditProjectCounter.post_count, 0).label("post_count"),
+            func.coalesce(RedditProjectCounter.comment_count, 0).label("comment_count"),
+            func.coalesce(RedditProjectCounter.draft_count, 0).label("draft_count"),
         )
         .join(RedditProjectConfig, RedditProjectConfig.project_id == Project.id)
+        .outerjoin(RedditProjectCounter, RedditProjectCounter.project_id == Project.id)
         .order_by(RedditProjectConfig.updated_at.desc())
     )
     result = await db.execute(stmt)
     rows = result.all()
 
-    if not rows:
-        return RedditProjectListResponse(items=[], total=0)
-
-    project_ids = [r.id for r in rows]
-
-    # Count posts per project
-    post_counts_stmt = (
-        select(RedditPost.project_id, func.count())
-        .where(RedditPost.project_id.in_(project_ids))
-        .group_by(RedditPost.project_id)
-    )
-    post_result = await db.execute(post_counts_stmt)
-    post_counts: dict[str, int] = dict(post_result.all())  # type: ignore[arg-type]
-
-    # Count total comments per project
-    comment_counts_stmt = (
-        select(RedditComment.project_id, func.count())
-        .where(RedditComment.project_id.in_(project_ids))
-        .group_by(RedditComment.project_id)
-    )
-    comment_result = await db.execute(comment_counts_stmt)
-    comment_counts: dict[str, int] = dict(comment_result.all())  # type: ignore[arg-type]
-
-    # Count draft comments per project
-    draft_counts_stmt = (
-        select(RedditComment.project_id, func.count())
-        .where(
-            RedditComment.project_id.in_(project_ids),
-            RedditComment.status == "draft",
-        )
-        .group_by(RedditComment.project_id)
-    )
-    draft_result = await db.execute(draft_counts_stmt)
-    draft_counts: dict[str, int] = dict(draft_result.all())  # type: ignore[arg-type]
-
     items = [
         RedditProjectCardResponse(
             id=r.id,
             name=r.name,
             site_url=r.site_url,
             is_active=r.is_active,
-            post_count=post_counts.get(r.id, 0),
-            comment_count=comment_counts.get(r.id, 0),
-            draft_count=draft_counts.get(r.id, 0),
+            post_count=r.post_count,
+            comment_count=r.comment_count,
+            draft_count=r.draft_count,
             updated_at=r.updated_at,
         )
         for r in rows
@@ -721,6 +694,7 @@ async def get_discovery_status(
         keywords_searched=progress.keywords_searched,
         total_posts_found=progress.total_posts_found,
         posts_scored=progress.posts_scored,
+        posts_reused=progress.posts_reused,
         posts_stored=progress.posts_stored,
         error=progress.error,
     )
@@ -317,6 +317,7 @@ async def get_progress(job_id: str) -> WPProgressResponse:
         status=progress.get("status", "unknown"),
         current=progress.get("current", 0),
         total=progress.get("total", 0),
+        skipped_unchanged=progress.get("skipped_unchanged", 0),
         error=progress.get("error"),
         result=progress.get("result"),
     )
@@ -654,6 +655,7 @@ async def export_posts(
                 job_id=job_id,
                 page_ids=body.page_ids,
                 title_filter=body.title_filter,
+                force=body.force,
             )
 
     background_tasks.add_task(_run_export)
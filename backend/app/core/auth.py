@@ -2,21 +2,43 @@
 
 Validates session tokens against the neon_auth schema managed by Neon Auth.
 When AUTH_REQUIRED=false, returns a dev user without checking headers.
+
+Validated sessions are cached so steady-state requests cost no queries:
+- In-process: a bounded LRU of session ID -> UserInfo, trusted for
+  AUTH_SESSION_CACHE_TTL_SECONDS but never past the session's expiresAt
+- Unknown and expired session IDs are cached as invalid for a very short
+  negative TTL, so a session created just after a miss is seen promptly
+- Optionally (AUTH_SESSION_CACHE_REDIS=true) entries are shared across
+  workers through Redis, keyed by a hash of the session ID
+- invalidate_session() drops a session everywhere
+
+Sign-out and revocation go from the frontend straight to Neon Auth and never
+reach this API, so nothing here can call invalidate_session() for them. A
+signed-out or revoked session is accepted for up to
+AUTH_SESSION_CACHE_TTL_SECONDS afterwards; that staleness is accepted.
 """
 
-from dataclasses import dataclass
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
+from typing import Any
 
-from fastapi import Depends, HTTPException, Request, status
+from fastapi import HTTPException, Request, status
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
-from app.core.database import get_session
+from app.core.database import db_manager
 from app.core.logging import get_logger
+from app.core.redis import redis_manager
 
 logger = get_logger(__name__)
 
+# Redis key prefix for shared session entries
+_REDIS_KEY_PREFIX = "auth:session:"
+
 
 @dataclass
 class UserInfo:
@@ -30,13 +52,208 @@ class UserInfo:
 _DEV_USER = UserInfo(id="dev-user", email="dev@localhost", name="Dev User")
 
 
-async def get_current_user(
-    request: Request, db: AsyncSession = Depends(get_session)
-) -> UserInfo:
+@dataclass
+class _CachedSession:
+    """Cache entry: user is None for a session known not to exist or expired."""
+
+    user: UserInfo | None
+    session_expires_at: datetime | None
+    cache_expires_at: float
+
+
+class SessionCache:
+    """Bounded in-process TTL cache of validated session IDs."""
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, _CachedSession] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, session_id: str) -> _CachedSession | None:
+        entry = self._entries.get(session_id)
+        if entry is None or entry.cache_expires_at <= time.monotonic():
+            if entry is not None:
+                del self._entries[session_id]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(session_id)
+        self.hits += 1
+        return entry
+
+    def put(
+        self,
+        session_id: str,
+        user: UserInfo | None,
+        session_expires_at: datetime | None,
+        ttl: float,
+    ) -> None:
+        if ttl <= 0:
+            return
+        if user is not None and session_expires_at is not None:
+            # Never trust a session past its own expiry
+            remaining = (session_expires_at - datetime.now(UTC)).total_seconds()
+            ttl = min(ttl, remaining)
+            if ttl <= 0:
+                return
+        self._entries[session_id] = _CachedSession(
+            user=user,
+            session_expires_at=session_expires_at,
+            cache_expires_at=time.monotonic() + ttl,
+        )
+        self._entries.move_to_end(session_id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, session_id: str) -> None:
+        self._entries.pop(session_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+_session_cache: SessionCache | None = None
+
+
+def get_session_cache() -> SessionCache:
+    """Return the process-wide session cache, creating it on first use."""
+    global _session_cache
+    if _session_cache is None:
+        _session_cache = SessionCache(get_settings().auth_session_cache_max_entries)
+    return _session_cache
+
+
+def _redis_key(session_id: str) -> str:
+    return _REDIS_KEY_PREFIX + hashlib.sha256(session_id.encode()).hexdigest()
+
+
+async def _redis_get(session_id: str) -> _CachedSession | None:
+    raw = await redis_manager.get(_redis_key(session_id))
+    if raw is None:
+        return None
+    try:
+        payload = json.loads(raw)
+        user = UserInfo(**payload["user"]) if payload.get("user") else None
+        expires_at = payload.get("expires_at")
+        return _CachedSession(
+            user=user,
+            session_expires_at=datetime.fromisoformat(expires_at)
+            if expires_at
+            else None,
+            cache_expires_at=time.monotonic() + payload.get("ttl", 0),
+        )
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+async def _redis_put(
+    session_id: str,
+    user: UserInfo | None,
+    session_expires_at: datetime | None,
+    ttl: float,
+) -> None:
+    if user is not None and session_expires_at is not None:
+        ttl = min(ttl, (session_expires_at - datetime.now(UTC)).total_seconds())
+    if ttl < 1:
+        return
+    payload = {
+        "user": asdict(user) if user else None,
+        "expires_at": session_expires_at.isoformat() if session_expires_at else None,
+        "ttl": ttl,
+    }
+    await redis_manager.set(_redis_key(session_id), json.dumps(payload), ex=int(ttl))
+
+
+async def invalidate_session(session_id: str) -> None:
+    """Drop a session from the in-process cache and Redis (e.g. on sign-out)."""
+    get_session_cache().invalidate(session_id)
+    if get_settings().auth_session_cache_redis and redis_manager.available:
+        await redis_manager.delete(_redis_key(session_id))
+
+
+def clear_session_cache() -> None:
+    """Drop all in-process cached sessions."""
+    get_session_cache().clear()
+
+
+async def _lookup_session(session_id: str) -> tuple[UserInfo, datetime] | None:
+    """Query neon_auth for a session and its user. Returns None if not found."""
+    # Look up by session ID (UUID primary key).
+    # The frontend sends session.id from useSession(), not session.token
+    # (which is a JWT and doesn't match the DB's opaque token column).
+    async with db_manager.session_factory() as db:
+        result = await db.execute(
+            text(
+                'SELECT u.id, u.email, u.name, s."expiresAt" '
+                "FROM neon_auth.session s "
+                'JOIN neon_auth."user" u ON s."userId" = u.id '
+                "WHERE s.id = :session_id"
+            ),
+            {"session_id": session_id},
+        )
+        row = result.first()
+
+    if row is None:
+        return None
+    return UserInfo(id=str(row.id), email=row.email, name=row.name), row.expiresAt
+
+
+async def _resolve_session(session_id: str) -> _CachedSession:
+    """Resolve a session through the caches, querying the database on a miss."""
+    settings = get_settings()
+    cache = get_session_cache()
+
+    entry = cache.get(session_id)
+    if entry is not None:
+        return entry
+
+    use_redis = settings.auth_session_cache_redis and redis_manager.available
+    if use_redis:
+        entry = await _redis_get(session_id)
+        if entry is not None:
+            cache.put(
+                session_id,
+                entry.user,
+                entry.session_expires_at,
+                entry.cache_expires_at - time.monotonic(),
+            )
+            return entry
+
+    found = await _lookup_session(session_id)
+    if found is None:
+        user, expires_at = None, None
+        ttl = settings.auth_session_negative_ttl_seconds
+    else:
+        user, expires_at = found
+        ttl = settings.auth_session_cache_ttl_seconds
+        if expires_at is not None and expires_at < datetime.now(UTC):
+            # Remember the expiry, not the user, so repeats skip the query
+            user = None
+            ttl = settings.auth_session_negative_ttl_seconds
+
+    cache.put(session_id, user, expires_at, ttl)
+    if use_redis:
+        await _redis_put(session_id, user, expires_at, ttl)
+
+    return _CachedSession(
+        user=user,
+        session_expires_at=expires_at,
+        cache_expires_at=time.monotonic() + ttl,
+    )
+
+
+async def get_current_user(request: Request) -> UserInfo:
     """FastAPI dependency that validates the session token and returns the current user.
 
     When AUTH_REQUIRED=false, returns a dev user without checking headers.
-    When AUTH_REQUIRED=true, validates the Bearer token against neon_auth.session.
+    When AUTH_REQUIRED=true, validates the Bearer token against neon_auth.session,
+    serving repeat requests from the session cache.
     """
     settings = get_settings()
 
@@ -53,32 +270,21 @@ async def get_current_user(
 
     session_id = auth_header[7:]  # Strip "Bearer " prefix
 
-    # Look up by session ID (UUID primary key).
-    # The frontend sends session.id from useSession(), not session.token
-    # (which is a JWT and doesn't match the DB's opaque token column).
-    result = await db.execute(
-        text(
-            'SELECT u.id, u.email, u.name, s."expiresAt" '
-            "FROM neon_auth.session s "
-            'JOIN neon_auth."user" u ON s."userId" = u.id '
-            "WHERE s.id = :session_id"
-        ),
-        {"session_id": session_id},
-    )
-    row = result.first()
+    entry = await _resolve_session(session_id)
 
-    if row is None:
-        logger.warning("Session not found: %s...", session_id[:8])
+    expires_at = entry.session_expires_at
+    if expires_at is not None and expires_at < datetime.now(UTC):
+        logger.warning("Session expired at %s", expires_at)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Session not found",
+            detail="Session expired",
         )
 
-    if row.expiresAt < datetime.now(UTC):
-        logger.warning("Session expired at %s", row.expiresAt)
+    if entry.user is None:
+        logger.warning("Session not found: %s...", session_id[:8])
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Session expired",
+            detail="Session not found",
         )
 
-    return UserInfo(id=str(row.id), email=row.email, name=row.name)
+    return entry.user
@@ -29,6 +29,21 @@ class Settings(BaseSettings):
         default=True,
         description="Require authentication for API requests (disable for local development)",
     )
+    auth_session_cache_ttl_seconds: float = Field(
+        default=60.0,
+        description="How long a validated session is trusted without re-querying, including after sign-out (0 disables)",
+    )
+    auth_session_negative_ttl_seconds: float = Field(
+        default=1.0,
+        description="How long an unknown or expired session ID is remembered as invalid",
+    )
+    auth_session_cache_max_entries: int = Field(
+        default=10000, description="Maximum sessions held in the in-process auth cache"
+    )
+    auth_session_cache_redis: bool = Field(
+        default=False,
+        description="Share validated sessions across workers via Redis (when available)",
+    )
 
     # Server - PORT is set dynamically by Railway
     port: int = Field(default=8000, description="Port to bind to (Railway sets this)")
@@ -61,6 +76,18 @@ class Settings(BaseSettings):
         default=300,
         description="Recycle connections after N seconds to match Neon idle timeout",
     )
+    db_query_stats_enabled: bool = Field(
+        default=True,
+        description="Enable per-statement timing, fingerprinting and N+1 detection",
+    )
+    db_n_plus_one_threshold: int = Field(
+        default=10,
+        description="Repeats of one statement (with varying params) in a request/run flagged as N+1",
+    )
+    db_query_stats_track_params: bool = Field(
+        default=False,
+        description="Hash bind parameters per statement so N+1 detection ignores repeats of identical queries (adds a hash of every parameter set)",
+    )
 
     # Redis
     redis_url: RedisDsn | None = Field(
@@ -92,6 +119,23 @@ class Settings(BaseSettings):
     log_level: str = Field(default="INFO", description="Log level")
     log_format: str = Field(default="json", description="Log format: json or text")
 
+    # Tracing (per-run stage timing spans, served by /health/traces)
+    tracing_enabled: bool = Field(
+        default=True,
+        description="Record spans for pipeline stages, integration calls and DB transactions",
+    )
+    tracing_max_traces: int = Field(
+        default=50, description="Finished pipeline traces kept in memory"
+    )
+    tracing_max_spans_per_trace: int = Field(
+        default=5000,
+        description="Spans recorded per trace before further ones are dropped",
+    )
+    tracing_otel_bridge: bool = Field(
+        default=False,
+        description="Mirror spans to OpenTelemetry (requires opentelemetry-api)",
+    )
+
     # Crawl4AI
     crawl4ai_api_url: str | None = Field(
         default=None,
@@ -150,6 +194,22 @@ class Settings(BaseSettings):
     claude_circuit_recovery_timeout: float = Field(
         default=60.0, description="Seconds before attempting recovery"
     )
+    # Message Batches (bulk, non-urgent generation)
+    claude_batch_poll_interval: float = Field(
+        default=30.0, description="Seconds between Message Batch status polls"
+    )
+    claude_batch_max_wait: float = Field(
+        default=86400.0,
+        description="Seconds to wait for a Message Batch before canceling it",
+    )
+    label_assignment_use_batches: bool = Field(
+        default=False,
+        description="Submit onboarding label assignment as a Message Batch (cheaper and off the interactive rate limit, but may take minutes to hours)",
+    )
+    label_assignment_batch_max_wait: float = Field(
+        default=3600.0,
+        description="Seconds to wait for the label assignment Message Batch; pages it has not labeled by then are assigned with interactive requests",
+    )
 
     # Scheduler (APScheduler)
     scheduler_enabled: bool = Field(
@@ -384,6 +444,20 @@ class Settings(BaseSettings):
     pop_task_timeout: float = Field(
         default=300.0, description="Maximum time in seconds to wait for task completion"
     )
+    pop_poll_max_interval: float = Field(
+        default=15.0, description="Upper bound in seconds for per-task poll backoff"
+    )
+    pop_poll_backoff_factor: float = Field(
+        default=1.5,
+        description="Multiplier applied to a task's poll interval while pending",
+    )
+    pop_poll_requests_per_second: float = Field(
+        default=2.0,
+        description="Global budget of task-status requests per second across all tasks",
+    )
+    pop_poll_max_concurrency: int = Field(
+        default=5, description="Maximum in-flight task-status requests"
+    )
     pop_max_retries: int = Field(
         default=3, description="Maximum retry attempts for POP API requests"
     )
@@ -421,6 +495,19 @@ class Settings(BaseSettings):
         default=5,
         description="Maximum concurrent requests for batch scoring operations",
     )
+    # Shared keyword-level POP brief cache (reused across pages and projects)
+    pop_brief_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse POP brief responses for the same keyword/location across pages and projects",
+    )
+    pop_brief_cache_ttl_days: int = Field(
+        default=14, description="TTL for shared POP brief cache entries in days"
+    )
+    # Project list response cache
+    project_list_cache_ttl_seconds: float = Field(
+        default=5.0,
+        description="TTL for cached project list pages (0 disables the cache)",
+    )
     # POP shadow mode for scoring comparison
     pop_shadow_mode: bool = Field(
         default=False,
@@ -476,6 +563,10 @@ class Settings(BaseSettings):
         default=None,
         description="Global max word count for blog post content field",
     )
+    blog_trend_cache_ttl_days: int = Field(
+        default=7,
+        description="Days a keyword's Perplexity trend research is reused across blog posts (0 disables)",
+    )
 
     # Content generation mode
     content_mode: str = Field(
@@ -488,6 +579,20 @@ class Settings(BaseSettings):
         default=1,
         description="Max concurrent page content generations (1=sequential for dev, 5 for production)",
     )
+    content_brief_concurrency: int = Field(
+        default=5,
+        description="Max concurrent POP brief fetches in the content pipeline",
+    )
+    content_quality_concurrency: int = Field(
+        default=2,
+        description="Max concurrent quality pipeline runs in the content pipeline",
+    )
+
+    # Internal link planning
+    link_target_weighting: str = Field(
+        default="label_overlap",
+        description="Edge weight for onboarding/WordPress link targets: 'label_overlap' or 'similarity' (local TF-IDF over page text)",
+    )
 
     # Reddit / CrowdReply
     serpapi_key: str = Field(
@@ -526,6 +631,14 @@ class Settings(BaseSettings):
         default=2.0,
         description="Seconds before polling for task ID after create",
     )
+    reddit_serp_concurrency: int = Field(
+        default=4,
+        description="Max concurrent SerpAPI searches during Reddit discovery",
+    )
+    reddit_rescore_after_days: int = Field(
+        default=14,
+        description="Reuse stored Reddit post evaluations younger than this instead of re-scoring",
+    )
 
     # Shopify Integration
     shopify_api_key: str | None = Field(
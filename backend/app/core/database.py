@@ -2,7 +2,9 @@
 
 Features:
 - Async SQLAlchemy with connection pooling
-- Slow query logging (>100ms at WARNING)
+- Slow query logging (>100ms at WARNING), per statement via query_stats
+- Statement fingerprinting with per-request/run aggregates and N+1 detection
+- A tracing span per transaction inside traced pipeline runs
 - Connection error logging with masked strings
 - Transaction failure logging with rollback context
 - Connection pool exhaustion logging at CRITICAL
@@ -21,15 +23,25 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session
 from sqlalchemy.pool import Pool
 
 from app.core.config import get_settings
 from app.core.logging import db_logger, get_logger
+from app.core.query_stats import query_stats
+from app.core.tracing import trace_collector
 
 logger = get_logger(__name__)
 
 
+class AppSession(Session):
+    """Sync session class behind db_manager's factory.
+
+    Session-level instrumentation (trace spans) attaches here rather than to
+    Session, so sessions created elsewhere are left alone.
+    """
+
+
 class Base(DeclarativeBase):
     """Base class for SQLAlchemy models."""
 
@@ -94,6 +106,7 @@ class DatabaseManager:
             self._session_factory = async_sessionmaker(
                 bind=self._engine,
                 class_=AsyncSession,
+                sync_session_class=AppSession,
                 expire_on_commit=False,
                 autoflush=False,
             )
@@ -101,6 +114,19 @@ class DatabaseManager:
             # Set up pool event listeners for monitoring
             self._setup_pool_listeners()
 
+            # Per-statement timing, fingerprinting and N+1 detection
+            if settings.db_query_stats_enabled:
+                query_stats.slow_query_threshold_ms = (
+                    settings.db_slow_query_threshold_ms
+                )
+                query_stats.n_plus_one_threshold = settings.db_n_plus_one_threshold
+                query_stats.track_params = settings.db_query_stats_track_params
+                query_stats.instrument(self._engine.sync_engine)
+
+            # Transaction spans for traced pipeline runs
+            if settings.tracing_enabled:
+                trace_collector.instrument_sessions(AppSession)
+
             logger.info("Database engine initialized successfully")
 
         except Exception as e:
@@ -0,0 +1,59 @@
+"""Helpers for cheap status polling endpoints.
+
+Status endpoints polled by open dashboards support two savings:
+- Conditional requests: the endpoint derives a weak ETag from a cheap
+  aggregate query (counts and max(updated_at)) and answers 304 Not Modified
+  when the client's If-None-Match still matches, before loading any rows.
+- Delta responses: clients pass back the returned cursor as `since` and
+  only receive rows changed after it. Deleted rows have no timestamp to
+  compare, so delta responses also carry the ids of every current row
+  (page_ids) and clients drop merged rows that are no longer listed.
+
+Rows are stamped with updated_at when flushed but become visible at commit,
+so a row can appear with a timestamp slightly older than a cursor already
+handed out. Delta queries therefore look back DELTA_OVERLAP before the
+cursor; clients merge rows by id, so repeats are harmless.
+"""
+
+import hashlib
+from datetime import datetime, timedelta
+from typing import Any
+
+from fastapi import Request, Response, status
+
+DELTA_OVERLAP = timedelta(seconds=5)
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a weak ETag from the values that determine a response."""
+    digest = hashlib.sha1(
+        "|".join("" if p is None else str(p) for p in parts).encode()
+    ).hexdigest()
+    return f'W/"{digest[:32]}"'
+
+
+def not_modified(request: Request, etag: str) -> Response | None:
+    """Return a 304 response if the request's If-None-Match matches etag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return None
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    if etag in candidates or "*" in candidates:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag},
+        )
+    return None
+
+
+def delta_floor(since: datetime | None) -> datetime | None:
+    """Lower updated_at bound for a delta query, or None for a full response."""
+    if since is None:
+        return None
+    return since - DELTA_OVERLAP
+
+
+def latest(*timestamps: datetime | None) -> datetime | None:
+    """Most recent of the given timestamps, ignoring None."""
+    present = [t for t in timestamps if t is not None]
+    return max(present) if present else None
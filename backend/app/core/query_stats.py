@@ -0,0 +1,385 @@
+"""Per-statement SQL instrumentation with N+1 detection.
+
+Hooks the engine's before/after_cursor_execute events so every statement is
+timed individually instead of whole sessions. Statements are fingerprinted
+(literals, bind parameters and IN lists collapsed) and aggregated:
+
+- Globally, per fingerprint: count, total time, p50/p95/p99 latency
+- Per scope (one HTTP request or one pipeline run): the same counters, plus
+  N+1 detection — a fingerprint executed at least ``n_plus_one_threshold``
+  times is flagged. With ``track_params`` on, bind parameters are hashed per
+  statement and only fingerprints run with more than one distinct parameter
+  set are flagged; it is off by default since hashing large bulk-insert
+  parameters on every statement is not free
+
+Scopes are tracked with a ContextVar holding a mutable QueryScope, so child
+tasks spawned inside a request or pipeline run report into the same scope.
+Finished scopes are kept in a bounded ring buffer for the debug endpoint.
+"""
+
+import functools
+import hashlib
+import inspect
+import math
+import re
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, ParamSpec, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.logging import db_logger, get_logger
+
+logger = get_logger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# Maximum latency samples retained per fingerprint for percentile estimates
+MAX_SAMPLES_PER_FINGERPRINT = 500
+
+# Maximum number of finished scopes retained for the debug endpoint
+MAX_RECENT_SCOPES = 50
+
+# Key used to stash start times on the connection info dict
+_START_TIMES_KEY = "query_stats_start_times"
+
+_STRING_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_POSITIONAL_PARAM_RE = re.compile(r"\$\d+|%\(\w+\)s|%s|:\w+|\?")
+_IN_LIST_RE = re.compile(r"\bIN\s*\((?:\s*\?\s*,?)+\)", re.IGNORECASE)
+_POSTEXECUTE_IN_RE = re.compile(r"\(\s*__\[POSTCOMPILE_\w+\]\s*\)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def fingerprint_statement(statement: str) -> str:
+    """Normalize a SQL statement so executions differing only in values match.
+
+    Collapses string/number literals and every bind-parameter style to ``?``,
+    folds IN lists of any length into ``IN (?)`` and squashes whitespace.
+    """
+    normalized = _STRING_LITERAL_RE.sub("?", statement)
+    normalized = _POSTEXECUTE_IN_RE.sub("(?)", normalized)
+    normalized = _POSITIONAL_PARAM_RE.sub("?", normalized)
+    normalized = _NUMBER_LITERAL_RE.sub("?", normalized)
+    normalized = _IN_LIST_RE.sub("IN (?)", normalized)
+    return _WHITESPACE_RE.sub(" ", normalized).strip()
+
+
+def _fingerprint_id(fingerprint: str) -> str:
+    """Short stable identifier for a fingerprint."""
+    return hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()[:12]
+
+
+def _params_key(parameters: Any) -> str:
+    """Hashable key for a parameter set (used for N+1 distinct-param counts)."""
+    try:
+        return hashlib.sha1(repr(parameters).encode("utf-8")).hexdigest()[:16]
+    except Exception:
+        return "unhashable"
+
+
+def _percentile(sorted_samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile over an already-sorted list."""
+    if not sorted_samples:
+        return 0.0
+    rank = math.ceil(pct / 100 * len(sorted_samples)) - 1
+    return sorted_samples[max(0, min(rank, len(sorted_samples) - 1))]
+
+
+@dataclass
+class StatementStats:
+    """Aggregated timings for a single statement fingerprint."""
+
+    fingerprint: str
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    samples: deque[float] = field(
+        default_factory=lambda: deque(maxlen=MAX_SAMPLES_PER_FINGERPRINT)
+    )
+    param_keys: set[str] = field(default_factory=set)
+
+    def record(self, duration_ms: float, params_key: str | None = None) -> None:
+        """Record one execution."""
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.samples.append(duration_ms)
+        if (
+            params_key is not None
+            and len(self.param_keys) < MAX_SAMPLES_PER_FINGERPRINT
+        ):
+            self.param_keys.add(params_key)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for the debug endpoint."""
+        ordered = sorted(self.samples)
+        return {
+            "id": _fingerprint_id(self.fingerprint),
+            "statement": self.fingerprint[:500],
+            "count": self.count,
+            "distinct_params": len(self.param_keys),
+            "total_ms": round(self.total_ms, 2),
+            "mean_ms": round(self.total_ms / self.count, 2) if self.count else 0.0,
+            "p50_ms": round(_percentile(ordered, 50), 2),
+            "p95_ms": round(_percentile(ordered, 95), 2),
+            "p99_ms": round(_percentile(ordered, 99), 2),
+            "max_ms": round(self.max_ms, 2),
+        }
+
+
+@dataclass
+class QueryScope:
+    """Statement aggregates for one request or pipeline run."""
+
+    label: str
+    started_at: float = field(default_factory=time.time)
+    finished_at: float | None = None
+    statements: dict[str, StatementStats] = field(default_factory=dict)
+
+    @property
+    def total_queries(self) -> int:
+        """Total statements executed in this scope."""
+        return sum(s.count for s in self.statements.values())
+
+    @property
+    def total_ms(self) -> float:
+        """Total time spent executing statements in this scope."""
+        return sum(s.total_ms for s in self.statements.values())
+
+    def record(
+        self, fingerprint: str, duration_ms: float, params_key: str | None
+    ) -> None:
+        """Record one execution in this scope."""
+        stats = self.statements.get(fingerprint)
+        if stats is None:
+            stats = StatementStats(fingerprint=fingerprint)
+            self.statements[fingerprint] = stats
+        stats.record(duration_ms, params_key)
+
+    def n_plus_one_suspects(self, threshold: int) -> list[StatementStats]:
+        """Fingerprints repeated >= threshold times with differing parameters.
+
+        When parameters were not tracked, repetition alone is flagged.
+        """
+        return [
+            s
+            for s in self.statements.values()
+            if s.count >= threshold and len(s.param_keys) != 1
+        ]
+
+    def to_dict(self, threshold: int) -> dict[str, Any]:
+        """Serialize for the debug endpoint."""
+        ordered = sorted(
+            self.statements.values(), key=lambda s: s.total_ms, reverse=True
+        )
+        return {
+            "label": self.label,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "total_queries": self.total_queries,
+            "total_ms": round(self.total_ms, 2),
+            "distinct_statements": len(self.statements),
+            "n_plus_one": [s.to_dict() for s in self.n_plus_one_suspects(threshold)],
+            "statements": [s.to_dict() for s in ordered[:20]],
+        }
+
+
+_current_scope: ContextVar[QueryScope | None] = ContextVar(
+    "query_stats_scope", default=None
+)
+
+
+class QueryStatsCollector:
+    """Process-wide statement aggregator fed by engine cursor events."""
+
+    def __init__(
+        self,
+        slow_query_threshold_ms: float = 100.0,
+        n_plus_one_threshold: int = 10,
+        track_params: bool = False,
+    ) -> None:
+        self.slow_query_threshold_ms = slow_query_threshold_ms
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.track_params = track_params
+        self._global: dict[str, StatementStats] = {}
+        self._recent_scopes: deque[QueryScope] = deque(maxlen=MAX_RECENT_SCOPES)
+        self._lock = threading.Lock()
+        self._instrumented: set[int] = set()
+
+    def instrument(self, engine: Engine) -> None:
+        """Attach cursor listeners to a (sync) engine. Idempotent."""
+        if id(engine) in self._instrumented:
+            return
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(engine, "handle_error", self._handle_error)
+        self._instrumented.add(id(engine))
+
+    def _before_cursor_execute(
+        self,
+        conn: Any,
+        _cursor: Any,
+        _statement: str,
+        _parameters: Any,
+        _context: Any,
+        _executemany: bool,
+    ) -> None:
+        conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+    def _after_cursor_execute(
+        self,
+        conn: Any,
+        _cursor: Any,
+        statement: str,
+        parameters: Any,
+        _context: Any,
+        _executemany: bool,
+    ) -> None:
+        start_times = conn.info.get(_START_TIMES_KEY)
+        if not start_times:
+            return
+        duration_ms = (time.perf_counter() - start_times.pop()) * 1000
+        self.record(statement, parameters, duration_ms)
+
+    def _handle_error(self, exception_context: Any) -> None:
+        # Drop the pending start time so the stack stays balanced
+        conn = exception_context.connection
+        if conn is not None:
+            start_times = conn.info.get(_START_TIMES_KEY)
+            if start_times:
+                start_times.pop()
+
+    def record(self, statement: str, parameters: Any, duration_ms: float) -> None:
+        """Record one statement execution globally and in the active scope."""
+        fingerprint = fingerprint_statement(statement)
+
+        with self._lock:
+            stats = self._global.get(fingerprint)
+            if stats is None:
+                stats = StatementStats(fingerprint=fingerprint)
+                self._global[fingerprint] = stats
+            stats.record(duration_ms)
+
+        scope = _current_scope.get()
+        if scope is not None:
+            params_key = _params_key(parameters) if self.track_params else None
+            scope.record(fingerprint, duration_ms, params_key)
+
+        if duration_ms > self.slow_query_threshold_ms:
+            db_logger.slow_query(
+                query=statement,
+                duration_ms=duration_ms,
+                table=_extract_table(statement),
+            )
+
+    @contextmanager
+    def scope(self, label: str) -> Iterator[QueryScope]:
+        """Aggregate every statement executed inside the block under ``label``."""
+        query_scope = QueryScope(label=label)
+        token = _current_scope.set(query_scope)
+        try:
+            yield query_scope
+        finally:
+            _current_scope.reset(token)
+            self.finish_scope(query_scope)
+
+    def finish_scope(self, query_scope: QueryScope) -> None:
+        """Close a scope, log N+1 suspects and keep it for the debug endpoint."""
+        query_scope.finished_at = time.time()
+        suspects = query_scope.n_plus_one_suspects(self.n_plus_one_threshold)
+        for suspect in suspects:
+            logger.warning(
+                "Possible N+1 query pattern",
+                extra={
+                    "scope": query_scope.label,
+                    "statement": suspect.fingerprint[:500],
+                    "count": suspect.count,
+                    "distinct_params": len(suspect.param_keys),
+                    "total_ms": round(suspect.total_ms, 2),
+                },
+            )
+        if query_scope.statements:
+            with self._lock:
+                self._recent_scopes.append(query_scope)
+
+    def snapshot(self, top: int = 25) -> dict[str, Any]:
+        """Return global and recent per-scope aggregates."""
+        with self._lock:
+            global_stats = sorted(
+                self._global.values(), key=lambda s: s.total_ms, reverse=True
+            )
+            recent = list(self._recent_scopes)
+        return {
+            "n_plus_one_threshold": self.n_plus_one_threshold,
+            "slow_query_threshold_ms": self.slow_query_threshold_ms,
+            "total_fingerprints": len(global_stats),
+            "statements": [s.to_dict() for s in global_stats[:top]],
+            "recent_scopes": [
+                s.to_dict(self.n_plus_one_threshold) for s in reversed(recent)
+            ],
+        }
+
+    def reset(self) -> None:
+        """Clear all aggregates."""
+        with self._lock:
+            self._global.clear()
+            self._recent_scopes.clear()
+
+
+def _extract_table(statement: str) -> str | None:
+    """Best-effort table name for slow query logs."""
+    match = re.search(
+        r'\b(?:FROM|INTO|UPDATE)\s+"?([\w.]+)"?', statement, re.IGNORECASE
+    )
+    return match.group(1) if match else None
+
+
+# Global collector instance (thresholds are applied from settings in init_db)
+query_stats = QueryStatsCollector()
+
+
+def query_scope(label: str) -> Any:
+    """Context manager aggregating statements under ``label``.
+
+    Usage:
+        with query_scope(f"content_pipeline:{project_id}"):
+            ...
+    """
+    return query_stats.scope(label)
+
+
+def query_scoped(
+    label: str,
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """Decorator running an async function inside its own query scope.
+
+    If the function has a ``project_id`` parameter, its value is appended to
+    the scope label so runs for different projects can be told apart.
+    """
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            try:
+                bound = signature.bind_partial(*args, **kwargs)
+            except TypeError:
+                project_id = None
+            else:
+                project_id = bound.arguments.get("project_id")
+            scope_label = f"{label}:{project_id}" if project_id else label
+            with query_stats.scope(scope_label):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,690 @@
+"""Lightweight in-process tracing with per-stage timing spans.
+
+Pipeline runs (content generation, link planning, WordPress linking, Reddit
+discovery) open a trace; pipeline stages, integration calls (Claude, POP,
+DataForSEO, Crawl4AI, SerpAPI) and DB transactions inside the run record
+child spans. Spans opened outside a run are non-recording, so ad-hoc calls
+from HTTP handlers cost almost nothing.
+
+The API follows OpenTelemetry's tracing API (get_tracer,
+start_as_current_span, set_attribute, record_exception, set_status) so call
+sites can move to the OpenTelemetry SDK unchanged. The default exporter is
+in-process: finished traces are kept in a bounded ring buffer and served,
+with a critical-path breakdown, by the /health/traces debug endpoints. With
+``tracing_otel_bridge`` enabled and opentelemetry-api installed, every
+recorded span is mirrored to an OpenTelemetry span as well.
+
+The current span is tracked with a ContextVar, so tasks spawned inside a
+run (asyncio.gather, create_task) record into the same trace.
+"""
+
+import functools
+import inspect
+import threading
+import time
+import uuid
+from collections import defaultdict, deque
+from collections.abc import Awaitable, Callable, Iterator, Sequence
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, ParamSpec, TypeVar
+
+from sqlalchemy import event
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# Default number of finished traces retained for the debug endpoint
+MAX_RECENT_TRACES = 50
+
+# Default cap on spans recorded per trace; further spans are counted only
+MAX_SPANS_PER_TRACE = 5000
+
+# String attribute values are truncated to this length
+MAX_ATTRIBUTE_LENGTH = 256
+
+# Key used to stash the open transaction span on Session.info
+_SESSION_SPAN_KEY = "tracing_transaction_span"
+
+AttributeValue = str | bool | int | float
+
+
+class SpanKind(Enum):
+    """Role of a span (mirrors opentelemetry.trace.SpanKind)."""
+
+    INTERNAL = "internal"
+    CLIENT = "client"
+
+
+class StatusCode(Enum):
+    """Span outcome (mirrors opentelemetry.trace.StatusCode)."""
+
+    UNSET = "unset"
+    OK = "ok"
+    ERROR = "error"
+
+
+def _clean_attribute(value: Any) -> AttributeValue:
+    if isinstance(value, bool | int | float):
+        return value
+    text = str(value)
+    return text if len(text) <= MAX_ATTRIBUTE_LENGTH else text[:MAX_ATTRIBUTE_LENGTH]
+
+
+@dataclass(eq=False)
+class Span:
+    """A timed operation within a trace.
+
+    Spans with no trace are non-recording: every mutator is a no-op, but
+    duration_ms still measures the span's own lifetime.
+    """
+
+    name: str
+    trace_id: str = ""
+    span_id: str = ""
+    parent_id: str | None = None
+    kind: SpanKind = SpanKind.INTERNAL
+    attributes: dict[str, AttributeValue] = field(default_factory=dict)
+    events: list[dict[str, Any]] = field(default_factory=list)
+    status: StatusCode = StatusCode.UNSET
+    status_description: str | None = None
+    start_time: float = field(default_factory=time.time)
+    start_perf: float = field(default_factory=time.perf_counter)
+    end_perf: float | None = None
+    trace: "TraceRecord | None" = field(default=None, repr=False)
+
+    def is_recording(self) -> bool:
+        """True while the span belongs to a trace and has not ended."""
+        return self.trace is not None and self.end_perf is None
+
+    @property
+    def duration_ms(self) -> float:
+        """Elapsed time so far, or the final duration once ended."""
+        end = self.end_perf if self.end_perf is not None else time.perf_counter()
+        return (end - self.start_perf) * 1000
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set one attribute (None values are ignored)."""
+        if self.is_recording() and value is not None:
+            self.attributes[key] = _clean_attribute(value)
+
+    def set_attributes(self, attributes: dict[str, Any]) -> None:
+        """Set several attributes."""
+        for key, value in attributes.items():
+            self.set_attribute(key, value)
+
+    def add_event(self, name: str, attributes: dict[str, Any] | None = None) -> None:
+        """Record a point-in-time event on the span."""
+        if not self.is_recording():
+            return
+        self.events.append(
+            {
+                "name": name,
+                "offset_ms": round(self.duration_ms, 2),
+                "attributes": {
+                    k: _clean_attribute(v)
+                    for k, v in (attributes or {}).items()
+                    if v is not None
+                },
+            }
+        )
+
+    def record_exception(self, exc: BaseException) -> None:
+        """Record an exception as a span event."""
+        self.add_event(
+            "exception",
+            {"exception.type": type(exc).__name__, "exception.message": str(exc)},
+        )
+
+    def set_status(self, status: StatusCode, description: str | None = None) -> None:
+        """Set the span outcome."""
+        if self.is_recording():
+            self.status = status
+            self.status_description = description
+
+    def end(self) -> None:
+        """Finish the span and hand it to its trace. Idempotent."""
+        if self.end_perf is not None:
+            return
+        self.end_perf = time.perf_counter()
+        if self.trace is not None:
+            self.trace.span_ended(self)
+
+    def to_dict(self, origin_perf: float) -> dict[str, Any]:
+        """Serialize for the debug endpoint (offsets relative to origin_perf)."""
+        return {
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind.value,
+            "start_ms": round((self.start_perf - origin_perf) * 1000, 2),
+            "duration_ms": round(self.duration_ms, 2),
+            "status": self.status.value,
+            "status_description": self.status_description,
+            "attributes": self.attributes,
+            "events": self.events,
+            "ended": self.end_perf is not None,
+        }
+
+
+# Shared non-recording span returned when no span is active
+INVALID_SPAN = Span(name="")
+
+
+@dataclass
+class TraceRecord:
+    """All spans recorded for one pipeline run."""
+
+    trace_id: str
+    root: Span
+    collector: "TraceCollector"
+    max_spans: int = MAX_SPANS_PER_TRACE
+    spans: list[Span] = field(default_factory=list)
+    dropped_spans: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        """True once the root span has ended."""
+        return self.root.end_perf is not None
+
+    def admit(self) -> bool:
+        """Reserve room for one more span; False once the cap is reached."""
+        with self._lock:
+            if len(self.spans) >= self.max_spans:
+                self.dropped_spans += 1
+                return False
+            return True
+
+    def span_started(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def span_ended(self, span: Span) -> None:
+        if span is self.root:
+            self.collector.finish_trace(self)
+
+    def critical_path(self) -> list[tuple[Span, float, float]]:
+        """Segments of the run's critical path, in chronological order.
+
+        Walks back from the end of the root span: the child that finished
+        last before the current point is on the critical path, then the
+        child that finished last before that one started, and so on. Time
+        not covered by any such child is the parent's own time. Each segment
+        is (span, start_perf, end_perf).
+        """
+        now = time.perf_counter()
+        children: defaultdict[str, list[Span]] = defaultdict(list)
+        with self._lock:
+            spans = list(self.spans)
+        for span in spans:
+            if span.parent_id is not None:
+                children[span.parent_id].append(span)
+
+        def end_of(span: Span) -> float:
+            return span.end_perf if span.end_perf is not None else now
+
+        for siblings in children.values():
+            siblings.sort(key=end_of, reverse=True)
+
+        segments: list[tuple[Span, float, float]] = []
+        # Explicit stack instead of recursion: (span, end, child index, cursor)
+        stack: list[list[Any]] = [[self.root, end_of(self.root), 0, end_of(self.root)]]
+        while stack:
+            frame = stack[-1]
+            span, _, index, cursor = frame
+            siblings = children.get(span.span_id, [])
+            descended = False
+            while index < len(siblings) and cursor > span.start_perf:
+                child = siblings[index]
+                index += 1
+                if child.start_perf >= cursor:
+                    continue
+                child_end = min(end_of(child), cursor)
+                if child_end < cursor:
+                    segments.append((span, child_end, cursor))
+                frame[2] = index
+                frame[3] = max(child.start_perf, span.start_perf)
+                stack.append([child, child_end, 0, child_end])
+                descended = True
+                break
+            if descended:
+                continue
+            if cursor > span.start_perf:
+                segments.append((span, span.start_perf, cursor))
+            stack.pop()
+
+        segments.reverse()
+        return segments
+
+    def breakdown(self) -> dict[str, Any]:
+        """Critical-path and total time per span name."""
+        segments = self.critical_path()
+        origin = self.root.start_perf
+        total_ms = self.root.duration_ms
+
+        critical_ms: defaultdict[str, float] = defaultdict(float)
+        path: list[dict[str, Any]] = []
+        for span, start, end in segments:
+            duration_ms = (end - start) * 1000
+            critical_ms[span.name] += duration_ms
+            if path and path[-1]["span_id"] == span.span_id:
+                path[-1]["duration_ms"] += duration_ms
+            else:
+                path.append(
+                    {
+                        "span_id": span.span_id,
+                        "name": span.name,
+                        "start_ms": (start - origin) * 1000,
+                        "duration_ms": duration_ms,
+                    }
+                )
+        for item in path:
+            item["start_ms"] = round(item["start_ms"], 2)
+            item["duration_ms"] = round(item["duration_ms"], 2)
+
+        with self._lock:
+            spans = list(self.spans)
+        totals: dict[str, dict[str, float]] = {}
+        for span in spans:
+            entry = totals.setdefault(span.name, {"count": 0, "total_ms": 0.0})
+            entry["count"] += 1
+            entry["total_ms"] += span.duration_ms
+
+        stages = [
+            {
+                "name": name,
+                "critical_ms": round(critical_ms.get(name, 0.0), 2),
+                "critical_share": (
+                    round(critical_ms.get(name, 0.0) / total_ms, 4) if total_ms else 0.0
+                ),
+                "count": int(entry["count"]),
+                "total_ms": round(entry["total_ms"], 2),
+            }
+            for name, entry in totals.items()
+        ]
+        stages.sort(key=lambda s: (-s["critical_ms"], -s["total_ms"]))
+        return {"stages": stages, "critical_path": path}
+
+    def summary(self) -> dict[str, Any]:
+        """Short description for trace listings."""
+        return {
+            "trace_id": self.trace_id,
+            "name": self.root.name,
+            "started_at": self.root.start_time,
+            "duration_ms": round(self.root.duration_ms, 2),
+            "finished": self.finished,
+            "status": self.root.status.value,
+            "attributes": self.root.attributes,
+            "span_count": len(self.spans),
+            "dropped_spans": self.dropped_spans,
+        }
+
+    def to_dict(self, include_spans: bool = False) -> dict[str, Any]:
+        """Serialize with the critical-path breakdown for the debug endpoint."""
+        data = {**self.summary(), **self.breakdown()}
+        if include_spans:
+            with self._lock:
+                spans = list(self.spans)
+            data["spans"] = [s.to_dict(self.root.start_perf) for s in spans]
+        return data
+
+
+class TraceCollector:
+    """Process-wide store of active and recently finished traces."""
+
+    def __init__(
+        self,
+        max_traces: int = MAX_RECENT_TRACES,
+        max_spans_per_trace: int = MAX_SPANS_PER_TRACE,
+    ) -> None:
+        self.enabled = True
+        self.otel_bridge = False
+        self.max_spans_per_trace = max_spans_per_trace
+        self._active: dict[str, TraceRecord] = {}
+        self._recent: deque[TraceRecord] = deque(maxlen=max_traces)
+        self._lock = threading.Lock()
+        self._instrumented: set[int] = set()
+
+    def configure(
+        self,
+        enabled: bool = True,
+        max_traces: int = MAX_RECENT_TRACES,
+        max_spans_per_trace: int = MAX_SPANS_PER_TRACE,
+        otel_bridge: bool = False,
+    ) -> None:
+        """Apply settings (called once at startup)."""
+        self.enabled = enabled
+        self.otel_bridge = otel_bridge
+        self.max_spans_per_trace = max_spans_per_trace
+        with self._lock:
+            if self._recent.maxlen != max_traces:
+                self._recent = deque(self._recent, maxlen=max_traces)
+
+    def start_trace(self, root: Span) -> TraceRecord:
+        """Register a new trace with ``root`` as its first span."""
+        trace = TraceRecord(
+            trace_id=root.trace_id,
+            root=root,
+            collector=self,
+            max_spans=self.max_spans_per_trace,
+        )
+        root.trace = trace
+        trace.spans.append(root)
+        with self._lock:
+            self._active[trace.trace_id] = trace
+        return trace
+
+    def finish_trace(self, trace: TraceRecord) -> None:
+        """Move a trace whose root span ended into the recent buffer."""
+        with self._lock:
+            self._active.pop(trace.trace_id, None)
+            self._recent.append(trace)
+        logger.info(
+            "Trace finished",
+            extra={
+                "trace_id": trace.trace_id,
+                "trace_name": trace.root.name,
+                "duration_ms": round(trace.root.duration_ms, 2),
+                "span_count": len(trace.spans),
+                "dropped_spans": trace.dropped_spans,
+            },
+        )
+
+    def get(self, trace_id: str) -> TraceRecord | None:
+        """Look up an active or recently finished trace."""
+        with self._lock:
+            trace = self._active.get(trace_id)
+            if trace is not None:
+                return trace
+            for recent in self._recent:
+                if recent.trace_id == trace_id:
+                    return recent
+        return None
+
+    def snapshot(self, name: str | None = None) -> dict[str, Any]:
+        """Summaries of active and recent traces, newest first."""
+        with self._lock:
+            active = list(self._active.values())
+            recent = list(reversed(self._recent))
+        if name is not None:
+            active = [t for t in active if t.root.name == name]
+            recent = [t for t in recent if t.root.name == name]
+        return {
+            "enabled": self.enabled,
+            "active": [t.summary() for t in active],
+            "recent": [t.summary() for t in recent],
+        }
+
+    def reset(self) -> None:
+        """Drop all traces."""
+        with self._lock:
+            self._active.clear()
+            self._recent.clear()
+
+    def instrument_sessions(self, session_class: Any) -> None:
+        """Record a span per DB transaction of ``session_class``. Idempotent.
+
+        The span runs from the first statement of a (root) transaction to its
+        commit or rollback and is a child of the span active at that first
+        statement.
+        """
+        if id(session_class) in self._instrumented:
+            return
+        event.listen(session_class, "after_begin", _session_after_begin)
+        event.listen(session_class, "after_commit", _session_after_commit)
+        event.listen(session_class, "after_rollback", _session_after_rollback)
+        event.listen(
+            session_class, "after_transaction_end", _session_after_transaction_end
+        )
+        self._instrumented.add(id(session_class))
+
+
+# Global collector instance (settings are applied at startup)
+trace_collector = TraceCollector()
+
+_current_span: ContextVar[Span | None] = ContextVar("tracing_span", default=None)
+
+
+def get_current_span() -> Span:
+    """The active span, or a non-recording span outside any trace."""
+    return _current_span.get() or INVALID_SPAN
+
+
+def _otel_span(span: Span) -> Any:
+    """Context manager mirroring span into OpenTelemetry, or None."""
+    try:
+        from opentelemetry import trace as otel_trace
+    except ImportError:
+        return None
+    return otel_trace.get_tracer("grove").start_as_current_span(
+        span.name,
+        kind=getattr(otel_trace.SpanKind, span.kind.name),
+        attributes=dict(span.attributes),
+    )
+
+
+class Tracer:
+    """Creates spans (subset of opentelemetry.trace.Tracer)."""
+
+    def __init__(self, name: str, collector: TraceCollector | None = None) -> None:
+        self.name = name
+        self._collector = collector
+
+    @property
+    def collector(self) -> TraceCollector:
+        return self._collector or trace_collector
+
+    def start_span(
+        self,
+        name: str,
+        kind: SpanKind = SpanKind.INTERNAL,
+        attributes: dict[str, Any] | None = None,
+        *,
+        new_trace: bool = False,
+    ) -> Span:
+        """Start a span without making it current.
+
+        The span is a child of the current span. With no current trace it is
+        non-recording unless ``new_trace`` is set, in which case it becomes
+        the root of a new trace.
+        """
+        collector = self.collector
+        parent = _current_span.get()
+        if not collector.enabled:
+            return Span(name=name)
+        if parent is not None and parent.is_recording():
+            trace = parent.trace
+            assert trace is not None
+            if not trace.admit():
+                return Span(name=name)
+            span = Span(
+                name=name,
+                trace_id=trace.trace_id,
+                span_id=uuid.uuid4().hex[:16],
+                parent_id=parent.span_id,
+                kind=kind,
+                trace=trace,
+            )
+            trace.span_started(span)
+        elif new_trace:
+            span = Span(
+                name=name,
+                trace_id=uuid.uuid4().hex,
+                span_id=uuid.uuid4().hex[:16],
+                kind=kind,
+            )
+            collector.start_trace(span)
+        else:
+            return Span(name=name)
+        span.set_attributes(attributes or {})
+        return span
+
+    @contextmanager
+    def start_as_current_span(
+        self,
+        name: str,
+        kind: SpanKind = SpanKind.INTERNAL,
+        attributes: dict[str, Any] | None = None,
+        *,
+        new_trace: bool = False,
+    ) -> Iterator[Span]:
+        """Run the block inside a new current span.
+
+        Exceptions are recorded on the span, which is marked as an error,
+        and re-raised.
+        """
+        span = self.start_span(name, kind, attributes, new_trace=new_trace)
+        if not span.is_recording():
+            try:
+                yield span
+            finally:
+                span.end()
+            return
+
+        token = _current_span.set(span)
+        try:
+            with ExitStack() as stack:
+                if self.collector.otel_bridge:
+                    otel_span = _otel_span(span)
+                    if otel_span is not None:
+                        stack.enter_context(otel_span)
+                yield span
+        except BaseException as exc:
+            span.record_exception(exc)
+            span.set_status(StatusCode.ERROR, f"{type(exc).__name__}: {exc}")
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+
+
+def get_tracer(name: str) -> Tracer:
+    """Return a tracer for an instrumentation scope (usually __name__)."""
+    return Tracer(name)
+
+
+_tracer = get_tracer(__name__)
+
+
+def traced(
+    name: str,
+    *,
+    kind: SpanKind = SpanKind.INTERNAL,
+    record_args: Sequence[str] = (),
+    result_attributes: Callable[[Any], dict[str, Any]] | None = None,
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """Decorator running an async function inside a child span.
+
+    Only records inside an active trace.
+
+    Args:
+        name: Span name.
+        kind: SpanKind.CLIENT for calls to external services.
+        record_args: Argument names whose values become span attributes.
+        result_attributes: Maps the return value to extra span attributes.
+    """
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            parent = _current_span.get()
+            if parent is None or not parent.is_recording():
+                return await func(*args, **kwargs)
+
+            attributes: dict[str, Any] = {}
+            if record_args:
+                bound = signature.bind_partial(*args, **kwargs)
+                attributes = {
+                    arg: bound.arguments.get(arg)
+                    for arg in record_args
+                    if arg in bound.arguments
+                }
+            with _tracer.start_as_current_span(name, kind, attributes) as span:
+                result = await func(*args, **kwargs)
+                if result_attributes is not None:
+                    span.set_attributes(result_attributes(result))
+                return result
+
+        return wrapper
+
+    return decorator
+
+
+def traced_run(
+    name: str,
+    *,
+    record_args: Sequence[str] = ("project_id",),
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """Decorator running an async pipeline entry point as a trace.
+
+    Starts a new trace, or a child span when called inside another run (e.g.
+    link planning triggered by the content pipeline). Arguments named in
+    ``record_args`` (by default ``project_id``) become root attributes.
+    """
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            bound = signature.bind_partial(*args, **kwargs)
+            attributes = {
+                arg: bound.arguments[arg]
+                for arg in record_args
+                if arg in bound.arguments
+            }
+            with _tracer.start_as_current_span(
+                name, attributes=attributes, new_trace=True
+            ):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def trace_stage(name: str, **attributes: Any) -> Any:
+    """Context manager timing one pipeline stage as a child span.
+
+    Usage:
+        with trace_stage("link_planning.select_targets", scope=scope):
+            ...
+    """
+    return _tracer.start_as_current_span(name, attributes=attributes)
+
+
+def _session_after_begin(session: Any, transaction: Any, connection: Any) -> None:
+    if transaction.parent is not None or _SESSION_SPAN_KEY in session.info:
+        return
+    span = _tracer.start_span("db.transaction", SpanKind.CLIENT)
+    if span.is_recording():
+        session.info[_SESSION_SPAN_KEY] = span
+
+
+def _session_after_commit(session: Any) -> None:
+    span = session.info.get(_SESSION_SPAN_KEY)
+    if span is not None:
+        span.set_attribute("db.outcome", "commit")
+
+
+def _session_after_rollback(session: Any) -> None:
+    span = session.info.get(_SESSION_SPAN_KEY)
+    if span is not None:
+        span.set_attribute("db.outcome", "rollback")
+
+
+def _session_after_transaction_end(session: Any, transaction: Any) -> None:
+    if transaction.parent is not None:
+        return
+    span = session.info.pop(_SESSION_SPAN_KEY, None)
+    if span is not None:
+        span.end()
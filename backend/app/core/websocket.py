@@ -12,6 +12,14 @@ ERROR LOGGING REQUIREMENTS:
 - Log message send/receive at DEBUG level
 - Log errors at ERROR level with full context
 - Log rate limit hits at WARNING level
+
+OUTBOUND DELIVERY:
+- Every connection has a bounded OutboundQueue drained by its own writer task
+- Broadcasts only enqueue, so one slow or stalled browser never delays other
+  subscribers or the pipeline coroutine doing the broadcast
+- Progress messages carry a coalesce key: a newer state replaces a queued one
+- When a queue is full the oldest coalescable message is dropped; if nothing
+  can be dropped the client is too slow and is disconnected
 """
 
 import asyncio
@@ -19,6 +27,7 @@ import contextlib
 import json
 import time
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -39,6 +48,70 @@ class ConnectionState(Enum):
     CLOSED = "closed"
 
 
+class OutboundQueue:
+    """Bounded per-connection send queue with coalescing.
+
+    Messages enqueued with a coalesce_key replace any still-queued message
+    with the same key in place (keeping its position), so only the latest
+    state per key is delivered. When full, the oldest coalescable message is
+    dropped to make room; put() returns False if nothing could be dropped.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._items: deque[list[Any]] = deque()
+        self._keyed: dict[str, list[Any]] = {}
+        self._not_empty = asyncio.Event()
+        self.enqueued = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.max_depth = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put(self, message: dict[str, Any], coalesce_key: str | None = None) -> bool:
+        """Enqueue a message without blocking. Returns False on overflow."""
+        if coalesce_key is not None:
+            entry = self._keyed.get(coalesce_key)
+            if entry is not None:
+                entry[1] = message
+                self.coalesced += 1
+                return True
+
+        if len(self._items) >= self._maxsize and not self._drop_oldest_coalescable():
+            self.dropped += 1
+            return False
+
+        entry = [coalesce_key, message]
+        self._items.append(entry)
+        if coalesce_key is not None:
+            self._keyed[coalesce_key] = entry
+        self.enqueued += 1
+        self.max_depth = max(self.max_depth, len(self._items))
+        self._not_empty.set()
+        return True
+
+    async def get(self) -> dict[str, Any]:
+        """Wait for and return the next message."""
+        while not self._items:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        coalesce_key, message = self._items.popleft()
+        if coalesce_key is not None:
+            self._keyed.pop(coalesce_key, None)
+        return message  # type: ignore[no-any-return]
+
+    def _drop_oldest_coalescable(self) -> bool:
+        for entry in self._items:
+            if entry[0] is not None:
+                self._items.remove(entry)
+                del self._keyed[entry[0]]
+                self.dropped += 1
+                return True
+        return False
+
+
 @dataclass
 class WebSocketConnection:
     """Wrapper for WebSocket connection with metadata."""
@@ -50,6 +123,9 @@ class WebSocketConnection:
     last_ping: float = field(default_factory=time.time)
     last_pong: float = field(default_factory=time.time)
     state: ConnectionState = ConnectionState.CONNECTING
+    outbox: OutboundQueue | None = None
+    writer_task: "asyncio.Task[None] | None" = None
+    messages_sent: int = 0
 
     def subscribe(self, project_id: str) -> None:
         """Subscribe to updates for a project."""
@@ -208,6 +284,16 @@ class WebSocketLogger:
             },
         )
 
+    def send_queue_overflow(self, connection_id: str, queue_depth: int) -> None:
+        """Log a client whose outbound queue overflowed (too slow to keep up)."""
+        self.logger.warning(
+            "WebSocket send queue overflow, disconnecting slow client",
+            extra={
+                "connection_id": connection_id,
+                "queue_depth": queue_depth,
+            },
+        )
+
     def progress_update_no_subscribers(self, project_id: str, crawl_id: str) -> None:
         """Log progress update with no subscribers."""
         self.logger.debug(
@@ -237,6 +323,12 @@ class ConnectionManager:
     HEARTBEAT_INTERVAL = 30
     # Timeout before considering connection dead
     HEARTBEAT_TIMEOUT = 90
+    # Maximum queued outbound messages per connection
+    OUTBOUND_QUEUE_SIZE = 100
+    # Seconds a single send may block before the client is considered stalled
+    SEND_TIMEOUT = 10.0
+    # Seconds to wait for a close handshake on disconnect
+    CLOSE_TIMEOUT = 5.0
 
     def __init__(self) -> None:
         """Initialize connection manager."""
@@ -244,6 +336,8 @@ class ConnectionManager:
         self._project_connections: dict[str, set[str]] = {}
         self._heartbeat_task: asyncio.Task[None] | None = None
         self._running = False
+        self._overflow_disconnects = 0
+        self._send_failures = 0
         logger.debug("ConnectionManager initialized")
 
     @property
@@ -303,18 +397,15 @@ class ConnectionManager:
                 stale_connections.append(conn_id)
                 continue
 
-            # Send ping
-            try:
-                await conn.websocket.send_json(
-                    {
-                        "type": "ping",
-                        "timestamp": current_time,
-                    }
-                )
+            # Queue ping (coalesced: a stalled client never accumulates pings)
+            if self._enqueue(
+                conn,
+                {"type": "ping", "timestamp": current_time},
+                coalesce_key="heartbeat",
+            ):
                 conn.last_ping = current_time
                 ws_logger.heartbeat_sent(conn_id)
-            except Exception as e:
-                ws_logger.connection_error(conn_id, e, "heartbeat_send")
+            else:
                 stale_connections.append(conn_id)
 
         # Clean up stale connections
@@ -338,14 +429,16 @@ class ConnectionManager:
         conn = WebSocketConnection(
             websocket=websocket,
             connection_id=connection_id,
+            outbox=OutboundQueue(self.OUTBOUND_QUEUE_SIZE),
         )
         conn.state = ConnectionState.CONNECTED
 
         self._connections[connection_id] = conn
+        conn.writer_task = asyncio.create_task(self._writer_loop(conn))
         ws_logger.connection_opened(connection_id, client_host)
 
         # Send welcome message with reconnection guidance
-        await self._send_message(
+        self._enqueue(
             conn,
             {
                 "type": "connected",
@@ -385,12 +478,24 @@ class ConnectionManager:
         for project_id in list(conn.project_ids):
             self._unsubscribe_connection(connection_id, project_id)
 
-        # Close the WebSocket (suppress errors if already closed)
+        # Remove before awaiting so concurrent disconnects are no-ops
+        del self._connections[connection_id]
+
+        # Stop the writer (unless we are being called from it)
+        writer = conn.writer_task
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await writer
+
+        # Close the WebSocket (suppress errors if already closed or stalled)
         with contextlib.suppress(Exception):
-            await conn.websocket.close(code=code, reason=reason)
+            await asyncio.wait_for(
+                conn.websocket.close(code=code, reason=reason),
+                timeout=self.CLOSE_TIMEOUT,
+            )
 
         conn.state = ConnectionState.CLOSED
-        del self._connections[connection_id]
         ws_logger.connection_closed(connection_id, reason, code)
 
     def _subscribe_connection(self, connection_id: str, project_id: str) -> None:
@@ -437,7 +542,10 @@ class ConnectionManager:
 
         try:
             message_str = json.dumps(message)
-            await conn.websocket.send_text(message_str)
+            await asyncio.wait_for(
+                conn.websocket.send_text(message_str), timeout=self.SEND_TIMEOUT
+            )
+            conn.messages_sent += 1
             ws_logger.message_sent(
                 conn.connection_id,
                 message.get("type", "unknown"),
@@ -448,6 +556,115 @@ class ConnectionManager:
             ws_logger.connection_error(conn.connection_id, e, "send_message")
             return False
 
+    def _enqueue(
+        self,
+        conn: WebSocketConnection,
+        message: dict[str, Any],
+        coalesce_key: str | None = None,
+    ) -> bool:
+        """Queue a message for the connection's writer task (never blocks).
+
+        Returns:
+            False if the connection is not open or its queue overflowed
+        """
+        if conn.state != ConnectionState.CONNECTED or conn.outbox is None:
+            return False
+        if conn.outbox.put(message, coalesce_key):
+            return True
+        self._overflow_disconnects += 1
+        ws_logger.send_queue_overflow(conn.connection_id, len(conn.outbox))
+        return False
+
+    async def _writer_loop(self, conn: WebSocketConnection) -> None:
+        """Drain a connection's outbound queue, one send at a time."""
+        assert conn.outbox is not None
+        while conn.state == ConnectionState.CONNECTED:
+            message = await conn.outbox.get()
+            if not await self._send_message(conn, message):
+                self._send_failures += 1
+                for project_id in list(conn.project_ids):
+                    ws_logger.broadcast_failure(
+                        conn.connection_id, project_id, message.get("type", "unknown")
+                    )
+                await self.disconnect(conn.connection_id, reason="send_failed")
+                return
+
+    async def flush(self, timeout: float = 2.0) -> None:
+        """Wait (bounded) for all outbound queues to drain."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if not any(
+                conn.outbox is not None and len(conn.outbox) > 0
+                for conn in self._connections.values()
+            ):
+                return
+            await asyncio.sleep(0.01)
+
+    def backpressure_stats(self) -> dict[str, Any]:
+        """Outbound queue metrics for health/debug endpoints."""
+        per_connection: list[dict[str, Any]] = []
+        totals = {"enqueued": 0, "coalesced": 0, "dropped": 0, "sent": 0}
+        for conn in self._connections.values():
+            outbox = conn.outbox
+            if outbox is None:
+                continue
+            totals["enqueued"] += outbox.enqueued
+            totals["coalesced"] += outbox.coalesced
+            totals["dropped"] += outbox.dropped
+            totals["sent"] += conn.messages_sent
+            per_connection.append(
+                {
+                    "connection_id": conn.connection_id,
+                    "queue_depth": len(outbox),
+                    "max_queue_depth": outbox.max_depth,
+                    "enqueued": outbox.enqueued,
+                    "coalesced": outbox.coalesced,
+                    "dropped": outbox.dropped,
+                    "sent": conn.messages_sent,
+                    "project_count": len(conn.project_ids),
+                }
+            )
+        return {
+            "connection_count": len(self._connections),
+            "queue_capacity": self.OUTBOUND_QUEUE_SIZE,
+            "overflow_disconnects": self._overflow_disconnects,
+            "send_failures": self._send_failures,
+            **totals,
+            "connections": per_connection,
+        }
+
+    async def _fan_out(
+        self,
+        project_id: str,
+        message: dict[str, Any],
+        coalesce_key: str | None = None,
+    ) -> int:
+        """Enqueue a message for every subscriber of a project.
+
+        Enqueues are O(1) per subscriber; actual sends happen in each
+        connection's writer task. Subscribers whose queue overflowed are
+        disconnected.
+        """
+        queued_count = 0
+        overflowed: list[str] = []
+
+        for conn_id in list(self._project_connections.get(project_id, ())):
+            conn = self._connections.get(conn_id)
+            if conn is None:
+                continue
+            if self._enqueue(conn, message, coalesce_key):
+                queued_count += 1
+            else:
+                ws_logger.broadcast_failure(
+                    conn_id, project_id, message.get("type", "unknown")
+                )
+                overflowed.append(conn_id)
+
+        for conn_id in overflowed:
+            await self.disconnect(conn_id, reason="send_queue_overflow", code=1013)
+
+        return queued_count
+
     async def handle_message(
         self, conn: WebSocketConnection, raw_message: str
     ) -> dict[str, Any] | None:
@@ -539,7 +756,7 @@ class ConnectionManager:
             data: Update data to send
 
         Returns:
-            Number of connections the message was sent to
+            Number of connections the message was queued for
         """
         connection_ids = self._project_connections.get(project_id, set())
         if not connection_ids:
@@ -553,26 +770,10 @@ class ConnectionManager:
             "timestamp": time.time(),
         }
 
-        sent_count = 0
-        failed_connections: list[str] = []
+        queued_count = await self._fan_out(project_id, message)
 
-        for conn_id in connection_ids:
-            conn = self._connections.get(conn_id)
-            if conn:
-                success = await self._send_message(conn, message)
-                if success:
-                    sent_count += 1
-                else:
-                    # Log broadcast failure per-client
-                    ws_logger.broadcast_failure(conn_id, project_id, event_type)
-                    failed_connections.append(conn_id)
-
-        # Clean up failed connections
-        for conn_id in failed_connections:
-            await self.disconnect(conn_id, reason="send_failed")
-
-        ws_logger.broadcast_sent(project_id, event_type, sent_count)
-        return sent_count
+        ws_logger.broadcast_sent(project_id, event_type, queued_count)
+        return queued_count
 
     async def broadcast_progress_update(
         self,
@@ -588,7 +789,11 @@ class ConnectionManager:
             progress: Progress data to send
 
         Returns:
-            Number of connections the message was sent to
+            Number of connections the message was queued for
+
+        Progress messages are coalesced per (project_id, crawl_id): if a
+        subscriber still has an undelivered update for the same crawl, it is
+        replaced by this newer state instead of queueing behind it.
 
         ERROR LOGGING REQUIREMENTS:
         - Log broadcast failures per-client
@@ -607,26 +812,12 @@ class ConnectionManager:
             "timestamp": time.time(),
         }
 
-        sent_count = 0
-        failed_connections: list[str] = []
+        queued_count = await self._fan_out(
+            project_id, message, coalesce_key=f"progress:{project_id}:{crawl_id}"
+        )
 
-        for conn_id in connection_ids:
-            conn = self._connections.get(conn_id)
-            if conn:
-                success = await self._send_message(conn, message)
-                if success:
-                    sent_count += 1
-                else:
-                    # Log broadcast failure per-client
-                    ws_logger.broadcast_failure(conn_id, project_id, "progress_update")
-                    failed_connections.append(conn_id)
-
-        # Clean up failed connections
-        for conn_id in failed_connections:
-            await self.disconnect(conn_id, reason="send_failed")
-
-        ws_logger.progress_broadcast_sent(project_id, crawl_id, sent_count, progress)
-        return sent_count
+        ws_logger.progress_broadcast_sent(project_id, crawl_id, queued_count, progress)
+        return queued_count
 
     async def broadcast_shutdown(self, reason: str = "server_shutdown") -> None:
         """Broadcast shutdown notice to all connections.
@@ -646,8 +837,10 @@ class ConnectionManager:
         }
 
         for _conn_id, conn in list(self._connections.items()):
-            with contextlib.suppress(Exception):
-                await self._send_message(conn, message)
+            self._enqueue(conn, message)
+
+        # Give writer tasks a bounded window to deliver the notice
+        await self.flush()
 
         logger.info(
             "Shutdown broadcast sent",
@@ -668,7 +861,7 @@ class ConnectionManager:
                     raw_message = await websocket.receive_text()
                     response = await self.handle_message(conn, raw_message)
                     if response:
-                        await self._send_message(conn, response)
+                        self._enqueue(conn, response)
                 except WebSocketDisconnect as e:
                     ws_logger.connection_closed(
                         conn.connection_id,
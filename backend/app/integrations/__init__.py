@@ -6,6 +6,7 @@ They abstract the details of external service protocols.
 
 from app.integrations.claude import (
     DEFAULT_CATEGORIES,
+    BatchRequest,
     CategorizationResult,
     ClaudeAuthError,
     ClaudeCircuitOpenError,
@@ -100,6 +101,7 @@ __all__ = [
     "close_claude",
     "get_claude",
     # Claude Data classes
+    "BatchRequest",
     "CategorizationResult",
     "CompletionResult",
     "DEFAULT_CATEGORIES",
@@ -8,6 +8,7 @@ Features:
 - Handles timeouts, rate limits (429), auth failures (401/403)
 - Masks API keys in all logs
 - Token usage logging for quota tracking
+- Message Batches mode (complete_batch) for bulk, non-urgent work
 
 ERROR LOGGING REQUIREMENTS:
 - Log all outbound API calls with endpoint, method, timing
@@ -26,10 +27,15 @@ RAILWAY DEPLOYMENT REQUIREMENTS:
 """
 
 import asyncio
+import inspect
 import json
+import math
 import os
 import time
+from collections.abc import Awaitable, Callable, Sequence
 from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from typing import Any
 
 import httpx
@@ -37,6 +43,7 @@ import httpx
 from app.core.circuit_breaker import CircuitBreaker, CircuitBreakerConfig
 from app.core.config import get_settings
 from app.core.logging import claude_logger, get_logger
+from app.core.tracing import SpanKind, traced
 
 logger = get_logger(__name__)
 
@@ -44,6 +51,10 @@ logger = get_logger(__name__)
 ANTHROPIC_API_URL = "https://api.anthropic.com"
 ANTHROPIC_API_VERSION = "2023-06-01"
 
+# Message Batches: requests per submitted batch (the API allows 100,000 and
+# 256 MB; smaller batches keep request bodies reasonable)
+MESSAGE_BATCH_MAX_REQUESTS = 10_000
+
 
 @dataclass
 class CategorizationResult:
@@ -77,6 +88,58 @@ class CompletionResult:
     request_id: str | None = None
 
 
+def _completion_span_attributes(result: CompletionResult) -> dict[str, Any]:
+    """Span attributes for a finished completion."""
+    return {
+        "success": result.success,
+        "input_tokens": result.input_tokens,
+        "output_tokens": result.output_tokens,
+        "status_code": result.status_code,
+    }
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After header (delay-seconds or HTTP-date).
+
+    Returns None when the header is missing or malformed.
+    """
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=UTC)
+        seconds = (retry_at - datetime.now(UTC)).total_seconds()
+    if not math.isfinite(seconds):
+        return None
+    return max(seconds, 0.0)
+
+
+@dataclass
+class BatchRequest:
+    """One completion request in a Message Batches submission.
+
+    custom_id identifies the result and must be unique within the batch
+    (1-64 characters: letters, digits, '-' and '_').
+    """
+
+    custom_id: str
+    user_prompt: str
+    system_prompt: str | None = None
+    max_tokens: int | None = None
+    temperature: float = 0.0
+    model: str | None = None
+
+
+# Called with (custom_id, result) as each batch result is read
+BatchResultCallback = Callable[[str, CompletionResult], Awaitable[None] | None]
+
+
 class ClaudeError(Exception):
     """Base exception for Claude API errors."""
 
@@ -267,6 +330,12 @@ class ClaudeClient:
             self._client = None
         logger.info("Claude client closed")
 
+    @traced(
+        "claude.complete",
+        kind=SpanKind.CLIENT,
+        record_args=("model", "max_tokens"),
+        result_attributes=_completion_span_attributes,
+    )
     async def complete(
         self,
         user_prompt: str,
@@ -313,15 +382,9 @@ class ClaudeClient:
         request_id: str | None = None
 
         # Build request body
-        effective_model = model or self._model
-        request_body: dict[str, Any] = {
-            "model": effective_model,
-            "max_tokens": max_tokens or self._max_tokens,
-            "temperature": temperature,
-            "messages": [{"role": "user", "content": user_prompt}],
-        }
-        if system_prompt:
-            request_body["system"] = system_prompt
+        request_body = self._message_params(
+            user_prompt, system_prompt, max_tokens, temperature, model
+        )
 
         effective_retries = (
             max_retries if max_retries is not None else self._max_retries
@@ -588,6 +651,319 @@ class ClaudeClient:
             request_id=request_id,
         )
 
+    def _message_params(
+        self,
+        user_prompt: str,
+        system_prompt: str | None,
+        max_tokens: int | None,
+        temperature: float,
+        model: str | None,
+    ) -> dict[str, Any]:
+        """Build the Messages API request body."""
+        params: dict[str, Any] = {
+            "model": model or self._model,
+            "max_tokens": max_tokens or self._max_tokens,
+            "temperature": temperature,
+            "messages": [{"role": "user", "content": user_prompt}],
+        }
+        if system_prompt:
+            params["system"] = system_prompt
+        return params
+
+    async def _batch_api_request(
+        self, method: str, url: str, **kwargs: Any
+    ) -> httpx.Response:
+        """Send a Message Batches API request.
+
+        Retries rate limits, server errors and transport errors with the
+        client's retry settings. Batch calls bypass the circuit breaker:
+        they are few and slow, and must not trip it for interactive calls.
+
+        Raises:
+            ClaudeAuthError: On 401/403.
+            ClaudeRateLimitError: When still rate limited after all retries.
+            ClaudeError: On other failures.
+        """
+        client = await self._get_client()
+        for attempt in range(self._max_retries + 1):
+            last_attempt = attempt == self._max_retries
+            try:
+                response = await client.request(method, url, **kwargs)
+            except httpx.RequestError as e:
+                if last_attempt:
+                    raise ClaudeError(f"Batch request failed: {e}") from e
+                await asyncio.sleep(self._retry_delay * (2**attempt))
+                continue
+
+            request_id = response.headers.get("request-id")
+            status = response.status_code
+            if (status == 429 or status >= 500) and not last_attempt:
+                delay = _parse_retry_after(response.headers.get("retry-after"))
+                if delay is None:
+                    delay = self._retry_delay * (2**attempt)
+                logger.warning(
+                    "Claude batch request retrying",
+                    extra={
+                        "url": url,
+                        "status_code": status,
+                        "attempt": attempt + 1,
+                        "delay_seconds": delay,
+                        "request_id": request_id,
+                    },
+                )
+                await asyncio.sleep(delay)
+                continue
+            if status in (401, 403):
+                claude_logger.auth_failure(status)
+                raise ClaudeAuthError(
+                    f"Authentication failed ({status})",
+                    status_code=status,
+                    request_id=request_id,
+                )
+            if status == 429:
+                raise ClaudeRateLimitError("Rate limit exceeded", request_id=request_id)
+            if status >= 400:
+                raise ClaudeError(
+                    f"Batch API error ({status})",
+                    status_code=status,
+                    response_body=response.json() if response.content else None,
+                    request_id=request_id,
+                )
+            return response
+        raise ClaudeError("Batch request failed after all retries")
+
+    async def submit_batch(self, requests: Sequence[BatchRequest]) -> str:
+        """Submit requests as one Message Batch.
+
+        Returns:
+            The batch ID, for wait_for_batch and fetch_batch_results.
+        """
+        body = {
+            "requests": [
+                {
+                    "custom_id": request.custom_id,
+                    "params": self._message_params(
+                        request.user_prompt,
+                        request.system_prompt,
+                        request.max_tokens,
+                        request.temperature,
+                        request.model,
+                    ),
+                }
+                for request in requests
+            ]
+        }
+        response = await self._batch_api_request(
+            "POST", "/v1/messages/batches", json=body
+        )
+        batch_id: str = response.json()["id"]
+        logger.info(
+            "Claude message batch submitted",
+            extra={"batch_id": batch_id, "request_count": len(requests)},
+        )
+        return batch_id
+
+    async def wait_for_batch(
+        self,
+        batch_id: str,
+        poll_interval: float | None = None,
+        max_wait: float | None = None,
+    ) -> dict[str, Any]:
+        """Poll a batch until processing has ended.
+
+        Returns:
+            The final batch object (includes request_counts and results_url).
+
+        Raises:
+            ClaudeTimeoutError: If the batch has not ended within max_wait.
+        """
+        settings = get_settings()
+        interval = (
+            poll_interval
+            if poll_interval is not None
+            else settings.claude_batch_poll_interval
+        )
+        deadline = time.monotonic() + (
+            max_wait if max_wait is not None else settings.claude_batch_max_wait
+        )
+        while True:
+            response = await self._batch_api_request(
+                "GET", f"/v1/messages/batches/{batch_id}"
+            )
+            batch: dict[str, Any] = response.json()
+            if batch.get("processing_status") == "ended":
+                logger.info(
+                    "Claude message batch ended",
+                    extra={
+                        "batch_id": batch_id,
+                        "request_counts": batch.get("request_counts"),
+                    },
+                )
+                return batch
+            if time.monotonic() + interval > deadline:
+                raise ClaudeTimeoutError(f"Message batch {batch_id} did not finish")
+            await asyncio.sleep(interval)
+
+    async def cancel_batch(self, batch_id: str) -> None:
+        """Ask the API to cancel a batch (requests already done still count)."""
+        await self._batch_api_request("POST", f"/v1/messages/batches/{batch_id}/cancel")
+        logger.info("Claude message batch canceled", extra={"batch_id": batch_id})
+
+    async def fetch_batch_results(
+        self, batch: dict[str, Any]
+    ) -> list[tuple[str, CompletionResult]]:
+        """Download and parse the results of an ended batch.
+
+        Returns:
+            (custom_id, CompletionResult) pairs in the order the API lists them.
+        """
+        results_url = batch.get("results_url") or (
+            f"/v1/messages/batches/{batch['id']}/results"
+        )
+        response = await self._batch_api_request("GET", results_url)
+        results: list[tuple[str, CompletionResult]] = []
+        for line in response.text.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            results.append(
+                (entry["custom_id"], self._batch_entry_result(entry.get("result", {})))
+            )
+        return results
+
+    def _batch_entry_result(self, result: dict[str, Any]) -> CompletionResult:
+        """Convert one batch result object into a CompletionResult."""
+        result_type = result.get("type")
+        if result_type == "succeeded":
+            message = result.get("message", {})
+            content = message.get("content", [])
+            usage = message.get("usage", {})
+            input_tokens = usage.get("input_tokens")
+            output_tokens = usage.get("output_tokens")
+            model = message.get("model", self._model)
+            if input_tokens and output_tokens:
+                claude_logger.token_usage(
+                    model,
+                    input_tokens,
+                    output_tokens,
+                    cache_creation_input_tokens=usage.get(
+                        "cache_creation_input_tokens"
+                    ),
+                    cache_read_input_tokens=usage.get("cache_read_input_tokens"),
+                )
+            return CompletionResult(
+                success=True,
+                text=content[0].get("text", "") if content else "",
+                stop_reason=message.get("stop_reason"),
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                request_id=message.get("id"),
+            )
+        if result_type == "errored":
+            error = result.get("error", {})
+            # Result errors wrap the API error object: {"type": "error", "error": {...}}
+            detail = error.get("error", error)
+            return CompletionResult(
+                success=False,
+                error=f"Batch request errored: {detail.get('message', detail)}",
+            )
+        return CompletionResult(success=False, error=f"Batch request {result_type}")
+
+    @traced(
+        "claude.complete_batch",
+        kind=SpanKind.CLIENT,
+        result_attributes=lambda results: {"requests": len(results)},
+    )
+    async def complete_batch(
+        self,
+        requests: Sequence[BatchRequest],
+        on_result: BatchResultCallback | None = None,
+        *,
+        poll_interval: float | None = None,
+        max_wait: float | None = None,
+    ) -> dict[str, CompletionResult]:
+        """Run many completions through the Message Batches API.
+
+        Batches are processed asynchronously by the API at a lower price and
+        outside the interactive rate limits, typically within minutes and
+        at most within 24 hours. Use for bulk work nobody is waiting on.
+
+        Requests are split into batches of MESSAGE_BATCH_MAX_REQUESTS, all
+        submitted up front and polled concurrently. Every request gets a
+        result: API-side failures, expiry, cancellation and batches that do
+        not end within max_wait (they are canceled) become unsuccessful
+        CompletionResults, mirroring complete().
+
+        Args:
+            requests: Requests with unique custom_ids.
+            on_result: Optional callback (sync or async) invoked with
+                (custom_id, result) as each result is read.
+            poll_interval: Seconds between status polls (default from settings).
+            max_wait: Seconds to wait per batch (default from settings).
+
+        Returns:
+            Dict mapping custom_id to CompletionResult.
+        """
+        results: dict[str, CompletionResult] = {}
+
+        async def deliver(custom_id: str, result: CompletionResult) -> None:
+            results[custom_id] = result
+            if on_result is not None:
+                outcome = on_result(custom_id, result)
+                if inspect.isawaitable(outcome):
+                    await outcome
+
+        async def fail_all(chunk: Sequence[BatchRequest], error: str) -> None:
+            for request in chunk:
+                if request.custom_id not in results:
+                    await deliver(
+                        request.custom_id, CompletionResult(success=False, error=error)
+                    )
+
+        if not requests:
+            return results
+        if not self._available:
+            await fail_all(requests, "Claude not configured (missing API key)")
+            return results
+
+        async def run_chunk(chunk: Sequence[BatchRequest]) -> None:
+            batch_id: str | None = None
+            try:
+                batch_id = await self.submit_batch(chunk)
+                batch = await self.wait_for_batch(batch_id, poll_interval, max_wait)
+                expected = {request.custom_id for request in chunk}
+                for custom_id, result in await self.fetch_batch_results(batch):
+                    if custom_id in expected:
+                        await deliver(custom_id, result)
+                await fail_all(chunk, "No result returned for batch request")
+            except ClaudeTimeoutError as e:
+                logger.warning(
+                    "Claude message batch timed out, canceling",
+                    extra={"batch_id": batch_id, "error": str(e)},
+                )
+                if batch_id is not None:
+                    try:
+                        await self.cancel_batch(batch_id)
+                    except ClaudeError:
+                        logger.warning(
+                            "Failed to cancel message batch",
+                            extra={"batch_id": batch_id},
+                        )
+                await fail_all(chunk, str(e))
+            except ClaudeError as e:
+                logger.error(
+                    "Claude message batch failed",
+                    extra={"batch_id": batch_id, "error": str(e)},
+                )
+                await fail_all(chunk, str(e))
+
+        chunks = [
+            requests[start : start + MESSAGE_BATCH_MAX_REQUESTS]
+            for start in range(0, len(requests), MESSAGE_BATCH_MAX_REQUESTS)
+        ]
+        await asyncio.gather(*(run_chunk(chunk) for chunk in chunks))
+        return results
+
     async def categorize_page(
         self,
         url: str,
@@ -34,6 +34,7 @@ import httpx
 from app.core.circuit_breaker import CircuitBreaker, CircuitBreakerConfig
 from app.core.config import get_settings
 from app.core.logging import crawl4ai_logger, get_logger
+from app.core.tracing import SpanKind, traced
 
 logger = get_logger(__name__)
 
@@ -328,6 +329,7 @@ class Crawl4AIClient:
             self._client = None
         logger.info("Crawl4AI client closed")
 
+    @traced("crawl4ai.request", kind=SpanKind.CLIENT, record_args=("endpoint",))
     async def _request(
         self,
         method: str,
@@ -45,6 +45,7 @@ import httpx
 from app.core.circuit_breaker import CircuitBreaker, CircuitBreakerConfig
 from app.core.config import get_settings
 from app.core.logging import dataforseo_logger, get_logger
+from app.core.tracing import SpanKind, traced
 
 logger = get_logger(__name__)
 
@@ -278,6 +279,7 @@ class DataForSEOClient:
             self._client = None
         logger.info("DataForSEO client closed")
 
+    @traced("dataforseo.request", kind=SpanKind.CLIENT, record_args=("endpoint",))
     async def _make_request(
         self,
         endpoint: str,
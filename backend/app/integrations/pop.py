@@ -7,7 +7,7 @@ Features:
 - Request/response logging per requirements
 - Handles timeouts, rate limits (429), auth failures (401/403)
 - Masks API credentials in all logs
-- Task polling for async operations
+- Task polling for async operations (multiplexed through one shared poller)
 
 PageOptimizer Pro provides:
 - Content briefs with keyword targets
@@ -39,9 +39,11 @@ API ENDPOINTS:
 """
 
 import asyncio
+import contextlib
 import hashlib
 import time
 import uuid
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -51,6 +53,7 @@ import httpx
 from app.core.circuit_breaker import CircuitBreaker, CircuitBreakerConfig
 from app.core.config import get_settings
 from app.core.logging import get_logger
+from app.core.tracing import SpanKind, traced
 
 logger = get_logger(__name__)
 
@@ -126,6 +129,8 @@ class POPTaskResult:
     error: str | None = None
     duration_ms: float = 0.0
     request_id: str | None = None
+    rate_limited: bool = False
+    retry_after: float | None = None
 
 
 # Maximum response body size to log (5KB)
@@ -164,6 +169,316 @@ def _truncate_for_logging(data: Any, max_size: int = MAX_RESPONSE_LOG_SIZE) -> A
         return f"{str_repr[:max_size]}... [truncated]"
 
 
+@dataclass
+class _PendingTask:
+    """Book-keeping for one task tracked by POPTaskPoller."""
+
+    task_id: str
+    future: "asyncio.Future[POPTaskResult]"
+    interval: float
+    deadline: float
+    timeout: float
+    started_at: float
+    next_poll_at: float
+    poll_count: int = 0
+
+
+class POPTaskPoller:
+    """Single shared poller that multiplexes all outstanding POP tasks.
+
+    Instead of one ``while True`` loop per task, callers register a task ID
+    and await a future. One runner coroutine polls every due task subject to:
+
+    - Adaptive backoff: each still-pending poll multiplies the task's
+      interval by ``backoff_factor`` up to ``max_interval``
+    - A global request budget (token bucket, ``requests_per_second``)
+    - A cap on in-flight status requests (``max_concurrency``)
+    - A global pause when POP answers 429, honouring Retry-After
+
+    The runner starts lazily on the first registration and exits once no
+    tasks remain, so it never outlives the event loop that created it.
+    """
+
+    def __init__(
+        self,
+        fetch_status: Callable[[str], Awaitable[POPTaskResult]],
+        poll_interval: float,
+        timeout: float,
+        max_interval: float,
+        backoff_factor: float,
+        requests_per_second: float,
+        max_concurrency: int,
+    ) -> None:
+        self._fetch_status = fetch_status
+        self._poll_interval = poll_interval
+        self._timeout = timeout
+        self._max_interval = max(max_interval, poll_interval)
+        self._backoff_factor = max(backoff_factor, 1.0)
+        self._requests_per_second = requests_per_second
+        self._max_concurrency = max(1, max_concurrency)
+        self._pending: dict[str, _PendingTask] = {}
+        self._runner: asyncio.Task[None] | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._tokens = max(1.0, requests_per_second)
+        self._tokens_updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._total_polls = 0
+        self._rate_limited_polls = 0
+
+    @property
+    def outstanding(self) -> int:
+        """Number of tasks currently awaiting completion."""
+        return len(self._pending)
+
+    def stats(self) -> dict[str, Any]:
+        """Poller counters for health/debug output."""
+        return {
+            "outstanding_tasks": len(self._pending),
+            "total_polls": self._total_polls,
+            "rate_limited_polls": self._rate_limited_polls,
+            "requests_per_second": self._requests_per_second,
+            "max_concurrency": self._max_concurrency,
+        }
+
+    async def wait_for(
+        self,
+        task_id: str,
+        poll_interval: float | None = None,
+        timeout: float | None = None,
+    ) -> POPTaskResult:
+        """Register a task (or join an existing registration) and await it.
+
+        Raises:
+            POPTimeoutError: If the task does not reach a terminal state in time.
+        """
+        pending = self._pending.get(task_id)
+        if pending is None:
+            now = time.monotonic()
+            interval = poll_interval or self._poll_interval
+            task_timeout = timeout or self._timeout
+            pending = _PendingTask(
+                task_id=task_id,
+                future=asyncio.get_running_loop().create_future(),
+                interval=interval,
+                deadline=now + task_timeout,
+                timeout=task_timeout,
+                started_at=now,
+                next_poll_at=now,
+            )
+            self._pending[task_id] = pending
+            self._ensure_runner()
+
+        # shield: one waiter being cancelled must not cancel the shared future
+        return await asyncio.shield(pending.future)
+
+    async def close(self) -> None:
+        """Stop the runner and fail any outstanding waiters."""
+        if self._runner is not None and not self._runner.done():
+            self._runner.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._runner
+        self._runner = None
+        for pending in self._pending.values():
+            if not pending.future.done():
+                pending.future.set_exception(
+                    POPError("POP poller closed", request_id=pending.task_id)
+                )
+        self._pending.clear()
+
+    def _ensure_runner(self) -> None:
+        if self._runner is None or self._runner.done():
+            self._wakeup = asyncio.Event()
+            self._runner = asyncio.create_task(self._run())
+        elif self._wakeup is not None:
+            self._wakeup.set()
+
+    def _take_token(self, now: float) -> bool:
+        """Token bucket for the global poll budget."""
+        if self._requests_per_second <= 0:
+            return True
+        capacity = max(1.0, self._requests_per_second)
+        self._tokens = min(
+            capacity,
+            self._tokens + (now - self._tokens_updated_at) * self._requests_per_second,
+        )
+        self._tokens_updated_at = now
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+
+    def _expire(self, now: float) -> None:
+        for task_id, pending in list(self._pending.items()):
+            if now < pending.deadline:
+                continue
+            elapsed = now - pending.started_at
+            logger.error(
+                "POP task polling timed out",
+                extra={
+                    "task_id": task_id,
+                    "elapsed_seconds": round(elapsed, 2),
+                    "configured_timeout_seconds": pending.timeout,
+                    "poll_count": pending.poll_count,
+                },
+            )
+            del self._pending[task_id]
+            if not pending.future.done():
+                pending.future.set_exception(
+                    POPTimeoutError(
+                        f"Task {task_id} timed out after {elapsed:.1f}s",
+                        request_id=task_id,
+                    )
+                )
+
+    async def _run(self) -> None:
+        try:
+            await self._run_loop()
+        except Exception as e:
+            logger.error(
+                "POP task poller crashed",
+                extra={"error": str(e), "outstanding_tasks": len(self._pending)},
+                exc_info=True,
+            )
+            for pending in self._pending.values():
+                if not pending.future.done():
+                    pending.future.set_exception(
+                        POPError(f"POP poller failed: {e}", request_id=pending.task_id)
+                    )
+            self._pending.clear()
+
+    async def _run_loop(self) -> None:
+        while self._pending:
+            now = time.monotonic()
+            self._expire(now)
+            if not self._pending:
+                break
+
+            due: list[_PendingTask] = []
+            if now >= self._paused_until:
+                for pending in sorted(
+                    self._pending.values(), key=lambda p: p.next_poll_at
+                ):
+                    if pending.next_poll_at > now or len(due) >= self._max_concurrency:
+                        break
+                    if not self._take_token(now):
+                        break
+                    due.append(pending)
+
+            if due:
+                await asyncio.gather(*(self._poll_one(p) for p in due))
+                continue
+
+            # Sleep until the next poll, deadline, budget refill, or new task
+            next_event = min(
+                min(p.next_poll_at for p in self._pending.values()),
+                min(p.deadline for p in self._pending.values()),
+            )
+            next_event = max(next_event, self._paused_until)
+            if self._requests_per_second > 0 and self._tokens < 1.0:
+                next_event = max(
+                    next_event, now + (1.0 - self._tokens) / self._requests_per_second
+                )
+            assert self._wakeup is not None
+            self._wakeup.clear()
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    self._wakeup.wait(), timeout=max(0.0, next_event - now)
+                )
+
+    async def _poll_one(self, pending: _PendingTask) -> None:
+        task_id = pending.task_id
+        try:
+            result = await self._fetch_status(task_id)
+        except Exception as e:
+            result = POPTaskResult(success=False, task_id=task_id, error=str(e))
+        pending.poll_count += 1
+        self._total_polls += 1
+        now = time.monotonic()
+        elapsed = now - pending.started_at
+
+        if self._pending.get(task_id) is not pending:
+            return  # expired or closed while the request was in flight
+
+        if result.rate_limited:
+            # Back off globally: every task shares POP's rate limit
+            self._rate_limited_polls += 1
+            pause = result.retry_after or pending.interval * self._backoff_factor
+            self._paused_until = max(self._paused_until, now + pause)
+            pending.interval = min(
+                pending.interval * self._backoff_factor, self._max_interval
+            )
+            pending.next_poll_at = now + pause
+            logger.warning(
+                "POP task polling rate limited, pausing poller",
+                extra={"task_id": task_id, "pause_seconds": round(pause, 2)},
+            )
+            return
+
+        if not result.success:
+            logger.warning(
+                "POP task poll failed",
+                extra={
+                    "task_id": task_id,
+                    "error": result.error,
+                    "poll_attempt": pending.poll_count,
+                    "elapsed_seconds": round(elapsed, 2),
+                },
+            )
+            self._resolve(pending, result)
+            return
+
+        if result.status == POPTaskStatus.SUCCESS:
+            logger.info(
+                "POP task completed successfully",
+                extra={
+                    "task_id": task_id,
+                    "status": result.status.value,
+                    "elapsed_seconds": round(elapsed, 2),
+                    "total_polls": pending.poll_count,
+                    "response_keys": list((result.data or {}).keys())[:20],
+                    "has_prepareId": "prepareId" in (result.data or {}),
+                },
+            )
+            self._resolve(pending, result)
+            return
+
+        if result.status == POPTaskStatus.FAILURE:
+            logger.warning(
+                "POP task failed",
+                extra={
+                    "task_id": task_id,
+                    "status": result.status.value,
+                    "elapsed_seconds": round(elapsed, 2),
+                    "total_polls": pending.poll_count,
+                    "error": result.data.get("error") if result.data else None,
+                },
+            )
+            self._resolve(pending, result)
+            return
+
+        # Still processing — back off this task
+        pending.interval = min(
+            pending.interval * self._backoff_factor, self._max_interval
+        )
+        pending.next_poll_at = now + pending.interval
+        logger.debug(
+            f"POP task polling: attempt {pending.poll_count}, status={result.status.value}",
+            extra={
+                "task_id": task_id,
+                "status": result.status.value,
+                "poll_attempt": pending.poll_count,
+                "elapsed_seconds": round(elapsed, 2),
+                "next_poll_in_seconds": round(pending.interval, 2),
+                "outstanding_tasks": len(self._pending),
+            },
+        )
+
+    def _resolve(self, pending: _PendingTask, result: POPTaskResult) -> None:
+        self._pending.pop(pending.task_id, None)
+        if not pending.future.done():
+            pending.future.set_result(result)
+
+
 class POPClient:
     """Async client for PageOptimizer Pro API.
 
@@ -229,6 +544,17 @@ class POPClient:
         self._client: httpx.AsyncClient | None = None
         self._available = bool(self._api_key)
 
+        # Shared poller: all outstanding tasks are polled by one runner
+        self._task_poller = POPTaskPoller(
+            fetch_status=lambda task_id: self.get_task_result(task_id),
+            poll_interval=self._task_poll_interval,
+            timeout=self._task_timeout,
+            max_interval=settings.pop_poll_max_interval,
+            backoff_factor=settings.pop_poll_backoff_factor,
+            requests_per_second=settings.pop_poll_requests_per_second,
+            max_concurrency=settings.pop_poll_max_concurrency,
+        )
+
     @property
     def available(self) -> bool:
         """Check if POP is configured and available."""
@@ -239,6 +565,11 @@ class POPClient:
         """Get the circuit breaker instance."""
         return self._circuit_breaker
 
+    @property
+    def task_poller(self) -> POPTaskPoller:
+        """Get the shared task poller."""
+        return self._task_poller
+
     def _mask_api_key(self, body: dict[str, Any]) -> dict[str, Any]:
         """Mask API key in body for logging."""
         if "apiKey" in body:
@@ -262,11 +593,13 @@ class POPClient:
 
     async def close(self) -> None:
         """Close the HTTP client."""
+        await self._task_poller.close()
         if self._client:
             await self._client.aclose()
             self._client = None
         logger.info("POP client closed")
 
+    @traced("pop.request", kind=SpanKind.CLIENT, record_args=("endpoint",))
     async def _make_request(
         self,
         endpoint: str,
@@ -1070,6 +1403,26 @@ class POPClient:
                 request_id=request_id,
             )
 
+        except POPRateLimitError as e:
+            duration_ms = (time.monotonic() - start_time) * 1000
+            logger.warning(
+                "POP task result rate limited",
+                extra={
+                    "task_id": task_id,
+                    "retry_after_seconds": e.retry_after,
+                    "duration_ms": round(duration_ms, 2),
+                },
+            )
+            return POPTaskResult(
+                success=False,
+                task_id=task_id,
+                error=str(e),
+                duration_ms=duration_ms,
+                request_id=e.request_id,
+                rate_limited=True,
+                retry_after=e.retry_after,
+            )
+
         except POPError as e:
             duration_ms = (time.monotonic() - start_time) * 1000
             logger.error(
@@ -1094,14 +1447,15 @@ class POPClient:
         poll_interval: float | None = None,
         timeout: float | None = None,
     ) -> POPTaskResult:
-        """Poll for task completion with configurable interval and timeout.
+        """Wait for task completion via the shared task poller.
 
-        Continuously polls get_task_result() until the task completes
-        (SUCCESS or FAILURE) or the timeout is reached.
+        Registers the task with POPTaskPoller and awaits its future rather
+        than running a private polling loop, so hundreds of concurrent brief
+        fetches share one adaptive, rate-limited poller.
 
         Args:
             task_id: The task ID to poll
-            poll_interval: Seconds between polls. Defaults to settings (3s).
+            poll_interval: Initial seconds between polls. Defaults to settings.
             timeout: Maximum seconds to wait. Defaults to settings (300s).
 
         Returns:
@@ -1110,112 +1464,18 @@ class POPClient:
         Raises:
             POPTimeoutError: If timeout is reached before task completes
         """
-        poll_interval = poll_interval or self._task_poll_interval
-        timeout = timeout or self._task_timeout
-
-        start_time = time.monotonic()
-        poll_count = 0
-
         logger.info(
             "Starting POP task polling",
             extra={
                 "task_id": task_id,
-                "poll_interval_seconds": poll_interval,
-                "timeout_seconds": timeout,
+                "poll_interval_seconds": poll_interval or self._task_poll_interval,
+                "timeout_seconds": timeout or self._task_timeout,
+                "outstanding_tasks": self._task_poller.outstanding,
             },
         )
-
-        while True:
-            elapsed = time.monotonic() - start_time
-
-            # Check timeout - log with task_id, elapsed time, and configured timeout
-            if elapsed >= timeout:
-                logger.error(
-                    "POP task polling timed out",
-                    extra={
-                        "task_id": task_id,
-                        "elapsed_seconds": round(elapsed, 2),
-                        "configured_timeout_seconds": timeout,
-                        "poll_count": poll_count,
-                        "poll_interval_seconds": poll_interval,
-                    },
-                )
-                raise POPTimeoutError(
-                    f"Task {task_id} timed out after {elapsed:.1f}s",
-                    request_id=task_id,
-                )
-
-            # Get current status - log poll attempt
-            logger.debug(
-                f"POP task poll attempt {poll_count + 1}",
-                extra={
-                    "task_id": task_id,
-                    "poll_attempt": poll_count + 1,
-                    "elapsed_seconds": round(elapsed, 2),
-                    "timeout_seconds": timeout,
-                },
-            )
-
-            result = await self.get_task_result(task_id)
-            poll_count += 1
-
-            if not result.success:
-                # API error - return the error result
-                logger.warning(
-                    "POP task poll failed",
-                    extra={
-                        "task_id": task_id,
-                        "error": result.error,
-                        "poll_attempt": poll_count,
-                        "elapsed_seconds": round(elapsed, 2),
-                    },
-                )
-                return result
-
-            # Check for terminal states
-            if result.status == POPTaskStatus.SUCCESS:
-                logger.info(
-                    "POP task completed successfully",
-                    extra={
-                        "task_id": task_id,
-                        "status": result.status.value,
-                        "elapsed_seconds": round(elapsed, 2),
-                        "poll_attempt": poll_count,
-                        "total_polls": poll_count,
-                        "response_keys": list((result.data or {}).keys())[:20],
-                        "has_prepareId": "prepareId" in (result.data or {}),
-                    },
-                )
-                return result
-
-            if result.status == POPTaskStatus.FAILURE:
-                logger.warning(
-                    "POP task failed",
-                    extra={
-                        "task_id": task_id,
-                        "status": result.status.value,
-                        "elapsed_seconds": round(elapsed, 2),
-                        "poll_attempt": poll_count,
-                        "total_polls": poll_count,
-                        "error": result.data.get("error") if result.data else None,
-                    },
-                )
-                return result
-
-            # Still processing - log poll attempt with task_id, attempt number, status
-            logger.info(
-                f"POP task polling: attempt {poll_count}, status={result.status.value}",
-                extra={
-                    "task_id": task_id,
-                    "status": result.status.value,
-                    "poll_attempt": poll_count,
-                    "elapsed_seconds": round(elapsed, 2),
-                    "next_poll_in_seconds": poll_interval,
-                    "timeout_seconds": timeout,
-                },
-            )
-
-            await asyncio.sleep(poll_interval)
+        return await self._task_poller.wait_for(
+            task_id, poll_interval=poll_interval, timeout=timeout
+        )
 
 
 # ---------------------------------------------------------------------------
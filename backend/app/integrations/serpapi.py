@@ -27,6 +27,7 @@ import httpx
 from app.core.circuit_breaker import CircuitBreaker, CircuitBreakerConfig
 from app.core.config import get_settings
 from app.core.logging import get_logger
+from app.core.tracing import SpanKind, traced
 
 logger = get_logger(__name__)
 
@@ -121,8 +122,10 @@ class SerpAPIClient:
         self._client: httpx.AsyncClient | None = None
         self._available = bool(self._api_key)
 
-        # Rate limiting: track last request time
+        # Rate limiting: track last request time; the lock keeps concurrent
+        # callers from all passing the check at once
         self._last_request_time: float = 0.0
+        self._rate_limit_lock = asyncio.Lock()
 
         logger.info(
             "SerpAPIClient instantiated",
@@ -160,17 +163,22 @@ class SerpAPIClient:
         logger.info("SerpAPI client closed")
 
     async def _rate_limit(self) -> None:
-        """Enforce minimum delay between consecutive requests."""
-        now = time.monotonic()
-        elapsed = now - self._last_request_time
-        if elapsed < self._rate_limit_delay:
-            wait = self._rate_limit_delay - elapsed
-            logger.debug(
-                "Rate limiting SerpAPI request",
-                extra={"wait_seconds": round(wait, 3)},
-            )
-            await asyncio.sleep(wait)
-        self._last_request_time = time.monotonic()
+        """Enforce minimum delay between consecutive requests.
+
+        Only request starts are spaced; concurrent callers still overlap
+        while waiting on responses.
+        """
+        async with self._rate_limit_lock:
+            now = time.monotonic()
+            elapsed = now - self._last_request_time
+            if elapsed < self._rate_limit_delay:
+                wait = self._rate_limit_delay - elapsed
+                logger.debug(
+                    "Rate limiting SerpAPI request",
+                    extra={"wait_seconds": round(wait, 3)},
+                )
+                await asyncio.sleep(wait)
+            self._last_request_time = time.monotonic()
 
     @staticmethod
     def _extract_subreddit(url: str) -> str:
@@ -204,6 +212,12 @@ class SerpAPIClient:
             return f'site:reddit.com/r/{subreddit} "{keyword}"'
         return f'site:reddit.com "{keyword}"'
 
+    @traced(
+        "serpapi.search",
+        kind=SpanKind.CLIENT,
+        record_args=("time_range",),
+        result_attributes=lambda results: {"results": len(results)},
+    )
     async def _execute_search(
         self,
         query: str,
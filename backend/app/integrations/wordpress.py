@@ -2,6 +2,8 @@
 
 Uses httpx with HTTP Basic Auth (application passwords). Handles paginated
 post fetching with _embed for inline terms, and single-post content updates.
+The first page of a listing reports X-WP-TotalPages; the remaining pages are
+then fetched concurrently.
 """
 
 import asyncio
@@ -18,6 +20,9 @@ logger = get_logger(__name__)
 # WordPress REST API pagination limit
 WP_PER_PAGE = 100
 
+# Max concurrent page requests once X-WP-TotalPages is known
+WP_PAGE_CONCURRENCY = 4
+
 # Retry settings for rate-limited requests
 MAX_RETRIES = 3
 RETRY_BASE_DELAY = 2.0  # seconds, doubles each retry
@@ -93,11 +98,17 @@ class WordPressClient:
         )
 
     async def _get_with_retry(self, url: str, params: dict[str, Any]) -> httpx.Response:
-        """GET request with retry on 429 Too Many Requests."""
+        """GET request with retry on 429 Too Many Requests.
+
+        Honors a numeric Retry-After header, otherwise backs off exponentially.
+        """
         for attempt in range(MAX_RETRIES + 1):
             resp = await self._client.get(url, params=params)
             if resp.status_code == 429 and attempt < MAX_RETRIES:
                 delay = RETRY_BASE_DELAY * (2**attempt)
+                retry_after = resp.headers.get("Retry-After", "")
+                if retry_after.isdigit():
+                    delay = max(delay, float(retry_after))
                 logger.warning(
                     "WP API rate limited, retrying",
                     extra={"attempt": attempt + 1, "delay": delay, "url": url},
@@ -121,19 +132,19 @@ class WordPressClient:
         filter is a single term.  Falls back to client-side filtering for
         multi-term filters (WP ``search`` only accepts one string).
 
+        Page 1 is fetched first to read X-WP-TotalPages; the remaining pages
+        are fetched concurrently (up to WP_PAGE_CONCURRENCY at a time) and
+        their posts returned in page order.
+
         Returns:
             Tuple of (matched posts, total posts fetched before filtering).
         """
-        all_posts: list[WPPost] = []
-        total_fetched = 0
-        page = 1
-
         # Single-term filter → let WP do server-side search
         use_server_search = title_filter and len(title_filter) == 1
         # Multi-term → client-side filtering after fetch
         use_client_filter = title_filter and len(title_filter) > 1
 
-        while True:
+        async def fetch_page(page: int) -> httpx.Response:
             params: dict[str, Any] = {
                 "per_page": WP_PER_PAGE,
                 "page": page,
@@ -142,17 +153,29 @@ class WordPressClient:
             }
             if use_server_search and title_filter:
                 params["search"] = title_filter[0]
-
-            resp = await self._get_with_retry(
-                f"{self._api_base}/posts",
-                params=params,
+            return await self._get_with_retry(f"{self._api_base}/posts", params=params)
+
+        # Page 1 tells us how many pages there are; fetch the rest in parallel
+        first = await fetch_page(1)
+        total_pages = int(first.headers.get("X-WP-TotalPages", "1"))
+        responses = [first]
+        if total_pages > 1:
+            semaphore = asyncio.Semaphore(WP_PAGE_CONCURRENCY)
+
+            async def fetch_limited(page: int) -> httpx.Response:
+                async with semaphore:
+                    return await fetch_page(page)
+
+            responses.extend(
+                await asyncio.gather(
+                    *(fetch_limited(page) for page in range(2, total_pages + 1))
+                )
             )
-            posts_data = resp.json()
-
-            if not posts_data:
-                break
 
-            for post in posts_data:
+        all_posts: list[WPPost] = []
+        total_fetched = 0
+        for resp in responses:
+            for post in resp.json() or []:
                 total_fetched += 1
                 wp_post = self._parse_post(post)
 
@@ -166,11 +189,6 @@ class WordPressClient:
 
                 all_posts.append(wp_post)
 
-            total_pages = int(resp.headers.get("X-WP-TotalPages", "1"))
-            if page >= total_pages:
-                break
-            page += 1
-
         return all_posts, total_fetched
 
     async def fetch_all_posts(
@@ -24,7 +24,7 @@ import uuid
 from contextlib import asynccontextmanager
 from typing import Any
 
-from fastapi import FastAPI, Request, status
+from fastapi import Depends, FastAPI, HTTPException, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -32,11 +32,13 @@ from starlette.middleware.base import BaseHTTPMiddleware
 
 from app.api.v1 import router as api_v1_router
 from app.api.v1.reddit import webhook_router
-from app.core.config import get_settings
+from app.core.config import Settings, get_settings
 from app.core.database import db_manager
 from app.core.logging import get_logger, setup_logging
+from app.core.query_stats import query_scope, query_stats
 from app.core.redis import redis_manager
 from app.core.scheduler import scheduler_manager
+from app.core.tracing import trace_collector
 from app.core.websocket import connection_manager
 from app.integrations.claude import init_claude
 from app.integrations.crowdreply import close_crowdreply, init_crowdreply
@@ -122,8 +124,9 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             except Exception:
                 pass  # Don't fail on body logging errors
 
-        # Process request
-        response = await call_next(request)
+        # Process request (statements are aggregated per request for N+1 checks)
+        with query_scope(f"{method} {path}"):
+            response = await call_next(request)
 
         # Calculate timing
         duration_ms = (time.monotonic() - start_time) * 1000
@@ -191,6 +194,14 @@ async def lifespan(app: FastAPI) -> Any:
             "Content mode: LOREM IPSUM — body text will be placeholder"
         )
 
+    # Pipeline tracing (in-process exporter, see /health/traces)
+    trace_collector.configure(
+        enabled=settings.tracing_enabled,
+        max_traces=settings.tracing_max_traces,
+        max_spans_per_trace=settings.tracing_max_spans_per_trace,
+        otel_bridge=settings.tracing_otel_bridge,
+    )
+
     # Initialize database
     try:
         db_manager.init_db()
@@ -288,6 +299,12 @@ async def lifespan(app: FastAPI) -> Any:
     logger.info("Application shutdown complete")
 
 
+def require_debug(settings: Settings = Depends(get_settings)) -> None:
+    """Hide diagnostic endpoints that expose SQL or run details unless DEBUG."""
+    if not settings.debug:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
     settings = get_settings()
@@ -420,6 +437,36 @@ def create_app() -> FastAPI:
             "database": is_healthy,
         }
 
+    # Per-statement query aggregates (fingerprints, percentiles, N+1 suspects)
+    @app.get(
+        "/health/db/queries", tags=["Health"], dependencies=[Depends(require_debug)]
+    )
+    async def database_query_stats(top: int = 25) -> dict[str, Any]:
+        """Return per-statement aggregates and recent per-request/run scopes.
+
+        Only served with DEBUG on, since it includes statement text.
+        """
+        return query_stats.snapshot(top=top)
+
+    # Recent pipeline run traces
+    @app.get("/health/traces", tags=["Health"], dependencies=[Depends(require_debug)])
+    async def pipeline_traces(name: str | None = None) -> dict[str, Any]:
+        """List active and recently finished pipeline run traces."""
+        return trace_collector.snapshot(name=name)
+
+    # Critical-path breakdown of one pipeline run
+    @app.get(
+        "/health/traces/{trace_id}",
+        tags=["Health"],
+        dependencies=[Depends(require_debug)],
+    )
+    async def pipeline_trace(trace_id: str, spans: bool = False) -> dict[str, Any]:
+        """Return per-stage critical-path timings (and optionally all spans)."""
+        trace = trace_collector.get(trace_id)
+        if trace is None:
+            raise HTTPException(status_code=404, detail="Trace not found")
+        return trace.to_dict(include_spans=spans)
+
     # Redis health check
     @app.get("/health/redis", tags=["Health"])
     async def redis_health() -> dict[str, str | bool]:
@@ -436,6 +483,12 @@ def create_app() -> FastAPI:
             "circuit_breaker": circuit_state,
         }
 
+    # WebSocket outbound queue / backpressure metrics
+    @app.get("/health/websocket", tags=["Health"])
+    async def websocket_health() -> dict[str, Any]:
+        """Report per-connection send queue depth and drop/coalesce counters."""
+        return connection_manager.backpressure_stats()
+
     # Scheduler health check
     @app.get("/health/scheduler", tags=["Health"])
     async def scheduler_health() -> dict[str, Any]:
@@ -449,6 +502,7 @@ def create_app() -> FastAPI:
         """Check status of external integrations (POP, DataForSEO, Claude)."""
         from app.core.config import get_settings
         from app.integrations.pop import POPMockClient, get_pop_client
+        from app.services.pop_content_brief import get_brief_cache_stats
 
         settings = get_settings()
         pop_client = await get_pop_client()
@@ -474,6 +528,11 @@ def create_app() -> FastAPI:
                 "api_key_set": bool(settings.anthropic_api_key),
                 "model": settings.claude_model,
             },
+            "pop_brief_cache": {
+                "enabled": settings.pop_brief_cache_enabled,
+                "ttl_days": settings.pop_brief_cache_ttl_days,
+                **get_brief_cache_stats(),
+            },
         }
 
     # POP full 3-step flow test
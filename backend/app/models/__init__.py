@@ -32,6 +32,7 @@ from app.models.notification import (
 from app.models.page_content import PageContent
 from app.models.page_keywords import PageKeywords
 from app.models.page_paa import PagePAA
+from app.models.pop_brief_cache import POPBriefCache
 from app.models.project import Project
 from app.models.project_file import ProjectFile
 from app.models.prompt_log import PromptLog
@@ -39,6 +40,7 @@ from app.models.reddit_account import AccountStatus, RedditAccount, WarmupStage
 from app.models.reddit_comment import CommentStatus, RedditComment
 from app.models.reddit_config import RedditProjectConfig
 from app.models.reddit_post import PostFilterStatus, PostIntent, RedditPost
+from app.models.reddit_project_counter import RedditProjectCounter
 from app.models.shopify_page import ShopifyPage
 from app.models.vertical_bible import VerticalBible
 
@@ -69,6 +71,7 @@ __all__ = [
     "PageContent",
     "PageKeywords",
     "PagePAA",
+    "POPBriefCache",
     "AccountStatus",
     "CommentStatus",
     "PostFilterStatus",
@@ -78,6 +81,7 @@ __all__ = [
     "RedditAccount",
     "RedditComment",
     "RedditPost",
+    "RedditProjectCounter",
     "RedditProjectConfig",
     "PromptLog",
     "ShopifyPage",
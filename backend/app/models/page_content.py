@@ -49,6 +49,8 @@ class PageContent(Base):
         word_count: Total word count across content fields
         status: Generation status (pending, generating_brief, writing, checking, complete, failed)
         qa_results: JSONB storing QA check results
+        wp_imported_hash: MD5 of bottom_description as imported from WordPress
+        wp_pushed_hash: MD5 of bottom_description last pushed to WordPress
         generation_started_at: When generation started
         generation_completed_at: When generation completed
         created_at: Timestamp when record was created
@@ -110,6 +112,18 @@ class PageContent(Base):
         nullable=True,
     )
 
+    # WordPress sync state: export only pushes posts whose current
+    # bottom_description hash differs from the last known remote version
+    wp_imported_hash: Mapped[str | None] = mapped_column(
+        String(32),
+        nullable=True,
+    )
+
+    wp_pushed_hash: Mapped[str | None] = mapped_column(
+        String(32),
+        nullable=True,
+    )
+
     outline_json: Mapped[dict[str, Any] | None] = mapped_column(
         JSONB,
         nullable=True,
@@ -0,0 +1,109 @@
+"""POPBriefCache model for sharing POP brief responses across pages and projects.
+
+The POPBriefCache model stores the merged 3-step POP response for a keyword:
+- cache_key: Hash of (normalized keyword, location)
+- keyword / location_name: The inputs the response was generated for
+- response_data: JSONB merged get-terms + create-report + recommendations data
+- TTL-based caching with expires_at timestamp and hit_count metrics
+
+Entries are deliberately independent of the target URL and the owning page or
+project, so the same keyword analyzed for a cluster page, a blog post, a
+WordPress post or a page in another client project reuses one POP report.
+"""
+
+from datetime import UTC, datetime
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy import DateTime, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class POPBriefCache(Base):
+    """POPBriefCache model for shared, keyword-keyed POP brief responses.
+
+    Attributes:
+        id: UUID primary key
+        cache_key: SHA-256 of normalized keyword + location (unique)
+        keyword: Normalized keyword the report was run for
+        location_name: POP/Google search location
+        response_data: Merged POP 3-step response (input to the brief parsers)
+        pop_task_id: POP task ID of the report that produced the response
+        expires_at: Timestamp when the cache entry expires
+        hit_count: Number of times this entry has been copied into a brief
+        created_at: Timestamp when record was created
+        updated_at: Timestamp when record was last updated
+    """
+
+    __tablename__ = "pop_brief_cache"
+
+    id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False),
+        primary_key=True,
+        default=lambda: str(uuid4()),
+        server_default=text("gen_random_uuid()"),
+    )
+
+    cache_key: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+        unique=True,
+        index=True,
+    )
+
+    keyword: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+        index=True,
+    )
+
+    location_name: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+    )
+
+    response_data: Mapped[dict[str, Any]] = mapped_column(
+        JSONB,
+        nullable=False,
+        default=dict,
+        server_default=text("'{}'::jsonb"),
+    )
+
+    pop_task_id: Mapped[str | None] = mapped_column(
+        String(255),
+        nullable=True,
+    )
+
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        index=True,
+    )
+
+    hit_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+        server_default=text("now()"),
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+        server_default=text("now()"),
+        onupdate=lambda: datetime.now(UTC),
+    )
+
+    def __repr__(self) -> str:
+        return f"<POPBriefCache(id={self.id!r}, keyword={self.keyword!r}, location={self.location_name!r})>"
@@ -0,0 +1,71 @@
+"""RedditProjectCounter model for precomputed Reddit dashboard counts.
+
+One row per project holding the number of discovered posts, generated
+comments, and comments still in draft. Rows are maintained by statement-level
+PostgreSQL triggers on reddit_posts and reddit_comments (see migration 0038),
+so every write path — ORM, bulk upsert, bulk delete, FK cascade — keeps them
+in step within the same transaction. Application code only reads them.
+"""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import DateTime, ForeignKey, Integer, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class RedditProjectCounter(Base):
+    """RedditProjectCounter model for per-project Reddit counts.
+
+    Attributes:
+        project_id: FK to projects.id (primary key, CASCADE delete)
+        post_count: Number of reddit_posts rows for the project
+        comment_count: Number of reddit_comments rows for the project
+        draft_count: Number of reddit_comments rows with status 'draft'
+        updated_at: When a trigger last changed the counts
+    """
+
+    __tablename__ = "reddit_project_counters"
+
+    project_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False),
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    post_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+    )
+
+    comment_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+    )
+
+    draft_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+        server_default=text("now()"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<RedditProjectCounter(project_id={self.project_id!r}, "
+            f"posts={self.post_count}, comments={self.comment_count}, "
+            f"drafts={self.draft_count})>"
+        )
@@ -119,6 +119,17 @@ class ContentGenerationStatus(BaseModel):
         default_factory=list,
         description="Per-page status breakdown",
     )
+    cursor: datetime | None = Field(
+        None,
+        description="Latest page update; pass as `since` to receive only changed pages",
+    )
+    is_delta: bool = Field(
+        False, description="True if pages only contains pages changed since the cursor"
+    )
+    page_ids: list[str] | None = Field(
+        None,
+        description="On delta responses, ids of all current pages; pages missing from it were removed",
+    )
 
 
 # =============================================================================
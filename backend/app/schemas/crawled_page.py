@@ -121,6 +121,17 @@ class CrawlStatusResponse(BaseModel):
         default_factory=list,
         description="Array of page summaries",
     )
+    cursor: datetime | None = Field(
+        None,
+        description="Latest page update; pass as `since` to receive only changed pages",
+    )
+    is_delta: bool = Field(
+        False, description="True if pages only contains pages changed since the cursor"
+    )
+    page_ids: list[str] | None = Field(
+        None,
+        description="On delta responses, ids of all current pages; pages missing from it were deleted",
+    )
 
 
 class UrlsUploadRequest(BaseModel):
@@ -308,3 +308,6 @@ class ProjectListResponse(BaseModel):
     total: int = Field(..., ge=0, description="Total count of projects")
     limit: int = Field(..., ge=1, description="Page size limit")
     offset: int = Field(..., ge=0, description="Offset from start")
+    next_cursor: str | None = Field(
+        None, description="Cursor for the next page, or null on the last page"
+    )
@@ -201,6 +201,9 @@ class DiscoveryStatusResponse(BaseModel):
     keywords_searched: int = Field(0, description="Keywords searched so far")
     total_posts_found: int = Field(0, description="Raw posts found from SERP")
     posts_scored: int = Field(0, description="Posts scored by Claude so far")
+    posts_reused: int = Field(
+        0, description="Posts whose stored evaluation was reused instead of re-scored"
+    )
     posts_stored: int = Field(0, description="Posts stored in database")
     error: str | None = Field(None, description="Error message if status is 'failed'")
 
@@ -189,6 +189,10 @@ class WPExportRequest(BaseModel):
         None,
         description="Optional title filter to export only specific posts (deprecated, use page_ids)",
     )
+    force: bool = Field(
+        False,
+        description="Push every matching post, even if unchanged since the last push",
+    )
 
 
 # =============================================================================
@@ -242,5 +246,8 @@ class WPProgressResponse(BaseModel):
     status: str = Field(..., description="Status: 'running', 'complete', 'failed'")
     current: int = Field(0, description="Current progress count")
     total: int = Field(0, description="Total items to process")
+    skipped_unchanged: int = Field(
+        0, description="Items skipped because nothing changed (export only)"
+    )
     error: str | None = Field(None, description="Error message if failed")
     result: dict[str, Any] | None = Field(None, description="Result data when complete")
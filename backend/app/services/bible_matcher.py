@@ -0,0 +1,302 @@
+"""Precompiled trigger-keyword matching for vertical bibles.
+
+Bible matching is bidirectional substring matching: a bible matches a page
+keyword if any of its trigger keywords occurs inside the page keyword, or the
+page keyword occurs inside one of its triggers. Done naively that is a
+bibles x triggers x keywords scan per page.
+
+BibleMatcher compiles a project's triggers once:
+- "trigger in keyword": an Aho-Corasick automaton over all triggers, so one
+  pass over each page keyword finds every contained trigger
+- "keyword in trigger": all triggers joined into one separator-delimited
+  haystack, so each page keyword is located with C-level str.find calls
+  instead of a Python loop over triggers
+
+Compiled matchers are cached in-process. get_compiled_matcher() keys on the
+bibles' content, so it is always consistent with the list it is given;
+the per-project cache used by VerticalBibleService.match_bibles is
+invalidated explicitly once a bible create/update/delete commits.
+"""
+
+import time
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+# Separator between triggers in the reverse-index haystack
+_SEPARATOR = "\x00"
+
+# Maximum number of compiled matchers kept by content signature
+_MAX_COMPILED_MATCHERS = 64
+
+# Upper bound on staleness of the per-project cache when another worker
+# process edits bibles (explicit invalidation only reaches this process)
+PROJECT_MATCHER_TTL_SECONDS = 300.0
+
+# Session.info key holding project IDs to invalidate when the session commits
+_PENDING_INVALIDATIONS_KEY = "bible_matcher_pending_invalidations"
+
+
+def normalize_trigger(value: Any) -> str:
+    """Normalize a trigger or page keyword for comparison."""
+    return str(value).strip().lower()
+
+
+class _AhoCorasick:
+    """Minimal Aho-Corasick automaton returning matched pattern indices."""
+
+    def __init__(self, patterns: Sequence[str]) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[int]] = [[]]
+
+        for index, pattern in enumerate(patterns):
+            node = 0
+            for char in pattern:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                node = next_node
+            self._out[node].append(index)
+
+        # Breadth-first failure links; outputs are merged along them so a
+        # search only has to read the current node's output list
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child].extend(self._out[self._fail[child]])
+
+    def search(self, text: str) -> set[int]:
+        """Return indices of all patterns occurring in text."""
+        found: set[int] = set()
+        node = 0
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if out[node]:
+                found.update(out[node])
+        return found
+
+
+class BibleMatcher:
+    """Compiled bidirectional substring matcher over a list of bibles.
+
+    Results are positions into the bible list the matcher was built from,
+    returned in that list's order, so callers keep their sort order.
+    """
+
+    def __init__(
+        self,
+        trigger_lists: Sequence[Sequence[Any]],
+        min_trigger_length: int = 1,
+    ) -> None:
+        """Compile triggers for each bible position.
+
+        Args:
+            trigger_lists: Trigger keywords per bible, in bible order
+            min_trigger_length: Normalized triggers shorter than this are ignored
+        """
+        self.bible_count = len(trigger_lists)
+        trigger_owners: dict[str, list[int]] = {}
+        for position, triggers in enumerate(trigger_lists):
+            for trigger in triggers or []:
+                normalized = normalize_trigger(trigger)
+                if not normalized or len(normalized) < min_trigger_length:
+                    continue
+                owners = trigger_owners.setdefault(normalized, [])
+                if not owners or owners[-1] != position:
+                    owners.append(position)
+
+        self._triggers = list(trigger_owners)
+        self._owners = [trigger_owners[t] for t in self._triggers]
+        self._automaton = _AhoCorasick(self._triggers)
+
+        # Reverse index: one haystack with the start offset of every trigger
+        self._starts: list[int] = []
+        offset = 0
+        for trigger in self._triggers:
+            self._starts.append(offset)
+            offset += len(trigger) + len(_SEPARATOR)
+        self._haystack = _SEPARATOR.join(self._triggers)
+
+    @property
+    def trigger_count(self) -> int:
+        return len(self._triggers)
+
+    def _triggers_containing(self, keyword: str) -> set[int]:
+        """Indices of triggers that contain keyword as a substring."""
+        if not keyword:
+            return set(range(len(self._triggers)))
+        if _SEPARATOR in keyword:
+            return {i for i, t in enumerate(self._triggers) if keyword in t}
+
+        found: set[int] = set()
+        haystack = self._haystack
+        starts = self._starts
+        pos = haystack.find(keyword)
+        while pos != -1:
+            trigger_index = bisect_right(starts, pos) - 1
+            found.add(trigger_index)
+            if trigger_index + 1 >= len(starts):
+                break
+            pos = haystack.find(keyword, starts[trigger_index + 1])
+        return found
+
+    def match_positions(self, keywords: Iterable[str]) -> list[int]:
+        """Return positions of bibles matching any of the normalized keywords."""
+        if not self._triggers:
+            return []
+
+        trigger_hits: set[int] = set()
+        for keyword in keywords:
+            trigger_hits |= self._automaton.search(keyword)
+            trigger_hits |= self._triggers_containing(keyword)
+            if len(trigger_hits) == len(self._triggers):
+                break
+
+        positions: set[int] = set()
+        for trigger_index in trigger_hits:
+            positions.update(self._owners[trigger_index])
+        return sorted(positions)
+
+
+# ---------------------------------------------------------------------------
+# Caches
+# ---------------------------------------------------------------------------
+
+_compiled_matchers: "OrderedDict[tuple[Any, ...], BibleMatcher]" = OrderedDict()
+
+
+def _bibles_signature(
+    bibles: Sequence[Any], min_trigger_length: int
+) -> tuple[Any, ...]:
+    return (
+        min_trigger_length,
+        tuple(
+            tuple(str(t) for t in (getattr(bible, "trigger_keywords", None) or []))
+            for bible in bibles
+        ),
+    )
+
+
+def get_compiled_matcher(
+    bibles: Sequence[Any], min_trigger_length: int = 1
+) -> BibleMatcher:
+    """Return a compiled matcher for a bible list, reusing a cached one.
+
+    Keyed on the bibles' trigger keywords (in order), so edits to a bible
+    naturally produce a new matcher and a stale one is never returned.
+    """
+    signature = _bibles_signature(bibles, min_trigger_length)
+    matcher = _compiled_matchers.get(signature)
+    if matcher is not None:
+        _compiled_matchers.move_to_end(signature)
+        return matcher
+
+    matcher = BibleMatcher(
+        [getattr(bible, "trigger_keywords", None) or [] for bible in bibles],
+        min_trigger_length=min_trigger_length,
+    )
+    _compiled_matchers[signature] = matcher
+    while len(_compiled_matchers) > _MAX_COMPILED_MATCHERS:
+        _compiled_matchers.popitem(last=False)
+    return matcher
+
+
+@dataclass
+class ProjectMatcherEntry:
+    """Compiled matcher for a project's active bibles, plus their IDs in order."""
+
+    matcher: BibleMatcher
+    bible_ids: list[str]
+    built_at: float
+
+    def is_fresh(self) -> bool:
+        return time.monotonic() - self.built_at < PROJECT_MATCHER_TTL_SECONDS
+
+
+_project_matchers: dict[str, ProjectMatcherEntry] = {}
+
+
+def get_project_matcher(project_id: str) -> ProjectMatcherEntry | None:
+    """Return the cached matcher entry for a project, if present and fresh."""
+    entry = _project_matchers.get(project_id)
+    if entry is None:
+        return None
+    if not entry.is_fresh():
+        _project_matchers.pop(project_id, None)
+        return None
+    return entry
+
+
+def set_project_matcher(project_id: str, bibles: Sequence[Any]) -> ProjectMatcherEntry:
+    """Compile and cache the matcher for a project's active bibles."""
+    entry = ProjectMatcherEntry(
+        matcher=get_compiled_matcher(bibles),
+        bible_ids=[str(bible.id) for bible in bibles],
+        built_at=time.monotonic(),
+    )
+    _project_matchers[project_id] = entry
+    return entry
+
+
+def invalidate_project_matcher(project_id: str) -> None:
+    """Drop a project's cached matcher (call after any bible change)."""
+    _project_matchers.pop(project_id, None)
+
+
+def invalidate_project_matcher_on_commit(db: AsyncSession, project_id: str) -> None:
+    """Drop a project's cached matcher once db's transaction commits.
+
+    Invalidating earlier would let a concurrent match_bibles rebuild the
+    matcher from the pre-commit rows, or from a transaction that then rolls
+    back, and cache it for the full TTL. Nothing is invalidated on rollback.
+    """
+    session = db.sync_session
+    pending = session.info.get(_PENDING_INVALIDATIONS_KEY)
+    if pending is None:
+        pending = session.info[_PENDING_INVALIDATIONS_KEY] = set()
+        event.listen(session, "after_commit", _invalidate_pending)
+        event.listen(session, "after_transaction_end", _discard_pending)
+    pending.add(project_id)
+
+
+def _invalidate_pending(session: Session) -> None:
+    pending = session.info[_PENDING_INVALIDATIONS_KEY]
+    for project_id in pending:
+        invalidate_project_matcher(project_id)
+    pending.clear()
+
+
+def _discard_pending(session: Session, transaction: SessionTransaction) -> None:
+    # Runs after after_commit; anything left when the outermost transaction
+    # ends was rolled back
+    if transaction.parent is None:
+        session.info[_PENDING_INVALIDATIONS_KEY].clear()
+
+
+def clear_matcher_caches() -> None:
+    """Drop all cached matchers (used by tests)."""
+    _compiled_matchers.clear()
+    _project_matchers.clear()
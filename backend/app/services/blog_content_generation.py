@@ -17,6 +17,7 @@ BlogPost (title, meta_description, content) not in a separate PageContent table.
 """
 
 import asyncio
+import hashlib
 import json
 import re
 import time
@@ -31,6 +32,7 @@ from sqlalchemy.orm import selectinload
 from app.core.config import get_settings
 from app.core.database import db_manager
 from app.core.logging import get_logger
+from app.core.redis import redis_manager
 from app.integrations.claude import ClaudeClient, CompletionResult, get_api_key
 from app.models.blog import (
     BlogCampaign,
@@ -57,6 +59,12 @@ BLOG_CONTENT_KEYS = {"page_title", "meta_description", "content"}
 # Content fields to check for blog QA
 BLOG_CONTENT_FIELDS = ("title", "meta_description", "content")
 
+# Redis key prefix for cached Perplexity trend research
+TREND_CACHE_KEY_PREFIX = "blog:trends:v1:"
+
+# Most keywords kept in the in-process trend cache; Redis holds the rest
+TREND_CACHE_MAX_ENTRIES = 256
+
 # Humanization replacements: AI-sounding word → natural alternative
 # From skill bible Part 5 humanization table (lines 826-840)
 HUMANIZATION_MAP: list[tuple[str, str]] = [
@@ -224,63 +232,39 @@ async def _auto_blog_link_planning(
 ) -> None:
     """Auto-run blog link planning for completed posts.
 
-    For each completed blog post, strips any existing blog-scope links,
-    then runs run_blog_link_planning to inject fresh internal links.
+    Runs campaign-level link planning once for all completed posts: the blog
+    graph and targets are built a single time, each post's existing
+    blog-scope links are replaced with freshly injected ones.
 
     Failures are non-fatal — logged but don't affect content generation results.
     """
-    from sqlalchemy import delete
-
-    from app.models.internal_link import InternalLink
-    from app.services.link_planning import run_blog_link_planning
+    from app.services.link_planning import run_campaign_blog_link_planning
 
     logger.info(
         "Auto blog link planning starting",
         extra={"campaign_id": campaign_id, "post_count": len(post_ids)},
     )
 
-    for post_id in post_ids:
-        try:
-            async with db_manager.session_factory() as db:
-                # Delete existing blog-scope links for this post's crawled page
-                # (run_blog_link_planning creates CrawledPage bridge records;
-                #  the source_page_id is the bridge crawled_page_id)
-                from app.models.blog import BlogPost
-
-                post_stmt = select(BlogPost).where(BlogPost.id == post_id)
-                post_result = await db.execute(post_stmt)
-                post = post_result.scalar_one_or_none()
-
-                crawled_page_id = (
-                    getattr(post, "crawled_page_id", None) if post else None
-                )
-                if crawled_page_id:
-                    del_stmt = delete(InternalLink).where(
-                        InternalLink.source_page_id == crawled_page_id,
-                        InternalLink.scope == "blog",
-                    )
-                    await db.execute(del_stmt)
-                    await db.commit()
-
-                # Run blog link planning
-                await run_blog_link_planning(post_id, campaign_id, db)
-
-            logger.info(
-                "Auto blog link planning complete for post",
-                extra={"post_id": post_id, "campaign_id": campaign_id},
-            )
-
-        except Exception as e:
-            logger.warning(
-                "Auto blog link planning failed for post (non-fatal)",
-                extra={
-                    "post_id": post_id,
-                    "campaign_id": campaign_id,
-                    "error": str(e),
-                    "error_type": type(e).__name__,
-                },
-                exc_info=True,
-            )
+    try:
+        summary = await run_campaign_blog_link_planning(campaign_id, post_ids)
+        logger.info(
+            "Auto blog link planning complete",
+            extra={
+                "campaign_id": campaign_id,
+                "completed": summary["completed"],
+                "failed": summary["failed"],
+            },
+        )
+    except Exception as e:
+        logger.warning(
+            "Auto blog link planning failed (non-fatal)",
+            extra={
+                "campaign_id": campaign_id,
+                "error": str(e),
+                "error_type": type(e).__name__,
+            },
+            exc_info=True,
+        )
 
 
 async def _load_approved_posts(
@@ -424,19 +408,152 @@ def _humanize_content(content: str) -> str:
     return result
 
 
+# In-process trend cache: key -> (monotonic expiry, trend data), oldest
+# first and capped at TREND_CACHE_MAX_ENTRIES. Backs up Redis when it is
+# unavailable and saves a round trip when it is not.
+_trend_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+# Trend fetches in flight, so concurrent posts sharing a keyword wait for
+# one Perplexity query instead of each issuing their own
+_trend_inflight: dict[str, asyncio.Task[dict[str, Any] | None]] = {}
+
+
+def _normalize_trend_keyword(keyword: str) -> str:
+    return " ".join(keyword.lower().split())
+
+
+def _trend_cache_key(keyword: str) -> str:
+    """Cache key for a keyword's trend research.
+
+    Keyed on the normalized keyword and the current year, which the research
+    query asks about, so cached trends never cross into a new year.
+    """
+    normalized = _normalize_trend_keyword(keyword)
+    digest = hashlib.sha256(normalized.encode()).hexdigest()[:32]
+    return f"{TREND_CACHE_KEY_PREFIX}{datetime.now(UTC).year}:{digest}"
+
+
+def _trend_is_fresh(trend_data: dict[str, Any] | None, ttl_seconds: int) -> bool:
+    """Whether stored trend data was fetched within the TTL."""
+    if not trend_data or not trend_data.get("trends"):
+        return False
+    try:
+        fetched_at = datetime.fromisoformat(trend_data["fetched_at"])
+    except (KeyError, TypeError, ValueError):
+        return False
+    if fetched_at.year != datetime.now(UTC).year:
+        return False
+    return (datetime.now(UTC) - fetched_at).total_seconds() < ttl_seconds
+
+
+async def _trend_cache_get(key: str) -> dict[str, Any] | None:
+    entry = _trend_cache.get(key)
+    if entry is not None:
+        if entry[0] > time.monotonic():
+            return entry[1]
+        _trend_cache.pop(key, None)
+
+    if not redis_manager.available:
+        return None
+    raw = await redis_manager.get(key)
+    if raw is None:
+        return None
+    try:
+        trend_data = json.loads(raw)
+    except ValueError:
+        return None
+    ttl = await redis_manager.ttl(key)
+    if ttl and ttl > 0:
+        _trend_cache_remember(key, trend_data, ttl)
+    return trend_data
+
+
+def _trend_cache_remember(key: str, trend_data: dict[str, Any], ttl: int) -> None:
+    """Store trend data in process, pruning expired and oldest entries."""
+    now = time.monotonic()
+    for stale in [k for k, (expires, _) in _trend_cache.items() if expires <= now]:
+        del _trend_cache[stale]
+    _trend_cache.pop(key, None)
+    while len(_trend_cache) >= TREND_CACHE_MAX_ENTRIES:
+        del _trend_cache[next(iter(_trend_cache))]
+    _trend_cache[key] = (now + ttl, trend_data)
+
+
+async def _trend_cache_put(key: str, trend_data: dict[str, Any], ttl: int) -> None:
+    _trend_cache_remember(key, trend_data, ttl)
+    if redis_manager.available:
+        await redis_manager.set(key, json.dumps(trend_data), ex=ttl)
+
+
+def clear_trend_cache() -> None:
+    """Drop all in-process cached trend research (used by tests)."""
+    _trend_cache.clear()
+    _trend_inflight.clear()
+
+
 async def _fetch_trend_context(
     keyword: str,
     brand_config: dict[str, Any],
+    stored: dict[str, Any] | None = None,
 ) -> dict[str, Any] | None:
-    """Fetch recent trend data for a keyword using Perplexity.
+    """Fetch recent trend data for a keyword, reusing recent research.
+
+    Research is cached per normalized keyword for BLOG_TREND_CACHE_TTL_DAYS
+    (in process and in Redis), so posts sharing a keyword and regenerations
+    don't re-query Perplexity. `stored` is the post's previously saved
+    trend research; it is reused while fresh and for the same keyword.
 
     Returns a dict with 'trends', 'citations', and 'fetched_at' keys,
     or None on failure (graceful degradation).
     """
+    ttl = get_settings().blog_trend_cache_ttl_days * 86400
+    if ttl <= 0:
+        return await _research_trends(keyword)
+
+    if (
+        stored
+        and stored.get("keyword") == _normalize_trend_keyword(keyword)
+        and _trend_is_fresh(stored, ttl)
+    ):
+        logger.info("Reusing stored trend research", extra={"keyword": keyword[:50]})
+        return stored
+
+    key = _trend_cache_key(keyword)
     try:
-        from app.integrations.perplexity import PerplexityClient
+        cached = await _trend_cache_get(key)
+    except Exception as exc:
+        logger.warning(
+            "Trend cache lookup failed",
+            extra={"keyword": keyword[:50], "error": str(exc)},
+        )
+        cached = None
+    if _trend_is_fresh(cached, ttl):
+        logger.info("Trend research cache hit", extra={"keyword": keyword[:50]})
+        return cached
+
+    task = _trend_inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_research_trends(keyword))
+        _trend_inflight[key] = task
+        task.add_done_callback(lambda _: _trend_inflight.pop(key, None))
+    trend_data = await asyncio.shield(task)
+
+    if trend_data is not None and key not in _trend_cache:
+        try:
+            await _trend_cache_put(key, trend_data, ttl)
+        except Exception as exc:
+            logger.warning(
+                "Trend cache store failed",
+                extra={"keyword": keyword[:50], "error": str(exc)},
+            )
+    return trend_data
+
 
-        client = PerplexityClient()
+async def _research_trends(keyword: str) -> dict[str, Any] | None:
+    """Run the Perplexity trend research query for a keyword."""
+    try:
+        from app.integrations.perplexity import get_perplexity
+
+        client = await get_perplexity()
         if not client.available:
             logger.info("Perplexity not configured, skipping trend research")
             return None
@@ -451,7 +568,6 @@ async def _fetch_trend_context(
         )
 
         result = await client.research_query(query)
-        await client.close()
 
         if not result.success or not result.text:
             logger.warning(
@@ -464,6 +580,7 @@ async def _fetch_trend_context(
             "trends": result.text,
             "citations": result.citations or [],
             "fetched_at": datetime.now(UTC).isoformat(),
+            "keyword": _normalize_trend_keyword(keyword),
         }
 
         logger.info(
@@ -548,7 +665,11 @@ async def _process_single_post(
                 refresh_briefs=refresh_briefs,
             )
 
-            trend_context = await _fetch_trend_context(keyword, brand_config)
+            trend_context = await _fetch_trend_context(
+                keyword,
+                brand_config,
+                stored=(blog_post.pop_brief or {}).get("trend_research"),
+            )
             if trend_context is not None:
                 existing_brief = blog_post.pop_brief or {}
                 existing_brief["trend_research"] = trend_context
@@ -775,9 +896,17 @@ async def _fetch_blog_brief(
                 return None
             response_data = task_result.data or {}
         else:
-            from app.services.pop_content_brief import _run_real_3step_flow
+            from app.services.pop_content_brief import (
+                run_3step_flow_with_shared_cache,
+            )
 
-            response_data, _ = await _run_real_3step_flow(pop_client, keyword, url_slug)
+            response_data, _, _ = await run_3step_flow_with_shared_cache(
+                db=db,
+                pop_client=pop_client,
+                keyword=keyword,
+                target_url=url_slug,
+                force_refresh=refresh_briefs,
+            )
 
         # Parse raw POP keys into normalized names for the frontend sidebar
         from app.services.pop_content_brief import (
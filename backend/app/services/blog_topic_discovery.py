@@ -9,13 +9,13 @@ This service orchestrates blog topic discovery using a 4-stage pipeline:
 
 import json
 import re
-import time
 from typing import Any
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logging import get_logger
+from app.core.tracing import trace_stage, traced_run
 from app.integrations.claude import ClaudeClient
 from app.integrations.dataforseo import DataForSEOClient
 from app.models.blog import BlogCampaign, BlogPost, CampaignStatus, PostStatus
@@ -682,6 +682,7 @@ Example:
 
         return results
 
+    @traced_run("blog_topic_discovery", record_args=("project_id", "cluster_id"))
     async def discover_topics(
         self,
         project_id: str,
@@ -726,19 +727,19 @@ Example:
         brand_context = self._build_brand_context(brand_config)
 
         # --- Stage 1: Extract POP seeds or use provided seed keyword ---
-        t1_start = time.perf_counter()
-        if seed_keyword and not cluster_id:
-            # Standalone mode: user-provided seed keyword becomes the seed
-            seeds = [
-                {
-                    "seed": seed_keyword.strip().lower(),
-                    "source_type": "user_provided",
-                    "source_page_id": None,
-                }
-            ]
-        else:
-            seeds = await self.extract_pop_seeds(cluster_id, db)  # type: ignore[arg-type]
-        t1_ms = round((time.perf_counter() - t1_start) * 1000)
+        with trace_stage("blog_topics.seeds") as stage:
+            if seed_keyword and not cluster_id:
+                # Standalone mode: user-provided seed keyword becomes the seed
+                seeds = [
+                    {
+                        "seed": seed_keyword.strip().lower(),
+                        "source_type": "user_provided",
+                        "source_page_id": None,
+                    }
+                ]
+            else:
+                seeds = await self.extract_pop_seeds(cluster_id, db)  # type: ignore[arg-type]
+        t1_ms = round(stage.duration_ms)
 
         if not seeds:
             raise ValueError(
@@ -747,44 +748,44 @@ Example:
             )
 
         # --- Stage 2: Expand topics ---
-        t2_start = time.perf_counter()
-        try:
-            candidates = await self.expand_topics(seeds, brand_context)
-        except Exception as e:
-            logger.error(
-                "Stage 2 (topic expansion) failed",
-                extra={"cluster_id": cluster_id, "error": str(e)},
-                exc_info=True,
-            )
-            raise ValueError(f"Blog topic discovery failed at Stage 2: {e}") from e
-        t2_ms = round((time.perf_counter() - t2_start) * 1000)
+        with trace_stage("blog_topics.expand") as stage:
+            try:
+                candidates = await self.expand_topics(seeds, brand_context)
+            except Exception as e:
+                logger.error(
+                    "Stage 2 (topic expansion) failed",
+                    extra={"cluster_id": cluster_id, "error": str(e)},
+                    exc_info=True,
+                )
+                raise ValueError(f"Blog topic discovery failed at Stage 2: {e}") from e
+        t2_ms = round(stage.duration_ms)
 
         # --- Stage 3: Enrich with volume ---
-        t3_start = time.perf_counter()
-        try:
-            enriched = await self.enrich_with_volume(candidates)
-            if enriched and enriched[0].get("volume_unavailable"):
+        with trace_stage("blog_topics.volume") as stage:
+            try:
+                enriched = await self.enrich_with_volume(candidates)
+                if enriched and enriched[0].get("volume_unavailable"):
+                    volume_unavailable = True
+                    warnings.append(
+                        "Search volume data unavailable — DataForSEO lookup failed or not configured. "
+                        "Filtering proceeded without volume data."
+                    )
+                    # Use all candidates without volume filtering
+                    candidates = enriched
+                else:
+                    candidates = enriched
+            except Exception as e:
+                logger.warning(
+                    "Stage 3 (volume enrichment) failed, continuing without volume",
+                    extra={"cluster_id": cluster_id, "error": str(e)},
+                    exc_info=True,
+                )
                 volume_unavailable = True
                 warnings.append(
-                    "Search volume data unavailable — DataForSEO lookup failed or not configured. "
+                    f"Search volume enrichment failed: {e}. "
                     "Filtering proceeded without volume data."
                 )
-                # Use all candidates without volume filtering
-                candidates = enriched
-            else:
-                candidates = enriched
-        except Exception as e:
-            logger.warning(
-                "Stage 3 (volume enrichment) failed, continuing without volume",
-                extra={"cluster_id": cluster_id, "error": str(e)},
-                exc_info=True,
-            )
-            volume_unavailable = True
-            warnings.append(
-                f"Search volume enrichment failed: {e}. "
-                "Filtering proceeded without volume data."
-            )
-        t3_ms = round((time.perf_counter() - t3_start) * 1000)
+        t3_ms = round(stage.duration_ms)
 
         # Resolve cluster/campaign name for Stage 4
         if cluster_id:
@@ -799,17 +800,17 @@ Example:
             campaign_name = name or f"Blog: {seed_keyword}"
 
         # --- Stage 4: Filter and rank ---
-        t4_start = time.perf_counter()
-        try:
-            filtered = await self.filter_and_rank(candidates, cluster_name)
-        except Exception as e:
-            logger.error(
-                "Stage 4 (filtering) failed",
-                extra={"cluster_id": cluster_id, "error": str(e)},
-                exc_info=True,
-            )
-            raise ValueError(f"Blog topic discovery failed at Stage 4: {e}") from e
-        t4_ms = round((time.perf_counter() - t4_start) * 1000)
+        with trace_stage("blog_topics.filter") as stage:
+            try:
+                filtered = await self.filter_and_rank(candidates, cluster_name)
+            except Exception as e:
+                logger.error(
+                    "Stage 4 (filtering) failed",
+                    extra={"cluster_id": cluster_id, "error": str(e)},
+                    exc_info=True,
+                )
+                raise ValueError(f"Blog topic discovery failed at Stage 4: {e}") from e
+        t4_ms = round(stage.duration_ms)
 
         # --- Enrich alternative keywords with volume data ---
         if not volume_unavailable and self._dataforseo.available:
@@ -5,7 +5,7 @@ Orchestrates the brand configuration generation process, including:
 - Tracking generation status in project.brand_wizard_state
 - Reporting current progress
 - Research phase: parallel data gathering from Perplexity, Crawl4AI, and documents
-- Synthesis phase: parallel-batched generation of 9 brand config sections + ai_prompt_snippet via Claude
+- Synthesis phase: dependency-scheduled generation of 9 brand config sections + ai_prompt_snippet via Claude
 - Post-synthesis: subreddit research via Perplexity (if Reddit config exists)
 """
 
@@ -73,22 +73,20 @@ SECTION_CONTEXT_DEPS: dict[str, list[str] | None] = {
     "ai_prompt_snippet": None,  # ALL sections (it's a summary)
 }
 
-# Execution batches for parallel synthesis. Sections in the same batch run
-# concurrently via asyncio.gather. Order derived from SECTION_CONTEXT_DEPS:
-# a section can run once ALL its dependency sections have been generated.
-SYNTHESIS_BATCHES: list[list[str]] = [
-    ["brand_foundation"],  # no deps
-    ["target_audience"],  # brand_foundation
-    [
-        "voice_dimensions",
-        "trust_elements",
-        "competitor_context",
-    ],  # brand_foundation + target_audience
-    ["voice_characteristics"],  # voice_dimensions
-    ["writing_style"],  # voice_characteristics
-    ["vocabulary"],  # voice_characteristics + writing_style
-    ["ai_prompt_snippet"],  # ALL sections
-]
+
+def resolve_section_dependencies() -> dict[str, list[str]]:
+    """Return the sections each synthesis section must wait for.
+
+    Derived from SECTION_CONTEXT_DEPS. A None entry means "all sections
+    declared before it" (nothing for brand_foundation, everything for
+    ai_prompt_snippet), matching the context _generate_section builds.
+    """
+    resolved: dict[str, list[str]] = {}
+    declared: list[str] = []
+    for section_name, deps in SECTION_CONTEXT_DEPS.items():
+        resolved[section_name] = list(declared) if deps is None else list(deps)
+        declared.append(section_name)
+    return resolved
 
 
 def fix_json_control_chars(json_text: str) -> str:
@@ -749,9 +747,9 @@ async def _generate_section(
 ) -> tuple[str, dict[str, Any] | None, list[str]]:
     """Generate a single brand config section with retry logic.
 
-    Designed to be called concurrently via asyncio.gather for sections
-    in the same execution batch. Reads from generated_sections but does
-    NOT write to it — the caller collects results after the batch completes.
+    Designed to be called concurrently for sections whose dependencies have
+    finished. Reads from generated_sections but does NOT write to it — the
+    caller stores the result once the section completes.
 
     Args:
         section_name: Name of the section to generate.
@@ -1435,19 +1433,17 @@ class BrandConfigService:
         claude: ClaudeClient,
         update_status_callback: Any | None = None,
     ) -> dict[str, Any]:
-        """Execute the synthesis phase, generating brand config sections in parallel batches.
+        """Execute the synthesis phase, generating brand config sections concurrently.
 
-        Sections are grouped into batches based on their dependency graph
-        (SECTION_CONTEXT_DEPS). Sections in the same batch share no dependencies
-        and run concurrently via asyncio.gather:
+        Sections are scheduled from their dependency graph
+        (SECTION_CONTEXT_DEPS): each section starts as soon as every section
+        it depends on has finished, instead of waiting for a whole batch.
+        For example voice_characteristics starts right after voice_dimensions,
+        while trust_elements and competitor_context may still be running.
+        ai_prompt_snippet depends on all other sections and runs last.
 
-        Batch 1: brand_foundation (no deps)
-        Batch 2: target_audience (brand_foundation)
-        Batch 3: voice_dimensions + trust_elements + competitor_context (brand_foundation + target_audience)
-        Batch 4: voice_characteristics (voice_dimensions)
-        Batch 5: writing_style (voice_characteristics)
-        Batch 6: vocabulary (voice_characteristics + writing_style)
-        Batch 7: ai_prompt_snippet (ALL sections)
+        Each section receives a snapshot of just its finished dependencies,
+        and progress is reported once per section as it starts.
 
         Args:
             project_id: UUID string of the project (for logging).
@@ -1538,50 +1534,68 @@ class BrandConfigService:
         errors: list[str] = []
         steps_completed = 0
 
-        # Generate sections in parallel batches (sections in the same batch
-        # share no dependencies and can run concurrently via asyncio.gather)
-        for batch in SYNTHESIS_BATCHES:
-            # Filter to synthesis-only sections (skip e.g. subreddit_research)
-            batch_sections = [s for s in batch if s in SECTION_PROMPTS]
-            if not batch_sections:
-                continue
+        # Synthesis-only sections (skip e.g. subreddit_research) and the
+        # sections each one waits for
+        dependencies = {
+            section_name: [d for d in deps if d in SECTION_PROMPTS]
+            for section_name, deps in resolve_section_dependencies().items()
+            if section_name in SECTION_PROMPTS
+        }
+        finished = {section_name: asyncio.Event() for section_name in dependencies}
+        # The status callback commits on the caller's session, so calls
+        # from concurrently running sections must not overlap
+        progress_lock = asyncio.Lock()
 
-            logger.info(
-                "Starting synthesis batch",
-                extra={
-                    "project_id": project_id,
-                    "batch": batch_sections,
-                    "parallel": len(batch_sections) > 1,
-                    "steps_completed": steps_completed,
-                },
-            )
+        async def run_section(section_name: str) -> None:
+            nonlocal steps_completed
+            try:
+                for dep in dependencies[section_name]:
+                    await finished[dep].wait()
 
-            # Report progress for the first section in this batch
-            if update_status_callback:
-                await update_status_callback(batch_sections[0], steps_completed)
-
-            # Launch all sections in this batch concurrently
-            batch_results = await asyncio.gather(
-                *[
-                    _generate_section(
-                        section_name=section_name,
-                        research_text=research_text,
-                        generated_sections=generated_sections,
-                        claude=claude,
-                        project_id=project_id,
-                        brand_directives=research_context.brand_directives,
-                    )
-                    for section_name in batch_sections
-                ]
-            )
+                # Dependencies are final once finished, so this is a
+                # consistent view regardless of what else is running
+                context_snapshot = {
+                    dep: generated_sections[dep]
+                    for dep in dependencies[section_name]
+                    if dep in generated_sections
+                }
 
-            # Collect results — update generated_sections AFTER the batch
-            # so the next batch can read from a consistent snapshot
-            for section_name, section_data, section_errors in batch_results:
+                logger.info(
+                    "Starting synthesis section",
+                    extra={
+                        "project_id": project_id,
+                        "section": section_name,
+                        "steps_completed": steps_completed,
+                    },
+                )
+                if update_status_callback:
+                    async with progress_lock:
+                        await update_status_callback(section_name, steps_completed)
+
+                _, section_data, section_errors = await _generate_section(
+                    section_name=section_name,
+                    research_text=research_text,
+                    generated_sections=context_snapshot,
+                    claude=claude,
+                    project_id=project_id,
+                    brand_directives=research_context.brand_directives,
+                )
                 if section_data is not None:
                     generated_sections[section_name] = section_data
                 errors.extend(section_errors)
                 steps_completed += 1
+            finally:
+                # Release dependents even if this section raised
+                finished[section_name].set()
+
+        await asyncio.gather(*(run_section(name) for name in dependencies))
+
+        # Keep section order stable regardless of completion order
+        generated_sections = {
+            name: generated_sections[name]
+            for name in GENERATION_STEPS
+            if name in generated_sections
+        }
 
         # Post-processing: seed vocabulary.competitors from competitor_context
         _seed_competitors_from_context(generated_sections, project_id)
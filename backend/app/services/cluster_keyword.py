@@ -11,16 +11,17 @@ import math
 import re
 import time
 from typing import Any
+from uuid import uuid4
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logging import get_logger
 from app.integrations.claude import ClaudeClient
 from app.integrations.dataforseo import DataForSEOClient
-from app.models.crawled_page import CrawledPage, CrawlStatus
 from app.models.keyword_cluster import ClusterPage, ClusterStatus, KeywordCluster
 from app.models.page_keywords import PageKeywords
+from app.services.page_bridge import BridgePage, bridge_crawled_pages
 
 HAIKU_MODEL = "claude-haiku-4-5-20251001"
 
@@ -1223,43 +1224,43 @@ Example:
         crawled_page_ids: list[str] = []
 
         try:
-            for cp in approved_pages:
-                # Check if a CrawledPage already exists for this URL
-                existing_stmt = select(CrawledPage).where(
-                    CrawledPage.project_id == cluster.project_id,
-                    CrawledPage.normalized_url == cp.url_slug,
-                )
-                existing_result = await db.execute(existing_stmt)
-                crawled_page = existing_result.scalar_one_or_none()
-
-                if crawled_page is None:
-                    # Create CrawledPage for the content pipeline
-                    crawled_page = CrawledPage(
-                        project_id=cluster.project_id,
+            # Resolve or create all CrawledPages in two statements
+            url_to_page_id = await bridge_crawled_pages(
+                db,
+                cluster.project_id,
+                [
+                    BridgePage(
                         normalized_url=cp.url_slug,
-                        source="cluster",
-                        status=CrawlStatus.COMPLETED.value,
-                        category="collection",
                         title=cp.keyword,
+                        category="collection",
                     )
-                    db.add(crawled_page)
-                    await db.flush()  # Get crawled_page.id
-
-                # Create PageKeywords for the content pipeline
-                page_keywords = PageKeywords(
-                    crawled_page_id=crawled_page.id,
-                    primary_keyword=cp.keyword,
-                    is_approved=True,
-                    is_priority=cp.role == "parent",
-                    search_volume=cp.search_volume,
-                    composite_score=cp.composite_score,
+                    for cp in approved_pages
+                ],
+                source="cluster",
+                match_any_source=True,
+            )
+
+            # Create PageKeywords for the content pipeline in one statement
+            keyword_rows = []
+            for cp in approved_pages:
+                crawled_page_id = url_to_page_id[cp.url_slug]
+                keyword_rows.append(
+                    {
+                        "id": str(uuid4()),
+                        "crawled_page_id": crawled_page_id,
+                        "primary_keyword": cp.keyword,
+                        "is_approved": True,
+                        "is_priority": cp.role == "parent",
+                        "search_volume": cp.search_volume,
+                        "composite_score": cp.composite_score,
+                    }
                 )
-                db.add(page_keywords)
 
                 # Link ClusterPage back to the new CrawledPage
-                cp.crawled_page_id = crawled_page.id
+                cp.crawled_page_id = crawled_page_id
 
-                crawled_page_ids.append(crawled_page.id)
+                crawled_page_ids.append(crawled_page_id)
+            await db.execute(insert(PageKeywords), keyword_rows)
 
             # Update cluster status
             cluster.status = ClusterStatus.APPROVED.value
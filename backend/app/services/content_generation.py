@@ -4,9 +4,11 @@ Orchestrates the brief → write → check → link pipeline for each approved p
 with concurrency control. Designed to be called from a FastAPI BackgroundTask.
 
 Pipeline phases:
-Phase 1: Pre-fetch POP content briefs concurrently
-Phase 2: Write content + quality checks per page (concurrent with semaphore)
-Phase 3: Auto-run link planning to inject/re-inject internal links
+Phase 1: Stream each page through brief → write → quality on its own. Every
+         stage has its own concurrency limit (POP, Claude, quality checks),
+         so a slow POP report only delays its own page
+Phase 2: Auto-run link planning to inject/re-inject internal links once all
+         pages are done (the onboarding link graph spans the whole project)
 
 Error isolation: if one page fails, others continue. Failed pages get
 status='failed' with error details in qa_results. Link planning failures
@@ -26,11 +28,14 @@ from sqlalchemy.orm import selectinload
 from app.core.config import get_settings
 from app.core.database import db_manager
 from app.core.logging import get_logger
+from app.core.query_stats import query_scoped
+from app.core.tracing import trace_stage, traced_run
 from app.models.brand_config import BrandConfig
 from app.models.crawled_page import CrawledPage
 from app.models.page_content import ContentStatus, PageContent
 from app.models.page_keywords import PageKeywords
 from app.models.prompt_log import PromptLog
+from app.services.bible_matcher import get_compiled_matcher, normalize_trigger
 from app.services.content_outline import (
     generate_content_from_outline,
     generate_outline,
@@ -88,6 +93,36 @@ class PipelinePageResult:
     skipped: bool = False
 
 
+@dataclass
+class PipelineStageLimits:
+    """Per-stage concurrency limits for the content pipeline.
+
+    A page holds a stage's slot only while that stage runs, so pages move
+    through brief → write → quality independently and each stage is limited
+    by its own resource (POP, Claude, quality checks). max_in_flight bounds
+    how many pages are admitted at once, which caps the pages waiting
+    between stages.
+    """
+
+    brief: asyncio.Semaphore
+    write: asyncio.Semaphore
+    quality: asyncio.Semaphore
+    max_in_flight: int
+
+    @classmethod
+    def from_settings(cls) -> "PipelineStageLimits":
+        settings = get_settings()
+        brief = max(1, settings.content_brief_concurrency)
+        write = max(1, settings.content_generation_concurrency)
+        quality = max(1, settings.content_quality_concurrency)
+        return cls(
+            brief=asyncio.Semaphore(brief),
+            write=asyncio.Semaphore(write),
+            quality=asyncio.Semaphore(quality),
+            max_in_flight=brief + write + quality,
+        )
+
+
 @dataclass
 class PipelineResult:
     """Result of running the content generation pipeline for a project."""
@@ -102,6 +137,8 @@ class PipelineResult:
     completed_at: str = ""
 
 
+@traced_run("content_pipeline")
+@query_scoped("content_pipeline")
 async def run_content_pipeline(
     project_id: str,
     force_refresh: bool = False,
@@ -111,8 +148,10 @@ async def run_content_pipeline(
 ) -> PipelineResult:
     """Run the content generation pipeline for all approved pages in a project.
 
-    Processes each page through: brief → write → check. Uses asyncio.Semaphore
-    for concurrency control (CONTENT_GENERATION_CONCURRENCY env var, default 1).
+    Processes each page through: brief → write → check. Pages flow through
+    the stages independently; each stage has its own limit (see
+    PipelineStageLimits: CONTENT_BRIEF_CONCURRENCY,
+    CONTENT_GENERATION_CONCURRENCY, CONTENT_QUALITY_CONCURRENCY).
 
     Designed to be called from a FastAPI BackgroundTask — creates its own
     database sessions per-page for isolation.
@@ -127,8 +166,7 @@ async def run_content_pipeline(
     Returns:
         PipelineResult with per-page results and aggregate counts.
     """
-    settings = get_settings()
-    concurrency = settings.content_generation_concurrency
+    stage_limits = PipelineStageLimits.from_settings()
 
     result = PipelineResult(
         project_id=project_id,
@@ -139,16 +177,17 @@ async def run_content_pipeline(
         "Starting content generation pipeline",
         extra={
             "project_id": project_id,
-            "concurrency": concurrency,
+            "max_in_flight": stage_limits.max_in_flight,
             "force_refresh": force_refresh,
         },
     )
 
     # Load approved pages, brand config, and bibles in a read-only session
-    async with db_manager.session_factory() as session:
-        pages_data = await _load_approved_pages(session, project_id, batch=batch)
-        brand_config = await _load_brand_config(session, project_id)
-        project_bibles = await _load_project_bibles(session, project_id)
+    with trace_stage("content.load_inputs"):
+        async with db_manager.session_factory() as session:
+            pages_data = await _load_approved_pages(session, project_id, batch=batch)
+            brand_config = await _load_brand_config(session, project_id)
+            project_bibles = await _load_project_bibles(session, project_id)
 
     if not pages_data:
         logger.info(
@@ -187,35 +226,30 @@ async def run_content_pipeline(
                 extra={"project_id": project_id, "pages_reset": len(page_ids)},
             )
 
-    # --- Phase 1: Pre-fetch all POP briefs concurrently ---
-    # POP briefs involve async polling loops that are mostly I/O wait.
-    # Fetching all briefs upfront in parallel (ungated) eliminates the
-    # per-page serial bottleneck where brief → write was sequential.
-    await _prefetch_all_briefs(
-        pages_data=pages_data,
-        force_refresh=force_refresh,
-        refresh_briefs=refresh_briefs,
-        outline_first=outline_first,
-    )
-
-    # --- Phase 2: Write content + quality checks (briefs are now cached) ---
-    semaphore = asyncio.Semaphore(concurrency)
-
-    async def _process_with_semaphore(
-        page_data: dict[str, Any],
-    ) -> PipelinePageResult:
-        async with semaphore:
-            return await _process_single_page(
-                page_data=page_data,
-                brand_config=brand_config,
-                force_refresh=force_refresh,
-                refresh_briefs=False,  # Briefs already fetched in Phase 1
-                outline_first=outline_first,
-                project_bibles=project_bibles,
-            )
+    # Batch-set every page that will be processed to GENERATING_BRIEF and
+    # commit, so the frontend polling endpoint sees the whole run start at
+    # once rather than as pages are admitted.
+    await _mark_pages_generating_brief(pages_data, force_refresh, outline_first)
+
+    # --- Phase 1: Stream pages through brief → write → quality ---
+    # No barrier between stages: a page starts writing as soon as its own
+    # brief is ready, while other pages are still waiting on POP.
+    admission = asyncio.Semaphore(stage_limits.max_in_flight)
+
+    async def _process_admitted(page_data: dict[str, Any]) -> PipelinePageResult:
+        async with admission:
+            with trace_stage("content.page", page_id=page_data["page_id"]):
+                return await _process_single_page(
+                    page_data=page_data,
+                    brand_config=brand_config,
+                    force_refresh=force_refresh,
+                    refresh_briefs=refresh_briefs,
+                    outline_first=outline_first,
+                    project_bibles=project_bibles,
+                    stage_limits=stage_limits,
+                )
 
-    tasks = [_process_with_semaphore(pd) for pd in pages_data]
-    page_results = await asyncio.gather(*tasks)
+    page_results = await asyncio.gather(*(_process_admitted(pd) for pd in pages_data))
 
     # Aggregate results
     for pr in page_results:
@@ -240,16 +274,55 @@ async def run_content_pipeline(
         },
     )
 
-    # --- Phase 3: Auto-run link planning to inject/re-inject internal links ---
+    # --- Phase 2: Auto-run link planning to inject/re-inject internal links ---
     # Only run if at least 2 pages have complete content (link planning needs ≥2)
     # Skip link planning in outline_first mode (outlines don't have content yet)
     completed_count = result.succeeded + result.skipped  # skipped = already complete
     if completed_count >= 2 and not outline_first:
-        await _auto_link_planning(project_id)
+        with trace_stage("content.auto_link_planning"):
+            await _auto_link_planning(project_id)
 
     return result
 
 
+async def _mark_pages_generating_brief(
+    pages_data: list[dict[str, Any]],
+    force_refresh: bool,
+    outline_first: bool = False,
+) -> None:
+    """Set GENERATING_BRIEF on every page _process_single_page won't skip."""
+
+    # Mirrors the skip rule in _process_single_page
+    def _needs_brief(pd: dict[str, Any]) -> bool:
+        if force_refresh:
+            return True
+        if pd["existing_content_status"] != ContentStatus.COMPLETE.value:
+            return True
+        return outline_first and pd.get("existing_outline_status") != "generating"
+
+    page_ids = [pd["page_id"] for pd in pages_data if _needs_brief(pd)]
+    if not page_ids:
+        return
+
+    async with db_manager.session_factory() as status_db:
+        stmt = select(PageContent).where(PageContent.crawled_page_id.in_(page_ids))
+        result = await status_db.execute(stmt)
+        existing = {pc.crawled_page_id: pc for pc in result.scalars().all()}
+
+        for pid in page_ids:
+            if pid in existing:
+                existing[pid].status = ContentStatus.GENERATING_BRIEF.value
+            else:
+                status_db.add(
+                    PageContent(
+                        crawled_page_id=pid,
+                        status=ContentStatus.GENERATING_BRIEF.value,
+                    )
+                )
+        await status_db.commit()
+
+
+@traced_run("generate_from_outline")
 async def run_generate_from_outline(
     project_id: str,
     page_id: str,
@@ -479,104 +552,8 @@ async def run_generate_from_outline(
         )
 
 
-async def _prefetch_all_briefs(
-    pages_data: list[dict[str, Any]],
-    force_refresh: bool,
-    refresh_briefs: bool,
-    outline_first: bool = False,
-) -> None:
-    """Phase 1: Pre-fetch POP content briefs for all pages concurrently.
-
-    POP briefs involve async polling loops (2s intervals) that are mostly I/O
-    wait. Running all brief fetches in parallel — instead of gated behind the
-    per-page content-writing semaphore — dramatically reduces wall-clock time.
-
-    Brief results are stored in the database by fetch_content_brief and will be
-    returned from cache when _process_single_page runs in Phase 2.
-    """
-    # Skip pages that will be skipped in Phase 2 (already complete).
-    # In outline_first mode, pages with complete content still need briefs
-    # (they won't be skipped in Phase 2) unless actively generating.
-    def _needs_brief(pd: dict[str, Any]) -> bool:
-        if force_refresh:
-            return True
-        if pd["existing_content_status"] != ContentStatus.COMPLETE.value:
-            return True
-        if outline_first and pd.get("existing_outline_status") != "generating":
-            return True
-        return False
-
-    pages_needing_briefs = [pd for pd in pages_data if _needs_brief(pd)]
-
-    if not pages_needing_briefs:
-        logger.info("Phase 1: All pages already complete, skipping brief pre-fetch")
-        return
-
-    logger.info(
-        "Phase 1: Pre-fetching POP briefs concurrently",
-        extra={"page_count": len(pages_needing_briefs)},
-    )
-
-    # Batch-set all pages to GENERATING_BRIEF and commit so the frontend
-    # polling endpoint can see the status immediately.
-    async with db_manager.session_factory() as status_db:
-        page_ids = [pd["page_id"] for pd in pages_needing_briefs]
-        stmt = select(PageContent).where(PageContent.crawled_page_id.in_(page_ids))
-        result = await status_db.execute(stmt)
-        existing = {pc.crawled_page_id: pc for pc in result.scalars().all()}
-
-        for pd in pages_needing_briefs:
-            pid = pd["page_id"]
-            if pid in existing:
-                existing[pid].status = ContentStatus.GENERATING_BRIEF.value
-            else:
-                status_db.add(
-                    PageContent(
-                        crawled_page_id=pid,
-                        status=ContentStatus.GENERATING_BRIEF.value,
-                    )
-                )
-        await status_db.commit()
-
-    async def _fetch_one_brief(page_data: dict[str, Any]) -> None:
-        page_id = page_data["page_id"]
-        keyword = page_data["keyword"]
-        url = page_data["url"]
-
-        try:
-            async with db_manager.session_factory() as db:
-                stmt = select(CrawledPage).where(CrawledPage.id == page_id)
-                result = await db.execute(stmt)
-                crawled_page = result.scalar_one_or_none()
-
-                if crawled_page is None:
-                    return
-
-                await fetch_content_brief(
-                    db=db,
-                    crawled_page=crawled_page,
-                    keyword=keyword,
-                    target_url=url,
-                    force_refresh=refresh_briefs,
-                )
-        except Exception as exc:
-            # Non-fatal: _process_single_page will retry in Phase 2
-            logger.warning(
-                "Brief pre-fetch failed (will retry in pipeline)",
-                extra={"page_id": page_id, "error": str(exc)},
-            )
-
-    brief_tasks = [_fetch_one_brief(pd) for pd in pages_needing_briefs]
-    await asyncio.gather(*brief_tasks)
-
-    logger.info(
-        "Phase 1: Brief pre-fetch complete",
-        extra={"page_count": len(pages_needing_briefs)},
-    )
-
-
 async def _auto_link_planning(project_id: str) -> None:
-    """Phase 3: Automatically run link planning after content generation.
+    """Phase 2: Automatically run link planning after content generation.
 
     Checks if InternalLink records already exist for the project (onboarding
     scope). If they do, runs replan_links (snapshot → strip → delete → re-run).
@@ -590,7 +567,7 @@ async def _auto_link_planning(project_id: str) -> None:
     from app.services.link_planning import replan_links, run_link_planning_pipeline
 
     logger.info(
-        "Phase 3: Starting auto link planning",
+        "Phase 2: Starting auto link planning",
         extra={"project_id": project_id},
     )
 
@@ -610,19 +587,19 @@ async def _auto_link_planning(project_id: str) -> None:
 
             if has_existing:
                 logger.info(
-                    "Phase 3: Existing links found, re-planning",
+                    "Phase 2: Existing links found, re-planning",
                     extra={"project_id": project_id},
                 )
                 await replan_links(project_id, "onboarding", None, db)
             else:
                 logger.info(
-                    "Phase 3: No existing links, running fresh link planning",
+                    "Phase 2: No existing links, running fresh link planning",
                     extra={"project_id": project_id},
                 )
                 await run_link_planning_pipeline(project_id, "onboarding", None, db)
 
         logger.info(
-            "Phase 3: Auto link planning complete",
+            "Phase 2: Auto link planning complete",
             extra={"project_id": project_id},
         )
 
@@ -630,7 +607,7 @@ async def _auto_link_planning(project_id: str) -> None:
         # Non-fatal: content generation already succeeded, links can be
         # planned manually via the UI if auto-planning fails.
         logger.warning(
-            "Phase 3: Auto link planning failed (non-fatal)",
+            "Phase 2: Auto link planning failed (non-fatal)",
             extra={
                 "project_id": project_id,
                 "error": str(e),
@@ -769,21 +746,15 @@ def _match_bibles_substring(
     project_bibles: list[Any],
     keyword: str,
 ) -> list[Any]:
-    """Fast substring matching — used as first pass before LLM fallback."""
-    keyword_lower = keyword.lower().strip()
-    matched: list[Any] = []
-
-    for bible in project_bibles:
-        triggers = getattr(bible, "trigger_keywords", []) or []
-        for trigger in triggers:
-            trigger_lower = str(trigger).lower().strip()
-            if not trigger_lower or len(trigger_lower) < 3:
-                continue
-            if trigger_lower in keyword_lower or keyword_lower in trigger_lower:
-                matched.append(bible)
-                break  # Don't add same bible twice
+    """Fast substring matching — used as first pass before LLM fallback.
 
-    return matched
+    Bidirectional (trigger in keyword or keyword in trigger), ignoring
+    triggers shorter than 3 characters. The compiled matcher is cached on the
+    bibles' triggers, so per-page calls within a run reuse it.
+    """
+    matcher = get_compiled_matcher(project_bibles, min_trigger_length=3)
+    positions = matcher.match_positions([normalize_trigger(keyword)])
+    return [project_bibles[p] for p in positions]
 
 
 async def _match_bibles_llm(
@@ -927,12 +898,17 @@ async def _process_single_page(
     refresh_briefs: bool = False,
     outline_first: bool = False,
     project_bibles: list[Any] | None = None,
+    stage_limits: PipelineStageLimits | None = None,
 ) -> PipelinePageResult:
     """Process a single page through the brief → write → check pipeline.
 
     Creates its own database session for error isolation — if this page fails,
-    the session is rolled back without affecting other pages.
+    the session is rolled back without affecting other pages. Each stage runs
+    under its slot in stage_limits; the session is committed before waiting
+    for the next stage so idle pages don't hold a connection.
     """
+    if stage_limits is None:
+        stage_limits = PipelineStageLimits.from_settings()
     page_id: str = page_data["page_id"]
     url: str = page_data["url"]
     keyword: str = page_data["keyword"]
@@ -998,13 +974,15 @@ async def _process_single_page(
             # By default, use cached POP brief — force_refresh only controls
             # whether we re-run the Claude writing step. Re-fetching from POP
             # (which costs API credits) requires explicit refresh_briefs=True.
-            brief_result = await fetch_content_brief(
-                db=db,
-                crawled_page=crawled_page,
-                keyword=keyword,
-                target_url=url,
-                force_refresh=refresh_briefs,
-            )
+            async with stage_limits.brief:
+                with trace_stage("content.brief"):
+                    brief_result = await fetch_content_brief(
+                        db=db,
+                        crawled_page=crawled_page,
+                        keyword=keyword,
+                        target_url=url,
+                        force_refresh=refresh_briefs,
+                    )
 
             content_brief = brief_result.content_brief
             if not brief_result.success:
@@ -1028,21 +1006,25 @@ async def _process_single_page(
                 )
 
             # Match vertical bibles for this keyword
-            matched_bibles = await _match_bibles_for_keyword(
-                project_bibles or [], keyword
-            )
+            with trace_stage("content.match_bibles"):
+                matched_bibles = await _match_bibles_for_keyword(
+                    project_bibles or [], keyword
+                )
+            await db.commit()
 
             # --- Step 2: Write content (or outline) ---
             if outline_first:
                 # Outline-first mode: generate outline, skip quality checks
-                outline_result = await generate_outline(
-                    db=db,
-                    crawled_page=crawled_page,
-                    content_brief=content_brief,
-                    brand_config=brand_config,
-                    keyword=keyword,
-                    matched_bibles=matched_bibles,
-                )
+                async with stage_limits.write:
+                    with trace_stage("content.outline"):
+                        outline_result = await generate_outline(
+                            db=db,
+                            crawled_page=crawled_page,
+                            content_brief=content_brief,
+                            brand_config=brand_config,
+                            keyword=keyword,
+                            matched_bibles=matched_bibles,
+                        )
 
                 if not outline_result.success:
                     await db.commit()
@@ -1094,29 +1076,31 @@ async def _process_single_page(
                 },
             )
 
-            if has_outline:
-                logger.info(
-                    "Page has outline — using outline-aware generation",
-                    extra={"page_id": page_id, "url": url},
-                )
-                writing_result = await generate_content_from_outline(
-                    db=db,
-                    crawled_page=crawled_page,
-                    content_brief=content_brief,
-                    brand_config=brand_config,
-                    keyword=keyword,
-                    outline_json=page_content.outline_json,
-                    matched_bibles=matched_bibles,
-                )
-            else:
-                writing_result = await generate_content(
-                    db=db,
-                    crawled_page=crawled_page,
-                    content_brief=content_brief,
-                    brand_config=brand_config,
-                    keyword=keyword,
-                    matched_bibles=matched_bibles,
-                )
+            async with stage_limits.write:
+                with trace_stage("content.write", from_outline=bool(has_outline)):
+                    if has_outline:
+                        logger.info(
+                            "Page has outline — using outline-aware generation",
+                            extra={"page_id": page_id, "url": url},
+                        )
+                        writing_result = await generate_content_from_outline(
+                            db=db,
+                            crawled_page=crawled_page,
+                            content_brief=content_brief,
+                            brand_config=brand_config,
+                            keyword=keyword,
+                            outline_json=page_content.outline_json,
+                            matched_bibles=matched_bibles,
+                        )
+                    else:
+                        writing_result = await generate_content(
+                            db=db,
+                            crawled_page=crawled_page,
+                            content_brief=content_brief,
+                            brand_config=brand_config,
+                            keyword=keyword,
+                            matched_bibles=matched_bibles,
+                        )
 
             if not writing_result.success:
                 # generate_content already marks PageContent as failed
@@ -1146,13 +1130,15 @@ async def _process_single_page(
             written_content.status = ContentStatus.CHECKING.value
             await db.commit()
 
-            pipeline_result = await run_quality_pipeline(
-                content=written_content,
-                brand_config=brand_config,
-                primary_keyword=keyword,
-                content_brief=content_brief,
-                matched_bibles=matched_bibles,
-            )
+            async with stage_limits.quality:
+                with trace_stage("content.quality"):
+                    pipeline_result = await run_quality_pipeline(
+                        content=written_content,
+                        brand_config=brand_config,
+                        primary_keyword=keyword,
+                        content_brief=content_brief,
+                        matched_bibles=matched_bibles,
+                    )
 
             # Apply auto-rewrite results if fixed version was kept
             _apply_rewrite_results(written_content, pipeline_result)
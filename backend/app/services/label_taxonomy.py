@@ -9,7 +9,9 @@ The taxonomy is stored in Project.phase_status.onboarding.taxonomy.
 Labels are stored in CrawledPage.labels array.
 """
 
+import asyncio
 import json
+from collections.abc import Awaitable, Callable, Sequence
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
@@ -17,14 +19,14 @@ from typing import Any
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import get_settings
 from app.core.logging import get_logger
-from app.integrations.claude import ClaudeClient
+from app.integrations.claude import BatchRequest, ClaudeClient, CompletionResult
 from app.models.crawled_page import CrawledPage, CrawlStatus
 from app.models.project import Project
 
 logger = get_logger(__name__)
 
-
 # Constants for label validation
 MIN_LABELS_PER_PAGE = 2
 MAX_LABELS_PER_PAGE = 5
@@ -297,6 +299,151 @@ Respond ONLY with valid JSON:
 }"""
 
 
+# Batched assignment: pages packed into one request (taxonomy sent once),
+# and how many batch requests run at the same time
+LABEL_BATCH_SIZE = 10
+LABEL_BATCH_CONCURRENCY = 4
+
+BATCH_ASSIGNMENT_INSTRUCTIONS = """BATCH MODE: The message contains several items, each introduced by a line "ITEM <number>". Apply the rules above to each item independently.
+
+Respond ONLY with valid JSON containing one entry per item:
+{
+  "assignments": [
+    {"item": 1, "labels": ["label-1", "label-2"], "confidence": 0.0-1.0, "reasoning": "Brief explanation"}
+  ]
+}"""
+
+
+def batch_system_prompt(system_prompt: str) -> str:
+    """Extend a single-item assignment system prompt for batched requests."""
+    return f"{system_prompt}\n\n{BATCH_ASSIGNMENT_INSTRUCTIONS}"
+
+
+def build_batch_user_prompt(
+    instruction: str,
+    taxonomy_desc: str,
+    item_infos: list[str],
+) -> str:
+    """Build a user prompt carrying the taxonomy once and several items.
+
+    Items are numbered from 1 in the order given.
+    """
+    items = "\n\n".join(
+        f"ITEM {number}\n{info}" for number, info in enumerate(item_infos, start=1)
+    )
+    return f"""{instruction}
+
+TAXONOMY:
+{taxonomy_desc}
+
+{items}
+
+Respond with JSON only."""
+
+
+def parse_batch_assignments(
+    text: str,
+    item_count: int,
+    valid_labels: set[str],
+) -> dict[int, dict[str, Any]]:
+    """Parse a batched assignment response into per-item results.
+
+    Returns a map from 0-based item position to that item's response object.
+    Items that are missing, duplicated, or have no label from valid_labels are
+    left out so callers can retry them individually.
+    """
+    json_text = text.strip()
+    if json_text.startswith("```"):
+        lines = json_text.split("\n")[1:]
+        if lines and lines[-1].strip() == "```":
+            lines = lines[:-1]
+        json_text = "\n".join(lines)
+
+    try:
+        parsed = json.loads(json_text)
+    except json.JSONDecodeError:
+        return {}
+    entries = parsed.get("assignments") if isinstance(parsed, dict) else None
+    if not isinstance(entries, list):
+        return {}
+
+    results: dict[int, dict[str, Any]] = {}
+    duplicates: set[int] = set()
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        try:
+            position = int(entry.get("item", 0)) - 1
+        except (TypeError, ValueError):
+            continue
+        labels = entry.get("labels")
+        if not 0 <= position < item_count or not isinstance(labels, list):
+            continue
+        if not any(str(label).strip().lower() in valid_labels for label in labels):
+            continue
+        if position in results:
+            duplicates.add(position)
+        results[position] = entry
+
+    for position in duplicates:
+        del results[position]
+    return results
+
+
+async def run_batched_assignment(
+    items: Sequence[Any],
+    assign_batch: Callable[[list[Any]], Awaitable[dict[int, Any]]],
+    assign_single: Callable[[Any], Awaitable[Any]],
+    *,
+    batch_size: int = LABEL_BATCH_SIZE,
+    concurrency: int = LABEL_BATCH_CONCURRENCY,
+) -> list[Any]:
+    """Assign labels to items in concurrent batches.
+
+    assign_batch returns results keyed by position within the batch; any item
+    it leaves out (or every item, if it raises) is retried with assign_single.
+    Batches of one go straight to assign_single.
+
+    Returns:
+        One result per item, in input order.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    batch_size = max(1, batch_size)
+
+    async def run_batch(batch: list[Any]) -> list[Any]:
+        async with semaphore:
+            batch_results: dict[int, Any] = {}
+            if len(batch) > 1:
+                try:
+                    batch_results = await assign_batch(batch)
+                except Exception as e:
+                    logger.warning(
+                        "Batched label assignment failed, retrying items individually",
+                        extra={"batch_size": len(batch), "error": str(e)},
+                    )
+            retry = [i for i in range(len(batch)) if i not in batch_results]
+            if retry and len(batch) > 1:
+                logger.info(
+                    "Retrying label assignment individually",
+                    extra={"batch_size": len(batch), "retried": len(retry)},
+                )
+            for i in retry:
+                batch_results[i] = await assign_single(batch[i])
+            return [batch_results[i] for i in range(len(batch))]
+
+    batches = [
+        list(items[start : start + batch_size])
+        for start in range(0, len(items), batch_size)
+    ]
+    batch_outputs = await asyncio.gather(*(run_batch(batch) for batch in batches))
+    return [result for output in batch_outputs for result in output]
+
+
+def _assignment_batch_id(pages: Sequence[CrawledPage]) -> str:
+    """Message Batch custom_id for a group of pages (keyed by its first page)."""
+    return f"labels-{pages[0].id}"
+
+
 @dataclass
 class TaxonomyLabel:
     """A label in the taxonomy with its definition."""
@@ -492,16 +639,34 @@ Generate a taxonomy that captures the main content types and purposes of these p
         db: AsyncSession,
         project_id: str,
         taxonomy: GeneratedTaxonomy | None = None,
+        batch_size: int = LABEL_BATCH_SIZE,
+        use_message_batches: bool | None = None,
     ) -> list[LabelAssignment]:
         """Assign labels from the taxonomy to each crawled page.
 
         If no taxonomy is provided, attempts to load it from the project's
         phase_status.onboarding.taxonomy field.
 
+        Pages are sent batch_size at a time with the taxonomy included once
+        per request; pages a batch response does not cover are retried one
+        by one. batch_size=1 sends one request per page.
+
+        With use_message_batches, all multi-page requests are submitted
+        together as one Claude Message Batch instead of interactive calls;
+        only the per-page retries stay interactive. db is committed before
+        the batch is submitted, so no transaction or connection is held
+        while it runs, and the labels are written in a new transaction.
+        Groups the batch has not finished within
+        LABEL_ASSIGNMENT_BATCH_MAX_WAIT are canceled and their pages
+        assigned one by one.
+
         Args:
             db: AsyncSession for database operations.
             project_id: Project ID to assign labels for.
             taxonomy: Optional taxonomy to use (loads from project if not provided).
+            batch_size: Pages per Claude request.
+            use_message_batches: Use the Message Batches API. Defaults to the
+                LABEL_ASSIGNMENT_USE_BATCHES setting.
 
         Returns:
             List of LabelAssignment results for each page.
@@ -567,21 +732,48 @@ Generate a taxonomy that captures the main content types and purposes of these p
             f"- {label.name}: {label.description}" for label in taxonomy.labels
         )
 
-        assignments: list[LabelAssignment] = []
+        valid_labels = {label.name for label in taxonomy.labels}
 
-        # Process each page
-        for page in pages:
-            assignment = await self._assign_labels_to_page(
+        if use_message_batches is None:
+            use_message_batches = get_settings().label_assignment_use_batches
+
+        batch_completions: dict[str, CompletionResult] | None = None
+        if use_message_batches:
+            # Batches can take minutes to hours; don't sit idle in a transaction
+            await db.commit()
+            batch_completions = await self._submit_assignment_batches(
+                pages, taxonomy_desc, batch_size
+            )
+
+        async def assign_batch(batch: list[CrawledPage]) -> dict[int, LabelAssignment]:
+            if batch_completions is None:
+                return await self._assign_labels_to_batch(
+                    batch, taxonomy_desc, valid_labels
+                )
+            completion = batch_completions.get(_assignment_batch_id(batch))
+            if completion is None:
+                return {}
+            return self._batch_assignments(batch, completion, valid_labels)
+
+        async def assign_single(page: CrawledPage) -> LabelAssignment:
+            return await self._assign_labels_to_page(
                 page=page,
                 taxonomy_desc=taxonomy_desc,
-                valid_labels={label.name for label in taxonomy.labels},
+                valid_labels=valid_labels,
             )
-            assignments.append(assignment)
 
-            # Update page labels in database
+        assignments = await run_batched_assignment(
+            pages,
+            assign_batch,
+            assign_single,
+            batch_size=batch_size,
+        )
+
+        # Update page labels in database
+        for page, assignment in zip(pages, assignments, strict=True):
             if assignment.success:
                 page.labels = assignment.labels
-                await db.flush()
+        await db.flush()
 
         # Log summary
         successful = sum(1 for a in assignments if a.success)
@@ -613,31 +805,13 @@ Generate a taxonomy that captures the main content types and purposes of these p
         Returns:
             LabelAssignment result.
         """
-        # Build page info for prompt
-        page_info = f"URL: {page.normalized_url}"
-        if page.title:
-            page_info += f"\nTitle: {page.title}"
-        if page.meta_description:
-            page_info += f"\nDescription: {page.meta_description[:300]}"
-        if page.headings:
-            h1s = page.headings.get("h1", [])
-            h2s = page.headings.get("h2", [])
-            if h1s:
-                page_info += f"\nH1: {', '.join(h1s[:3])}"
-            if h2s:
-                page_info += f"\nH2: {', '.join(h2s[:5])}"
-        if page.product_count:
-            page_info += f"\nProducts on page: {page.product_count}"
-        if page.word_count:
-            page_info += f"\nWord count: {page.word_count}"
-
         user_prompt = f"""Assign labels to this page using the taxonomy below.
 
 TAXONOMY:
 {taxonomy_desc}
 
 PAGE:
-{page_info}
+{self._page_info(page)}
 
 Respond with JSON only."""
 
@@ -664,43 +838,7 @@ Respond with JSON only."""
             response_text = completion.text or ""
             json_text = self._extract_json(response_text)
             parsed = json.loads(json_text)
-
-            labels = parsed.get("labels", [])
-
-            # Validate labels using the validation function
-            validation_result = validate_labels(labels, valid_labels)
-
-            if not validation_result.valid:
-                # Log validation issues but still use the valid labels we got
-                for error in validation_result.errors:
-                    if error.code == "invalid_labels":
-                        logger.warning(
-                            "AI assigned labels not in taxonomy",
-                            extra={
-                                "page_id": page.id,
-                                "invalid_labels": error.details.get(
-                                    "invalid_labels", []
-                                ),
-                            },
-                        )
-                    elif error.code in ("too_few_labels", "too_many_labels"):
-                        logger.warning(
-                            f"AI label count validation: {error.message}",
-                            extra={"page_id": page.id},
-                        )
-
-            # Filter to only valid labels from taxonomy
-            valid_assigned = [
-                label for label in validation_result.labels if label in valid_labels
-            ]
-
-            return LabelAssignment(
-                page_id=page.id,
-                labels=valid_assigned,
-                confidence=float(parsed.get("confidence", 0.5)),
-                reasoning=parsed.get("reasoning"),
-                success=True,
-            )
+            return self._assignment_from_response(page.id, parsed, valid_labels)
 
         except json.JSONDecodeError as e:
             logger.error(
@@ -720,6 +858,150 @@ Respond with JSON only."""
                 error=f"JSON parse error: {e}",
             )
 
+    async def _assign_labels_to_batch(
+        self,
+        pages: list[CrawledPage],
+        taxonomy_desc: str,
+        valid_labels: set[str],
+    ) -> dict[int, LabelAssignment]:
+        """Assign labels to several pages in one request.
+
+        Returns:
+            Assignments keyed by position in pages; pages without a usable
+            result are omitted.
+        """
+        completion = await self._claude.complete(
+            **self._batch_request_kwargs(pages, taxonomy_desc)
+        )
+        return self._batch_assignments(pages, completion, valid_labels)
+
+    async def _submit_assignment_batches(
+        self,
+        pages: list[CrawledPage],
+        taxonomy_desc: str,
+        batch_size: int,
+    ) -> dict[str, CompletionResult]:
+        """Run every multi-page assignment request as one Message Batch.
+
+        Pages are grouped exactly as run_batched_assignment groups them.
+
+        Returns:
+            Completions keyed by _assignment_batch_id of each group.
+        """
+        batch_size = max(1, batch_size)
+        groups = [
+            pages[start : start + batch_size]
+            for start in range(0, len(pages), batch_size)
+        ]
+        requests = [
+            BatchRequest(
+                custom_id=_assignment_batch_id(group),
+                **self._batch_request_kwargs(group, taxonomy_desc),
+            )
+            for group in groups
+            if len(group) > 1
+        ]
+        return await self._claude.complete_batch(
+            requests, max_wait=get_settings().label_assignment_batch_max_wait
+        )
+
+    def _batch_request_kwargs(
+        self, pages: list[CrawledPage], taxonomy_desc: str
+    ) -> dict[str, Any]:
+        """Prompt and limits for a multi-page assignment request."""
+        return {
+            "user_prompt": build_batch_user_prompt(
+                "Assign labels to each page using the taxonomy below.",
+                taxonomy_desc,
+                [f"PAGE:\n{self._page_info(page)}" for page in pages],
+            ),
+            "system_prompt": batch_system_prompt(ASSIGNMENT_SYSTEM_PROMPT),
+            "temperature": 0.0,
+            "max_tokens": 300 * len(pages) + 200,
+        }
+
+    def _batch_assignments(
+        self,
+        pages: list[CrawledPage],
+        completion: CompletionResult,
+        valid_labels: set[str],
+    ) -> dict[int, LabelAssignment]:
+        """Parse a multi-page assignment completion, keyed by page position."""
+        if not completion.success:
+            return {}
+
+        entries = parse_batch_assignments(
+            completion.text or "", len(pages), valid_labels
+        )
+        return {
+            position: self._assignment_from_response(
+                pages[position].id, entry, valid_labels
+            )
+            for position, entry in entries.items()
+        }
+
+    def _page_info(self, page: CrawledPage) -> str:
+        """Describe a page for an assignment prompt."""
+        page_info = f"URL: {page.normalized_url}"
+        if page.title:
+            page_info += f"\nTitle: {page.title}"
+        if page.meta_description:
+            page_info += f"\nDescription: {page.meta_description[:300]}"
+        if page.headings:
+            h1s = page.headings.get("h1", [])
+            h2s = page.headings.get("h2", [])
+            if h1s:
+                page_info += f"\nH1: {', '.join(h1s[:3])}"
+            if h2s:
+                page_info += f"\nH2: {', '.join(h2s[:5])}"
+        if page.product_count:
+            page_info += f"\nProducts on page: {page.product_count}"
+        if page.word_count:
+            page_info += f"\nWord count: {page.word_count}"
+        return page_info
+
+    def _assignment_from_response(
+        self,
+        page_id: str,
+        parsed: dict[str, Any],
+        valid_labels: set[str],
+    ) -> LabelAssignment:
+        """Validate a parsed assignment response and build the result."""
+        labels = parsed.get("labels", [])
+
+        # Validate labels using the validation function
+        validation_result = validate_labels(labels, valid_labels)
+
+        if not validation_result.valid:
+            # Log validation issues but still use the valid labels we got
+            for error in validation_result.errors:
+                if error.code == "invalid_labels":
+                    logger.warning(
+                        "AI assigned labels not in taxonomy",
+                        extra={
+                            "page_id": page_id,
+                            "invalid_labels": error.details.get("invalid_labels", []),
+                        },
+                    )
+                elif error.code in ("too_few_labels", "too_many_labels"):
+                    logger.warning(
+                        f"AI label count validation: {error.message}",
+                        extra={"page_id": page_id},
+                    )
+
+        # Filter to only valid labels from taxonomy
+        valid_assigned = [
+            label for label in validation_result.labels if label in valid_labels
+        ]
+
+        return LabelAssignment(
+            page_id=page_id,
+            labels=valid_assigned,
+            confidence=float(parsed.get("confidence", 0.5)),
+            reasoning=parsed.get("reasoning"),
+            success=True,
+        )
+
     def _extract_json(self, text: str) -> str:
         """Extract JSON from a response that may contain markdown code blocks.
 
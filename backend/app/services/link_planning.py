@@ -4,6 +4,8 @@ the full link planning pipeline.
 SiloLinkPlanner constructs three types of graphs:
 - Cluster graph: parent/child + sibling adjacency from ClusterPage records
 - Onboarding graph: pairwise label-overlap edges from onboarding CrawledPages
+  (or, with LINK_TARGET_WEIGHTING=similarity, nearest neighbours from a local
+  TF-IDF index over page text; see topical_similarity)
 - Blog graph: blog posts link UP to cluster pages and sideways to sibling blogs
 
 Target selection uses budgets (based on word count) to determine how many
@@ -21,7 +23,11 @@ Pipeline orchestrator (run_link_planning_pipeline) runs the 4-step sequence:
 4. Validate all rules
 """
 
+import asyncio
+import heapq
 import json
+from collections import Counter, defaultdict
+from collections.abc import Collection
 from itertools import combinations
 from typing import Any, Literal
 
@@ -29,12 +35,15 @@ from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
+from app.core.config import get_settings
 from app.core.database import db_manager
 from app.core.logging import get_logger
+from app.core.query_stats import query_scoped
+from app.core.tracing import trace_stage, traced, traced_run
 from app.integrations.claude import ClaudeClient, get_api_key
 from app.models.blog import BlogCampaign, BlogPost
 from app.models.content_brief import ContentBrief
-from app.models.crawled_page import CrawledPage, CrawlStatus
+from app.models.crawled_page import CrawledPage
 from app.models.internal_link import InternalLink, LinkPlanSnapshot
 from app.models.keyword_cluster import ClusterPage
 from app.models.page_content import PageContent
@@ -45,6 +54,8 @@ from app.services.link_injection import (
     LinkValidator,
     strip_internal_links,
 )
+from app.services.page_bridge import BridgePage, bridge_crawled_pages
+from app.services.topical_similarity import TopicalIndex, sync_topical_index
 
 logger = get_logger(__name__)
 
@@ -58,6 +69,17 @@ MAX_ANCHOR_REUSE = 3
 
 LABEL_OVERLAP_THRESHOLD = 2
 
+# Similarity edge weights: cosine similarity (0-1) is scaled onto the range of
+# label-overlap weights so priority bonuses and diversity penalties keep
+# their relative strength
+SIMILARITY_EDGE_SCALE = 10.0
+
+# Nearest neighbours considered per page, as a multiple of its link budget
+SIMILARITY_CANDIDATE_FACTOR = 4
+
+# Posts injected at once by campaign-level blog link planning
+BLOG_LINK_CONCURRENCY = 4
+
 
 class SiloLinkPlanner:
     """Builds link graphs for cluster and onboarding page sets."""
@@ -159,6 +181,8 @@ class SiloLinkPlanner:
         self,
         project_id: str,
         db: AsyncSession,
+        *,
+        with_edges: bool = True,
     ) -> dict[str, Any]:
         """Build label-overlap graph from collection pages.
 
@@ -166,6 +190,9 @@ class SiloLinkPlanner:
         Only includes pages where PageContent.status='complete' and
         PageKeywords.is_approved=True. Cluster pages additionally require
         PageContent.is_approved=True (export-ready).
+
+        With with_edges=False the quadratic edge list is skipped; use this
+        when target selection takes its edge weights from a TopicalIndex.
         """
         from sqlalchemy import and_, or_
 
@@ -206,7 +233,7 @@ class SiloLinkPlanner:
         # target selection prefers topically related pages, but no page is
         # excluded. Budgets (3-5 links per page) constrain link density.
         edges: list[dict[str, Any]] = []
-        for a, b in combinations(crawled_pages, 2):
+        for a, b in combinations(crawled_pages if with_edges else [], 2):
             labels_a = set(a.labels or [])
             labels_b = set(b.labels or [])
             overlap = len(labels_a & labels_b)
@@ -288,31 +315,25 @@ class SiloLinkPlanner:
         ]
 
         # Create or reuse CrawledPage records for blog posts (source='blog')
-        blog_crawled_map: dict[str, str] = {}  # blog_post.id -> crawled_page_id
-        for post in blog_posts:
-            # Check if CrawledPage already exists for this blog post slug
-            existing_stmt = select(CrawledPage).where(
-                CrawledPage.project_id == project_id,
-                CrawledPage.normalized_url == post.url_slug,
-                CrawledPage.source == "blog",
-            )
-            existing_result = await db.execute(existing_stmt)
-            crawled_page = existing_result.scalar_one_or_none()
-
-            if crawled_page is None:
-                crawled_page = CrawledPage(
-                    project_id=project_id,
+        slug_to_crawled = await bridge_crawled_pages(
+            db,
+            project_id,
+            [
+                BridgePage(
                     normalized_url=post.url_slug,
-                    source="blog",
-                    status=CrawlStatus.COMPLETED.value,
-                    category="blog",
                     title=post.title or post.primary_keyword,
+                    category="blog",
                     word_count=len((post.content or "").split()),
                 )
-                db.add(crawled_page)
-                await db.flush()
+                for post in blog_posts
+            ],
+            source="blog",
+        )
 
-            blog_crawled_map[post.id] = crawled_page.id
+        # blog_post.id -> crawled_page_id
+        blog_crawled_map = {
+            post.id: slug_to_crawled[post.url_slug] for post in blog_posts
+        }
 
         # Build graph nodes
         blog_post_nodes = [
@@ -517,38 +538,152 @@ def select_targets_cluster(
     return result
 
 
+def similarity_adjacency(
+    pages: list[dict[str, Any]],
+    budgets: dict[str, int],
+    index: TopicalIndex,
+    pools: list[set[str]],
+    sources: Collection[str] | None = None,
+) -> dict[str, dict[str, float]]:
+    """Build edge weights from a TopicalIndex instead of label overlap.
+
+    Each source page queries every candidate pool for its nearest neighbours
+    (budget * SIMILARITY_CANDIDATE_FACTOR per pool), weighted by
+    SIMILARITY_EDGE_SCALE * cosine similarity. A pool that yields fewer hits,
+    e.g. for a page without indexed text, is topped up with the pool pages
+    sharing the most labels, weighted by that label overlap, so every page
+    keeps link candidates.
+
+    Args:
+        pages: Graph page dicts with page_id and labels.
+        budgets: Dict mapping page_id to link budget.
+        index: Synced TopicalIndex covering the pages.
+        pools: Sets of page IDs that are queried separately.
+        sources: Page IDs that get outbound edges (default: all pages).
+
+    Returns:
+        Dict mapping page_id to {neighbor_page_id: weight}.
+    """
+    labels = {p["page_id"]: set(p.get("labels") or []) for p in pages}
+    adjacency: dict[str, dict[str, float]] = {p["page_id"]: {} for p in pages}
+    # Per pool label -> member pages and sorted members, built on first need
+    fallbacks: dict[int, tuple[dict[str, list[str]], list[str]]] = {}
+
+    for page in pages:
+        page_id = page["page_id"]
+        if sources is not None and page_id not in sources:
+            continue
+        k = budgets.get(page_id, 3) * SIMILARITY_CANDIDATE_FACTOR
+        neighbors = adjacency[page_id]
+        for pool_num, pool in enumerate(pools):
+            hits = index.top_k(page_id, k, candidates=pool)
+            for target_id, similarity in hits:
+                neighbors[target_id] = round(similarity * SIMILARITY_EDGE_SCALE, 4)
+            if len(hits) < k:
+                if pool_num not in fallbacks:
+                    fallbacks[pool_num] = _label_fallback(pool, labels)
+                by_label, ordered = fallbacks[pool_num]
+                _add_label_fillers(
+                    page_id, k - len(hits), neighbors, labels, by_label, ordered
+                )
+
+    return adjacency
+
+
+def _label_fallback(
+    pool: set[str], labels: dict[str, set[str]]
+) -> tuple[dict[str, list[str]], list[str]]:
+    """Index a pool by label for similarity_adjacency's filler edges."""
+    by_label: dict[str, list[str]] = defaultdict(list)
+    ordered = sorted(pool)
+    for target_id in ordered:
+        for label in labels.get(target_id, ()):
+            by_label[label].append(target_id)
+    return by_label, ordered
+
+
+def _add_label_fillers(
+    page_id: str,
+    count: int,
+    neighbors: dict[str, float],
+    labels: dict[str, set[str]],
+    by_label: dict[str, list[str]],
+    ordered: list[str],
+) -> None:
+    """Add up to count pool pages sharing the most labels with page_id.
+
+    Ties, and pages sharing no labels once overlapping ones run out, go by
+    page_id. Only the pages sharing a label are scored, not the whole pool.
+    """
+    overlaps = Counter(
+        target_id for label in labels[page_id] for target_id in by_label.get(label, ())
+    )
+    fillers = heapq.nsmallest(
+        count,
+        (
+            (-overlap, target_id)
+            for target_id, overlap in overlaps.items()
+            if target_id != page_id and target_id not in neighbors
+        ),
+    )
+    for neg_overlap, target_id in fillers:
+        neighbors[target_id] = float(-neg_overlap)
+
+    for target_id in ordered:
+        if len(fillers) >= count:
+            break
+        if target_id != page_id and target_id not in neighbors:
+            neighbors[target_id] = 0.0
+            fillers.append((0, target_id))
+
+
 def select_targets_onboarding(
     graph: dict[str, Any],
     budgets: dict[str, int],
+    similarity_index: TopicalIndex | None = None,
 ) -> dict[str, list[dict[str, Any]]]:
     """Select link targets for each page in an onboarding graph.
 
     Scores each eligible target per page:
-        score = label_overlap + (2 if target is_priority else 0) - diversity_penalty
+        score = edge_weight + (2 if target is_priority else 0) - diversity_penalty
     where diversity_penalty = max(0, (inbound_counts[target] - avg_inbound) * 0.5)
 
+    The edge weight is the label overlap from the graph edges, or, when a
+    similarity_index is given, the scaled TF-IDF similarity of each page's
+    nearest neighbours (graph edges are then ignored).
+
     Selects top N within budget. Updates inbound counts after each page
     to spread links across targets.
 
     Args:
         graph: Output from build_onboarding_graph with pages and edges.
         budgets: Dict mapping page_id to link budget (from calculate_budget).
+        similarity_index: Optional synced TopicalIndex for similarity weights.
 
     Returns:
         Dict mapping page_id to list of target dicts with page_id, keyword,
-        url, is_priority, label_overlap, and score.
+        url, is_priority, label_overlap, and score (plus similarity when a
+        similarity_index is used).
     """
     pages_by_id: dict[str, dict[str, Any]] = {p["page_id"]: p for p in graph["pages"]}
 
-    # Build adjacency map: page_id -> {neighbor_page_id: overlap_weight}
-    adjacency: dict[str, dict[str, int]] = {p["page_id"]: {} for p in graph["pages"]}
-    for edge in graph["edges"]:
-        adjacency[edge["source"]][edge["target"]] = edge["weight"]
-        adjacency[edge["target"]][edge["source"]] = edge["weight"]
+    # Build adjacency map: page_id -> {neighbor_page_id: edge_weight}
+    adjacency: dict[str, dict[str, float]]
+    if similarity_index is not None:
+        adjacency = similarity_adjacency(
+            graph["pages"], budgets, similarity_index, [set(pages_by_id)]
+        )
+    else:
+        adjacency = {p["page_id"]: {} for p in graph["pages"]}
+        for edge in graph["edges"]:
+            adjacency[edge["source"]][edge["target"]] = edge["weight"]
+            adjacency[edge["target"]][edge["source"]] = edge["weight"]
 
     # Running inbound counts for diversity penalty
     inbound_counts: dict[str, int] = {p["page_id"]: 0 for p in graph["pages"]}
 
+    # Running sum of inbound_counts, for the average in the diversity penalty
+    total_inbound = 0
     result: dict[str, list[dict[str, Any]]] = {}
 
     for page in graph["pages"]:
@@ -561,18 +696,17 @@ def select_targets_onboarding(
             continue
 
         # Calculate average inbound across all pages for diversity penalty
-        total_inbound = sum(inbound_counts.values())
         page_count = len(graph["pages"])
         avg_inbound = total_inbound / page_count if page_count > 0 else 0.0
 
         # Score each eligible target
         scored_targets: list[tuple[float, str]] = []
-        for target_id, overlap in neighbors.items():
+        for target_id, weight in neighbors.items():
             target_page = pages_by_id[target_id]
             priority_bonus = 2.0 if target_page.get("is_priority") else 0.0
             excess_inbound = inbound_counts[target_id] - avg_inbound
             diversity_penalty = max(0.0, excess_inbound * 0.5)
-            score = overlap + priority_bonus - diversity_penalty
+            score = weight + priority_bonus - diversity_penalty
             scored_targets.append((score, target_id))
 
         # Sort by score descending, then by page_id for stable ordering
@@ -584,17 +718,22 @@ def select_targets_onboarding(
             if len(targets) >= budget:
                 break
             target_page = pages_by_id[target_id]
-            targets.append(
-                {
-                    "page_id": target_id,
-                    "keyword": target_page["keyword"],
-                    "url": target_page["url"],
-                    "is_priority": target_page.get("is_priority", False),
-                    "label_overlap": neighbors[target_id],
-                    "score": score,
-                }
-            )
+            target: dict[str, Any] = {
+                "page_id": target_id,
+                "keyword": target_page["keyword"],
+                "url": target_page["url"],
+                "is_priority": target_page.get("is_priority", False),
+                "label_overlap": neighbors[target_id],
+                "score": score,
+            }
+            if similarity_index is not None:
+                target["label_overlap"] = len(
+                    set(page.get("labels") or []) & set(target_page.get("labels") or [])
+                )
+                target["similarity"] = neighbors[target_id]
+            targets.append(target)
             inbound_counts[target_id] += 1
+            total_inbound += 1
 
         result[page_id] = targets
 
@@ -1053,6 +1192,8 @@ def get_pipeline_progress(
 # ---------------------------------------------------------------------------
 
 
+@traced_run("link_planning", record_args=("project_id", "scope", "cluster_id"))
+@query_scoped("link_planning")
 async def run_link_planning_pipeline(
     project_id: str,
     scope: Literal["onboarding", "cluster"],
@@ -1088,6 +1229,7 @@ async def run_link_planning_pipeline(
     injector = LinkInjector()
     validator = LinkValidator()
     anchor_selector = AnchorTextSelector()
+    use_similarity = get_settings().link_target_weighting == "similarity"
 
     try:
         # ------------------------------------------------------------------
@@ -1096,12 +1238,15 @@ async def run_link_planning_pipeline(
         progress["current_step"] = 1
         progress["step_label"] = "Building link graph"
 
-        if scope == "cluster":
-            if cluster_id is None:
-                raise ValueError("cluster_id is required for cluster scope")
-            graph = await planner.build_cluster_graph(cluster_id, db)
-        else:
-            graph = await planner.build_onboarding_graph(project_id, db)
+        with trace_stage("link_planning.build_graph", scope=scope):
+            if scope == "cluster":
+                if cluster_id is None:
+                    raise ValueError("cluster_id is required for cluster scope")
+                graph = await planner.build_cluster_graph(cluster_id, db)
+            else:
+                graph = await planner.build_onboarding_graph(
+                    project_id, db, with_edges=not use_similarity
+                )
 
         pages = graph["pages"]
         progress["total_pages"] = len(pages)
@@ -1130,74 +1275,85 @@ async def run_link_planning_pipeline(
         progress["current_step"] = 2
         progress["step_label"] = "Selecting targets and anchor text"
 
-        # Load word counts to compute budgets
-        page_ids = _extract_page_ids(pages, scope)
-        word_counts = await _load_word_counts(db, page_ids)
-        budgets = {pid: calculate_budget(wc) for pid, wc in word_counts.items()}
+        with trace_stage("link_planning.select_targets"):
+            # Load word counts to compute budgets
+            page_ids = _extract_page_ids(pages, scope)
+            word_counts = await _load_word_counts(db, page_ids)
+            budgets = {pid: calculate_budget(wc) for pid, wc in word_counts.items()}
 
-        # Select targets per scope
-        if scope == "cluster":
-            targets_map = select_targets_cluster(graph, budgets)
-        else:
-            targets_map = select_targets_onboarding(graph, budgets)
+            # Select targets per scope
+            if scope == "cluster":
+                targets_map = select_targets_cluster(graph, budgets)
+            else:
+                similarity_index = None
+                if use_similarity:
+                    similarity_index = await sync_topical_index(
+                        db, project_id, [p["page_id"] for p in pages]
+                    )
+                targets_map = select_targets_onboarding(
+                    graph, budgets, similarity_index=similarity_index
+                )
 
-        # Gather anchor candidates and generate natural phrases
-        # Build keyword map for LLM natural phrase generation
-        keyword_map: dict[str, str] = {}
-        for page in pages:
-            pid = _page_id_for_scope(page, scope)
-            kw = page.get("keyword", "")
-            if kw:
-                keyword_map[pid] = kw
+        with trace_stage("link_planning.select_anchors"):
+            # Gather anchor candidates and generate natural phrases
+            # Build keyword map for LLM natural phrase generation
+            keyword_map: dict[str, str] = {}
+            for page in pages:
+                pid = _page_id_for_scope(page, scope)
+                kw = page.get("keyword", "")
+                if kw:
+                    keyword_map[pid] = kw
 
-        natural_phrases = await anchor_selector.generate_natural_phrases(keyword_map)
+            natural_phrases = await anchor_selector.generate_natural_phrases(
+                keyword_map
+            )
 
-        # Select anchors for each page's targets
-        usage_tracker: dict[str, dict[str, int]] = {}
-        # page_link_plans: list of (source_page_id, target_info_with_anchor)
-        page_link_plans: dict[str, list[dict[str, Any]]] = {}
+            # Select anchors for each page's targets
+            usage_tracker: dict[str, dict[str, int]] = {}
+            # page_link_plans: list of (source_page_id, target_info_with_anchor)
+            page_link_plans: dict[str, list[dict[str, Any]]] = {}
 
-        for page in pages:
-            source_id = _page_id_for_scope(page, scope)
-            page_targets = targets_map.get(page.get("page_id", source_id), [])
-            planned_links: list[dict[str, Any]] = []
+            for page in pages:
+                source_id = _page_id_for_scope(page, scope)
+                page_targets = targets_map.get(page.get("page_id", source_id), [])
+                planned_links: list[dict[str, Any]] = []
 
-            # Load source page content for context_fit scoring
-            source_content = await _load_page_content_text(db, source_id)
+                # Load source page content for context_fit scoring
+                source_content = await _load_page_content_text(db, source_id)
 
-            for target in page_targets:
-                target_id = _page_id_for_scope(target, scope)
+                for target in page_targets:
+                    target_id = _page_id_for_scope(target, scope)
 
-                # Gather candidates from DB
-                candidates = await anchor_selector.gather_candidates(target_id, db)
+                    # Gather candidates from DB
+                    candidates = await anchor_selector.gather_candidates(target_id, db)
 
-                # Append natural phrase candidates if available
-                if target_id in natural_phrases:
-                    candidates.extend(natural_phrases[target_id])
+                    # Append natural phrase candidates if available
+                    if target_id in natural_phrases:
+                        candidates.extend(natural_phrases[target_id])
 
-                anchor_result = anchor_selector.select_anchor(
-                    candidates, source_content, target_id, usage_tracker
-                )
+                    anchor_result = anchor_selector.select_anchor(
+                        candidates, source_content, target_id, usage_tracker
+                    )
 
-                if anchor_result is None:
-                    # Fallback: use the target keyword as exact_match
-                    anchor_result = {
-                        "anchor_text": target.get("keyword", "link"),
-                        "anchor_type": "exact_match",
-                        "score": 0.0,
-                    }
+                    if anchor_result is None:
+                        # Fallback: use the target keyword as exact_match
+                        anchor_result = {
+                            "anchor_text": target.get("keyword", "link"),
+                            "anchor_type": "exact_match",
+                            "score": 0.0,
+                        }
 
-                planned_links.append(
-                    {
-                        **target,
-                        "anchor_text": anchor_result["anchor_text"],
-                        "anchor_type": anchor_result["anchor_type"],
-                        "target_page_id": target_id,
-                    }
-                )
+                    planned_links.append(
+                        {
+                            **target,
+                            "anchor_text": anchor_result["anchor_text"],
+                            "anchor_type": anchor_result["anchor_type"],
+                            "target_page_id": target_id,
+                        }
+                    )
 
-            page_link_plans[source_id] = planned_links
-            progress["pages_processed"] = len(page_link_plans)
+                page_link_plans[source_id] = planned_links
+                progress["pages_processed"] = len(page_link_plans)
 
         logger.info(
             "Step 2 complete: targets and anchors selected",
@@ -1234,54 +1390,32 @@ async def run_link_planning_pipeline(
         # Track updated HTML per source page for validation + DB write
         pages_html: dict[str, str] = {}
 
-        pages_processed = 0
-        for source_id, planned_links in page_link_plans.items():
-            try:
-                html = await _load_bottom_description(db, source_id)
-                if not html:
-                    logger.warning(
-                        "No bottom_description for page, skipping injection",
-                        extra={"page_id": source_id},
-                    )
-                    pages_processed += 1
-                    progress["pages_processed"] = pages_processed
-                    continue
-
-                current_html = html
-                for link_plan in planned_links:
-                    anchor_text = link_plan["anchor_text"]
-                    target_url = link_plan.get("url", "")
-                    target_id = link_plan["target_page_id"]
-                    is_mandatory = link_plan.get("is_mandatory", False)
-
-                    # Try rule-based first
-                    modified_html, p_idx = injector.inject_rule_based(
-                        current_html, anchor_text, target_url
-                    )
-
-                    if p_idx is not None:
-                        current_html = modified_html
-                        injection_results.append(
-                            {
-                                "source_page_id": source_id,
-                                "target_page_id": target_id,
-                                "anchor_text": anchor_text,
-                                "anchor_type": link_plan["anchor_type"],
-                                "placement_method": "rule_based",
-                                "position_in_content": p_idx,
-                                "is_mandatory": is_mandatory,
-                            }
+        with trace_stage("link_planning.inject"):
+            pages_processed = 0
+            for source_id, planned_links in page_link_plans.items():
+                try:
+                    html = await _load_bottom_description(db, source_id)
+                    if not html:
+                        logger.warning(
+                            "No bottom_description for page, skipping injection",
+                            extra={"page_id": source_id},
                         )
-                    else:
-                        # LLM fallback
-                        target_keyword = link_plan.get("keyword", "")
-                        modified_html, p_idx = await injector.inject_llm_fallback(
-                            current_html,
-                            anchor_text,
-                            target_url,
-                            target_keyword,
-                            mandatory_parent=is_mandatory,
+                        pages_processed += 1
+                        progress["pages_processed"] = pages_processed
+                        continue
+
+                    current_html = html
+                    for link_plan in planned_links:
+                        anchor_text = link_plan["anchor_text"]
+                        target_url = link_plan.get("url", "")
+                        target_id = link_plan["target_page_id"]
+                        is_mandatory = link_plan.get("is_mandatory", False)
+
+                        # Try rule-based first
+                        modified_html, p_idx = injector.inject_rule_based(
+                            current_html, anchor_text, target_url
                         )
+
                         if p_idx is not None:
                             current_html = modified_html
                             injection_results.append(
@@ -1290,32 +1424,55 @@ async def run_link_planning_pipeline(
                                     "target_page_id": target_id,
                                     "anchor_text": anchor_text,
                                     "anchor_type": link_plan["anchor_type"],
-                                    "placement_method": "llm_fallback",
+                                    "placement_method": "rule_based",
                                     "position_in_content": p_idx,
                                     "is_mandatory": is_mandatory,
                                 }
                             )
                         else:
-                            logger.warning(
-                                "Link injection failed (both rule-based and LLM)",
-                                extra={
-                                    "source_page_id": source_id,
-                                    "target_page_id": target_id,
-                                    "anchor_text": anchor_text,
-                                },
+                            # LLM fallback
+                            target_keyword = link_plan.get("keyword", "")
+                            modified_html, p_idx = await injector.inject_llm_fallback(
+                                current_html,
+                                anchor_text,
+                                target_url,
+                                target_keyword,
+                                mandatory_parent=is_mandatory,
                             )
+                            if p_idx is not None:
+                                current_html = modified_html
+                                injection_results.append(
+                                    {
+                                        "source_page_id": source_id,
+                                        "target_page_id": target_id,
+                                        "anchor_text": anchor_text,
+                                        "anchor_type": link_plan["anchor_type"],
+                                        "placement_method": "llm_fallback",
+                                        "position_in_content": p_idx,
+                                        "is_mandatory": is_mandatory,
+                                    }
+                                )
+                            else:
+                                logger.warning(
+                                    "Link injection failed (both rule-based and LLM)",
+                                    extra={
+                                        "source_page_id": source_id,
+                                        "target_page_id": target_id,
+                                        "anchor_text": anchor_text,
+                                    },
+                                )
+
+                    pages_html[source_id] = current_html
+
+                except Exception:
+                    logger.error(
+                        "Injection failed for page, skipping",
+                        extra={"page_id": source_id},
+                        exc_info=True,
+                    )
 
-                pages_html[source_id] = current_html
-
-            except Exception:
-                logger.error(
-                    "Injection failed for page, skipping",
-                    extra={"page_id": source_id},
-                    exc_info=True,
-                )
-
-            pages_processed += 1
-            progress["pages_processed"] = pages_processed
+                pages_processed += 1
+                progress["pages_processed"] = pages_processed
 
         logger.info(
             "Step 3 complete: links injected",
@@ -1347,9 +1504,10 @@ async def run_link_planning_pipeline(
         # (validator expects objects with .source_page_id, .target_page_id, etc.)
         temp_links = [_LinkProxy({**r, "scope": scope}) for r in injection_results]
 
-        validation = validator.validate_links(
-            temp_links, pages_html, scope, cluster_data
-        )
+        with trace_stage("link_planning.validate"):
+            validation = validator.validate_links(
+                temp_links, pages_html, scope, cluster_data
+            )
 
         logger.info(
             "Step 4 complete: validation done",
@@ -1362,65 +1520,68 @@ async def run_link_planning_pipeline(
         # ------------------------------------------------------------------
         # Persist: Create InternalLink rows + update PageContent
         # ------------------------------------------------------------------
-        async with db_manager.session_factory() as write_db:
-            # Create InternalLink rows
-            created_links: list[InternalLink] = []
-            for result_dict in injection_results:
-                # Determine status based on validation
-                source_id = result_dict["source_page_id"]
-                # Find validation status for this link's source page
-                link_status = "injected"
-                if validation["passed"]:
-                    link_status = "verified"
-                else:
-                    # Check if this specific page had failures
-                    for page_result in validation.get("results", []):
-                        if page_result["page_id"] == source_id:
-                            failing = [
-                                r["rule"]
-                                for r in page_result["rules"]
-                                if not r["passed"]
-                            ]
-                            if failing:
-                                link_status = f"failed:{','.join(failing)}"
-                            else:
-                                link_status = "verified"
-                            break
-
-                link = InternalLink(
-                    source_page_id=result_dict["source_page_id"],
-                    target_page_id=result_dict["target_page_id"],
-                    project_id=project_id,
-                    cluster_id=cluster_id,
-                    scope=scope,
-                    anchor_text=result_dict["anchor_text"],
-                    anchor_type=result_dict["anchor_type"],
-                    placement_method=result_dict["placement_method"],
-                    position_in_content=result_dict["position_in_content"],
-                    is_mandatory=result_dict["is_mandatory"],
-                    status=link_status,
-                )
-                write_db.add(link)
-                created_links.append(link)
-
-            # Update PageContent.bottom_description with injected HTML
-            for page_id, updated_html in pages_html.items():
-                stmt = select(PageContent).where(PageContent.crawled_page_id == page_id)
-                pc_result = await write_db.execute(stmt)
-                pc = pc_result.scalar_one_or_none()
-                if pc is not None:
-                    pc.bottom_description = updated_html
-
-            await write_db.commit()
+        with trace_stage("link_planning.persist"):
+            async with db_manager.session_factory() as write_db:
+                # Create InternalLink rows
+                created_links: list[InternalLink] = []
+                for result_dict in injection_results:
+                    # Determine status based on validation
+                    source_id = result_dict["source_page_id"]
+                    # Find validation status for this link's source page
+                    link_status = "injected"
+                    if validation["passed"]:
+                        link_status = "verified"
+                    else:
+                        # Check if this specific page had failures
+                        for page_result in validation.get("results", []):
+                            if page_result["page_id"] == source_id:
+                                failing = [
+                                    r["rule"]
+                                    for r in page_result["rules"]
+                                    if not r["passed"]
+                                ]
+                                if failing:
+                                    link_status = f"failed:{','.join(failing)}"
+                                else:
+                                    link_status = "verified"
+                                break
+
+                    link = InternalLink(
+                        source_page_id=result_dict["source_page_id"],
+                        target_page_id=result_dict["target_page_id"],
+                        project_id=project_id,
+                        cluster_id=cluster_id,
+                        scope=scope,
+                        anchor_text=result_dict["anchor_text"],
+                        anchor_type=result_dict["anchor_type"],
+                        placement_method=result_dict["placement_method"],
+                        position_in_content=result_dict["position_in_content"],
+                        is_mandatory=result_dict["is_mandatory"],
+                        status=link_status,
+                    )
+                    write_db.add(link)
+                    created_links.append(link)
 
-            logger.info(
-                "Pipeline persist complete",
-                extra={
-                    "project_id": project_id,
-                    "links_created": len(created_links),
-                    "pages_updated": len(pages_html),
-                },
-            )
+                # Update PageContent.bottom_description with injected HTML
+                for page_id, updated_html in pages_html.items():
+                    stmt = select(PageContent).where(
+                        PageContent.crawled_page_id == page_id
+                    )
+                    pc_result = await write_db.execute(stmt)
+                    pc = pc_result.scalar_one_or_none()
+                    if pc is not None:
+                        pc.bottom_description = updated_html
+
+                await write_db.commit()
+
+                logger.info(
+                    "Pipeline persist complete",
+                    extra={
+                        "project_id": project_id,
+                        "links_created": len(created_links),
+                        "pages_updated": len(pages_html),
+                    },
+                )
 
         progress["status"] = "complete"
         progress["pages_processed"] = len(pages)
@@ -1715,6 +1876,220 @@ def get_blog_link_progress(blog_post_id: str) -> dict[str, Any] | None:
     return _blog_link_progress.get(blog_post_id)
 
 
+@traced("link_planning.blog_post", record_args=("blog_post_id",))
+async def _inject_blog_post_links(
+    blog_post_id: str,
+    source_crawled_id: str,
+    my_targets: list[dict[str, Any]],
+    graph: dict[str, Any],
+    campaign: BlogCampaign,
+    site_base: str,
+    db: AsyncSession,
+    progress: dict[str, Any],
+) -> dict[str, Any]:
+    """Inject, validate and persist links for one blog post.
+
+    Steps 3-5 of blog link planning, given a built graph and the post's
+    selected targets. Reads through db and writes in a separate session.
+    """
+    injector = LinkInjector()
+    validator = LinkValidator()
+    anchor_selector = AnchorTextSelector()
+
+    # Step 3: Generate anchor text and inject
+    progress["step"] = "injecting_links"
+
+    # Load the blog post content for injection
+    post_stmt = select(BlogPost).where(BlogPost.id == blog_post_id)
+    post_result = await db.execute(post_stmt)
+    blog_post = post_result.scalar_one()
+
+    current_html = blog_post.content or ""
+    if not current_html:
+        progress["status"] = "failed"
+        progress["error"] = "Blog post has no content"
+        return {"status": "failed", "error": progress["error"]}
+
+    # Generate anchor text candidates
+    keyword_map: dict[str, str] = {}
+    for target in my_targets:
+        tid = target["crawled_page_id"]
+        kw = target.get("keyword", "")
+        if kw:
+            keyword_map[tid] = kw
+
+    natural_phrases = await anchor_selector.generate_natural_phrases(keyword_map)
+
+    usage_tracker: dict[str, dict[str, int]] = {}
+    injection_results: list[dict[str, Any]] = []
+
+    for target in my_targets:
+        target_id = target["crawled_page_id"]
+        target_keyword = target.get("keyword", "")
+        is_mandatory = target.get("is_mandatory", False)
+
+        # Resolve URL
+        target_url = target.get("url") or target.get("url_slug", "")
+        if target_url and not target_url.startswith("http"):
+            target_url = f"{site_base}/{target_url.lstrip('/')}"
+
+        # Gather anchor candidates from DB (if target has PageKeywords/ContentBrief)
+        candidates = await anchor_selector.gather_candidates(target_id, db)
+
+        # Append natural phrases
+        if target_id in natural_phrases:
+            candidates.extend(natural_phrases[target_id])
+
+        # If no candidates from DB, use the keyword directly
+        if not candidates:
+            candidates = [{"anchor_text": target_keyword, "anchor_type": "exact_match"}]
+
+        anchor_result = anchor_selector.select_anchor(
+            candidates, current_html, target_id, usage_tracker
+        )
+        if anchor_result is None:
+            anchor_result = {
+                "anchor_text": target_keyword or "link",
+                "anchor_type": "exact_match",
+                "score": 0.0,
+            }
+
+        anchor_text = anchor_result["anchor_text"]
+
+        # Try rule-based injection
+        modified_html, p_idx = injector.inject_rule_based(
+            current_html, anchor_text, target_url
+        )
+
+        if p_idx is not None:
+            current_html = modified_html
+            injection_results.append(
+                {
+                    "source_page_id": source_crawled_id,
+                    "target_page_id": target_id,
+                    "anchor_text": anchor_text,
+                    "anchor_type": anchor_result["anchor_type"],
+                    "placement_method": "rule_based",
+                    "position_in_content": p_idx,
+                    "is_mandatory": is_mandatory,
+                }
+            )
+        else:
+            # LLM fallback
+            modified_html, p_idx = await injector.inject_llm_fallback(
+                current_html,
+                anchor_text,
+                target_url,
+                target_keyword,
+                mandatory_parent=is_mandatory,
+            )
+            if p_idx is not None:
+                current_html = modified_html
+                injection_results.append(
+                    {
+                        "source_page_id": source_crawled_id,
+                        "target_page_id": target_id,
+                        "anchor_text": anchor_text,
+                        "anchor_type": anchor_result["anchor_type"],
+                        "placement_method": "llm_fallback",
+                        "position_in_content": p_idx,
+                        "is_mandatory": is_mandatory,
+                    }
+                )
+            else:
+                logger.warning(
+                    "Blog link injection failed for target",
+                    extra={
+                        "blog_post_id": blog_post_id,
+                        "target_id": target_id,
+                        "anchor_text": anchor_text,
+                    },
+                )
+
+    # Step 4: Validate
+    progress["step"] = "validating"
+
+    # Build cluster_data for silo validation
+    all_page_ids = {bp["crawled_page_id"] for bp in graph["blog_posts"]}
+    all_page_ids |= {cp["crawled_page_id"] for cp in graph["cluster_pages"]}
+
+    blog_cluster_data: dict[str, Any] = {
+        "pages": [
+            *[
+                {
+                    "crawled_page_id": cp["crawled_page_id"],
+                    "role": cp["role"],
+                    "url": cp.get("url"),
+                }
+                for cp in graph["cluster_pages"]
+            ],
+            *[
+                {
+                    "crawled_page_id": bp["crawled_page_id"],
+                    "role": "blog",
+                    "url": bp.get("url_slug"),
+                }
+                for bp in graph["blog_posts"]
+            ],
+        ],
+    }
+
+    temp_links = [_LinkProxy({**r, "scope": "blog"}) for r in injection_results]
+    pages_html = {source_crawled_id: current_html}
+
+    validation = validator.validate_links(
+        temp_links, pages_html, "blog", blog_cluster_data
+    )
+
+    # Step 5: Persist InternalLink rows and update BlogPost.content
+    progress["step"] = "persisting"
+
+    async with db_manager.session_factory() as write_db:
+        for result_dict in injection_results:
+            link_status = "verified" if validation["passed"] else "injected"
+            link = InternalLink(
+                source_page_id=result_dict["source_page_id"],
+                target_page_id=result_dict["target_page_id"],
+                project_id=campaign.project_id,
+                cluster_id=campaign.cluster_id,
+                scope="blog",
+                anchor_text=result_dict["anchor_text"],
+                anchor_type=result_dict["anchor_type"],
+                placement_method=result_dict["placement_method"],
+                position_in_content=result_dict["position_in_content"],
+                is_mandatory=result_dict["is_mandatory"],
+                status=link_status,
+            )
+            write_db.add(link)
+
+        # Update BlogPost.content with injected HTML
+        post_update_stmt = select(BlogPost).where(BlogPost.id == blog_post_id)
+        post_update_result = await write_db.execute(post_update_stmt)
+        post_to_update = post_update_result.scalar_one()
+        post_to_update.content = current_html
+
+        await write_db.commit()
+
+    progress["status"] = "complete"
+    progress["links_planned"] = len(injection_results)
+
+    logger.info(
+        "Blog link planning complete",
+        extra={
+            "blog_post_id": blog_post_id,
+            "links_injected": len(injection_results),
+            "validation_passed": validation["passed"],
+        },
+    )
+
+    return {
+        "status": "complete",
+        "links_planned": len(injection_results),
+        "validation_passed": validation["passed"],
+    }
+
+
+@traced_run("blog_link_planning", record_args=("blog_post_id", "campaign_id"))
 async def run_blog_link_planning(
     blog_post_id: str,
     campaign_id: str,
@@ -1745,9 +2120,6 @@ async def run_blog_link_planning(
     _blog_link_progress[blog_post_id] = progress
 
     planner = SiloLinkPlanner()
-    injector = LinkInjector()
-    validator = LinkValidator()
-    anchor_selector = AnchorTextSelector()
 
     try:
         # Step 1: Build blog graph
@@ -1787,210 +2159,170 @@ async def run_blog_link_planning(
         project_obj = await db.get(Project, campaign.project_id)
         site_base = (project_obj.site_url or "").rstrip("/") if project_obj else ""
 
-        # Step 3: Generate anchor text and inject
-        progress["step"] = "injecting_links"
-
-        # Load the blog post content for injection
-        post_stmt = select(BlogPost).where(BlogPost.id == blog_post_id)
-        post_result = await db.execute(post_stmt)
-        blog_post = post_result.scalar_one()
-
-        current_html = blog_post.content or ""
-        if not current_html:
-            progress["status"] = "failed"
-            progress["error"] = "Blog post has no content"
-            return {"status": "failed", "error": progress["error"]}
-
-        # Generate anchor text candidates
-        keyword_map: dict[str, str] = {}
-        for target in my_targets:
-            tid = target["crawled_page_id"]
-            kw = target.get("keyword", "")
-            if kw:
-                keyword_map[tid] = kw
-
-        natural_phrases = await anchor_selector.generate_natural_phrases(keyword_map)
-
-        usage_tracker: dict[str, dict[str, int]] = {}
-        injection_results: list[dict[str, Any]] = []
+        return await _inject_blog_post_links(
+            blog_post_id,
+            source_crawled_id,
+            my_targets,
+            graph,
+            campaign,
+            site_base,
+            db,
+            progress,
+        )
 
-        for target in my_targets:
-            target_id = target["crawled_page_id"]
-            target_keyword = target.get("keyword", "")
-            is_mandatory = target.get("is_mandatory", False)
+    except Exception as exc:
+        progress["status"] = "failed"
+        progress["error"] = str(exc)
+        logger.error(
+            "Blog link planning failed",
+            extra={"blog_post_id": blog_post_id, "error": str(exc)},
+            exc_info=True,
+        )
+        raise
+    finally:
+        # Clean up progress after a delay (let polling catch final state)
+        # In production this would be cleaned by a TTL; here we leave it
+        pass
 
-            # Resolve URL
-            target_url = target.get("url") or target.get("url_slug", "")
-            if target_url and not target_url.startswith("http"):
-                target_url = f"{site_base}/{target_url.lstrip('/')}"
 
-            # Gather anchor candidates from DB (if target has PageKeywords/ContentBrief)
-            candidates = await anchor_selector.gather_candidates(target_id, db)
+@traced_run("campaign_blog_link_planning", record_args=("campaign_id",))
+async def run_campaign_blog_link_planning(
+    campaign_id: str,
+    post_ids: list[str],
+    concurrency: int = BLOG_LINK_CONCURRENCY,
+) -> dict[str, Any]:
+    """Run blog link planning for several posts of one campaign.
 
-            # Append natural phrases
-            if target_id in natural_phrases:
-                candidates.extend(natural_phrases[target_id])
+    The blog graph, its CrawledPage bridge records and the target map are
+    built once for the campaign instead of once per post. Existing
+    blog-scope links of the requested posts are replaced. Injection then
+    runs per post, up to `concurrency` at a time, each in its own session;
+    a failing post is logged and does not affect the others. If the shared
+    graph, target or delete phase fails, every post is marked failed.
 
-            # If no candidates from DB, use the keyword directly
-            if not candidates:
-                candidates = [
-                    {"anchor_text": target_keyword, "anchor_type": "exact_match"}
-                ]
+    Args:
+        campaign_id: UUID of the BlogCampaign.
+        post_ids: UUIDs of the BlogPosts to plan links for.
+        concurrency: Maximum number of posts injected at once.
 
-            anchor_result = anchor_selector.select_anchor(
-                candidates, current_html, target_id, usage_tracker
-            )
-            if anchor_result is None:
-                anchor_result = {
-                    "anchor_text": target_keyword or "link",
-                    "anchor_type": "exact_match",
-                    "score": 0.0,
-                }
+    Returns:
+        Dict with per-post results and completed/failed counts.
+    """
+    for post_id in post_ids:
+        _blog_link_progress[post_id] = {
+            "status": "planning",
+            "step": "building_graph",
+            "links_planned": 0,
+        }
 
-            anchor_text = anchor_result["anchor_text"]
+    try:
+        async with db_manager.session_factory() as db:
+            graph = await SiloLinkPlanner().build_blog_graph(campaign_id, db)
+            targets_map = select_targets_blog(graph) if graph["blog_posts"] else {}
 
-            # Try rule-based injection
-            modified_html, p_idx = injector.inject_rule_based(
-                current_html, anchor_text, target_url
+            campaign_result = await db.execute(
+                select(BlogCampaign).where(BlogCampaign.id == campaign_id)
             )
+            campaign = campaign_result.scalar_one()
+            project_obj = await db.get(Project, campaign.project_id)
+            site_base = (project_obj.site_url or "").rstrip("/") if project_obj else ""
 
-            if p_idx is not None:
-                current_html = modified_html
-                injection_results.append(
-                    {
-                        "source_page_id": source_crawled_id,
-                        "target_page_id": target_id,
-                        "anchor_text": anchor_text,
-                        "anchor_type": anchor_result["anchor_type"],
-                        "placement_method": "rule_based",
-                        "position_in_content": p_idx,
-                        "is_mandatory": is_mandatory,
-                    }
-                )
-            else:
-                # LLM fallback
-                modified_html, p_idx = await injector.inject_llm_fallback(
-                    current_html,
-                    anchor_text,
-                    target_url,
-                    target_keyword,
-                    mandatory_parent=is_mandatory,
-                )
-                if p_idx is not None:
-                    current_html = modified_html
-                    injection_results.append(
-                        {
-                            "source_page_id": source_crawled_id,
-                            "target_page_id": target_id,
-                            "anchor_text": anchor_text,
-                            "anchor_type": anchor_result["anchor_type"],
-                            "placement_method": "llm_fallback",
-                            "position_in_content": p_idx,
-                            "is_mandatory": is_mandatory,
-                        }
-                    )
-                else:
-                    logger.warning(
-                        "Blog link injection failed for target",
-                        extra={
-                            "blog_post_id": blog_post_id,
-                            "target_id": target_id,
-                            "anchor_text": anchor_text,
-                        },
+            # Replace previous blog-scope links of these posts in one statement
+            crawled_by_post = {
+                bp["post_id"]: bp["crawled_page_id"] for bp in graph["blog_posts"]
+            }
+            source_ids = [
+                crawled_by_post[pid] for pid in post_ids if pid in crawled_by_post
+            ]
+            if source_ids:
+                await db.execute(
+                    delete(InternalLink).where(
+                        InternalLink.source_page_id.in_(source_ids),
+                        InternalLink.scope == "blog",
                     )
-
-        # Step 4: Validate
-        progress["step"] = "validating"
-
-        # Build cluster_data for silo validation
-        all_page_ids = {bp["crawled_page_id"] for bp in graph["blog_posts"]}
-        all_page_ids |= {cp["crawled_page_id"] for cp in graph["cluster_pages"]}
-
-        blog_cluster_data: dict[str, Any] = {
-            "pages": [
-                *[
-                    {
-                        "crawled_page_id": cp["crawled_page_id"],
-                        "role": cp["role"],
-                        "url": cp.get("url"),
-                    }
-                    for cp in graph["cluster_pages"]
-                ],
-                *[
-                    {
-                        "crawled_page_id": bp["crawled_page_id"],
-                        "role": "blog",
-                        "url": bp.get("url_slug"),
-                    }
-                    for bp in graph["blog_posts"]
-                ],
-            ],
-        }
-
-        temp_links = [_LinkProxy({**r, "scope": "blog"}) for r in injection_results]
-        pages_html = {source_crawled_id: current_html}
-
-        validation = validator.validate_links(
-            temp_links, pages_html, "blog", blog_cluster_data
+                )
+            await db.commit()
+    except Exception as exc:
+        # Without a graph no post can be planned; end every poll as failed
+        for post_id in post_ids:
+            _blog_link_progress[post_id]["status"] = "failed"
+            _blog_link_progress[post_id]["error"] = str(exc)
+        logger.warning(
+            "Campaign blog link graph build failed",
+            extra={
+                "campaign_id": campaign_id,
+                "post_count": len(post_ids),
+                "error": str(exc),
+                "error_type": type(exc).__name__,
+            },
+            exc_info=True,
         )
+        return {
+            "posts": {pid: {"status": "failed", "error": str(exc)} for pid in post_ids},
+            "completed": 0,
+            "failed": len(post_ids),
+        }
 
-        # Step 5: Persist InternalLink rows and update BlogPost.content
-        progress["step"] = "persisting"
-
-        async with db_manager.session_factory() as write_db:
-            for result_dict in injection_results:
-                link_status = "verified" if validation["passed"] else "injected"
-                link = InternalLink(
-                    source_page_id=result_dict["source_page_id"],
-                    target_page_id=result_dict["target_page_id"],
-                    project_id=campaign.project_id,
-                    cluster_id=campaign.cluster_id,
-                    scope="blog",
-                    anchor_text=result_dict["anchor_text"],
-                    anchor_type=result_dict["anchor_type"],
-                    placement_method=result_dict["placement_method"],
-                    position_in_content=result_dict["position_in_content"],
-                    is_mandatory=result_dict["is_mandatory"],
-                    status=link_status,
-                )
-                write_db.add(link)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
 
-            # Update BlogPost.content with injected HTML
-            post_update_stmt = select(BlogPost).where(BlogPost.id == blog_post_id)
-            post_update_result = await write_db.execute(post_update_stmt)
-            post_to_update = post_update_result.scalar_one()
-            post_to_update.content = current_html
+    async def plan_post(post_id: str) -> dict[str, Any]:
+        progress = _blog_link_progress[post_id]
+        source_crawled_id = crawled_by_post.get(post_id)
+        if source_crawled_id is None:
+            progress["status"] = "failed"
+            progress["error"] = (
+                "Blog post not found in graph (not approved or no content?)"
+            )
+            return {"status": "failed", "error": progress["error"]}
 
-            await write_db.commit()
+        my_targets = targets_map.get(source_crawled_id, [])
+        if not my_targets:
+            progress["status"] = "complete"
+            return {"status": "complete", "links_planned": 0}
 
-        progress["status"] = "complete"
-        progress["links_planned"] = len(injection_results)
+        async with semaphore:
+            try:
+                async with db_manager.session_factory() as post_db:
+                    return await _inject_blog_post_links(
+                        post_id,
+                        source_crawled_id,
+                        my_targets,
+                        graph,
+                        campaign,
+                        site_base,
+                        post_db,
+                        progress,
+                    )
+            except Exception as exc:
+                progress["status"] = "failed"
+                progress["error"] = str(exc)
+                logger.warning(
+                    "Blog link planning failed for post",
+                    extra={
+                        "blog_post_id": post_id,
+                        "campaign_id": campaign_id,
+                        "error": str(exc),
+                        "error_type": type(exc).__name__,
+                    },
+                    exc_info=True,
+                )
+                return {"status": "failed", "error": str(exc)}
 
-        logger.info(
-            "Blog link planning complete",
-            extra={
-                "blog_post_id": blog_post_id,
-                "links_injected": len(injection_results),
-                "validation_passed": validation["passed"],
-            },
-        )
+    results = await asyncio.gather(*(plan_post(pid) for pid in post_ids))
+    per_post = dict(zip(post_ids, results, strict=True))
+    failed = sum(1 for r in results if r["status"] == "failed")
 
-        return {
-            "status": "complete",
-            "links_planned": len(injection_results),
-            "validation_passed": validation["passed"],
-        }
+    logger.info(
+        "Campaign blog link planning complete",
+        extra={
+            "campaign_id": campaign_id,
+            "post_count": len(post_ids),
+            "failed": failed,
+        },
+    )
 
-    except Exception as exc:
-        progress["status"] = "failed"
-        progress["error"] = str(exc)
-        logger.error(
-            "Blog link planning failed",
-            extra={"blog_post_id": blog_post_id, "error": str(exc)},
-            exc_info=True,
-        )
-        raise
-    finally:
-        # Clean up progress after a delay (let polling catch final state)
-        # In production this would be cleaned by a TTL; here we leave it
-        pass
+    return {
+        "posts": per_post,
+        "completed": len(post_ids) - failed,
+        "failed": failed,
+    }
@@ -0,0 +1,95 @@
+"""Set-based bridging of entities into CrawledPage records.
+
+Cluster pages and blog posts live in their own tables, but the content
+generation, link planning and export pipelines all key on CrawledPage.
+bridge_crawled_pages resolves the CrawledPage for many URLs at once: one
+SELECT for the pages that already exist and one bulk INSERT, with
+client-side IDs, for the missing ones. Round trips stay constant no matter
+how many entities are bridged.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from uuid import uuid4
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.crawled_page import CrawledPage, CrawlStatus
+
+
+@dataclass
+class BridgePage:
+    """A CrawledPage to find or create for a bridged entity."""
+
+    normalized_url: str
+    title: str | None = None
+    category: str | None = None
+    word_count: int | None = None
+
+
+async def bridge_crawled_pages(
+    db: AsyncSession,
+    project_id: str,
+    pages: Sequence[BridgePage],
+    *,
+    source: str,
+    match_any_source: bool = False,
+) -> dict[str, str]:
+    """Find or create CrawledPages for a set of URLs.
+
+    Existing pages are matched on (project_id, normalized_url), and also on
+    source unless match_any_source is set. Missing pages are inserted with
+    status='completed' and the given source. Duplicate URLs in `pages` map
+    to a single CrawledPage (the first spec wins).
+
+    Args:
+        db: Async database session. Nothing is committed.
+        project_id: UUID of the project the pages belong to.
+        pages: Pages to resolve.
+        source: CrawledPage.source for created pages (and lookups).
+        match_any_source: Reuse an existing page for the URL whatever its source.
+
+    Returns:
+        Dict of normalized_url -> crawled_page_id for every requested URL.
+    """
+    specs: dict[str, BridgePage] = {}
+    for page in pages:
+        specs.setdefault(page.normalized_url, page)
+    if not specs:
+        return {}
+
+    existing_stmt = select(CrawledPage.normalized_url, CrawledPage.id).where(
+        CrawledPage.project_id == project_id,
+        CrawledPage.normalized_url.in_(specs),
+    )
+    if not match_any_source:
+        existing_stmt = existing_stmt.where(CrawledPage.source == source)
+    existing_result = await db.execute(existing_stmt.order_by(CrawledPage.created_at))
+
+    url_to_id: dict[str, str] = {}
+    for url, crawled_page_id in existing_result.all():
+        url_to_id.setdefault(url, crawled_page_id)
+
+    new_rows = []
+    for url, spec in specs.items():
+        if url in url_to_id:
+            continue
+        crawled_page_id = str(uuid4())
+        url_to_id[url] = crawled_page_id
+        new_rows.append(
+            {
+                "id": crawled_page_id,
+                "project_id": project_id,
+                "normalized_url": url,
+                "source": source,
+                "status": CrawlStatus.COMPLETED.value,
+                "category": spec.category,
+                "title": spec.title,
+                "word_count": spec.word_count,
+            }
+        )
+    if new_rows:
+        await db.execute(insert(CrawledPage), new_rows)
+
+    return url_to_id
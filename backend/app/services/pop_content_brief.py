@@ -8,15 +8,29 @@ structured brief data as ContentBrief records. Supports the full 3-step POP flow
 
 Handles caching, force refresh, and graceful error handling so that content
 generation is never blocked.
+
+Two cache layers sit in front of POP:
+- Per page: an existing ContentBrief for the CrawledPage is returned as-is
+- Shared: merged POP responses are stored in pop_brief_cache keyed by
+  (normalized keyword, location), independent of target URL, page and
+  project. A hit is copied into the page's own ContentBrief row, so the same
+  keyword across cluster pages, blog posts, WordPress posts and other client
+  projects costs one POP report per TTL window.
 """
 
+import asyncio
 import contextlib
+import hashlib
+import re
 from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.integrations.pop import (
     POPClient,
@@ -27,9 +41,30 @@ from app.integrations.pop import (
 )
 from app.models.content_brief import ContentBrief
 from app.models.crawled_page import CrawledPage
+from app.models.pop_brief_cache import POPBriefCache
 
 logger = get_logger(__name__)
 
+# POP's default search location (create_report_task default)
+DEFAULT_POP_LOCATION = "United States"
+
+# Shared brief cache counters (process-local, exposed on /health/integrations)
+_brief_cache_stats: dict[str, int] = {
+    "hits": 0,
+    "misses": 0,
+    "stores": 0,
+    "partial_skips": 0,
+    "inflight_joins": 0,
+}
+
+# Key _run_real_3step_flow sets on its response to record how many of the
+# three POP steps contributed data; only 3 is a complete brief
+POP_STEPS_COMPLETED_KEY = "_pop_steps_completed"
+
+# In-flight POP runs keyed by cache key, so concurrent fetches of the same
+# keyword (e.g. several pages in one pipeline run) share a single report
+_inflight_reports: dict[str, "asyncio.Future[tuple[dict[str, Any], str | None]]"] = {}
+
 
 @dataclass
 class ContentBriefResult:
@@ -39,6 +74,7 @@ class ContentBriefResult:
     content_brief: ContentBrief | None = None
     error: str | None = None
     cached: bool = False
+    shared_cache_hit: bool = False
 
 
 async def fetch_content_brief(
@@ -47,6 +83,7 @@ async def fetch_content_brief(
     keyword: str,
     target_url: str,
     force_refresh: bool = False,
+    location_name: str = DEFAULT_POP_LOCATION,
 ) -> ContentBriefResult:
     """Fetch a content brief from POP and store as a ContentBrief record.
 
@@ -57,7 +94,10 @@ async def fetch_content_brief(
       3. get_custom_recommendations(reportId) → extract recommendations
 
     Caching: if a ContentBrief already exists for the page and force_refresh is
-    False, returns the existing record without making an API call.
+    False, returns the existing record without making an API call. For the
+    real client, the shared keyword-level cache (pop_brief_cache) is consulted
+    before running the 3-step flow and the hit is copied into this page's
+    ContentBrief.
 
     On POP API error or timeout, returns a failure result with error details
     but does NOT raise — content generation can proceed without LSI terms.
@@ -68,6 +108,7 @@ async def fetch_content_brief(
         keyword: Target keyword for POP get-terms.
         target_url: URL to analyze.
         force_refresh: If True, make a new API call even if a brief exists.
+        location_name: POP/Google search location (part of the shared cache key).
 
     Returns:
         ContentBriefResult with success status, ContentBrief (or None), and
@@ -106,6 +147,8 @@ async def fetch_content_brief(
         },
     )
 
+    shared_cache_hit = False
+
     try:
         if isinstance(pop_client, POPMockClient):
             # Mock client returns all 3 steps merged in get_terms()
@@ -144,9 +187,18 @@ async def fetch_content_brief(
             response_data = task_result.data or {}
             pop_task_id = task_result.task_id
         else:
-            # Real client: 3-step orchestration
-            response_data, pop_task_id = await _run_real_3step_flow(
-                pop_client, keyword, target_url
+            # Real client: shared keyword cache, then 3-step orchestration
+            (
+                response_data,
+                pop_task_id,
+                shared_cache_hit,
+            ) = await run_3step_flow_with_shared_cache(
+                db=db,
+                pop_client=pop_client,
+                keyword=keyword,
+                target_url=target_url,
+                force_refresh=force_refresh,
+                location_name=location_name,
             )
 
         # Parse all fields from merged response data
@@ -198,6 +250,7 @@ async def fetch_content_brief(
         return ContentBriefResult(
             success=True,
             content_brief=content_brief,
+            shared_cache_hit=shared_cache_hit,
         )
 
     except POPTimeoutError as e:
@@ -230,10 +283,185 @@ async def fetch_content_brief(
         )
 
 
+# ---------------------------------------------------------------------------
+# Shared keyword-level brief cache
+# ---------------------------------------------------------------------------
+
+
+def normalize_brief_keyword(keyword: str) -> str:
+    """Normalize a keyword for shared brief cache lookups.
+
+    Lowercases, strips punctuation (keeping intra-word hyphens/apostrophes)
+    and collapses whitespace, so "Best Dog Beds!" and "best  dog beds" match.
+    """
+    lowered = keyword.lower().strip()
+    cleaned = re.sub(r"[^\w\s'-]", " ", lowered)
+    return re.sub(r"\s+", " ", cleaned).strip()
+
+
+def brief_cache_key(keyword: str, location_name: str = DEFAULT_POP_LOCATION) -> str:
+    """Shared cache key for (normalized keyword, location).
+
+    The target URL is deliberately excluded: POP terms, competitors and
+    recommendations depend on the SERP for the keyword, not on our page.
+    """
+    raw = f"{normalize_brief_keyword(keyword)}|{location_name.strip().lower()}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def get_brief_cache_stats() -> dict[str, int]:
+    """Return shared brief cache hit/miss counters."""
+    return dict(_brief_cache_stats)
+
+
+async def _get_shared_brief(
+    db: AsyncSession,
+    cache_key: str,
+) -> POPBriefCache | None:
+    """Return an unexpired shared cache entry, or None."""
+    stmt = select(POPBriefCache).where(
+        POPBriefCache.cache_key == cache_key,
+        POPBriefCache.expires_at > datetime.now(UTC),
+    )
+    result = await db.execute(stmt)
+    return result.scalar_one_or_none()
+
+
+async def _store_shared_brief(
+    db: AsyncSession,
+    cache_key: str,
+    keyword: str,
+    location_name: str,
+    response_data: dict[str, Any],
+    pop_task_id: str | None,
+) -> None:
+    """Create or refresh a shared cache entry. Never raises."""
+    ttl_days = get_settings().pop_brief_cache_ttl_days
+    expires_at = datetime.now(UTC) + timedelta(days=ttl_days)
+    try:
+        async with db.begin_nested():
+            stmt = select(POPBriefCache).where(POPBriefCache.cache_key == cache_key)
+            result = await db.execute(stmt)
+            entry = result.scalar_one_or_none()
+            if entry is None:
+                db.add(
+                    POPBriefCache(
+                        cache_key=cache_key,
+                        keyword=normalize_brief_keyword(keyword),
+                        location_name=location_name,
+                        response_data=response_data,
+                        pop_task_id=pop_task_id,
+                        expires_at=expires_at,
+                    )
+                )
+            else:
+                entry.response_data = response_data
+                entry.pop_task_id = pop_task_id
+                entry.expires_at = expires_at
+        _brief_cache_stats["stores"] += 1
+    except SQLAlchemyError as e:
+        logger.warning(
+            "Failed to store shared POP brief",
+            extra={"keyword": keyword[:50], "error": str(e)},
+        )
+
+
+async def run_3step_flow_with_shared_cache(
+    db: AsyncSession,
+    pop_client: POPClient,
+    keyword: str,
+    target_url: str,
+    force_refresh: bool = False,
+    location_name: str = DEFAULT_POP_LOCATION,
+) -> tuple[dict[str, Any], str | None, bool]:
+    """Run the real 3-step POP flow behind the shared keyword-level cache.
+
+    Lookup order: shared cache (unless force_refresh or disabled) → an
+    in-flight run for the same key → a new POP report, which is then stored.
+
+    Returns:
+        Tuple of (merged_response_data, pop_task_id, shared_cache_hit)
+
+    Raises:
+        Same as _run_real_3step_flow.
+    """
+    if not get_settings().pop_brief_cache_enabled:
+        response_data, pop_task_id = await _run_real_3step_flow(
+            pop_client, keyword, target_url, location_name=location_name
+        )
+        return response_data, pop_task_id, False
+
+    cache_key = brief_cache_key(keyword, location_name)
+
+    if not force_refresh:
+        entry = await _get_shared_brief(db, cache_key)
+        if entry is not None:
+            entry.hit_count += 1
+            _brief_cache_stats["hits"] += 1
+            logger.info(
+                "Shared POP brief cache hit",
+                extra={
+                    "keyword": keyword[:50],
+                    "location": location_name,
+                    "hit_count": entry.hit_count,
+                    "pop_task_id": entry.pop_task_id,
+                },
+            )
+            # Copy so callers mutating the dict never touch the cached row
+            return dict(entry.response_data or {}), entry.pop_task_id, True
+
+        inflight = _inflight_reports.get(cache_key)
+        if inflight is not None:
+            _brief_cache_stats["inflight_joins"] += 1
+            response_data, pop_task_id = await asyncio.shield(inflight)
+            return dict(response_data), pop_task_id, True
+
+    _brief_cache_stats["misses"] += 1
+    future: asyncio.Future[tuple[dict[str, Any], str | None]] = (
+        asyncio.get_running_loop().create_future()
+    )
+    _inflight_reports[cache_key] = future
+    try:
+        response_data, pop_task_id = await _run_real_3step_flow(
+            pop_client, keyword, target_url, location_name=location_name
+        )
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        # Mark retrieved so un-joined failures don't log "never retrieved"
+        future.exception()
+        raise
+    else:
+        future.set_result((dict(response_data), pop_task_id))
+    finally:
+        if _inflight_reports.get(cache_key) is future:
+            del _inflight_reports[cache_key]
+
+    if response_data.get(POP_STEPS_COMPLETED_KEY) == 3:
+        await _store_shared_brief(
+            db, cache_key, keyword, location_name, response_data, pop_task_id
+        )
+    else:
+        # A partial brief (POP hiccup in step 2 or 3) would otherwise be
+        # served to every project for the full TTL
+        _brief_cache_stats["partial_skips"] += 1
+        logger.warning(
+            "Partial POP brief not stored in shared cache",
+            extra={
+                "keyword": keyword[:50],
+                "steps_completed": response_data.get(POP_STEPS_COMPLETED_KEY),
+            },
+        )
+    return response_data, pop_task_id, False
+
+
 async def _run_real_3step_flow(
     pop_client: POPClient,
     keyword: str,
     target_url: str,
+    location_name: str = DEFAULT_POP_LOCATION,
 ) -> tuple[dict[str, Any], str | None]:
     """Run the real 3-step POP API flow and merge results.
 
@@ -243,6 +471,8 @@ async def _run_real_3step_flow(
     3. get-custom-recommendations (reportId) → keyword/heading targets
 
     Step 3 is optional — if it fails, data from steps 1+2 is still returned.
+    The number of steps that contributed data is recorded under
+    POP_STEPS_COMPLETED_KEY in the response.
 
     Returns:
         Tuple of (merged_response_data, pop_task_id)
@@ -255,6 +485,7 @@ async def _run_real_3step_flow(
     task_result = await pop_client.create_report_task(
         keyword=keyword,
         url=target_url,
+        location_name=location_name,
     )
 
     if not task_result.success or not task_result.task_id:
@@ -280,6 +511,7 @@ async def _run_real_3step_flow(
     # Preserve step 1 keyword variations (strings) before step 2/3 overwrite them
     # Steps 2+3 have their own "variations" key with recommendation objects
     response_data["_keyword_variations"] = list(variations)
+    response_data[POP_STEPS_COMPLETED_KEY] = 1
 
     if not prepare_id:
         logger.warning(
@@ -337,6 +569,7 @@ async def _run_real_3step_flow(
     else:
         # Fallback: merge as-is (some API versions may not nest)
         response_data.update(report_data)
+    response_data[POP_STEPS_COMPLETED_KEY] = 2
 
     # --- Step 3: get-custom-recommendations (optional) ---
     # Also check polled data and merged response as fallback
@@ -375,6 +608,7 @@ async def _run_real_3step_flow(
                     "Step 3 recommendations merged (no nesting)",
                     extra={"report_id": report_id, "keyword": keyword[:50]},
                 )
+            response_data[POP_STEPS_COMPLETED_KEY] = 3
         else:
             logger.warning(
                 "get-custom-recommendations failed, continuing without recs",
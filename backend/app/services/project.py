@@ -2,20 +2,143 @@
 
 Provides business logic for Project entities, separating concerns from API routes.
 Uses async SQLAlchemy 2.0 patterns.
+
+The dashboard list is served by one aggregated query (brand config existence,
+file counts and the total all computed in SQL) with keyset pagination, and
+pages are cached briefly in-process. The cache is invalidated by mapper
+events when a Project, BrandConfig or ProjectFile row is written, by
+do_orm_execute for bulk insert/update/delete statements against those
+models, and again when the writing session's transaction ends.
 """
 
+import base64
+import binascii
+import json
+import time
+from dataclasses import dataclass
+from datetime import datetime
 from typing import Any
 
 from fastapi import HTTPException, status
-from sqlalchemy import func, select
+from sqlalchemy import and_, event, exists, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-
+from sqlalchemy.orm import (
+    Mapper,
+    ORMExecuteState,
+    Session,
+    SessionTransaction,
+    aliased,
+    object_session,
+)
+
+from app.core.config import get_settings
 from app.integrations.s3 import S3Client, S3Error, S3NotFoundError
 from app.models.brand_config import BrandConfig
 from app.models.project import Project
 from app.models.project_file import ProjectFile
 from app.schemas.project import ProjectCreate, ProjectResponse, ProjectUpdate
 
+# Sortable columns for the project list (keyset tiebreaker is always id)
+PROJECT_LIST_SORT_FIELDS = ("updated_at", "created_at", "name")
+
+# Models whose writes change what the project list returns
+_LIST_AFFECTING_MODELS = (Project, BrandConfig, ProjectFile)
+
+# Session.info flag: True while a session's transaction holds list-affecting
+# writes (present at all once its transaction-end listener is registered)
+_PROJECT_WRITES_KEY = "project_list_writes"
+
+# Upper bound on cached list pages (keys are param combinations)
+_MAX_CACHED_PAGES = 64
+
+
+@dataclass
+class ProjectListPage:
+    """One page of the project list."""
+
+    items: list[ProjectResponse]
+    total: int
+    next_cursor: str | None
+
+
+_list_cache: dict[tuple[Any, ...], tuple[int, float, ProjectListPage]] = {}
+_list_cache_version = 0
+
+
+def invalidate_project_list_cache() -> None:
+    """Drop all cached project list pages."""
+    global _list_cache_version
+    _list_cache_version += 1
+    _list_cache.clear()
+
+
+def _note_project_list_write(session: Session | None) -> None:
+    """Invalidate now, and again when the writing session's transaction ends."""
+    invalidate_project_list_cache()
+    if session is None:
+        return
+    if _PROJECT_WRITES_KEY not in session.info:
+        event.listen(session, "after_transaction_end", _finish_project_list_writes)
+    session.info[_PROJECT_WRITES_KEY] = True
+
+
+def _finish_project_list_writes(
+    session: Session, transaction: SessionTransaction
+) -> None:
+    # Pages read between the write and the commit/rollback may have seen
+    # uncommitted rows, so invalidate again once the outcome is known
+    if transaction.parent is None and session.info[_PROJECT_WRITES_KEY]:
+        session.info[_PROJECT_WRITES_KEY] = False
+        invalidate_project_list_cache()
+
+
+def _on_row_write(mapper: Mapper[Any], connection: Any, target: Any) -> None:
+    _note_project_list_write(object_session(target))
+
+
+for _model in _LIST_AFFECTING_MODELS:
+    for _identifier in ("after_insert", "after_update", "after_delete"):
+        event.listen(_model, _identifier, _on_row_write)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_bulk_project_list_writes(orm_execute_state: ORMExecuteState) -> None:
+    # Bulk insert()/update()/delete() statements skip the mapper events
+    if not (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and issubclass(mapper.class_, _LIST_AFFECTING_MODELS):
+        _note_project_list_write(orm_execute_state.session)
+
+
+def _encode_cursor(sort: str, order: str, value: Any, project_id: str) -> str:
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps({"s": sort, "o": order, "v": value, "id": project_id})
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort: str, order: str) -> tuple[Any, str]:
+    """Decode a list cursor. Raises HTTPException 400 if invalid."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if payload["s"] != sort or payload["o"] != order:
+            raise ValueError("cursor was issued for a different sort")
+        value = payload["v"]
+        if sort != "name":
+            value = datetime.fromisoformat(value)
+        return value, str(payload["id"])
+    except (ValueError, KeyError, TypeError, binascii.Error) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid cursor: {e}",
+        ) from e
+
 
 class ProjectService:
     """Service class for Project CRUD operations."""
@@ -40,6 +163,167 @@ class ProjectService:
         result = await db.execute(stmt)
         return list(result.scalars().all())
 
+    @staticmethod
+    async def list_projects_page(
+        db: AsyncSession,
+        *,
+        include_reddit_only: bool = False,
+        sort: str = "updated_at",
+        order: str = "desc",
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> ProjectListPage:
+        """List projects with computed fields in a single aggregated query.
+
+        Pages are ordered by (sort, id) and continued with an opaque keyset
+        cursor; limit=None returns every remaining project.
+
+        Args:
+            db: AsyncSession for database operations.
+            include_reddit_only: Include reddit-only projects.
+            sort: One of PROJECT_LIST_SORT_FIELDS.
+            order: "asc" or "desc".
+            limit: Page size, or None for no limit.
+            cursor: next_cursor from a previous page.
+
+        Returns:
+            ProjectListPage with items, the filtered total and next_cursor.
+
+        Raises:
+            HTTPException: 400 if sort, order or cursor is invalid.
+        """
+        if sort not in PROJECT_LIST_SORT_FIELDS or order not in ("asc", "desc"):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid sort '{sort} {order}'",
+            )
+
+        ttl = get_settings().project_list_cache_ttl_seconds
+        # Never cache reads from a session holding uncommitted project writes
+        use_cache = ttl > 0 and not db.info.get(_PROJECT_WRITES_KEY)
+        cache_key = (include_reddit_only, sort, order, limit, cursor)
+        if use_cache:
+            cached = _list_cache.get(cache_key)
+            if (
+                cached is not None
+                and cached[0] == _list_cache_version
+                and cached[1] > time.monotonic()
+            ):
+                return cached[2]
+
+        version = _list_cache_version
+        page = await ProjectService._query_projects_page(
+            db, include_reddit_only, sort, order, limit, cursor
+        )
+
+        if use_cache and version == _list_cache_version:
+            if len(_list_cache) >= _MAX_CACHED_PAGES:
+                _list_cache.clear()
+            _list_cache[cache_key] = (version, time.monotonic() + ttl, page)
+        return page
+
+    @staticmethod
+    async def _query_projects_page(
+        db: AsyncSession,
+        include_reddit_only: bool,
+        sort: str,
+        order: str,
+        limit: int | None,
+        cursor: str | None,
+    ) -> ProjectListPage:
+        sort_col = getattr(Project, sort)
+        descending = order == "desc"
+
+        filters = []
+        if not include_reddit_only:
+            filters.append(Project.reddit_only == False)  # noqa: E712
+
+        file_counts = (
+            select(
+                ProjectFile.project_id,
+                func.count().label("file_count"),
+            )
+            .group_by(ProjectFile.project_id)
+            .subquery()
+        )
+        has_brand_config = (
+            exists().where(BrandConfig.project_id == Project.id).label("has_bc")
+        )
+        # Aliased so the count is not correlated to the outer Project row
+        counted = aliased(Project)
+        total_filters = []
+        if not include_reddit_only:
+            total_filters.append(counted.reddit_only == False)  # noqa: E712
+        total = (
+            select(func.count())
+            .select_from(counted)
+            .where(*total_filters)
+            .scalar_subquery()
+            .label("total")
+        )
+
+        stmt = (
+            select(
+                Project,
+                has_brand_config,
+                func.coalesce(file_counts.c.file_count, 0).label("file_count"),
+                total,
+            )
+            .outerjoin(file_counts, file_counts.c.project_id == Project.id)
+            .where(*filters)
+        )
+
+        if cursor is not None:
+            after_value, after_id = _decode_cursor(cursor, sort, order)
+            if descending:
+                stmt = stmt.where(
+                    or_(
+                        sort_col < after_value,
+                        and_(sort_col == after_value, Project.id < after_id),
+                    )
+                )
+            else:
+                stmt = stmt.where(
+                    or_(
+                        sort_col > after_value,
+                        and_(sort_col == after_value, Project.id > after_id),
+                    )
+                )
+
+        if descending:
+            stmt = stmt.order_by(sort_col.desc(), Project.id.desc())
+        else:
+            stmt = stmt.order_by(sort_col.asc(), Project.id.asc())
+        if limit is not None:
+            stmt = stmt.limit(limit + 1)
+
+        rows = list((await db.execute(stmt)).all())
+
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1][0]
+            next_cursor = _encode_cursor(sort, order, getattr(last, sort), last.id)
+
+        if rows:
+            total_count = rows[0].total
+        elif cursor is None:
+            total_count = 0
+        else:
+            # Past the last page: the total is not carried by any row
+            count_stmt = select(func.count()).select_from(Project).where(*filters)
+            total_count = (await db.execute(count_stmt)).scalar_one()
+
+        items = [
+            ProjectService._build_response(
+                row[0],
+                has_brand_config=bool(row.has_bc),
+                uploaded_files_count=row.file_count,
+            )
+            for row in rows
+        ]
+        return ProjectListPage(items=items, total=total_count, next_cursor=next_cursor)
+
     @staticmethod
     async def get_project(db: AsyncSession, project_id: str) -> Project:
         """Get a project by ID.
@@ -188,13 +472,6 @@ class ProjectService:
         Returns:
             ProjectResponse with all computed fields populated.
         """
-        # Get brand_config_status from brand_wizard_state
-        brand_config_status = "pending"
-        brand_wizard_state: dict[str, Any] = project.brand_wizard_state or {}
-        generation_state = brand_wizard_state.get("generation", {})
-        if generation_state and "status" in generation_state:
-            brand_config_status = generation_state["status"]
-
         # Check if BrandConfig exists for this project
         brand_config_stmt = select(func.count()).where(
             BrandConfig.project_id == project.id
@@ -207,6 +484,27 @@ class ProjectService:
         files_result = await db.execute(files_stmt)
         uploaded_files_count = files_result.scalar_one()
 
+        return ProjectService._build_response(
+            project,
+            has_brand_config=has_brand_config,
+            uploaded_files_count=uploaded_files_count,
+        )
+
+    @staticmethod
+    def _build_response(
+        project: Project,
+        *,
+        has_brand_config: bool,
+        uploaded_files_count: int,
+    ) -> ProjectResponse:
+        """Build a ProjectResponse from a project and its precomputed counts."""
+        # Get brand_config_status from brand_wizard_state
+        brand_config_status = "pending"
+        brand_wizard_state: dict[str, Any] = project.brand_wizard_state or {}
+        generation_state = brand_wizard_state.get("generation", {})
+        if generation_state and "status" in generation_state:
+            brand_config_status = generation_state["status"]
+
         return ProjectResponse(
             id=project.id,
             name=project.name,
@@ -236,4 +534,32 @@ class ProjectService:
         Returns:
             List of ProjectResponse with all computed fields populated.
         """
-        return [await ProjectService.to_response(db, project) for project in projects]
+        if not projects:
+            return []
+
+        project_ids = [project.id for project in projects]
+
+        brand_config_stmt = (
+            select(BrandConfig.project_id)
+            .where(BrandConfig.project_id.in_(project_ids))
+            .distinct()
+        )
+        with_brand_config = set((await db.execute(brand_config_stmt)).scalars().all())
+
+        files_stmt = (
+            select(ProjectFile.project_id, func.count())
+            .where(ProjectFile.project_id.in_(project_ids))
+            .group_by(ProjectFile.project_id)
+        )
+        file_counts: dict[str, int] = dict(
+            (await db.execute(files_stmt)).tuples().all()
+        )
+
+        return [
+            ProjectService._build_response(
+                project,
+                has_brand_config=project.id in with_brand_config,
+                uploaded_files_count=file_counts.get(project.id, 0),
+            )
+            for project in projects
+        ]
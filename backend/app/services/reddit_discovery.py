@@ -12,26 +12,37 @@ Follows the trigger → background task → poll status pattern
 from content_generation.py.
 """
 
+import asyncio
 import contextlib
+import hashlib
 import json
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
 from typing import Any
 
 from sqlalchemy import select
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import get_settings
 from app.core.database import db_manager
 from app.core.logging import get_logger
+from app.core.query_stats import query_scoped
+from app.core.redis import redis_manager
+from app.core.tracing import traced, traced_run
 from app.integrations.claude import ClaudeClient, get_api_key
-from app.integrations.serpapi import SerpResult, get_serpapi
+from app.integrations.serpapi import SerpAPIClient, SerpResult, get_serpapi
 from app.models.brand_config import BrandConfig
 from app.models.reddit_config import RedditProjectConfig
 from app.models.reddit_post import RedditPost
 
 logger = get_logger(__name__)
 
+# Redis key prefix for evaluations of posts that scored below the storage
+# threshold, so unchanged rejects are not sent to Claude again
+REJECTED_CACHE_KEY_PREFIX = "reddit:rejected:v1:"
+
 # ---------------------------------------------------------------------------
 # Intent classification keyword lists
 # Ported exactly from the Flask app (REDDIT_INTEGRATION_PLAN.md)
@@ -329,6 +340,10 @@ class ScoringResult:
     filter_status: str | None  # "relevant", "low_relevance", or None (discard)
     raw_response: dict[str, Any] | None = None
     error: str | None = None
+    # Hash of the scoring inputs and when Claude produced this result; set on
+    # results reused from a previous run so their age is not reset
+    input_hash: str | None = None
+    scored_at: datetime | None = None
 
 
 def _determine_filter_status(score: float) -> str | None:
@@ -345,6 +360,164 @@ def _determine_filter_status(score: float) -> str | None:
     return "low_relevance"
 
 
+def _scoring_input_hash(
+    post: SerpResult,
+    brand_name: str,
+    brand_description: str,
+    competitors: list[str],
+) -> str:
+    """Hash everything the scoring prompt depends on.
+
+    A stored evaluation with the same hash was produced from an identical
+    prompt, so it can be reused instead of calling Claude again.
+    """
+    payload = json.dumps(
+        [
+            post.title,
+            post.snippet,
+            post.subreddit,
+            brand_name,
+            brand_description,
+            sorted(competitors),
+        ]
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _reusable_scoring(
+    post: SerpResult,
+    existing: Any,
+    input_hash: str,
+    max_age: timedelta,
+    now: datetime,
+) -> ScoringResult | None:
+    """Return the stored evaluation for a post if it is still valid.
+
+    Valid means: it has a score, the scoring inputs are unchanged (by input
+    hash, or by title/snippet for rows stored before hashes were recorded),
+    and it is younger than max_age.
+    """
+    evaluation = existing.ai_evaluation or {}
+    score = evaluation.get("score")
+    if score is None:
+        return None
+
+    stored_hash = evaluation.get("input_hash")
+    if stored_hash is not None:
+        if stored_hash != input_hash:
+            return None
+    elif existing.title != post.title or existing.snippet != post.snippet:
+        return None
+
+    scored_at = existing.created_at
+    if evaluation.get("scored_at"):
+        with contextlib.suppress(ValueError, TypeError):
+            scored_at = datetime.fromisoformat(evaluation["scored_at"])
+    if scored_at is None or now - scored_at > max_age:
+        return None
+
+    return ScoringResult(
+        score=float(score),
+        reasoning=evaluation.get("reasoning", ""),
+        intent=evaluation.get("intent", "general"),
+        filter_status=_determine_filter_status(float(score)),
+        raw_response=evaluation.get("raw"),
+        input_hash=input_hash,
+        scored_at=scored_at,
+    )
+
+
+def _rejected_cache_field(url: str) -> str:
+    return hashlib.sha256(url.encode()).hexdigest()[:32]
+
+
+async def _load_rejected_evaluations(project_id: str) -> dict[str, dict[str, Any]]:
+    """Load cached evaluations of discarded posts, keyed by URL digest.
+
+    Posts scoring below 5 are never stored, so this is the only record of
+    them. Returns an empty dict when Redis is unavailable, which just means
+    those posts are scored again.
+    """
+    if not redis_manager.available:
+        return {}
+    raw = await redis_manager.get(f"{REJECTED_CACHE_KEY_PREFIX}{project_id}")
+    if raw is None:
+        return {}
+    try:
+        cached = json.loads(raw)
+    except ValueError:
+        return {}
+    return cached if isinstance(cached, dict) else {}
+
+
+async def _remember_rejected_evaluations(
+    project_id: str,
+    cached: dict[str, dict[str, Any]],
+    posts: list[SerpResult],
+    results: list[ScoringResult],
+    max_age: timedelta,
+    now: datetime,
+) -> None:
+    """Add newly discarded posts to the rejected cache, dropping stale entries.
+
+    Only the input hash, score and scoring time are kept; failed scorings are
+    not cached so they are retried next run.
+    """
+    if not redis_manager.available:
+        return
+    entries = {
+        field: evaluation
+        for field, evaluation in cached.items()
+        if _rejected_entry_is_fresh(evaluation, max_age, now)
+    }
+    for post, result in zip(posts, results, strict=True):
+        if result.filter_status is None and result.error is None:
+            entries[_rejected_cache_field(post.url)] = {
+                "score": result.score,
+                "input_hash": result.input_hash,
+                "scored_at": (result.scored_at or now).isoformat(),
+            }
+    if not entries:
+        return
+    await redis_manager.set(
+        f"{REJECTED_CACHE_KEY_PREFIX}{project_id}",
+        json.dumps(entries),
+        ex=int(max_age.total_seconds()),
+    )
+
+
+def _rejected_entry_is_fresh(
+    evaluation: Any, max_age: timedelta, now: datetime
+) -> bool:
+    try:
+        return now - datetime.fromisoformat(evaluation["scored_at"]) <= max_age
+    except (KeyError, TypeError, ValueError):
+        return False
+
+
+@traced("reddit_discovery.load_evaluations")
+async def _load_existing_evaluations(
+    db: AsyncSession,
+    project_id: str,
+    urls: list[str],
+) -> dict[str, Any]:
+    """Load stored title/snippet/evaluation for the given URLs in one query."""
+    if not urls:
+        return {}
+    stmt = select(
+        RedditPost.url,
+        RedditPost.title,
+        RedditPost.snippet,
+        RedditPost.ai_evaluation,
+        RedditPost.created_at,
+    ).where(
+        RedditPost.project_id == project_id,
+        RedditPost.url.in_(urls),
+    )
+    result = await db.execute(stmt)
+    return {row.url: row for row in result.all()}
+
+
 def _build_scoring_prompt(
     post: SerpResult,
     brand_name: str,
@@ -474,6 +647,7 @@ async def score_post_with_claude(
         )
 
 
+@traced("reddit_discovery.score")
 async def score_posts_batch(
     posts: list[SerpResult],
     claude_client: ClaudeClient,
@@ -565,6 +739,7 @@ class DiscoveryProgress:
     keywords_searched: int = 0
     total_posts_found: int = 0
     posts_scored: int = 0
+    posts_reused: int = 0
     posts_stored: int = 0
     error: str | None = None
     started_at: str = ""
@@ -605,6 +780,100 @@ def _clear_progress(project_id: str) -> None:
 # ---------------------------------------------------------------------------
 
 
+# ---------------------------------------------------------------------------
+# SERP search phase
+# ---------------------------------------------------------------------------
+
+
+@traced("reddit_discovery.search")
+async def search_keywords_concurrently(
+    serpapi: SerpAPIClient,
+    keywords: list[str],
+    target_subreddits: list[str],
+    time_range: str | None,
+    progress: DiscoveryProgress,
+    concurrency: int,
+) -> list[SerpResult]:
+    """Run the broad and subreddit-scoped searches for all keywords.
+
+    Each (keyword, scope) pair is an independent search; up to `concurrency`
+    run at once. Identical searches within the run are issued only once.
+    Progress counters are updated as searches finish, in any order; a keyword
+    counts as searched once all of its scopes are done.
+
+    Returns:
+        All results in keyword order, broad results before scoped ones, so
+        first-occurrence deduplication behaves as with sequential searching.
+    """
+    scopes: list[tuple[str, ...]] = [()]
+    scopes.extend((sub,) for sub in target_subreddits)
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    # Per-run response cache keyed by (keyword, subreddits, time_range);
+    # holding the task lets a duplicate search await the one in flight
+    cache: dict[tuple[Any, ...], asyncio.Task[list[SerpResult]]] = {}
+
+    async def _search(keyword: str, scope: tuple[str, ...]) -> list[SerpResult]:
+        async with semaphore:
+            try:
+                return await serpapi.search(
+                    keyword=keyword,
+                    subreddits=list(scope) or None,
+                    time_range=time_range,
+                )
+            except Exception as e:
+                logger.error(
+                    "SerpAPI search failed for keyword",
+                    extra={"keyword": keyword, "subreddits": scope, "error": str(e)},
+                )
+                return []
+
+    # Searches still outstanding per keyword index
+    remaining = dict.fromkeys(range(len(keywords)), len(scopes))
+
+    def _on_done(index: int, results: list[SerpResult]) -> None:
+        progress.total_posts_found += len(results)
+        remaining[index] -= 1
+        if remaining[index] == 0:
+            progress.keywords_searched += 1
+
+    async def _run(
+        index: int, keyword: str, scope: tuple[str, ...]
+    ) -> list[SerpResult]:
+        key = (keyword, scope, time_range)
+        task = cache.get(key)
+        if task is None:
+            task = asyncio.ensure_future(_search(keyword, scope))
+            cache[key] = task
+        results = await task
+        _on_done(index, results)
+        return results
+
+    searches = [(keyword, scope) for keyword in keywords for scope in scopes]
+    job_results = await asyncio.gather(
+        *(
+            _run(position // len(scopes), keyword, scope)
+            for position, (keyword, scope) in enumerate(searches)
+        )
+    )
+
+    all_posts: list[SerpResult] = []
+    for (keyword, _scope), results in zip(searches, job_results, strict=True):
+        for r in results:
+            r.search_keyword = keyword
+        all_posts.extend(results)
+
+    logger.info(
+        "SERP searches complete",
+        extra={
+            "searches": len(searches),
+            "unique_searches": len(cache),
+            "concurrency": concurrency,
+        },
+    )
+    return all_posts
+
+
 def _deduplicate_posts(posts: list[SerpResult]) -> list[SerpResult]:
     """Deduplicate SerpResult posts by URL (first occurrence wins)."""
     seen_urls: set[str] = set()
@@ -622,6 +891,79 @@ def _deduplicate_posts(posts: list[SerpResult]) -> list[SerpResult]:
 # ---------------------------------------------------------------------------
 
 
+# Rows per multi-row upsert statement (~15 bind params per row keeps each
+# statement well under asyncpg's 32767-parameter limit)
+_UPSERT_CHUNK_SIZE = 500
+
+# Existing filter statuses that new scoring may overwrite; anything else
+# was set by a user and is preserved
+_OVERWRITABLE_FILTER_STATUSES = ("pending", "low_relevance")
+
+
+def _build_post_upsert(rows: list[dict[str, Any]]) -> Any:
+    """Build a multi-row INSERT ... ON CONFLICT DO UPDATE for RedditPost rows."""
+    from sqlalchemy import case
+
+    stmt = pg_insert(RedditPost).values(rows)
+
+    # On conflict (project_id, url): update metadata but preserve
+    # user-set filter_status. CASE: if existing is still 'pending',
+    # update it from new scoring; otherwise keep the user's choice.
+    return stmt.on_conflict_do_update(
+        constraint="uq_reddit_posts_project_url",
+        set_={
+            "title": stmt.excluded.title,
+            "snippet": stmt.excluded.snippet,
+            "subreddit": stmt.excluded.subreddit,
+            "intent": stmt.excluded.intent,
+            "intent_categories": stmt.excluded.intent_categories,
+            "relevance_score": stmt.excluded.relevance_score,
+            "matched_keywords": stmt.excluded.matched_keywords,
+            "ai_evaluation": stmt.excluded.ai_evaluation,
+            "discovered_at": stmt.excluded.discovered_at,
+            "updated_at": datetime.now(UTC),
+            "filter_status": case(
+                (
+                    RedditPost.__table__.c.filter_status.in_(
+                        list(_OVERWRITABLE_FILTER_STATUSES)
+                    ),
+                    stmt.excluded.filter_status,
+                ),
+                else_=RedditPost.__table__.c.filter_status,
+            ),
+        },
+    )
+
+
+def _merge_duplicate_rows(
+    rows: list[dict[str, Any]],
+) -> list[tuple[dict[str, Any], int]]:
+    """Collapse rows sharing a URL, as sequential upserts would have.
+
+    Postgres rejects a single ON CONFLICT DO UPDATE statement that touches
+    the same row twice. The first row's insert-only fields (keyword) are
+    kept, later rows overwrite the updatable fields, and filter_status
+    follows the same CASE rule as the upsert. Returns (row, source_count).
+    """
+    merged: dict[str, tuple[dict[str, Any], int]] = {}
+    for row in rows:
+        existing = merged.get(row["url"])
+        if existing is None:
+            merged[row["url"]] = (dict(row), 1)
+            continue
+        current, count = existing
+        filter_status = current["filter_status"]
+        if filter_status in _OVERWRITABLE_FILTER_STATUSES:
+            filter_status = row["filter_status"]
+        current.update(
+            {k: v for k, v in row.items() if k not in ("project_id", "keyword")}
+        )
+        current["filter_status"] = filter_status
+        merged[row["url"]] = (current, count + 1)
+    return list(merged.values())
+
+
+@traced("reddit_discovery.store")
 async def store_discovered_posts(
     project_id: str,
     posts: list[SerpResult],
@@ -636,6 +978,10 @@ async def store_discovered_posts(
     at the DB level. Does NOT overwrite filter_status if it was manually
     changed by a user (i.e., not 'pending').
 
+    Rows are sent in multi-row statements of up to _UPSERT_CHUNK_SIZE, each
+    in its own savepoint. If a chunk fails, its rows are retried one at a
+    time so a single bad row only loses itself.
+
     Args:
         project_id: The project UUID.
         posts: List of SerpResult posts.
@@ -647,10 +993,11 @@ async def store_discovered_posts(
     Returns:
         Number of posts stored/updated.
     """
-    from sqlalchemy import case
-
     stored = 0
     skipped = 0
+    failed_chunks = 0
+    now = datetime.now(UTC)
+    rows: list[dict[str, Any]] = []
 
     for post, intent, scoring in zip(
         posts, intent_results, scoring_results, strict=False
@@ -670,66 +1017,67 @@ async def store_discovered_posts(
         # Normalize relevance_score from 0-10 to 0.0-1.0 for the DB field
         relevance_score = scoring.score / 10.0 if scoring.score is not None else None
 
-        values = {
-            "project_id": project_id,
-            "url": post.url,
-            "title": post.title,
-            "snippet": post.snippet,
-            "subreddit": post.subreddit,
-            "keyword": post.search_keyword or None,
-            "intent": primary_intent,
-            "intent_categories": intent.intents,
-            "relevance_score": relevance_score,
-            "matched_keywords": intent.matched_keywords,
-            "ai_evaluation": {
-                "score": scoring.score,
-                "reasoning": scoring.reasoning,
-                "intent": scoring.intent,
-                "raw": scoring.raw_response,
-            },
-            "filter_status": scoring.filter_status,
-            "discovered_at": post.discovered_at,
-        }
-
-        stmt = pg_insert(RedditPost).values(**values)
-
-        # On conflict (project_id, url): update metadata but preserve
-        # user-set filter_status. CASE: if existing is still 'pending',
-        # update it from new scoring; otherwise keep the user's choice.
-        stmt = stmt.on_conflict_do_update(
-            constraint="uq_reddit_posts_project_url",
-            set_={
-                "title": stmt.excluded.title,
-                "snippet": stmt.excluded.snippet,
-                "subreddit": stmt.excluded.subreddit,
-                "intent": stmt.excluded.intent,
-                "intent_categories": stmt.excluded.intent_categories,
-                "relevance_score": stmt.excluded.relevance_score,
-                "matched_keywords": stmt.excluded.matched_keywords,
-                "ai_evaluation": stmt.excluded.ai_evaluation,
-                "discovered_at": stmt.excluded.discovered_at,
-                "updated_at": datetime.now(UTC),
-                "filter_status": case(
-                    (
-                        RedditPost.__table__.c.filter_status.in_(
-                            ["pending", "low_relevance"]
-                        ),
-                        stmt.excluded.filter_status,
-                    ),
-                    else_=RedditPost.__table__.c.filter_status,
-                ),
-            },
+        rows.append(
+            {
+                "project_id": project_id,
+                "url": post.url,
+                "title": post.title,
+                "snippet": post.snippet,
+                "subreddit": post.subreddit,
+                "keyword": post.search_keyword or None,
+                "intent": primary_intent,
+                "intent_categories": intent.intents,
+                "relevance_score": relevance_score,
+                "matched_keywords": intent.matched_keywords,
+                "ai_evaluation": {
+                    "score": scoring.score,
+                    "reasoning": scoring.reasoning,
+                    "intent": scoring.intent,
+                    "raw": scoring.raw_response,
+                    "input_hash": scoring.input_hash,
+                    "scored_at": (scoring.scored_at or now).isoformat(),
+                },
+                "filter_status": scoring.filter_status,
+                "discovered_at": post.discovered_at,
+            }
         )
 
+    merged = _merge_duplicate_rows(rows)
+
+    for start in range(0, len(merged), _UPSERT_CHUNK_SIZE):
+        chunk = merged[start : start + _UPSERT_CHUNK_SIZE]
         try:
-            await db.execute(stmt)
-            stored += 1
+            async with db.begin_nested():
+                await db.execute(_build_post_upsert([row for row, _ in chunk]))
+            stored += sum(count for _, count in chunk)
+            continue
         except Exception as e:
-            logger.error(
-                "Failed to upsert Reddit post",
-                extra={"url": post.url, "project_id": project_id, "error": str(e)},
+            failed_chunks += 1
+            logger.warning(
+                "Bulk upsert of Reddit posts failed, retrying rows individually",
+                extra={
+                    "project_id": project_id,
+                    "chunk_start": start,
+                    "chunk_size": len(chunk),
+                    "error": str(e),
+                },
             )
 
+        for row, count in chunk:
+            try:
+                async with db.begin_nested():
+                    await db.execute(_build_post_upsert([row]))
+                stored += count
+            except Exception as e:
+                logger.error(
+                    "Failed to upsert Reddit post",
+                    extra={
+                        "url": row["url"],
+                        "project_id": project_id,
+                        "error": str(e),
+                    },
+                )
+
     await db.commit()
 
     logger.info(
@@ -739,6 +1087,8 @@ async def store_discovered_posts(
             "stored": stored,
             "discarded": skipped,
             "total": len(posts),
+            "statements": (len(merged) + _UPSERT_CHUNK_SIZE - 1) // _UPSERT_CHUNK_SIZE,
+            "failed_chunks": failed_chunks,
         },
     )
 
@@ -750,6 +1100,8 @@ async def store_discovered_posts(
 # ---------------------------------------------------------------------------
 
 
+@traced_run("reddit_discovery", record_args=("project_id", "time_range"))
+@query_scoped("reddit_discovery")
 async def discover_posts(
     project_id: str,
     time_range: str = "7d",
@@ -764,7 +1116,9 @@ async def discover_posts(
     3. Deduplicate results by URL
     4. Filter banned/marketing subreddits and promotional content
     5. Classify intent via keyword matching
-    6. Score relevance via Claude Sonnet
+    6. Score relevance via Claude Sonnet, reusing stored evaluations for
+       URLs whose scoring inputs are unchanged and not older than
+       reddit_rescore_after_days
     7. Store results with upsert semantics
 
     Args:
@@ -772,7 +1126,8 @@ async def discover_posts(
         time_range: Time filter for SERP search ("24h", "7d", "30d").
 
     Returns:
-        Summary dict with total_found, unique, filtered, scored, stored counts.
+        Summary dict with total_found, unique, filtered, scored, reused and
+        stored counts.
     """
     progress = DiscoveryProgress(
         status="searching",
@@ -829,41 +1184,16 @@ async def discover_posts(
 
         progress.total_keywords = len(search_keywords)
 
-        # --- Step 2: Search SerpAPI ---
+        # --- Step 2: Search SerpAPI (keywords x scopes, concurrently) ---
         serpapi = await get_serpapi()
-        all_posts: list[SerpResult] = []
-
-        for keyword in search_keywords:
-            try:
-                # Always do a broad reddit-wide search first
-                results = await serpapi.search(
-                    keyword=keyword,
-                    subreddits=None,
-                    time_range=time_range,
-                )
-                for r in results:
-                    r.search_keyword = keyword
-                all_posts.extend(results)
-
-                # If target subreddits are set, also do scoped searches
-                # to catch posts that the broad search might miss
-                if target_subreddits:
-                    scoped_results = await serpapi.search(
-                        keyword=keyword,
-                        subreddits=target_subreddits,
-                        time_range=time_range,
-                    )
-                    for r in scoped_results:
-                        r.search_keyword = keyword
-                    all_posts.extend(scoped_results)
-            except Exception as e:
-                logger.error(
-                    "SerpAPI search failed for keyword",
-                    extra={"keyword": keyword, "error": str(e)},
-                )
-
-            progress.keywords_searched += 1
-            progress.total_posts_found = len(all_posts)
+        all_posts = await search_keywords_concurrently(
+            serpapi=serpapi,
+            keywords=search_keywords,
+            target_subreddits=target_subreddits,
+            time_range=time_range,
+            progress=progress,
+            concurrency=get_settings().reddit_serp_concurrency,
+        )
 
         logger.info(
             "SERP search phase complete",
@@ -900,6 +1230,7 @@ async def discover_posts(
                 "unique": len(unique_posts),
                 "filtered": len(filtered_posts),
                 "scored": 0,
+                "reused": 0,
                 "stored": 0,
             }
 
@@ -908,22 +1239,78 @@ async def discover_posts(
             classify_intent(post, brand_competitors) for post in filtered_posts
         ]
 
-        # --- Step 6: Claude Sonnet scoring ---
+        # --- Step 6: Claude Sonnet scoring (only new or changed posts) ---
         progress.status = "scoring"
 
+        input_hashes = [
+            _scoring_input_hash(post, brand_name, brand_description, brand_competitors)
+            for post in filtered_posts
+        ]
+        async with db_manager.session_factory() as db:
+            existing = await _load_existing_evaluations(
+                db, project_id, [post.url for post in filtered_posts]
+            )
+        rejected = await _load_rejected_evaluations(project_id)
+
+        max_age = timedelta(days=get_settings().reddit_rescore_after_days)
+        now = datetime.now(UTC)
+        scoring_slots: list[ScoringResult | None] = []
+        posts_to_score: list[SerpResult] = []
+        for post, input_hash in zip(filtered_posts, input_hashes, strict=True):
+            row = existing.get(post.url)
+            if row is None:
+                evaluation = rejected.get(_rejected_cache_field(post.url))
+                if evaluation is not None:
+                    row = SimpleNamespace(
+                        ai_evaluation=evaluation,
+                        title=None,
+                        snippet=None,
+                        created_at=None,
+                    )
+            reused = (
+                _reusable_scoring(post, row, input_hash, max_age, now) if row else None
+            )
+            scoring_slots.append(reused)
+            if reused is None:
+                posts_to_score.append(post)
+        progress.posts_reused = len(filtered_posts) - len(posts_to_score)
+
         def _update_scoring_progress(scored: int, total: int) -> None:
             progress.posts_scored = scored
 
-        claude = ClaudeClient(api_key=get_api_key())
-        scoring_results = await score_posts_batch(
-            posts=filtered_posts,
-            claude_client=claude,
-            brand_name=brand_name,
-            brand_description=brand_description,
-            competitors=brand_competitors,
-            on_progress=_update_scoring_progress,
+        new_results: list[ScoringResult] = []
+        if posts_to_score:
+            claude = ClaudeClient(api_key=get_api_key())
+            new_results = await score_posts_batch(
+                posts=posts_to_score,
+                claude_client=claude,
+                brand_name=brand_name,
+                brand_description=brand_description,
+                competitors=brand_competitors,
+                on_progress=_update_scoring_progress,
+            )
+            await claude.close()
+
+        # Merge fresh results back into the original post order
+        fresh = iter(new_results)
+        scoring_results: list[ScoringResult] = []
+        for slot, input_hash in zip(scoring_slots, input_hashes, strict=True):
+            if slot is None:
+                slot = next(fresh)
+                slot.input_hash = input_hash
+            scoring_results.append(slot)
+        await _remember_rejected_evaluations(
+            project_id, rejected, posts_to_score, new_results, max_age, now
+        )
+
+        logger.info(
+            "Scoring phase complete",
+            extra={
+                "project_id": project_id,
+                "scored": len(posts_to_score),
+                "reused": progress.posts_reused,
+            },
         )
-        await claude.close()
 
         # --- Step 7: Store results ---
         progress.status = "storing"
@@ -946,7 +1333,8 @@ async def discover_posts(
             "total_found": len(all_posts),
             "unique": len(unique_posts),
             "filtered": len(filtered_posts),
-            "scored": len(scoring_results),
+            "scored": len(posts_to_score),
+            "reused": progress.posts_reused,
             "stored": stored_count,
         }
 
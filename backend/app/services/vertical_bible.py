@@ -23,6 +23,11 @@ from app.schemas.vertical_bible import (
     VerticalBibleCreate,
     VerticalBibleUpdate,
 )
+from app.services.bible_matcher import (
+    get_project_matcher,
+    invalidate_project_matcher_on_commit,
+    set_project_matcher,
+)
 
 logger = get_logger(__name__)
 
@@ -87,6 +92,7 @@ class VerticalBibleService:
         db.add(bible)
         await db.flush()
         await db.refresh(bible)
+        invalidate_project_matcher_on_commit(db, project_id)
 
         return bible
 
@@ -183,6 +189,7 @@ class VerticalBibleService:
 
         await db.flush()
         await db.refresh(bible)
+        invalidate_project_matcher_on_commit(db, project_id)
 
         return bible
 
@@ -196,6 +203,7 @@ class VerticalBibleService:
         bible = await VerticalBibleService.get_bible(db, project_id, bible_id)
         await db.delete(bible)
         await db.flush()
+        invalidate_project_matcher_on_commit(db, project_id)
 
     # ---- MATCHING ----
 
@@ -214,22 +222,10 @@ class VerticalBibleService:
           of any trigger_keyword.
         - Also check against secondary_keywords if provided.
         - Returns matched bibles sorted by sort_order (ascending).
-        """
-        # Load all active bibles for this project
-        stmt = (
-            select(VerticalBible)
-            .where(
-                VerticalBible.project_id == project_id,
-                VerticalBible.is_active == True,  # noqa: E712
-            )
-            .order_by(VerticalBible.sort_order, VerticalBible.name)
-        )
-        result = await db.execute(stmt)
-        bibles = list(result.scalars().all())
-
-        if not bibles:
-            return []
 
+        The project's triggers are compiled into a cached BibleMatcher, so
+        repeat calls skip loading every bible and only fetch the matched rows.
+        """
         # Normalize the page keywords for comparison
         primary_lower = primary_keyword.strip().lower()
         all_page_keywords = [primary_lower]
@@ -238,32 +234,31 @@ class VerticalBibleService:
                 kw.strip().lower() for kw in secondary_keywords if kw.strip()
             )
 
-        matched: list[VerticalBible] = []
-
-        for bible in bibles:
-            trigger_kws: list[str] = bible.trigger_keywords or []
-            if not trigger_kws:
-                continue
-
-            is_match = False
-            for trigger in trigger_kws:
-                trigger_lower = trigger.strip().lower()
-                if not trigger_lower:
-                    continue
-
-                for page_kw in all_page_keywords:
-                    # Bidirectional substring: trigger in page_kw OR page_kw in trigger
-                    if trigger_lower in page_kw or page_kw in trigger_lower:
-                        is_match = True
-                        break
-
-                if is_match:
-                    break
+        active_stmt = (
+            select(VerticalBible)
+            .where(
+                VerticalBible.project_id == project_id,
+                VerticalBible.is_active == True,  # noqa: E712
+            )
+            .order_by(VerticalBible.sort_order, VerticalBible.name)
+        )
 
-            if is_match:
-                matched.append(bible)
+        entry = get_project_matcher(project_id)
+        if entry is None:
+            # Load all active bibles for this project and compile their triggers
+            result = await db.execute(active_stmt)
+            bibles = list(result.scalars().all())
+            entry = set_project_matcher(project_id, bibles)
+            positions = entry.matcher.match_positions(all_page_keywords)
+            return [bibles[p] for p in positions]
+
+        positions = entry.matcher.match_positions(all_page_keywords)
+        if not positions:
+            return []
 
-        return matched
+        matched_ids = [entry.bible_ids[p] for p in positions]
+        result = await db.execute(active_stmt.where(VerticalBible.id.in_(matched_ids)))
+        return list(result.scalars().all())
 
     # ---- IMPORT / EXPORT ----
 
@@ -7,17 +7,21 @@ and reuses the existing link planning pipeline for per-silo link generation.
 """
 
 import asyncio
+import hashlib
 import json
 import re
 from itertools import combinations
 from typing import Any, cast
+from uuid import uuid4
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, case, func, insert, or_, select, true, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 from sqlalchemy.orm.attributes import flag_modified
 
+from app.core.config import get_settings
 from app.core.logging import get_logger
+from app.core.tracing import traced, traced_run
 from app.integrations.claude import ClaudeClient, get_api_key
 from app.integrations.wordpress import WordPressClient, WPSiteInfo
 from app.models.crawled_page import CrawledPage, CrawlStatus
@@ -26,6 +30,12 @@ from app.models.keyword_cluster import ClusterPage, KeywordCluster
 from app.models.page_content import ContentStatus, PageContent
 from app.models.page_keywords import PageKeywords
 from app.models.project import Project
+from app.services.label_taxonomy import (
+    batch_system_prompt,
+    build_batch_user_prompt,
+    parse_batch_assignments,
+    run_batched_assignment,
+)
 from app.services.link_injection import LinkInjector, LinkValidator
 from app.services.link_planning import (
     AnchorTextSelector,
@@ -35,8 +45,10 @@ from app.services.link_planning import (
     _load_word_counts,
     calculate_budget,
     select_targets_onboarding,
+    similarity_adjacency,
 )
 from app.services.pop_content_brief import fetch_content_brief
+from app.services.topical_similarity import TopicalIndex, sync_topical_index
 
 logger = get_logger(__name__)
 
@@ -47,6 +59,9 @@ _wp_progress: dict[str, dict[str, Any]] = {}
 POP_SEMAPHORE_LIMIT = 3
 EXPORT_SEMAPHORE_LIMIT = 5
 
+# Posts per bulk INSERT during import (CrawledPage rows carry ~12 params each)
+IMPORT_CHUNK_SIZE = 500
+
 # LLM settings for blog labeling
 LABEL_LLM_MODEL = "claude-sonnet-4-5"
 LABEL_LLM_MAX_TOKENS = 4000
@@ -126,6 +141,7 @@ async def step1_connect(
 # =============================================================================
 
 
+@traced_run("wp_linker.import", record_args=("job_id",))
 async def step2_import(
     db: AsyncSession,
     site_url: str,
@@ -215,34 +231,53 @@ async def step2_import(
 
         progress["total"] = len(new_posts)
 
-        # Create CrawledPage + PageContent for each NEW post
-        for i, post in enumerate(new_posts):
-            page = CrawledPage(
-                project_id=project.id,
-                normalized_url=post.url,
-                raw_url=str(post.id),  # Store WP post ID for export
-                title=post.title,
-                source="wordpress",
-                status=CrawlStatus.COMPLETED.value,
-                body_content=post.content_html,
-                word_count=post.word_count,
-                headings=_extract_headings(post.content_html),
-                labels=post.tag_names if post.tag_names else [],
-            )
-            db.add(page)
-            await db.flush()
+        # HTML parsing is CPU-bound; keep it off the event loop
+        headings = await asyncio.to_thread(
+            lambda: [_extract_headings(post.content_html) for post in new_posts]
+        )
 
-            # Create PageContent with post body as bottom_description
-            content = PageContent(
-                crawled_page_id=page.id,
-                page_title=post.title,
-                bottom_description=post.content_html,
-                word_count=post.word_count,
-                status=ContentStatus.COMPLETE.value,
-            )
-            db.add(content)
+        # Create CrawledPage + PageContent for each NEW post. IDs are generated
+        # client-side so contents can reference their page without a flush,
+        # and rows are inserted in a few multi-row statements.
+        for start in range(0, len(new_posts), IMPORT_CHUNK_SIZE):
+            chunk = new_posts[start : start + IMPORT_CHUNK_SIZE]
+            page_rows: list[dict[str, Any]] = []
+            content_rows: list[dict[str, Any]] = []
+            for post, post_headings in zip(
+                chunk, headings[start : start + IMPORT_CHUNK_SIZE], strict=True
+            ):
+                page_id = str(uuid4())
+                page_rows.append(
+                    {
+                        "id": page_id,
+                        "project_id": project.id,
+                        "normalized_url": post.url,
+                        "raw_url": str(post.id),  # Store WP post ID for export
+                        "title": post.title,
+                        "source": "wordpress",
+                        "status": CrawlStatus.COMPLETED.value,
+                        "body_content": post.content_html,
+                        "word_count": post.word_count,
+                        "headings": post_headings,
+                        "labels": post.tag_names if post.tag_names else [],
+                    }
+                )
+                # PageContent with post body as bottom_description
+                content_rows.append(
+                    {
+                        "id": str(uuid4()),
+                        "crawled_page_id": page_id,
+                        "page_title": post.title,
+                        "bottom_description": post.content_html,
+                        "word_count": post.word_count,
+                        "status": ContentStatus.COMPLETE.value,
+                        "wp_imported_hash": _content_hash(post.content_html),
+                    }
+                )
 
-            progress["current"] = i + 1
+            await db.execute(insert(CrawledPage), page_rows)
+            await db.execute(insert(PageContent), content_rows)
+            progress["current"] = start + len(chunk)
 
         await db.commit()
 
@@ -276,6 +311,7 @@ async def step2_import(
 # =============================================================================
 
 
+@traced_run("wp_linker.analyze", record_args=("project_id", "job_id"))
 async def step3_analyze(
     db: AsyncSession,
     project_id: str,
@@ -405,6 +441,7 @@ async def step3_analyze(
 # =============================================================================
 
 
+@traced_run("wp_linker.label", record_args=("project_id", "job_id"))
 async def step4_label(
     db: AsyncSession,
     project_id: str,
@@ -485,6 +522,7 @@ async def step4_label(
         raise
 
 
+@traced("wp_linker.generate_taxonomy")
 async def _generate_blog_taxonomy(
     db: AsyncSession,
     project_id: str,
@@ -615,137 +653,176 @@ Generate a taxonomy that captures the main topics. Each label should group posts
         return None
 
 
+def _blog_post_info(page: CrawledPage) -> str:
+    """Describe a blog post (with POP data) for a label assignment prompt."""
+    page_info = f"Title: {page.title or 'Untitled'}\nURL: {page.normalized_url}"
+
+    if page.keywords and page.keywords.primary_keyword:
+        page_info += f"\nPrimary keyword: {page.keywords.primary_keyword}"
+
+    if page.content_brief and page.content_brief.keyword_targets:
+        targets = page.content_brief.keyword_targets[:5]
+        kw_list = [
+            t.get("keyword", "") if isinstance(t, dict) else str(t) for t in targets
+        ]
+        if kw_list:
+            page_info += f"\nKeyword targets: {', '.join(kw_list)}"
+
+    # Add headings
+    if page.headings:
+        h1s = page.headings.get("h1", [])
+        h2s = page.headings.get("h2", [])
+        if h1s:
+            page_info += f"\nH1: {', '.join(h1s[:3])}"
+        if h2s:
+            page_info += f"\nH2: {', '.join(h2s[:5])}"
+
+    # Add content excerpt (first 500 chars)
+    if page.body_content:
+        text = re.sub(r"<[^>]+>", " ", page.body_content)
+        excerpt = " ".join(text.split()[:100])
+        page_info += f"\nExcerpt: {excerpt}"
+
+    if page.word_count:
+        page_info += f"\nWord count: {page.word_count}"
+
+    return page_info
+
+
+def _blog_labels_from_response(
+    labels: list[Any],
+    taxonomy: dict[str, Any],
+    valid_labels: set[str],
+) -> list[str]:
+    """Normalize assigned labels to 2-4 valid taxonomy labels."""
+    # Filter to valid labels only
+    valid_assigned = [
+        str(label).strip().lower()
+        for label in labels
+        if str(label).strip().lower() in valid_labels
+    ]
+
+    # Ensure 2-4 labels
+    if len(valid_assigned) < 2:
+        # Pad with the first available taxonomy label not already assigned
+        for tl in taxonomy.get("labels", []):
+            if tl["name"] not in valid_assigned:
+                valid_assigned.append(tl["name"])
+            if len(valid_assigned) >= 2:
+                break
+
+    return valid_assigned[:4]
+
+
+@traced("wp_linker.assign_labels")
 async def _assign_blog_labels(
     db: AsyncSession,
     pages: list[CrawledPage],
     taxonomy: dict[str, Any],
 ) -> list[dict[str, Any]]:
-    """Assign 2-4 topic labels to each blog post using Claude."""
+    """Assign 2-4 topic labels to each blog post using Claude.
+
+    Posts are labeled LABEL_BATCH_SIZE per request with the taxonomy sent
+    once; posts a batch response does not cover are retried individually.
+    """
     taxonomy_desc = "\n".join(
         f"- {label['name']}: {label.get('description', '')}"
         for label in taxonomy.get("labels", [])
     )
     valid_labels = {label["name"] for label in taxonomy.get("labels", [])}
 
-    assignments: list[dict[str, Any]] = []
-
     client = ClaudeClient(api_key=get_api_key())
-    try:
-        for page in pages:
-            # Build page info with POP data
-            page_info = f"Title: {page.title or 'Untitled'}\nURL: {page.normalized_url}"
-
-            if page.keywords and page.keywords.primary_keyword:
-                page_info += f"\nPrimary keyword: {page.keywords.primary_keyword}"
-
-            if page.content_brief and page.content_brief.keyword_targets:
-                targets = page.content_brief.keyword_targets[:5]
-                kw_list = [
-                    t.get("keyword", "") if isinstance(t, dict) else str(t)
-                    for t in targets
-                ]
-                if kw_list:
-                    page_info += f"\nKeyword targets: {', '.join(kw_list)}"
-
-            # Add headings
-            if page.headings:
-                h1s = page.headings.get("h1", [])
-                h2s = page.headings.get("h2", [])
-                if h1s:
-                    page_info += f"\nH1: {', '.join(h1s[:3])}"
-                if h2s:
-                    page_info += f"\nH2: {', '.join(h2s[:5])}"
-
-            # Add content excerpt (first 500 chars)
-            if page.body_content:
-                text = re.sub(r"<[^>]+>", " ", page.body_content)
-                excerpt = " ".join(text.split()[:100])
-                page_info += f"\nExcerpt: {excerpt}"
-
-            if page.word_count:
-                page_info += f"\nWord count: {page.word_count}"
-
-            user_prompt = f"""Assign topic labels to this blog post from the taxonomy.
+
+    async def assign_batch(batch: list[CrawledPage]) -> dict[int, dict[str, Any]]:
+        completion = await client.complete(
+            user_prompt=build_batch_user_prompt(
+                "Assign topic labels to each blog post from the taxonomy.",
+                taxonomy_desc,
+                [f"POST:\n{_blog_post_info(page)}" for page in batch],
+            ),
+            system_prompt=batch_system_prompt(BLOG_ASSIGNMENT_SYSTEM_PROMPT),
+            model=LABEL_LLM_MODEL,
+            temperature=0.0,
+            max_tokens=300 * len(batch) + 200,
+        )
+        if not completion.success:
+            return {}
+        entries = parse_batch_assignments(
+            completion.text or "", len(batch), valid_labels
+        )
+        return {
+            position: {
+                "page_id": batch[position].id,
+                "labels": _blog_labels_from_response(
+                    entry["labels"], taxonomy, valid_labels
+                ),
+                "success": True,
+            }
+            for position, entry in entries.items()
+        }
+
+    async def assign_single(page: CrawledPage) -> dict[str, Any]:
+        user_prompt = f"""Assign topic labels to this blog post from the taxonomy.
 
 TAXONOMY:
 {taxonomy_desc}
 
 POST:
-{page_info}
+{_blog_post_info(page)}
 
 Respond with JSON only."""
 
-            completion = await client.complete(
-                user_prompt=user_prompt,
-                system_prompt=BLOG_ASSIGNMENT_SYSTEM_PROMPT,
-                model=LABEL_LLM_MODEL,
-                temperature=0.0,
-                max_tokens=500,
-            )
+        completion = await client.complete(
+            user_prompt=user_prompt,
+            system_prompt=BLOG_ASSIGNMENT_SYSTEM_PROMPT,
+            model=LABEL_LLM_MODEL,
+            temperature=0.0,
+            max_tokens=500,
+        )
 
-            if not completion.success:
-                assignments.append(
-                    {
-                        "page_id": page.id,
-                        "labels": [],
-                        "success": False,
-                        "error": completion.error,
-                    }
-                )
-                continue
+        if not completion.success:
+            return {
+                "page_id": page.id,
+                "labels": [],
+                "success": False,
+                "error": completion.error,
+            }
 
-            try:
-                response_text = completion.text or ""
-                json_text = _extract_json(response_text)
-                parsed = json.loads(json_text)
-                labels = parsed.get("labels", [])
-
-                # Filter to valid labels only
-                valid_assigned = [
-                    label.strip().lower()
-                    for label in labels
-                    if label.strip().lower() in valid_labels
-                ]
-
-                # Ensure 2-4 labels
-                if len(valid_assigned) < 2:
-                    # Pad with the first available taxonomy label not already assigned
-                    for tl in taxonomy.get("labels", []):
-                        if tl["name"] not in valid_assigned:
-                            valid_assigned.append(tl["name"])
-                        if len(valid_assigned) >= 2:
-                            break
-
-                valid_assigned = valid_assigned[:4]
-
-                # Update page labels
-                page.labels = valid_assigned
-                await db.flush()
-
-                assignments.append(
-                    {
-                        "page_id": page.id,
-                        "labels": valid_assigned,
-                        "success": True,
-                    }
-                )
+        try:
+            response_text = completion.text or ""
+            json_text = _extract_json(response_text)
+            parsed = json.loads(json_text)
+        except json.JSONDecodeError as e:
+            return {
+                "page_id": page.id,
+                "labels": [],
+                "success": False,
+                "error": f"JSON parse error: {e}",
+            }
 
-            except json.JSONDecodeError as e:
-                assignments.append(
-                    {
-                        "page_id": page.id,
-                        "labels": [],
-                        "success": False,
-                        "error": f"JSON parse error: {e}",
-                    }
-                )
+        return {
+            "page_id": page.id,
+            "labels": _blog_labels_from_response(
+                parsed.get("labels", []), taxonomy, valid_labels
+            ),
+            "success": True,
+        }
 
+    try:
+        assignments = await run_batched_assignment(pages, assign_batch, assign_single)
     finally:
         await client.close()
 
+    # Update page labels
+    for page, assignment in zip(pages, assignments, strict=True):
+        if assignment["success"]:
+            page.labels = assignment["labels"]
+    await db.flush()
+
     return assignments
 
 
+@traced("wp_linker.create_silos")
 async def _create_silo_groups(
     db: AsyncSession,
     project_id: str,
@@ -819,6 +896,7 @@ async def _create_silo_groups(
 # =============================================================================
 
 
+@traced_run("wp_linker.plan_links", record_args=("project_id", "job_id"))
 async def step5_plan_links(
     db: AsyncSession,
     project_id: str,
@@ -943,6 +1021,18 @@ async def step5_plan_links(
             coll_result = await db.execute(coll_stmt)
             collection_pages = list(coll_result.scalars().all())
 
+        # Optional TF-IDF edge weights, indexed once for all silos
+        similarity_index: TopicalIndex | None = None
+        if get_settings().link_target_weighting == "similarity":
+            wp_ids_stmt = select(CrawledPage.id).where(
+                CrawledPage.project_id == project_id,
+                CrawledPage.source == "wordpress",
+            )
+            wp_ids = list((await db.execute(wp_ids_stmt)).scalars().all())
+            similarity_index = await sync_topical_index(
+                db, project_id, wp_ids + [cp.id for cp in collection_pages]
+            )
+
         total_links = 0
         injector = LinkInjector()
         validator = LinkValidator()
@@ -960,10 +1050,17 @@ async def step5_plan_links(
                     injector,
                     validator,
                     anchor_selector,
+                    similarity_index,
                 )
             else:
                 links_in_group = await _plan_links_for_silo(
-                    db, project_id, cluster, injector, validator, anchor_selector
+                    db,
+                    project_id,
+                    cluster,
+                    injector,
+                    validator,
+                    anchor_selector,
+                    similarity_index,
                 )
             total_links += links_in_group
             progress["current"] = i + 1
@@ -987,6 +1084,7 @@ async def step5_plan_links(
         raise
 
 
+@traced("wp_linker.plan_silo")
 async def _plan_links_for_silo(
     db: AsyncSession,
     project_id: str,
@@ -994,6 +1092,7 @@ async def _plan_links_for_silo(
     injector: LinkInjector,
     validator: LinkValidator,
     anchor_selector: AnchorTextSelector,
+    similarity_index: TopicalIndex | None = None,
 ) -> int:
     """Plan and inject links for a single silo group. Returns link count."""
     # Load cluster pages with their CrawledPage data
@@ -1020,7 +1119,9 @@ async def _plan_links_for_silo(
     budgets = {pid: calculate_budget(wc) for pid, wc in word_counts.items()}
 
     # 3. Select targets (reuse onboarding selector)
-    targets_map = select_targets_onboarding(graph, budgets)
+    targets_map = select_targets_onboarding(
+        graph, budgets, similarity_index=similarity_index
+    )
 
     # 4. Resolve URLs using project site_url
     project_obj = await db.get(Project, project_id)
@@ -1340,12 +1441,17 @@ def _build_silo_graph_with_collections(
 def select_targets_wp_with_collections(
     graph: dict[str, Any],
     budgets: dict[str, int],
+    similarity_index: TopicalIndex | None = None,
 ) -> dict[str, list[dict[str, Any]]]:
     """Select link targets for WP pages in a mixed graph with collection pages.
 
     Collection pages get a bonus score (collection_bonus=4.0 + priority_bonus=3.0).
     Budget is split: ~half for collection targets, ~half for sibling blogs.
     Only WP pages are sources — collection pages never have outbound links.
+
+    With a similarity_index, edge weights come from each WP page's nearest
+    collection pages and nearest sibling posts by TF-IDF similarity instead
+    of the graph's label/keyword edges.
     """
     COLLECTION_BONUS = 4.0
     PRIORITY_BONUS = 3.0
@@ -1353,24 +1459,41 @@ def select_targets_wp_with_collections(
     pages_by_id: dict[str, dict[str, Any]] = {p["page_id"]: p for p in graph["pages"]}
 
     # Build one-directional adjacency: source → {target: weight}
-    adjacency: dict[str, dict[str, int]] = {p["page_id"]: {} for p in graph["pages"]}
-    for edge in graph["edges"]:
-        source_page = pages_by_id.get(edge["source"])
-        if not source_page:
-            continue
-        # Only WP pages can be sources
-        if source_page.get("source") == "wordpress":
-            adjacency[edge["source"]][edge["target"]] = edge["weight"]
-        # For WP→WP edges, also add reverse direction
-        target_page = pages_by_id.get(edge["target"])
-        if (
-            target_page
-            and target_page.get("source") == "wordpress"
-            and source_page.get("source") == "wordpress"
-        ):
-            adjacency[edge["target"]][edge["source"]] = edge["weight"]
+    adjacency: dict[str, dict[str, float]] = {p["page_id"]: {} for p in graph["pages"]}
+    if similarity_index is not None:
+        wp_ids = {
+            pid for pid, p in pages_by_id.items() if p.get("source") == "wordpress"
+        }
+        collection_ids = {
+            pid for pid, p in pages_by_id.items() if p.get("source") == "collection"
+        }
+        adjacency = similarity_adjacency(
+            graph["pages"],
+            budgets,
+            similarity_index,
+            [collection_ids, wp_ids],
+            sources=wp_ids,
+        )
+    else:
+        for edge in graph["edges"]:
+            source_page = pages_by_id.get(edge["source"])
+            if not source_page:
+                continue
+            # Only WP pages can be sources
+            if source_page.get("source") == "wordpress":
+                adjacency[edge["source"]][edge["target"]] = edge["weight"]
+            # For WP→WP edges, also add reverse direction
+            target_page = pages_by_id.get(edge["target"])
+            if (
+                target_page
+                and target_page.get("source") == "wordpress"
+                and source_page.get("source") == "wordpress"
+            ):
+                adjacency[edge["target"]][edge["source"]] = edge["weight"]
 
     inbound_counts: dict[str, int] = {p["page_id"]: 0 for p in graph["pages"]}
+    # Running sum of inbound_counts, for the average in the diversity penalty
+    total_inbound = 0
     result: dict[str, list[dict[str, Any]]] = {}
 
     for page in graph["pages"]:
@@ -1396,7 +1519,6 @@ def select_targets_wp_with_collections(
             max(1, budget // 2),
         ) if collection_targets_available else 0
 
-        total_inbound = sum(inbound_counts.values())
         page_count = len(graph["pages"])
         avg_inbound = total_inbound / page_count if page_count > 0 else 0.0
 
@@ -1404,7 +1526,7 @@ def select_targets_wp_with_collections(
         scored_collection: list[tuple[float, str]] = []
         scored_blog: list[tuple[float, str]] = []
 
-        for target_id, overlap in neighbors.items():
+        for target_id, weight in neighbors.items():
             target_page = pages_by_id[target_id]
             excess_inbound = inbound_counts[target_id] - avg_inbound
             diversity_penalty = max(0.0, excess_inbound * 0.5)
@@ -1416,12 +1538,12 @@ def select_targets_wp_with_collections(
                 priority_bonus = (
                     PRIORITY_BONUS if target_page.get("is_priority") else 0.0
                 )
-                score = overlap + COLLECTION_BONUS + priority_bonus - coll_diversity_penalty
+                score = weight + COLLECTION_BONUS + priority_bonus - coll_diversity_penalty
                 scored_collection.append((score, target_id))
             else:
                 # Sibling blog post
                 priority_bonus = 2.0 if target_page.get("is_priority") else 0.0
-                score = overlap + priority_bonus - diversity_penalty
+                score = weight + priority_bonus - diversity_penalty
                 scored_blog.append((score, target_id))
 
         scored_collection.sort(key=lambda x: (-x[0], x[1]))
@@ -1446,6 +1568,7 @@ def select_targets_wp_with_collections(
                 }
             )
             inbound_counts[target_id] += 1
+            total_inbound += 1
 
         # Fill remaining with blog targets
         for score, target_id in scored_blog:
@@ -1464,6 +1587,7 @@ def select_targets_wp_with_collections(
                 }
             )
             inbound_counts[target_id] += 1
+            total_inbound += 1
 
         # Intra-silo guarantee: if no sibling blog links were selected
         # and there are available blog targets, force at least one
@@ -1486,6 +1610,7 @@ def select_targets_wp_with_collections(
                     }
                 )
                 inbound_counts[best_blog_id] += 1
+                total_inbound += 1
 
         result[page_id] = targets
 
@@ -1505,6 +1630,7 @@ def select_targets_wp_with_collections(
     return result
 
 
+@traced("wp_linker.plan_silo")
 async def _plan_links_for_silo_with_collections(
     db: AsyncSession,
     project_id: str,
@@ -1513,6 +1639,7 @@ async def _plan_links_for_silo_with_collections(
     injector: LinkInjector,
     validator: LinkValidator,
     anchor_selector: AnchorTextSelector,
+    similarity_index: TopicalIndex | None = None,
 ) -> int:
     """Plan and inject links for a silo group including collection page targets.
 
@@ -1545,7 +1672,9 @@ async def _plan_links_for_silo_with_collections(
     budgets = {pid: calculate_budget(wc) for pid, wc in word_counts.items()}
 
     # 3. Select targets with collection awareness
-    targets_map = select_targets_wp_with_collections(graph, budgets)
+    targets_map = select_targets_wp_with_collections(
+        graph, budgets, similarity_index=similarity_index
+    )
 
     # 4. Resolve URLs
     project_obj = await db.get(Project, project_id)
@@ -1827,6 +1956,7 @@ async def step6_get_review(
 # =============================================================================
 
 
+@traced_run("wp_linker.export", record_args=("project_id", "job_id"))
 async def step7_export(
     db: AsyncSession,
     project_id: str,
@@ -1836,65 +1966,90 @@ async def step7_export(
     job_id: str,
     page_ids: list[str] | None = None,
     title_filter: list[str] | None = None,
+    force: bool = False,
 ) -> dict[str, Any]:
-    """Push updated content back to WordPress."""
+    """Push updated content back to WordPress.
+
+    Only posts whose bottom_description differs from the last version known
+    to be on WordPress (last pushed, else as imported) are sent; the change
+    check runs in SQL on content hashes. Posts with no recorded hash are
+    always pushed. Explicitly requested page_ids are always pushed, as is
+    everything when force is set.
+    """
     progress = {
         "step": "export",
         "step_label": "Exporting to WordPress",
         "status": "running",
         "current": 0,
         "total": 0,
+        "skipped_unchanged": 0,
     }
     _wp_progress[job_id] = progress
 
     try:
-        # Load pages with updated content
+        remote_hash = func.coalesce(
+            PageContent.wp_pushed_hash, PageContent.wp_imported_hash
+        )
+        changed = func.md5(PageContent.bottom_description).is_distinct_from(remote_hash)
+        if force or page_ids:
+            changed = true()
         stmt = (
-            select(CrawledPage)
-            .options(joinedload(CrawledPage.page_content))
+            select(
+                CrawledPage.id,
+                CrawledPage.raw_url,
+                PageContent.id.label("content_id"),
+                changed.label("changed"),
+                # Only load bodies that will actually be pushed
+                case((changed, PageContent.bottom_description)).label("content"),
+            )
+            .join(PageContent, PageContent.crawled_page_id == CrawledPage.id)
             .where(
                 CrawledPage.project_id == project_id,
                 CrawledPage.source == "wordpress",
+                CrawledPage.raw_url.is_not(None),
+                CrawledPage.raw_url != "",
+                PageContent.bottom_description.is_not(None),
+                PageContent.bottom_description != "",
             )
         )
-        result = await db.execute(stmt)
-        pages = list(result.unique().scalars().all())
 
         # Apply page_ids filter (preferred) or title filter (legacy)
         if page_ids:
-            page_id_set = set(page_ids)
-            pages = [p for p in pages if p.id in page_id_set]
+            stmt = stmt.where(CrawledPage.id.in_(page_ids))
         elif title_filter:
-            pages = [
-                p
-                for p in pages
-                if p.title and any(f.lower() in p.title.lower() for f in title_filter)
-            ]
+            stmt = stmt.where(
+                or_(
+                    *(
+                        CrawledPage.title.ilike(f"%{_escape_like(f)}%", escape="\\")
+                        for f in title_filter
+                    )
+                )
+            )
 
-        # Filter to pages that have links (updated content)
-        pages_to_export = [
-            p
-            for p in pages
-            if p.page_content and p.page_content.bottom_description and p.raw_url
-        ]
+        rows = (await db.execute(stmt)).all()
+        pages_to_export = [row for row in rows if row.changed]
+        skipped_unchanged = len(rows) - len(pages_to_export)
         progress["total"] = len(pages_to_export)
+        progress["skipped_unchanged"] = skipped_unchanged
 
         client = WordPressClient(site_url, username, app_password)
         semaphore = asyncio.Semaphore(EXPORT_SEMAPHORE_LIMIT)
         success_count = 0
         fail_count = 0
+        pushed_hashes: list[dict[str, Any]] = []
 
-        async def export_page(page: CrawledPage) -> None:
+        async def export_page(page: Any) -> None:
             nonlocal success_count, fail_count
             async with semaphore:
                 try:
                     wp_post_id = int(page.raw_url or "0")
-                    content = (
-                        page.page_content.bottom_description
-                        if page.page_content
-                        else ""
+                    await client.update_post_content(wp_post_id, page.content)
+                    pushed_hashes.append(
+                        {
+                            "id": page.content_id,
+                            "wp_pushed_hash": _content_hash(page.content),
+                        }
                     )
-                    await client.update_post_content(wp_post_id, content or "")
                     success_count += 1
                 except Exception:
                     fail_count += 1
@@ -1911,9 +2066,15 @@ async def step7_export(
         finally:
             await client.close()
 
+        # Record what WordPress now has so the next export skips these posts
+        if pushed_hashes:
+            await db.execute(update(PageContent), pushed_hashes)
+            await db.commit()
+
         result_data = {
             "exported": success_count,
             "failed": fail_count,
+            "skipped_unchanged": skipped_unchanged,
             "total": len(pages_to_export),
         }
         progress["status"] = "complete"
@@ -1934,6 +2095,16 @@ async def step7_export(
 # =============================================================================
 
 
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so a filter matches as a literal substring."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _content_hash(content: str) -> str:
+    """MD5 hex digest of post content, matching PostgreSQL's md5(text)."""
+    return hashlib.md5(content.encode(), usedforsecurity=False).hexdigest()
+
+
 def _extract_headings(html: str) -> dict[str, list[str]]:
     """Extract h1, h2, h3 headings from HTML content."""
     from bs4 import BeautifulSoup
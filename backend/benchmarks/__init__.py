@@ -0,0 +1,11 @@
+"""Offline benchmarks for the CPU-bound hot paths of the backend.
+
+Run from the backend directory:
+
+    python -m benchmarks                      # compare against baseline.json
+    python -m benchmarks --sizes 100 1000     # subset of fixture sizes
+    python -m benchmarks --update-baseline    # record a new baseline
+
+Every case runs against deterministic synthetic fixtures (see fixtures.py),
+so no database or external service is needed.
+"""
@@ -0,0 +1,153 @@
+"""Benchmark cases for the CPU hot paths.
+
+Each case turns a fixture size (page count) into a zero-argument callable
+that does one full unit of production work at that size: planning links for
+every page, injecting every planned link, validating a project's links, and
+so on. Fixture generation and any index building happen in setup and are
+not timed.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from itertools import combinations
+from types import SimpleNamespace
+from typing import Any
+
+from app.models.page_content import PageContent
+from app.services.blog_dedup import check_duplicates
+from app.services.content_extraction import extract_content_from_html
+from app.services.content_quality import run_quality_checks
+from app.services.link_injection import LinkInjector, LinkValidator
+from app.services.link_planning import _LinkProxy, select_targets_onboarding
+from app.services.shopify_sync import _parse_bulk_results
+from app.services.topical_similarity import TopicalIndex, page_terms
+from benchmarks import fixtures
+
+# The label-overlap graph is fully connected, so its edge list grows with
+# the square of the page count; production switches to similarity weights
+# long before 10k pages
+LABEL_GRAPH_MAX_SIZE = 2_000
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """A named benchmark and the setup that builds its workload."""
+
+    name: str
+    setup: Callable[[int], Callable[[], Any]]
+    max_size: int | None = None
+
+    def supports(self, size: int) -> bool:
+        return self.max_size is None or size <= self.max_size
+
+
+def _budgets(size: int) -> dict[str, int]:
+    return {page["page_id"]: 3 + i % 3 for i, page in enumerate(fixtures.pages(size))}
+
+
+def select_targets_labels(size: int) -> Callable[[], Any]:
+    pages = fixtures.pages(size)
+    edges = [
+        {
+            "source": a["page_id"],
+            "target": b["page_id"],
+            "weight": max(len(set(a["labels"]) & set(b["labels"])), 1),
+        }
+        for a, b in combinations(pages, 2)
+    ]
+    graph = {"pages": pages, "edges": edges}
+    budgets = _budgets(size)
+    return lambda: select_targets_onboarding(graph, budgets)
+
+
+def select_targets_similarity(size: int) -> Callable[[], Any]:
+    index = TopicalIndex()
+    for page_id, text in fixtures.page_texts(size).items():
+        index.upsert(page_id, page_terms(text))
+    graph = {"pages": fixtures.pages(size), "edges": []}
+    budgets = _budgets(size)
+    # Build the vectors and postings up front; they are cached across runs
+    index.vector(graph["pages"][0]["page_id"])
+    return lambda: select_targets_onboarding(graph, budgets, similarity_index=index)
+
+
+def inject_rule_based(size: int) -> Callable[[], Any]:
+    html_by_page = fixtures.content_html(size)
+    links = fixtures.link_plans(size)
+    injector = LinkInjector()
+
+    def run() -> int:
+        injected = 0
+        pages = dict(html_by_page)
+        for link in links:
+            html, p_idx = injector.inject_rule_based(
+                pages[link["source_page_id"]], link["anchor_text"], link["target_url"]
+            )
+            if p_idx is not None:
+                pages[link["source_page_id"]] = html
+                injected += 1
+        return injected
+
+    return run
+
+
+def validate_links(size: int) -> Callable[[], Any]:
+    pages_html = fixtures.content_html(size)
+    records = fixtures.link_plans(size)
+    validator = LinkValidator()
+
+    def run() -> dict[str, Any]:
+        links = [_LinkProxy({**r, "scope": "onboarding"}) for r in records]
+        return validator.validate_links(links, pages_html, "onboarding")
+
+    return run
+
+
+def quality_checks(size: int) -> Callable[[], Any]:
+    brand_config = fixtures.brand_config()
+    bibles = [SimpleNamespace(**bible) for bible in fixtures.bibles()]
+    contents = [PageContent(**fields) for fields in fixtures.generated_copy(size)]
+
+    def run() -> int:
+        return sum(
+            len(run_quality_checks(content, brand_config, bibles).issues)
+            for content in contents
+        )
+
+    return run
+
+
+def dedup_titles(size: int) -> Callable[[], Any]:
+    existing = fixtures.article_titles(size)
+    titles = fixtures.generated_titles(size)
+    return lambda: check_duplicates(titles, existing)
+
+
+def extract_content(size: int) -> Callable[[], Any]:
+    documents = fixtures.crawled_html(size)
+    return lambda: [extract_content_from_html(html) for html in documents]
+
+
+def parse_bulk_results(size: int) -> Callable[[], Any]:
+    articles = fixtures.bulk_records(size, "article")
+    products = fixtures.bulk_records(size, "product")
+    return lambda: (
+        _parse_bulk_results("article", articles),
+        _parse_bulk_results("product", products),
+    )
+
+
+CASES: tuple[BenchmarkCase, ...] = (
+    BenchmarkCase(
+        "select_targets_onboarding[labels]",
+        select_targets_labels,
+        max_size=LABEL_GRAPH_MAX_SIZE,
+    ),
+    BenchmarkCase("select_targets_onboarding[similarity]", select_targets_similarity),
+    BenchmarkCase("LinkInjector.inject_rule_based", inject_rule_based),
+    BenchmarkCase("LinkValidator.validate_links", validate_links),
+    BenchmarkCase("run_quality_checks", quality_checks),
+    BenchmarkCase("check_duplicates", dedup_titles),
+    BenchmarkCase("extract_content_from_html", extract_content),
+    BenchmarkCase("_parse_bulk_results", parse_bulk_results),
+)
@@ -0,0 +1,365 @@
+"""Deterministic synthetic fixtures for the benchmarks.
+
+Every generator takes a page count and returns the same data on every call
+and every machine: all randomness comes from a random.Random seeded with
+the generator name and the size. Vocabulary is fixed below, so fixtures do
+not depend on installed word lists or locale.
+
+The data mimics a mid-sized Shopify store: collection pages with a label
+taxonomy, crawled HTML with header/nav/footer boilerplate and a product
+grid, generated copy that links to other pages, blog titles with
+near-duplicates, vertical bibles and Shopify bulk-operation JSONL records.
+"""
+
+import random
+from functools import cache
+from typing import Any
+
+SIZES = (100, 1_000, 10_000)
+
+ADJECTIVES = (
+    "waterproof", "leather", "organic", "wireless", "vintage", "compact",
+    "ergonomic", "handmade", "insulated", "lightweight", "premium", "rugged",
+    "stainless", "bamboo", "ceramic", "merino", "cordless", "adjustable",
+    "modular", "recycled", "heated", "foldable", "magnetic", "polarized",
+)  # fmt: skip
+
+PRODUCTS = (
+    "boots", "backpack", "jacket", "tent", "lantern", "kettle", "grinder",
+    "headphones", "speaker", "keyboard", "blanket", "mattress", "cookware",
+    "knife", "bottle", "sunglasses", "gloves", "socks", "hammock", "stove",
+    "charger", "watch", "wallet", "planter", "candle", "rug", "chair",
+    "desk", "lamp", "mug",
+)  # fmt: skip
+
+AUDIENCES = (
+    "hiking", "camping", "travel", "office", "kitchen", "running", "winter",
+    "summer", "kids", "outdoor", "garden", "studio", "coffee", "fishing",
+    "cycling", "yoga",
+)  # fmt: skip
+
+FILLER = (
+    "every", "piece", "made", "from", "durable", "materials", "that", "hold",
+    "up", "daily", "wear", "customers", "love", "comfort", "fit", "finish",
+    "designed", "tested", "real", "conditions", "keeps", "gear", "ready",
+    "season", "after", "built", "simple", "care", "long", "lasting",
+    "quality", "shipping", "returns", "sizes", "colors", "available",
+    "choose", "right", "option", "budget", "style", "performance",
+)  # fmt: skip
+
+LABELS = tuple(
+    f"{audience}-{product}" for audience in AUDIENCES[:8] for product in PRODUCTS[:6]
+)
+
+# Phrases the quality checks look for, so every check has work to do
+QUALITY_TRIGGERS = (
+    "In today's fast-paced world, gear matters.",
+    "It's not just a jacket, it's a lifestyle.",
+    "We delve into durable, versatile, and reliable options.",
+    "Why settle for less?",
+    "This robust collection is a game-changer — truly.",
+    "Moving forward, we leverage synergy across the range.",
+    "Unlike Acme Outfitters, our gear is not cheap.",
+)
+
+
+def _rng(name: str, size: int) -> random.Random:
+    return random.Random(f"{name}:{size}")
+
+
+def _sentence(rng: random.Random, words: int, *phrases: str) -> str:
+    tokens = [rng.choice(FILLER) for _ in range(words)]
+    for phrase in phrases:
+        tokens.insert(rng.randrange(len(tokens) + 1), phrase)
+    return " ".join(tokens).capitalize() + "."
+
+
+def _keyword(rng: random.Random) -> str:
+    return f"{rng.choice(ADJECTIVES)} {rng.choice(AUDIENCES)} {rng.choice(PRODUCTS)}"
+
+
+@cache
+def pages(size: int) -> list[dict[str, Any]]:
+    """Collection pages in the shape of an onboarding link graph."""
+    rng = _rng("pages", size)
+    result: list[dict[str, Any]] = []
+    for i in range(size):
+        keyword = _keyword(rng)
+        result.append(
+            {
+                "page_id": f"page-{i:05d}",
+                "keyword": keyword,
+                "url": f"/collections/{keyword.replace(' ', '-')}-{i}",
+                "labels": rng.sample(LABELS, rng.randint(2, 4)),
+                "is_priority": rng.random() < 0.1,
+            }
+        )
+    return result
+
+
+@cache
+def page_texts(size: int) -> dict[str, str]:
+    """Body copy per page, topically centred on the page keyword."""
+    rng = _rng("page_texts", size)
+    return {
+        page["page_id"]: " ".join(
+            _sentence(rng, 12, page["keyword"], rng.choice(PRODUCTS)) for _ in range(8)
+        )
+        for page in pages(size)
+    }
+
+
+@cache
+def content_html(size: int) -> dict[str, str]:
+    """Generated bottom_description HTML per page.
+
+    Paragraphs mention the anchors of most of the page's planned links (see
+    link_plans) plus unrelated keywords, with headings, a list and an
+    existing link on some pages.
+    """
+    rng = _rng("content_html", size)
+    all_pages = pages(size)
+    anchors: dict[str, list[str]] = {page["page_id"]: [] for page in all_pages}
+    for link in link_plans(size):
+        if rng.random() < 0.8:
+            anchors[link["source_page_id"]].append(link["anchor_text"])
+    result: dict[str, str] = {}
+    for page in all_pages:
+        page_anchors = anchors[page["page_id"]]
+        parts = [f"<h2>Shop {page['keyword']}</h2>"]
+        for p_idx in range(6):
+            mentions = page_anchors[p_idx::6] or [rng.choice(all_pages)["keyword"]]
+            text = _sentence(rng, 40, *mentions)
+            if p_idx == 2 and rng.random() < 0.3:
+                other = rng.choice(all_pages)
+                text += f' See <a href="{other["url"]}">{other["keyword"]}</a>.'
+            parts.append(f"<p>{text}</p>")
+            if p_idx == 3:
+                parts.append(f"<h3>Choosing {page['keyword']}</h3>")
+                items = "".join(
+                    f"<li>{_sentence(rng, 6, rng.choice(all_pages)['keyword'])}</li>"
+                    for _ in range(3)
+                )
+                parts.append(f"<ul>{items}</ul>")
+        result[page["page_id"]] = "".join(parts)
+    return result
+
+
+@cache
+def crawled_html(size: int) -> list[str]:
+    """Full crawled collection page documents, boilerplate included."""
+    rng = _rng("crawled_html", size)
+    documents: list[str] = []
+    for page in pages(size):
+        keyword = page["keyword"]
+        nav = "".join(
+            f'<li><a href="/collections/{label}">{label}</a></li>'
+            for label in rng.sample(LABELS, 12)
+        )
+        cards = "".join(
+            f'<div class="product-card"><a href="/products/p{i}">'
+            f'<h3 class="card__heading">{_keyword(rng).title()}</h3></a>'
+            f'<span class="price">${rng.randint(10, 400)}.00</span></div>'
+            for i in range(rng.randint(8, 24))
+        )
+        body = "".join(f"<p>{_sentence(rng, 30, keyword)}</p>" for _ in range(4))
+        documents.append(
+            "<!DOCTYPE html><html><head>"
+            f"<title>{keyword.title()} | Example Store</title>"
+            f'<meta name="description" content="{_sentence(rng, 18, keyword)}">'
+            "<script>window.Shopify = {};</script><style>.x{color:red}</style>"
+            "</head><body>"
+            '<div class="announcement-bar">Free shipping over $50</div>'
+            f'<header class="site-header"><nav><ul>{nav}</ul></nav></header>'
+            f'<main id="MainContent"><h1>{keyword.title()}</h1>'
+            f"<h2>About {keyword}</h2>{body}"
+            f'<div class="collection-grid">{cards}</div></main>'
+            f'<footer class="site-footer"><ul>{nav}</ul>'
+            "<p>© Example Store</p></footer>"
+            "</body></html>"
+        )
+    return documents
+
+
+@cache
+def link_plans(size: int) -> list[dict[str, Any]]:
+    """Injected link records (3-5 per page) as produced by link planning."""
+    rng = _rng("link_plans", size)
+    all_pages = pages(size)
+    links: list[dict[str, Any]] = []
+    for page in all_pages:
+        for target in rng.sample(all_pages, rng.randint(3, 5)):
+            links.append(
+                {
+                    "id": f"link-{len(links)}",
+                    "source_page_id": page["page_id"],
+                    "target_page_id": target["page_id"],
+                    "target_url": target["url"],
+                    "anchor_text": target["keyword"],
+                    "anchor_type": rng.choice(("exact_match", "partial_match")),
+                }
+            )
+    return links
+
+
+@cache
+def generated_copy(size: int) -> list[dict[str, str]]:
+    """Generated page copy fields, seeded with quality-check triggers."""
+    rng = _rng("generated_copy", size)
+    result: list[dict[str, str]] = []
+    for page in pages(size):
+        keyword = page["keyword"]
+        paragraphs = [
+            f"<p>{_sentence(rng, 35, keyword)} {rng.choice(QUALITY_TRIGGERS)}</p>"
+            for _ in range(5)
+        ]
+        result.append(
+            {
+                "page_title": keyword.title(),
+                "meta_description": _sentence(rng, 20, keyword),
+                "top_description": _sentence(rng, 40, keyword),
+                "bottom_description": (
+                    f"<h2>Shop {keyword}</h2>{''.join(paragraphs)}"
+                    "<h2>FAQ</h2><h3>What size should I buy?</h3>"
+                    f"<p>{_sentence(rng, 20)}</p>"
+                ),
+            }
+        )
+    return result
+
+
+def brand_config() -> dict[str, Any]:
+    """BrandConfig.v2_schema with vocabulary rules."""
+    return {
+        "vocabulary": {
+            "banned_words": ["cheap", "best-in-class", "revolutionary", "unbeatable"],
+            "competitors": ["Acme Outfitters", "Summit Supply", "Trailhead Co"],
+        }
+    }
+
+
+def bibles() -> list[dict[str, Any]]:
+    """Vertical bibles (name and qa_rules) covering every bible check."""
+    result: list[dict[str, Any]] = []
+    for product in PRODUCTS[:5]:
+        result.append(
+            {
+                "name": f"{product.title()} Bible",
+                "qa_rules": {
+                    "preferred_terms": [
+                        {"use": f"{product} shell", "instead_of": f"{product} cover"},
+                        {"use": "water-resistant", "instead_of": "waterproof"},
+                    ],
+                    "banned_claims": [
+                        {
+                            "claim": "lifetime",
+                            "context": product,
+                            "reason": "No lifetime warranty",
+                        }
+                    ],
+                    "feature_attribution": [
+                        {
+                            "feature": "insulation",
+                            "correct_component": "lining",
+                            "wrong_components": ["shell", "sole"],
+                        }
+                    ],
+                    "term_context_rules": [
+                        {
+                            "term": "durable",
+                            "wrong_contexts": ["disposable", "single use"],
+                            "explanation": "Durability claims need reusable context",
+                        }
+                    ],
+                },
+            }
+        )
+    return result
+
+
+@cache
+def article_titles(size: int) -> list[dict[str, Any]]:
+    """Existing blog articles (title, full_url) from shopify_pages."""
+    rng = _rng("article_titles", size)
+    templates = (
+        "How to Choose {kw}",
+        "The Complete Guide to {kw}",
+        "{kw}: What to Know Before You Buy",
+        "Caring for Your {kw}",
+        "{n} Mistakes to Avoid With {kw}",
+    )
+    return [
+        {
+            "title": rng.choice(templates).format(
+                kw=_keyword(rng).title(), n=rng.randint(3, 12)
+            ),
+            "full_url": f"https://example.com/blogs/news/article-{i}",
+        }
+        for i in range(size)
+    ]
+
+
+def generated_titles(size: int, count: int = 25) -> list[str]:
+    """New blog topic titles, a third of them near-duplicates of existing ones."""
+    rng = _rng("generated_titles", size)
+    existing = article_titles(size)
+    titles: list[str] = []
+    for i in range(count):
+        if i % 3 == 0:
+            titles.append(rng.choice(existing)["title"].replace("How to", "How To"))
+        else:
+            titles.append(f"Why {_keyword(rng).title()} Matters This Season")
+    return titles
+
+
+@cache
+def bulk_records(size: int, page_type: str) -> list[dict[str, Any]]:
+    """Shopify bulk operation JSONL records for one page type.
+
+    Articles are emitted as blog parents followed by child records carrying
+    __parentId, as Shopify returns them.
+    """
+    rng = _rng(f"bulk_records:{page_type}", size)
+    records: list[dict[str, Any]] = []
+    if page_type == "article":
+        blog_count = max(1, size // 200)
+        blog_ids = [f"gid://shopify/Blog/{b}" for b in range(blog_count)]
+        for b, blog_id in enumerate(blog_ids):
+            records.append({"id": blog_id, "title": f"Blog {b}", "handle": f"blog-{b}"})
+        for i in range(size):
+            records.append(
+                {
+                    "id": f"gid://shopify/Article/{i}",
+                    "title": _keyword(rng).title(),
+                    "handle": f"article-{i}",
+                    "publishedAt": "2025-01-01T00:00:00Z" if i % 5 else None,
+                    "updatedAt": "2025-06-01T00:00:00Z",
+                    "tags": rng.sample(AUDIENCES, 2),
+                    "__parentId": rng.choice(blog_ids),
+                }
+            )
+        return records
+
+    for i in range(size):
+        keyword = _keyword(rng)
+        records.append(
+            {
+                "id": f"gid://shopify/Product/{i}",
+                "title": keyword.title(),
+                "handle": keyword.replace(" ", "-"),
+                "status": rng.choice(("ACTIVE", "DRAFT", "ARCHIVED")),
+                "publishedAt": "2025-01-01T00:00:00Z",
+                "updatedAt": "2025-06-01T00:00:00Z",
+                "productType": rng.choice(PRODUCTS),
+                "tags": rng.sample(AUDIENCES, 3),
+            }
+        )
+        # Variants come back as children of their product
+        for v in range(2):
+            records.append(
+                {
+                    "id": f"gid://shopify/ProductVariant/{i}-{v}",
+                    "__parentId": f"gid://shopify/Product/{i}",
+                }
+            )
+    return records
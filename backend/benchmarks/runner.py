@@ -0,0 +1,270 @@
+"""Run the benchmark cases and compare them against a stored baseline.
+
+Time is the best of several runs (the least noisy estimate of the cost of
+the code itself); runs repeat until MIN_TOTAL_SECONDS have been spent or
+MAX_REPEATS is reached. Peak memory is measured in one extra run under
+tracemalloc, kept apart from the timed runs because tracing slows Python
+allocation down several-fold.
+
+A case regresses when its time grows by more than the time threshold or its
+peak memory by more than the memory threshold, relative to the baseline.
+Timings below MIN_SIGNIFICANT_SECONDS are too noisy to compare and never
+fail the run.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Sequence
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from benchmarks.cases import CASES, BenchmarkCase
+from benchmarks.fixtures import SIZES
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+
+MAX_REPEATS = 5
+MIN_TOTAL_SECONDS = 1.0
+MIN_SIGNIFICANT_SECONDS = 0.005
+
+DEFAULT_TIME_THRESHOLD = 1.25
+DEFAULT_MEMORY_THRESHOLD = 1.10
+
+
+@dataclass
+class Measurement:
+    """Result of one case at one size."""
+
+    case: str
+    size: int
+    seconds: float
+    peak_bytes: int
+    repeats: int
+
+
+@dataclass
+class Comparison:
+    """A measurement next to its baseline."""
+
+    measurement: Measurement
+    baseline: dict[str, Any] | None
+    time_ratio: float | None
+    memory_ratio: float | None
+    regressed: bool
+
+
+def measure(case: BenchmarkCase, size: int) -> Measurement:
+    """Time a case (best of several runs) and record its peak memory."""
+    run = case.setup(size)
+
+    gc.collect()
+    timings: list[float] = []
+    while len(timings) < MAX_REPEATS and sum(timings) < MIN_TOTAL_SECONDS:
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Measurement(
+        case=case.name,
+        size=size,
+        seconds=min(timings),
+        peak_bytes=peak,
+        repeats=len(timings),
+    )
+
+
+def compare(
+    measurement: Measurement,
+    baseline: dict[str, Any] | None,
+    time_threshold: float = DEFAULT_TIME_THRESHOLD,
+    memory_threshold: float = DEFAULT_MEMORY_THRESHOLD,
+) -> Comparison:
+    """Compare a measurement to its baseline entry (None if not recorded)."""
+    if baseline is None:
+        return Comparison(measurement, None, None, None, regressed=False)
+
+    base_seconds = baseline["seconds"]
+    base_peak = baseline["peak_bytes"]
+    time_ratio = measurement.seconds / base_seconds if base_seconds > 0 else None
+    memory_ratio = measurement.peak_bytes / base_peak if base_peak > 0 else None
+
+    slower = (
+        time_ratio is not None
+        and time_ratio > time_threshold
+        and measurement.seconds >= MIN_SIGNIFICANT_SECONDS
+    )
+    larger = memory_ratio is not None and memory_ratio > memory_threshold
+    return Comparison(
+        measurement, baseline, time_ratio, memory_ratio, regressed=slower or larger
+    )
+
+
+def load_baseline(path: Path) -> dict[str, dict[str, dict[str, Any]]]:
+    """Read baseline results as {case: {size: {seconds, peak_bytes}}}."""
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())["results"]
+
+
+def save_baseline(
+    path: Path,
+    measurements: Sequence[Measurement],
+    previous: dict[str, dict[str, dict[str, Any]]],
+) -> None:
+    """Write measurements into the baseline, keeping entries not re-run."""
+    results = {case: dict(sizes) for case, sizes in previous.items()}
+    for m in measurements:
+        results.setdefault(m.case, {})[str(m.size)] = {
+            "seconds": round(m.seconds, 6),
+            "peak_bytes": m.peak_bytes,
+        }
+    document = {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+            "recorded_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        },
+        "results": results,
+    }
+    path.write_text(json.dumps(document, indent=2, sort_keys=True) + "\n")
+
+
+def _format_row(comparison: Comparison) -> str:
+    m = comparison.measurement
+    time_change = (
+        f"{comparison.time_ratio:6.2f}x"
+        if comparison.time_ratio is not None
+        else "   new"
+    )
+    memory_change = (
+        f"{comparison.memory_ratio:6.2f}x"
+        if comparison.memory_ratio is not None
+        else "   new"
+    )
+    flag = "REGRESSED" if comparison.regressed else ""
+    return (
+        f"{m.case:40} {m.size:>6} {m.seconds * 1000:>11.1f}ms {time_change}"
+        f" {m.peak_bytes / 1_048_576:>9.2f}MiB {memory_change}  {flag}"
+    )
+
+
+def run(
+    cases: Sequence[BenchmarkCase],
+    sizes: Sequence[int],
+    baseline: dict[str, dict[str, dict[str, Any]]],
+    time_threshold: float = DEFAULT_TIME_THRESHOLD,
+    memory_threshold: float = DEFAULT_MEMORY_THRESHOLD,
+    report: Callable[[str], None] = print,
+) -> list[Comparison]:
+    """Measure every case at every supported size, reporting as it goes."""
+    report(
+        f"{'case':40} {'pages':>6} {'time':>13} {'vs base':>7}"
+        f" {'peak mem':>12} {'vs base':>7}"
+    )
+    comparisons: list[Comparison] = []
+    for size in sizes:
+        for case in cases:
+            if not case.supports(size):
+                continue
+            measurement = measure(case, size)
+            comparison = compare(
+                measurement,
+                baseline.get(case.name, {}).get(str(size)),
+                time_threshold,
+                memory_threshold,
+            )
+            comparisons.append(comparison)
+            report(_format_row(comparison))
+    return comparisons
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark the CPU hot paths against synthetic fixtures.",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(SIZES),
+        help=f"page counts to run (default: {' '.join(map(str, SIZES))})",
+    )
+    parser.add_argument(
+        "--cases",
+        nargs="+",
+        metavar="SUBSTRING",
+        help="only run cases whose name contains one of these substrings",
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_TIME_THRESHOLD,
+        help="fail when time exceeds baseline by this factor (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--memory-threshold",
+        type=float,
+        default=DEFAULT_MEMORY_THRESHOLD,
+        help="fail when peak memory exceeds baseline by this factor "
+        "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="record these results as the new baseline instead of comparing",
+    )
+    parser.add_argument("--json", type=Path, help="also write results to this file")
+    args = parser.parse_args(argv)
+
+    cases = [
+        case
+        for case in CASES
+        if not args.cases or any(s in case.name for s in args.cases)
+    ]
+    baseline = load_baseline(args.baseline)
+    comparisons = run(
+        cases,
+        args.sizes,
+        {} if args.update_baseline else baseline,
+        args.threshold,
+        args.memory_threshold,
+    )
+    measurements = [c.measurement for c in comparisons]
+
+    if args.json:
+        args.json.write_text(
+            json.dumps([asdict(m) for m in measurements], indent=2) + "\n"
+        )
+
+    if args.update_baseline:
+        save_baseline(args.baseline, measurements, baseline)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    regressions = [c for c in comparisons if c.regressed]
+    if regressions:
+        print(
+            f"{len(regressions)} regression(s) beyond {args.threshold}x time"
+            f" / {args.memory_threshold}x memory",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
@@ -0,0 +1,15 @@
+"""Full-pipeline load harness with local fakes for every external API.
+
+Runs N concurrent projects through crawl, keywords, briefs, content, links
+and export against the real app and database, with Crawl4AI, Claude,
+DataForSEO, POP, SerpAPI and Perplexity served by in-process fakes, and
+reports throughput, stage latency percentiles, DB query counts and
+event-loop lag. Use it to size settings such as crawl_concurrency and
+content_generation_concurrency.
+
+Run from backend/ against a scratch database:
+
+    DATABASE_URL=postgresql://... python -m loadtest --projects 8 --pages 25
+    python -m loadtest --set content_generation_concurrency=5 \\
+        --fault claude:latency_ms=4000,rate_limit_rate=0.05
+"""
@@ -0,0 +1,201 @@
+"""Drives projects through the onboarding flow over the HTTP API.
+
+Each project follows the same calls the frontend makes:
+
+    create   POST /projects
+    crawl    POST /projects/{id}/urls, poll crawl-status until labeled
+    keywords POST generate-primary-keywords, poll, approve-all-keywords
+    content  POST generate-content, poll, bulk-approve-content
+             (POP briefs, writing, quality checks and the automatic link
+             planning pass all run inside this stage)
+    links    POST links/plan (scope=onboarding), poll until complete
+    export   GET /projects/{id}/export
+
+Stage time is wall time from the first call to the final poll, i.e. what a
+user waiting on the UI would see.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from benchmarks import fixtures
+
+STAGES = ("create", "crawl", "keywords", "content", "links", "export")
+
+API_PREFIX = "/api/v1/projects"
+
+
+class StageFailedError(Exception):
+    """A stage returned an error status or did not finish in time."""
+
+
+@dataclass
+class ProjectRun:
+    """Outcome and per-stage timings of one project."""
+
+    index: int
+    pages: int
+    project_id: str | None = None
+    stage_seconds: dict[str, float] = field(default_factory=dict)
+    failed_stage: str | None = None
+    error: str | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.failed_stage is None and len(self.stage_seconds) == len(STAGES)
+
+
+def site_urls(index: int, pages: int) -> list[str]:
+    """Collection page URLs for project ``index`` (same slugs, own domain)."""
+    return [
+        f"https://store-{index}.example.com{p['url']}" for p in fixtures.pages(pages)
+    ]
+
+
+def _check(response: httpx.Response) -> dict[str, Any]:
+    if response.status_code >= 400:
+        raise StageFailedError(
+            f"{response.request.method} {response.request.url.path} returned "
+            f"{response.status_code}: {response.text[:200]}"
+        )
+    return response.json() if "json" in response.headers.get("content-type", "") else {}
+
+
+class ProjectDriver:
+    """Runs projects through every stage with one shared HTTP client."""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        poll_interval: float = 1.0,
+        stage_timeout: float = 1800.0,
+    ) -> None:
+        self._client = client
+        self._poll_interval = poll_interval
+        self._stage_timeout = stage_timeout
+
+    async def _poll(
+        self,
+        path: str,
+        done: Callable[[dict[str, Any]], bool],
+        params: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        deadline = time.monotonic() + self._stage_timeout
+        while True:
+            body = _check(await self._client.get(path, params=params))
+            if done(body):
+                return body
+            if time.monotonic() > deadline:
+                raise StageFailedError(f"Timed out polling {path}: {body}")
+            await asyncio.sleep(self._poll_interval)
+
+    async def run(self, index: int, urls: list[str]) -> ProjectRun:
+        """Take one project through every stage, stopping at the first failure."""
+        run = ProjectRun(index=index, pages=len(urls))
+        steps = {
+            "create": lambda: self.create(run),
+            "crawl": lambda: self.crawl(run, urls),
+            "keywords": lambda: self.keywords(run),
+            "content": lambda: self.content(run),
+            "links": lambda: self.links(run),
+            "export": lambda: self.export(run),
+        }
+        for stage in STAGES:
+            start = time.perf_counter()
+            try:
+                await steps[stage]()
+            except Exception as exc:
+                run.failed_stage = stage
+                run.error = f"{type(exc).__name__}: {exc}"
+                break
+            run.stage_seconds[stage] = time.perf_counter() - start
+        return run
+
+    async def create(self, run: ProjectRun) -> None:
+        body = _check(
+            await self._client.post(
+                API_PREFIX,
+                json={
+                    "name": f"Load test {run.index}",
+                    "site_url": f"https://store-{run.index}.example.com",
+                },
+            )
+        )
+        run.project_id = body["id"]
+
+    async def crawl(self, run: ProjectRun, urls: list[str]) -> None:
+        project = f"{API_PREFIX}/{run.project_id}"
+        _check(await self._client.post(f"{project}/urls", json={"urls": urls}))
+        await self._poll(
+            f"{project}/crawl-status", lambda body: body["status"] == "complete"
+        )
+
+    async def keywords(self, run: ProjectRun) -> None:
+        project = f"{API_PREFIX}/{run.project_id}"
+        _check(await self._client.post(f"{project}/generate-primary-keywords"))
+        body = await self._poll(
+            f"{project}/primary-keywords-status",
+            lambda body: body["status"] in ("completed", "partial", "failed"),
+        )
+        if body["status"] == "failed":
+            raise StageFailedError(body.get("error") or "Keyword generation failed")
+        _check(await self._client.post(f"{project}/approve-all-keywords"))
+
+    async def content(self, run: ProjectRun) -> None:
+        project = f"{API_PREFIX}/{run.project_id}"
+        _check(await self._client.post(f"{project}/generate-content"))
+        body = await self._poll(
+            f"{project}/content-generation-status",
+            lambda body: body["overall_status"] != "generating",
+        )
+        if body["overall_status"] == "failed":
+            raise StageFailedError("Content generation failed")
+        _check(await self._client.post(f"{project}/bulk-approve-content"))
+
+    async def links(self, run: ProjectRun) -> None:
+        project = f"{API_PREFIX}/{run.project_id}"
+        _check(
+            await self._client.post(
+                f"{project}/links/plan", json={"scope": "onboarding"}
+            )
+        )
+        body = await self._poll(
+            f"{project}/links/plan/status",
+            lambda body: body["status"] in ("complete", "failed"),
+            params={"scope": "onboarding"},
+        )
+        if body["status"] == "failed":
+            raise StageFailedError(body.get("error") or "Link planning failed")
+
+    async def export(self, run: ProjectRun) -> None:
+        response = await self._client.get(f"{API_PREFIX}/{run.project_id}/export")
+        _check(response)
+        if not response.content:
+            raise StageFailedError("Export returned an empty file")
+
+
+async def drive(
+    base_url: str,
+    projects: int,
+    pages: int,
+    ramp_seconds: float = 0.0,
+    poll_interval: float = 1.0,
+    stage_timeout: float = 1800.0,
+) -> list[ProjectRun]:
+    """Run ``projects`` projects concurrently, starts spread over ramp_seconds."""
+    # An explicit transport keeps the driver's own traffic off the fake router
+    async with httpx.AsyncClient(
+        base_url=base_url, transport=httpx.AsyncHTTPTransport(), timeout=120.0
+    ) as client:
+        driver = ProjectDriver(client, poll_interval, stage_timeout)
+
+        async def start(index: int) -> ProjectRun:
+            await asyncio.sleep(ramp_seconds * index / max(projects, 1))
+            return await driver.run(index, site_urls(index, pages))
+
+        return list(await asyncio.gather(*(start(i) for i in range(projects))))
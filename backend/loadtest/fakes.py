@@ -0,0 +1,720 @@
+"""Local stand-ins for every external API the onboarding flow calls.
+
+Each fake answers the real endpoint paths with payloads in the shape the
+integration client parses, so the production clients run unchanged: their
+retries, circuit breakers, rate limiting and POP task polling all see
+ordinary HTTP responses. Responses are derived from the request (URL slug,
+keyword, prompt), so the pipeline produces plausible crawls, labels,
+keywords, copy and links.
+
+Requests reach the fakes through FakeRouter, an httpx transport keyed by
+host. route_httpx() installs it as the default transport of every
+httpx.AsyncClient created without one; hosts with no fake raise a
+ConnectError so the run stays offline.
+
+Every fake applies a FaultProfile before answering: a latency drawn around
+latency_ms, then a 429 (with Retry-After) or a 503 at the configured rates.
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import re
+import time
+from collections import Counter
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any
+from unittest.mock import patch
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.integrations.claude import ANTHROPIC_API_URL
+from app.integrations.dataforseo import DATAFORSEO_API_URL
+from app.integrations.perplexity import PERPLEXITY_API_URL
+from app.integrations.pop import POPMockClient
+from app.integrations.serpapi import SERPAPI_URL
+from benchmarks.fixtures import AUDIENCES, FILLER, PRODUCTS
+
+CRAWL4AI_URL = "http://crawl4ai.loadtest"
+POP_URL = "https://app.pageoptimizer.pro"
+
+# Hosts that are never faked (the app under test and the driver)
+PASSTHROUGH_HOSTS = frozenset({"127.0.0.1", "localhost"})
+
+
+@dataclass
+class FaultProfile:
+    """Latency and failure injection for one fake service."""
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after_s: float = 1.0
+
+    def update(self, spec: str) -> None:
+        """Apply comma-separated overrides, e.g. "latency_ms=800,error_rate=0.02"."""
+        for item in spec.split(","):
+            key, _, value = item.partition("=")
+            key = key.strip()
+            if not hasattr(self, key):
+                raise ValueError(f"Unknown fault setting: {key}")
+            setattr(self, key, float(value))
+
+
+@dataclass
+class ServiceStats:
+    """Request counters for one fake service."""
+
+    requests: int = 0
+    errors: int = 0
+    rate_limited: int = 0
+    routes: Counter[str] = field(default_factory=Counter)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "rate_limited": self.rate_limited,
+            "routes": dict(self.routes.most_common()),
+        }
+
+
+def _words(rng: random.Random, count: int) -> str:
+    return " ".join(rng.choice(FILLER) for _ in range(count))
+
+
+def _sentence(rng: random.Random, count: int, phrase: str) -> str:
+    words = _words(rng, count).split()
+    words.insert(rng.randrange(len(words) + 1), phrase)
+    return " ".join(words).capitalize() + "."
+
+
+def _json(data: Any, status_code: int = 200) -> httpx.Response:
+    return httpx.Response(status_code, json=data)
+
+
+class FakeService:
+    """Base class: fault injection and counters around respond()."""
+
+    name = "service"
+    hosts: tuple[str, ...] = ()
+
+    def __init__(self, profile: FaultProfile | None = None, seed: int = 0) -> None:
+        self.profile = profile or FaultProfile()
+        self.stats = ServiceStats()
+        self._rng = random.Random(f"{self.name}:{seed}")
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        """Apply the fault profile, then answer the request."""
+        profile = self.profile
+        self.stats.requests += 1
+        self.stats.routes[f"{request.method} {self.route(request)}"] += 1
+
+        delay_ms = profile.latency_ms + self._rng.uniform(
+            -profile.jitter_ms, profile.jitter_ms
+        )
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000)
+
+        roll = self._rng.random()
+        if roll < profile.rate_limit_rate:
+            self.stats.rate_limited += 1
+            return httpx.Response(
+                429,
+                headers={"Retry-After": f"{profile.retry_after_s:g}"},
+                json={"error": {"type": "rate_limit_error", "message": "injected"}},
+            )
+        if roll < profile.rate_limit_rate + profile.error_rate:
+            self.stats.errors += 1
+            return _json({"error": {"type": "api_error", "message": "injected"}}, 503)
+
+        return self.respond(request)
+
+    def route(self, request: httpx.Request) -> str:
+        """Route label for the counters (path with ids collapsed)."""
+        return re.sub(r"/[\w-]*\d[\w-]*(?=/|$)", "/{id}", request.url.path)
+
+    def respond(self, request: httpx.Request) -> httpx.Response:
+        raise NotImplementedError
+
+
+class FakeCrawl4AI(FakeService):
+    """Crawl4AI: renders a Shopify-like collection page for any URL."""
+
+    name = "crawl4ai"
+    hosts = (urlsplit(CRAWL4AI_URL).hostname or "",)
+
+    def respond(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "POST":
+            return _json({"status": "ok"})
+        url = json.loads(request.content)["urls"][0]
+        html = render_collection_page(url)
+        return _json(
+            {
+                "success": True,
+                "results": [
+                    {
+                        "url": url,
+                        "success": True,
+                        "html": html,
+                        "cleaned_html": html,
+                        "markdown": {
+                            "raw_markdown": f"# {keyword_from_url(url).title()}"
+                        },
+                        "links": [],
+                        "metadata": {},
+                        "status_code": 200,
+                    }
+                ],
+            }
+        )
+
+
+def keyword_from_url(url: str) -> str:
+    """The page keyword encoded in a collection URL slug."""
+    slug = urlsplit(url).path.rstrip("/").rsplit("/", 1)[-1]
+    return re.sub(r"-\d+$", "", slug).replace("-", " ")
+
+
+def render_collection_page(url: str) -> str:
+    """A collection page document with header, nav, product grid and footer."""
+    rng = random.Random(url)
+    keyword = keyword_from_url(url)
+    title = keyword.title()
+    nav = "".join(
+        f'<li><a href="/collections/{a}-{p}">{a} {p}</a></li>'
+        for a, p in zip(rng.sample(AUDIENCES, 8), rng.sample(PRODUCTS, 8), strict=True)
+    )
+    cards = "".join(
+        f'<div class="product-card"><a href="/products/{keyword.replace(" ", "-")}-{i}">'
+        f'<h3 class="card__heading">{title} {i + 1}</h3></a>'
+        f'<span class="price">${rng.randint(10, 400)}.00</span></div>'
+        for i in range(rng.randint(8, 24))
+    )
+    body = "".join(f"<p>{_sentence(rng, 30, keyword)}</p>" for _ in range(3))
+    return (
+        "<!DOCTYPE html><html><head>"
+        f"<title>{title} | Example Store</title>"
+        f'<meta name="description" content="{_sentence(rng, 18, keyword)}">'
+        "<script>window.Shopify = {};</script></head><body>"
+        f'<header class="site-header"><nav><ul>{nav}</ul></nav></header>'
+        f'<main id="MainContent"><h1>{title}</h1><h2>About {keyword}</h2>{body}'
+        f'<div class="collection-grid">{cards}</div></main>'
+        f'<footer class="site-footer"><ul>{nav}</ul></footer>'
+        "</body></html>"
+    )
+
+
+class FakeClaude(FakeService):
+    """Anthropic Messages and Message Batches APIs.
+
+    Replies are chosen by recognising the prompt (taxonomy, label
+    assignment, keyword ideas and filtering, content writing, anchor
+    phrases, link rewrites); anything else gets a short plain-text reply.
+    """
+
+    name = "claude"
+    hosts = (urlsplit(ANTHROPIC_API_URL).hostname or "",)
+
+    def __init__(self, profile: FaultProfile | None = None, seed: int = 0) -> None:
+        super().__init__(profile, seed)
+        self._batches: dict[str, list[dict[str, Any]]] = {}
+
+    def respond(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/v1/messages":
+            return _json(self.message(json.loads(request.content)))
+        if path == "/v1/messages/batches":
+            batch_id = f"msgbatch_{len(self._batches)}"
+            self._batches[batch_id] = json.loads(request.content)["requests"]
+            return _json({"id": batch_id, "processing_status": "in_progress"})
+
+        # Batches end on the first poll; the fault profile supplies the delay
+        batch_id = path.split("/")[4]
+        requests = self._batches[batch_id]
+        if path.endswith("/results"):
+            lines = [
+                json.dumps(
+                    {
+                        "custom_id": item["custom_id"],
+                        "result": {
+                            "type": "succeeded",
+                            "message": self.message(item["params"]),
+                        },
+                    }
+                )
+                for item in requests
+            ]
+            return httpx.Response(200, text="\n".join(lines))
+        if path.endswith("/cancel"):
+            return _json({"id": batch_id})
+        return _json(
+            {
+                "id": batch_id,
+                "processing_status": "ended",
+                "request_counts": {"succeeded": len(requests)},
+                "results_url": f"{ANTHROPIC_API_URL}{path}/results",
+            }
+        )
+
+    def message(self, params: dict[str, Any]) -> dict[str, Any]:
+        """A Messages API response for one request body."""
+        system = params.get("system") or ""
+        if isinstance(system, list):
+            system = "\n".join(block.get("text", "") for block in system)
+        content = params["messages"][-1]["content"]
+        if isinstance(content, list):
+            content = "\n".join(block.get("text", "") for block in content)
+        text = self.reply(system, content)
+        return {
+            "id": f"msg_{hashlib.sha256(content.encode()).hexdigest()[:16]}",
+            "type": "message",
+            "role": "assistant",
+            "model": params.get("model", ""),
+            "content": [{"type": "text", "text": text}],
+            "stop_reason": "end_turn",
+            "usage": {
+                "input_tokens": (len(system) + len(content)) // 4,
+                "output_tokens": len(text) // 4,
+            },
+        }
+
+    def reply(self, system: str, prompt: str) -> str:
+        """The assistant text for a system and user prompt."""
+        if "taxonomy of PRODUCT CATEGORY labels" in system:
+            return json.dumps(_taxonomy(prompt))
+        if "BATCH MODE" in system:
+            return json.dumps(_batch_assignments(prompt))
+        if "TAXONOMY:" in prompt and "PAGE:" in prompt:
+            names = _taxonomy_names(prompt)
+            return json.dumps(_assignment(names, prompt.split("PAGE:", 1)[1]))
+        if "generate high-level keyword ideas" in prompt:
+            return json.dumps(_keyword_ideas(prompt))
+        if "Filter this keyword list" in prompt:
+            return json.dumps(_filtered_keywords(prompt))
+        if "keyword matching assistant" in system:
+            return "[]"
+        if "Generate 2-3 natural anchor text phrases" in prompt:
+            return json.dumps(_anchor_phrases(prompt))
+        if prompt.startswith("Rewrite this paragraph"):
+            return _rewritten_paragraph(prompt)
+        match = re.search(r'the keyword "([^"]+)"', prompt)
+        if match:
+            return json.dumps(_page_copy(match.group(1)))
+        return "Done."
+
+
+def _taxonomy(prompt: str) -> dict[str, Any]:
+    text = prompt.lower()
+    products = [p for p in PRODUCTS if p in text] or ["general"]
+    return {
+        "labels": [
+            {
+                "name": product,
+                "description": f"Collections selling {product}",
+                "examples": [f"{audience} {product}" for audience in AUDIENCES[:2]],
+            }
+            for product in products
+        ],
+        "reasoning": "Grouped by the product type in each collection",
+    }
+
+
+def _taxonomy_names(prompt: str) -> list[str]:
+    block = prompt.split("TAXONOMY:", 1)[1]
+    return re.findall(r"^- ([\w-]+):", block, re.MULTILINE)
+
+
+def _assignment(names: Sequence[str], page_info: str) -> dict[str, Any]:
+    text = page_info.lower()
+    labels = [name for name in names if name in text] or list(names[:1])
+    return {
+        "labels": labels[:3],
+        "confidence": 0.9,
+        "reasoning": "Matched the product type in the URL and title",
+    }
+
+
+def _batch_assignments(prompt: str) -> dict[str, Any]:
+    names = _taxonomy_names(prompt)
+    items = re.split(r"^ITEM (\d+)$", prompt, flags=re.MULTILINE)[1:]
+    return {
+        "assignments": [
+            {"item": int(number), **_assignment(names, info)}
+            for number, info in zip(items[::2], items[1::2], strict=True)
+        ]
+    }
+
+
+def _prompt_field(prompt: str, name: str) -> str:
+    match = re.search(rf"^- {name}: (.+)$", prompt, re.MULTILINE)
+    return match.group(1).strip() if match else ""
+
+
+def _keyword_ideas(prompt: str) -> list[str]:
+    keyword = (_prompt_field(prompt, "H1") or _prompt_field(prompt, "Title")).lower()
+    keyword = keyword.split(" | ")[0]
+    head = " ".join(keyword.split()[-2:])
+    return [
+        keyword,
+        f"best {keyword}",
+        f"{keyword} for sale",
+        f"buy {keyword} online",
+        f"{keyword} reviews",
+        f"how to choose {keyword}",
+        head,
+        f"best {head}",
+        f"{head} sale",
+        f"{keyword} gift ideas",
+    ]
+
+
+def _filtered_keywords(prompt: str) -> list[dict[str, Any]]:
+    keywords = re.findall(r'^  - "(.+)": ', prompt, re.MULTILINE)
+    return [
+        {"keyword": keyword, "relevance_score": round(1.0 - 0.05 * i, 2)}
+        for i, keyword in enumerate(keywords[:8])
+    ]
+
+
+def _page_copy(keyword: str) -> dict[str, str]:
+    rng = random.Random(keyword)
+    paragraphs = "".join(f"<p>{_sentence(rng, 40, keyword)}</p>" for _ in range(4))
+    return {
+        "page_title": f"Shop {keyword.title()}",
+        "meta_description": _sentence(rng, 18, keyword),
+        "top_description": f"<p>{_sentence(rng, 35, keyword)}</p>",
+        "bottom_description": (
+            f"<h2>Shop {keyword}</h2>{paragraphs}"
+            f"<h2>Caring for {keyword}</h2><p>{_sentence(rng, 30, keyword)}</p>"
+        ),
+    }
+
+
+def _anchor_phrases(prompt: str) -> dict[str, Any]:
+    items = re.findall(r"^\d+\. \[([^\]]+)\] (.+)$", prompt, re.MULTILINE)
+    return {
+        "results": [
+            {
+                "id": page_id,
+                "phrases": [keyword, f"shop {keyword}", " ".join(keyword.split()[-2:])],
+            }
+            for page_id, keyword in items
+        ]
+    }
+
+
+def _rewritten_paragraph(prompt: str) -> str:
+    match = re.search(r'hyperlink to (\S+) with anchor text "([^"]+)"', prompt)
+    paragraph = prompt.split("\n\n", 1)[-1]
+    if not match:
+        return paragraph
+    url, anchor = match.groups()
+    link = f' Browse our <a href="{url}">{anchor}</a>.'
+    if paragraph.endswith("</p>"):
+        return paragraph[: -len("</p>")] + link + "</p>"
+    return paragraph + link
+
+
+class FakeDataForSEO(FakeService):
+    """DataForSEO search volume, keyword suggestion and SERP endpoints."""
+
+    name = "dataforseo"
+    hosts = (urlsplit(DATAFORSEO_API_URL).hostname or "",)
+
+    def respond(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        task = json.loads(request.content)[0]
+        if path.endswith("/search_volume/live"):
+            result = [_keyword_volume(kw) for kw in task.get("keywords", [])]
+        elif path.endswith("/keywords_for_keywords/live"):
+            seeds = task.get("keywords", [])
+            result = [
+                _keyword_volume(f"{seed} {suffix}")
+                for seed in seeds
+                for suffix in ("sale", "near me", "online")
+            ]
+        else:
+            keyword = task.get("keyword", "")
+            result = [
+                {
+                    "keyword": keyword,
+                    "se_results_count": 1_000_000,
+                    "items": [
+                        {
+                            "type": "organic",
+                            "rank_group": rank,
+                            "url": f"https://competitor-{rank}.example.com/{rank}",
+                            "title": f"{keyword.title()} | Competitor {rank}",
+                            "description": f"Shop {keyword} at Competitor {rank}.",
+                            "domain": f"competitor-{rank}.example.com",
+                        }
+                        for rank in range(1, 11)
+                    ],
+                }
+            ]
+        return _json(
+            {
+                "status_code": 20000,
+                "status_message": "Ok.",
+                "cost": 0.05,
+                "tasks_count": 1,
+                "tasks_error": 0,
+                "tasks": [
+                    {"status_code": 20000, "status_message": "Ok.", "result": result}
+                ],
+            }
+        )
+
+
+def _keyword_volume(keyword: str) -> dict[str, Any]:
+    rng = random.Random(keyword)
+    # Longer keywords are rarer, as in real search data
+    volume = int(rng.randint(50, 5000) / max(1, len(keyword.split()) - 1))
+    return {
+        "keyword": keyword,
+        "search_volume": volume,
+        "cpc": round(rng.uniform(0.2, 3.5), 2),
+        "competition": rng.choice(("LOW", "MEDIUM", "HIGH")),
+        "competition_index": rng.randint(0, 100),
+        "monthly_searches": [
+            {"year": 2025, "month": month, "search_volume": volume}
+            for month in range(1, 13)
+        ],
+    }
+
+
+class FakePOP(FakeService):
+    """PageOptimizer Pro: get-terms, create-report, recommendations and tasks.
+
+    Tasks complete task_seconds after they are created, so the client's
+    task poller sees pending results in between. Payloads come from the
+    POPMockClient generators.
+    """
+
+    name = "pop"
+    hosts = (urlsplit(POP_URL).hostname or "",)
+
+    def __init__(
+        self,
+        profile: FaultProfile | None = None,
+        seed: int = 0,
+        task_seconds: float = 0.0,
+    ) -> None:
+        super().__init__(profile, seed)
+        self.task_seconds = task_seconds
+        self._mock = POPMockClient()
+        self._tasks: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._prepared: dict[str, str] = {}
+        self._reports: dict[str, str] = {}
+
+    def _task(self, result: dict[str, Any]) -> str:
+        task_id = f"task-{len(self._tasks)}"
+        self._tasks[task_id] = (time.monotonic() + self.task_seconds, result)
+        return task_id
+
+    def respond(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.startswith("/api/task/"):
+            ready_at, result = self._tasks[path.split("/")[3]]
+            if time.monotonic() < ready_at:
+                return _json({"status": "processing"})
+            return _json({"status": "success", **result})
+
+        body = json.loads(request.content) if request.content else {}
+        if path == "/api/expose/get-terms/":
+            keyword = body.get("keyword", "")
+            seed = self._mock._seed_from_keyword(keyword)
+            prepare_id = self._mock._generate_prepare_id(keyword)
+            self._prepared[prepare_id] = keyword
+            task_id = self._task(
+                {
+                    "lsaPhrases": self._mock._generate_lsa_phrases(keyword, seed),
+                    "variations": self._mock._generate_variations(keyword, seed),
+                    "prepareId": prepare_id,
+                    "wordCountTarget": random.Random(seed).choice((600, 800, 1000)),
+                }
+            )
+            return _json({"status": "success", "taskId": task_id})
+
+        if path == "/api/expose/create-report/":
+            keyword = self._prepared.get(body.get("prepareId", ""), "")
+            report = self._mock._generate_report_data(
+                keyword, self._mock._seed_from_keyword(keyword)
+            )
+            self._reports[report["reportId"]] = keyword
+            task_id = self._task({"report": report})
+            return _json(
+                {"status": "success", "taskId": task_id, "reportId": report["reportId"]}
+            )
+
+        if path == "/api/expose/get-custom-recommendations/":
+            keyword = self._reports.get(body.get("reportId", ""), "")
+            recommendations = self._mock._generate_recommendations_data(
+                keyword, self._mock._seed_from_keyword(keyword)
+            )
+            return _json({"status": "success", "recommendations": recommendations})
+
+        return _json({"status": "FAILURE", "msg": f"Unknown endpoint {path}"}, 404)
+
+
+class FakeSerpAPI(FakeService):
+    """SerpAPI Google search, returning Reddit threads for the query."""
+
+    name = "serpapi"
+    hosts = (urlsplit(SERPAPI_URL).hostname or "",)
+
+    def respond(self, request: httpx.Request) -> httpx.Response:
+        query = request.url.params.get("q", "")
+        rng = random.Random(query)
+        topic = re.sub(r"\W+", "_", query.replace("site:reddit.com", "")).strip("_")
+        return _json(
+            {
+                "search_metadata": {"status": "Success"},
+                "organic_results": [
+                    {
+                        "position": rank,
+                        "link": (
+                            f"https://www.reddit.com/r/{rng.choice(AUDIENCES)}"
+                            f"/comments/{rng.randrange(16**6):06x}/{topic[:40]}/"
+                        ),
+                        "title": f"Looking for {query} recommendations",
+                        "snippet": _sentence(rng, 20, "recommendations"),
+                        "date": "3 days ago",
+                    }
+                    for rank in range(1, 11)
+                ],
+            }
+        )
+
+
+class FakePerplexity(FakeService):
+    """Perplexity chat completions with citations."""
+
+    name = "perplexity"
+    hosts = (urlsplit(PERPLEXITY_API_URL).hostname or "",)
+
+    def respond(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        prompt = body["messages"][-1]["content"]
+        rng = random.Random(prompt)
+        text = "\n\n".join(_sentence(rng, 40, "research") for _ in range(4))
+        return _json(
+            {
+                "id": f"ppl-{hashlib.sha256(prompt.encode()).hexdigest()[:12]}",
+                "model": body.get("model", ""),
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {"role": "assistant", "content": text},
+                    }
+                ],
+                "citations": [f"https://source-{i}.example.com/" for i in range(3)],
+                "usage": {
+                    "prompt_tokens": len(prompt) // 4,
+                    "completion_tokens": len(text) // 4,
+                    "total_tokens": (len(prompt) + len(text)) // 4,
+                },
+            }
+        )
+
+
+SERVICES: tuple[type[FakeService], ...] = (
+    FakeCrawl4AI,
+    FakeClaude,
+    FakeDataForSEO,
+    FakePOP,
+    FakeSerpAPI,
+    FakePerplexity,
+)
+
+
+class FakeRouter(httpx.AsyncBaseTransport):
+    """Routes requests to fakes by host; local hosts go to the network."""
+
+    def __init__(self, services: Sequence[FakeService]) -> None:
+        self.services = {service.name: service for service in services}
+        self._routes = {host: service for service in services for host in service.hosts}
+        self._passthrough = httpx.AsyncHTTPTransport()
+        self.unrouted: Counter[str] = Counter()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        service = self._routes.get(host)
+        if service is not None:
+            await request.aread()
+            return await service.handle(request)
+        if host in PASSTHROUGH_HOSTS:
+            return await self._passthrough.handle_async_request(request)
+        self.unrouted[host] += 1
+        raise httpx.ConnectError(f"No fake for {host} (load test is offline)")
+
+    async def aclose(self) -> None:
+        # Shared by every client; closed once by close()
+        return None
+
+    async def close(self) -> None:
+        await self._passthrough.aclose()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "services": {
+                name: service.stats.to_dict() for name, service in self.services.items()
+            },
+            "profiles": {
+                name: asdict(service.profile) for name, service in self.services.items()
+            },
+            "unrouted_hosts": dict(self.unrouted),
+        }
+
+
+def build_fakes(
+    profiles: dict[str, FaultProfile] | None = None,
+    seed: int = 0,
+    pop_task_seconds: float = 0.0,
+) -> FakeRouter:
+    """Create every fake with its fault profile, behind one router."""
+    profiles = profiles or {}
+    services: list[FakeService] = []
+    for service_class in SERVICES:
+        profile = profiles.get(service_class.name)
+        if service_class is FakePOP:
+            services.append(FakePOP(profile, seed, task_seconds=pop_task_seconds))
+        else:
+            services.append(service_class(profile, seed))
+    return FakeRouter(services)
+
+
+def fake_environment() -> dict[str, str]:
+    """Settings that point every integration at its fake."""
+    return {
+        "ANTHROPIC_API_KEY": "loadtest",
+        "PERPLEXITY_API_KEY": "loadtest",
+        "DATAFORSEO_API_LOGIN": "loadtest",
+        "DATAFORSEO_API_PASSWORD": "loadtest",
+        "POP_API_KEY": "loadtest",
+        "POP_API_URL": POP_URL,
+        "POP_USE_MOCK": "false",
+        "SERPAPI_KEY": "loadtest",
+        "CRAWL4AI_API_URL": CRAWL4AI_URL,
+    }
+
+
+@contextmanager
+def route_httpx(router: FakeRouter) -> Iterator[FakeRouter]:
+    """Make ``router`` the transport of every AsyncClient created without one."""
+    original_init = httpx.AsyncClient.__init__
+
+    def __init__(client: httpx.AsyncClient, *args: Any, **kwargs: Any) -> None:
+        if kwargs.get("transport") is None and not kwargs.get("mounts"):
+            kwargs["transport"] = router
+        original_init(client, *args, **kwargs)
+
+    with patch.object(httpx.AsyncClient, "__init__", __init__):
+        yield router
@@ -0,0 +1,100 @@
+"""Measurements taken inside the process serving the load.
+
+- LoopLagMonitor samples event-loop lag: how late a short sleep wakes up.
+  Lag is time every request and background task spent waiting behind
+  CPU-bound work on the loop.
+- span_latencies() reads per-stage span durations from the trace collector
+  (content.brief, content.write, claude.complete, pop.request, ...).
+- query_counts() totals the statements recorded by query_stats.
+"""
+
+import asyncio
+import math
+import time
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import Any
+
+from app.core.query_stats import query_stats
+from app.core.tracing import trace_collector
+
+
+def percentile(samples: Iterable[float], pct: float) -> float:
+    """Nearest-rank percentile (0 for no samples)."""
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    rank = math.ceil(pct / 100 * len(ordered)) - 1
+    return ordered[max(0, min(rank, len(ordered) - 1))]
+
+
+def distribution(samples: list[float]) -> dict[str, float]:
+    """Count, p50, p99 and max of a list of samples."""
+    return {
+        "count": len(samples),
+        "p50": round(percentile(samples, 50), 2),
+        "p99": round(percentile(samples, 99), 2),
+        "max": round(max(samples, default=0.0), 2),
+    }
+
+
+class LoopLagMonitor:
+    """Samples event-loop lag on the loop it is started from."""
+
+    def __init__(self, interval: float = 0.05) -> None:
+        self.interval = interval
+        self.samples_ms: list[float] = []
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = time.perf_counter() - start - self.interval
+            self.samples_ms.append(max(0.0, lag) * 1000)
+
+    def summary(self) -> dict[str, float]:
+        return distribution(self.samples_ms)
+
+
+def span_latencies() -> dict[str, dict[str, float]]:
+    """Duration distribution (ms) per span name over every recorded trace."""
+    snapshot = trace_collector.snapshot()
+    durations: defaultdict[str, list[float]] = defaultdict(list)
+    for summary in snapshot["active"] + snapshot["recent"]:
+        trace = trace_collector.get(summary["trace_id"])
+        if trace is None:
+            continue
+        for span in list(trace.spans):
+            if span.end_perf is not None:
+                durations[span.name].append(span.duration_ms)
+    return {
+        name: distribution(samples)
+        for name, samples in sorted(durations.items(), key=lambda item: -sum(item[1]))
+    }
+
+
+def query_counts(top: int = 10) -> dict[str, Any]:
+    """Total statements executed and the most expensive fingerprints."""
+    fingerprints = query_stats.snapshot(top=0)["total_fingerprints"]
+    statements = query_stats.snapshot(top=fingerprints)["statements"]
+    return {
+        "total_queries": sum(s["count"] for s in statements),
+        "total_ms": round(sum(s["total_ms"] for s in statements), 2),
+        "top_statements": [
+            {
+                key: s[key]
+                for key in ("statement", "count", "total_ms", "p50_ms", "p99_ms")
+            }
+            for s in statements[:top]
+        ],
+    }
@@ -0,0 +1,348 @@
+"""Serve the app in-process against local fakes and drive projects through it.
+
+The app runs under uvicorn on a local port with the real lifespan, so
+background tasks, client singletons, the POP task poller and the DB pool
+behave as in production. Every external API is served by the fakes in
+loadtest.fakes. The driver runs in its own thread and event loop, so the
+loop lag measured here comes from the app alone.
+
+The database is real: DATABASE_URL must point at a scratch Postgres
+(migrated with `alembic upgrade head`, or pass --create-schema).
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from loadtest.driver import STAGES, ProjectRun, drive
+from loadtest.fakes import (
+    SERVICES,
+    FakeRouter,
+    FaultProfile,
+    build_fakes,
+    fake_environment,
+    route_httpx,
+)
+from loadtest.metrics import (
+    LoopLagMonitor,
+    distribution,
+    query_counts,
+    span_latencies,
+)
+
+
+def default_profiles() -> dict[str, FaultProfile]:
+    """Typical production latencies per service, without injected failures."""
+    return {
+        "crawl4ai": FaultProfile(latency_ms=1500, jitter_ms=500),
+        "claude": FaultProfile(latency_ms=2000, jitter_ms=1000),
+        "dataforseo": FaultProfile(latency_ms=800, jitter_ms=300),
+        "pop": FaultProfile(latency_ms=400, jitter_ms=150),
+        "serpapi": FaultProfile(latency_ms=1000, jitter_ms=300),
+        "perplexity": FaultProfile(latency_ms=3000, jitter_ms=1000),
+    }
+
+
+def build_report(
+    runs: Sequence[ProjectRun],
+    wall_seconds: float,
+    router: FakeRouter,
+    lag: LoopLagMonitor,
+    config: dict[str, Any],
+) -> dict[str, Any]:
+    """Collect throughput, stage latency, DB, loop lag and fake API stats."""
+    completed = [run for run in runs if run.succeeded]
+    pages_completed = sum(run.pages for run in completed)
+    pages_total = sum(run.pages for run in runs)
+    minutes = wall_seconds / 60 if wall_seconds > 0 else 0.0
+    queries = query_counts()
+    return {
+        "config": config,
+        "throughput": {
+            "wall_seconds": round(wall_seconds, 2),
+            "projects": len(runs),
+            "projects_completed": len(completed),
+            "projects_failed": len(runs) - len(completed),
+            "projects_per_minute": round(len(completed) / minutes, 3) if minutes else 0,
+            "pages_per_minute": round(pages_completed / minutes, 2) if minutes else 0,
+        },
+        "stages_seconds": {
+            stage: distribution(
+                [run.stage_seconds[stage] for run in runs if stage in run.stage_seconds]
+            )
+            for stage in STAGES
+        },
+        "spans_ms": span_latencies(),
+        "database": {
+            **queries,
+            "queries_per_project": round(queries["total_queries"] / max(len(runs), 1)),
+            "queries_per_page": round(queries["total_queries"] / max(pages_total, 1)),
+        },
+        "event_loop_lag_ms": lag.summary(),
+        "fakes": router.stats(),
+        "failures": [
+            {"project": run.index, "stage": run.failed_stage, "error": run.error}
+            for run in runs
+            if not run.succeeded
+        ],
+    }
+
+
+def _distribution_table(title: str, rows: dict[str, dict[str, float]]) -> list[str]:
+    lines = [f"{title:40} {'count':>6} {'p50':>9} {'p99':>9} {'max':>9}"]
+    for name, dist in rows.items():
+        lines.append(
+            f"{name:40} {dist['count']:>6} {dist['p50']:>9}"
+            f" {dist['p99']:>9} {dist['max']:>9}"
+        )
+    return lines
+
+
+def format_report(report: dict[str, Any]) -> str:
+    """Render the report as aligned text tables."""
+    throughput = report["throughput"]
+    lines = [
+        f"{throughput['projects_completed']}/{throughput['projects']} projects"
+        f" in {throughput['wall_seconds']:.1f}s"
+        f" ({throughput['projects_per_minute']} projects/min,"
+        f" {throughput['pages_per_minute']} pages/min)",
+        "",
+        *_distribution_table("stage (s)", report["stages_seconds"]),
+        "",
+        *_distribution_table("span (ms)", report["spans_ms"]),
+    ]
+
+    database = report["database"]
+    lag = report["event_loop_lag_ms"]
+    lines += [
+        "",
+        f"DB queries: {database['total_queries']} total,"
+        f" {database['queries_per_project']}/project,"
+        f" {database['queries_per_page']}/page,"
+        f" {database['total_ms']:.0f}ms in the database",
+    ]
+    for statement in database["top_statements"][:5]:
+        lines.append(
+            f"  {statement['count']:>7}x {statement['total_ms']:>10.0f}ms"
+            f"  {statement['statement'][:90]}"
+        )
+    lines += [
+        "",
+        f"Event loop lag (ms): p50 {lag['p50']}, p99 {lag['p99']}, max {lag['max']}"
+        f" over {lag['count']} samples",
+        "",
+        f"{'fake API':12} {'requests':>9} {'503s':>6} {'429s':>6}",
+    ]
+    for name, stats in report["fakes"]["services"].items():
+        lines.append(
+            f"{name:12} {stats['requests']:>9} {stats['errors']:>6}"
+            f" {stats['rate_limited']:>6}"
+        )
+    if report["fakes"]["unrouted_hosts"]:
+        lines.append(f"Blocked hosts: {report['fakes']['unrouted_hosts']}")
+    for failure in report["failures"]:
+        lines.append(
+            f"FAILED project {failure['project']} at {failure['stage']}:"
+            f" {failure['error']}"
+        )
+    return "\n".join(lines)
+
+
+async def _create_schema() -> None:
+    from app.core.database import Base, db_manager
+
+    async with db_manager.engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+
+async def run_load(
+    args: argparse.Namespace, profiles: dict[str, FaultProfile]
+) -> dict[str, Any]:
+    """Start the app, drive the projects and build the report."""
+    import uvicorn
+
+    from app.core.query_stats import query_stats
+    from app.core.tracing import trace_collector
+    from app.main import app
+
+    router = build_fakes(
+        profiles, seed=args.seed, pop_task_seconds=args.pop_task_seconds
+    )
+    with route_httpx(router):
+        server = uvicorn.Server(
+            uvicorn.Config(app, host="127.0.0.1", port=args.port, log_level="warning")
+        )
+        serving = asyncio.create_task(server.serve())
+        while not server.started:
+            if serving.done():
+                serving.result()
+                raise RuntimeError("Server exited during startup")
+            await asyncio.sleep(0.05)
+        port = server.servers[0].sockets[0].getsockname()[1]
+
+        try:
+            if args.create_schema:
+                await _create_schema()
+            query_stats.reset()
+            trace_collector.reset()
+
+            lag = LoopLagMonitor()
+            lag.start()
+            start = time.perf_counter()
+            runs = await asyncio.to_thread(
+                asyncio.run,
+                drive(
+                    f"http://127.0.0.1:{port}",
+                    args.projects,
+                    args.pages,
+                    ramp_seconds=args.ramp_seconds,
+                    poll_interval=args.poll_interval,
+                    stage_timeout=args.stage_timeout,
+                ),
+            )
+            wall_seconds = time.perf_counter() - start
+            await lag.stop()
+
+            config = {
+                "projects": args.projects,
+                "pages_per_project": args.pages,
+                "ramp_seconds": args.ramp_seconds,
+                "settings": dict(args.set),
+                "pop_task_seconds": args.pop_task_seconds,
+            }
+            return build_report(runs, wall_seconds, router, lag, config)
+        finally:
+            server.should_exit = True
+            await serving
+            await router.close()
+
+
+def _setting(value: str) -> tuple[str, str]:
+    key, sep, setting = value.partition("=")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"Expected NAME=VALUE, got {value!r}")
+    return key.strip().lower(), setting
+
+
+def _fault(value: str) -> tuple[str, str]:
+    service, sep, spec = value.partition(":")
+    names = [s.name for s in SERVICES]
+    if not sep or service not in names:
+        raise argparse.ArgumentTypeError(
+            f"Expected SERVICE:key=value,... with SERVICE one of {', '.join(names)}"
+        )
+    return service, spec
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m loadtest",
+        description="Run concurrent projects through the onboarding flow against "
+        "local fakes of every external API.",
+    )
+    parser.add_argument("--projects", type=int, default=4, help="concurrent projects")
+    parser.add_argument("--pages", type=int, default=20, help="pages per project")
+    parser.add_argument(
+        "--ramp-seconds",
+        type=float,
+        default=0.0,
+        help="spread project starts over this many seconds",
+    )
+    parser.add_argument(
+        "--set",
+        type=_setting,
+        action="append",
+        default=[],
+        metavar="SETTING=VALUE",
+        help="override an app setting, e.g. content_generation_concurrency=5",
+    )
+    parser.add_argument(
+        "--fault",
+        type=_fault,
+        action="append",
+        default=[],
+        metavar="SERVICE:KEY=VALUE,...",
+        help="per-service latency_ms, jitter_ms, error_rate, rate_limit_rate "
+        "or retry_after_s, e.g. claude:latency_ms=4000,rate_limit_rate=0.05",
+    )
+    parser.add_argument(
+        "--latency-scale",
+        type=float,
+        default=1.0,
+        help="multiply every default latency (0 removes them)",
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="503 rate for every service"
+    )
+    parser.add_argument(
+        "--rate-limit-rate",
+        type=float,
+        default=0.0,
+        help="429 rate for every service",
+    )
+    parser.add_argument(
+        "--pop-task-seconds",
+        type=float,
+        default=5.0,
+        help="time a POP task stays pending before its result is ready",
+    )
+    parser.add_argument("--poll-interval", type=float, default=1.0)
+    parser.add_argument("--stage-timeout", type=float, default=1800.0)
+    parser.add_argument("--port", type=int, default=0, help="0 picks a free port")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--create-schema",
+        action="store_true",
+        help="create tables from the models before running (scratch databases)",
+    )
+    parser.add_argument("--log-level", default="ERROR")
+    parser.add_argument("--json", type=Path, help="also write the report to this file")
+    args = parser.parse_args(argv)
+
+    if not os.environ.get("DATABASE_URL"):
+        parser.error("DATABASE_URL must point at a scratch Postgres database")
+
+    from app.core.config import Settings, get_settings
+
+    unknown = [key for key, _ in args.set if key not in Settings.model_fields]
+    if unknown:
+        parser.error(f"Unknown settings: {', '.join(unknown)}")
+
+    profiles = default_profiles()
+    for profile in profiles.values():
+        profile.latency_ms *= args.latency_scale
+        profile.jitter_ms *= args.latency_scale
+        profile.error_rate = args.error_rate
+        profile.rate_limit_rate = args.rate_limit_rate
+    for service, spec in args.fault:
+        profiles[service].update(spec)
+
+    os.environ.update(fake_environment())
+    os.environ.update(
+        {
+            "AUTH_REQUIRED": "false",
+            "DB_QUERY_STATS_ENABLED": "true",
+            "TRACING_ENABLED": "true",
+            # Keep every project's traces for the span percentiles
+            "TRACING_MAX_TRACES": str(args.projects * 4 + 50),
+            "LOG_LEVEL": args.log_level,
+        }
+    )
+    os.environ.update({key.upper(): value for key, value in args.set})
+    get_settings.cache_clear()
+
+    report = asyncio.run(run_load(args, profiles))
+    print(format_report(report))
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2, default=str) + "\n")
+
+    if report["failures"]:
+        print(f"{len(report['failures'])} project(s) failed", file=sys.stderr)
+        return 1
+    return 0
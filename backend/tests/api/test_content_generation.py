@@ -216,6 +216,30 @@ class TestContentGenerationStatus:
         assert data["pages_failed"] == 0
         assert data["pages"] == []
 
+    @pytest.mark.asyncio
+    async def test_etag_returns_not_modified(
+        self, async_client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        """Returns 304 when If-None-Match matches the current ETag."""
+        from app.models.project import Project
+
+        project = Project(
+            name="ETag Status Test",
+            site_url="https://etag-status.example.com",
+        )
+        db_session.add(project)
+        await db_session.commit()
+        await db_session.refresh(project)
+
+        url = f"/api/v1/projects/{project.id}/content-generation-status"
+        first = await async_client.get(url)
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+
+        second = await async_client.get(url, headers={"If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.headers["etag"] == etag
+
     @pytest.mark.asyncio
     async def test_returns_status_with_pages(
         self, async_client: AsyncClient, db_session: AsyncSession
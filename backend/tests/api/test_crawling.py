@@ -389,6 +389,69 @@ class TestCrawlStatus:
         assert data["progress"]["completed"] == 2
         assert data["progress"]["failed"] == 1
 
+    @pytest.mark.asyncio
+    async def test_crawl_status_etag_not_modified(
+        self,
+        async_client_with_crawl4ai: tuple[AsyncClient, MockCrawl4AIClient],
+        db_session: AsyncSession,
+    ) -> None:
+        """Should return 304 for a matching If-None-Match until pages change."""
+        client, _mock_crawl = async_client_with_crawl4ai
+        project = await create_test_project(client, "Crawl Status ETag Test")
+        project_id = project["id"]
+        await create_crawled_page(
+            db_session,
+            project_id,
+            "https://example.com/etag",
+            CrawlStatus.PENDING.value,
+        )
+
+        url = f"/api/v1/projects/{project_id}/crawl-status"
+        first = await client.get(url)
+        etag = first.headers["etag"]
+
+        unchanged = await client.get(url, headers={"If-None-Match": etag})
+        assert unchanged.status_code == 304
+
+        await create_crawled_page(
+            db_session,
+            project_id,
+            "https://example.com/etag-2",
+            CrawlStatus.COMPLETED.value,
+        )
+        changed = await client.get(url, headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.json()["progress"]["total"] == 2
+
+    @pytest.mark.asyncio
+    async def test_crawl_status_delta_since_cursor(
+        self,
+        async_client_with_crawl4ai: tuple[AsyncClient, MockCrawl4AIClient],
+        db_session: AsyncSession,
+    ) -> None:
+        """Should only return pages changed after the cursor, with full counts."""
+        client, _mock_crawl = async_client_with_crawl4ai
+        project = await create_test_project(client, "Crawl Status Delta Test")
+        project_id = project["id"]
+        await create_crawled_page(
+            db_session,
+            project_id,
+            "https://example.com/delta",
+            CrawlStatus.COMPLETED.value,
+        )
+
+        url = f"/api/v1/projects/{project_id}/crawl-status"
+        full = (await client.get(url)).json()
+        assert full["is_delta"] is False
+        assert full["cursor"] is not None
+
+        # A cursor well past the overlap window returns no pages
+        response = await client.get(url, params={"since": "2999-01-01T00:00:00Z"})
+        data = response.json()
+        assert data["is_delta"] is True
+        assert data["pages"] == []
+        assert data["progress"]["total"] == 1
+
     @pytest.mark.asyncio
     async def test_crawl_status_crawling_when_pending(
         self,
@@ -532,6 +595,67 @@ class TestCrawlStatus:
         assert response.status_code == 404
 
 
+class TestCrawlStatusQueries:
+    """Tests for get_crawl_status label counting and delta deletions."""
+
+    @staticmethod
+    async def _status(db: AsyncSession, project_id: str, since: Any = None) -> Any:
+        from fastapi import Response
+        from starlette.requests import Request
+
+        from app.api.v1.projects import get_crawl_status
+
+        request = Request({"type": "http", "method": "GET", "headers": []})
+        return await get_crawl_status(
+            project_id, request, Response(), batch=None, since=since, db=db
+        )
+
+    @pytest.fixture
+    async def project_id(self, db_session: AsyncSession) -> str:
+        project = Project(name="Status Queries", site_url="https://example.com")
+        db_session.add(project)
+        await db_session.commit()
+        return project.id
+
+    @pytest.mark.asyncio
+    async def test_json_null_labels_count_as_unlabeled(
+        self, db_session: AsyncSession, project_id: str
+    ) -> None:
+        """Pages whose labels are JSON null are still waiting for labels."""
+        page = await create_crawled_page(
+            db_session,
+            project_id,
+            "https://example.com/null-labels",
+            CrawlStatus.COMPLETED.value,
+        )
+        page.labels = None
+        await db_session.commit()
+
+        assert (await self._status(db_session, project_id)).status == "labeling"
+
+    @pytest.mark.asyncio
+    async def test_delta_lists_current_page_ids(
+        self, db_session: AsyncSession, project_id: str
+    ) -> None:
+        """Delta responses list every current page so deletions are visible."""
+        kept = await create_crawled_page(
+            db_session, project_id, "https://example.com/kept"
+        )
+        deleted = await create_crawled_page(
+            db_session, project_id, "https://example.com/deleted"
+        )
+        full = await self._status(db_session, project_id)
+        assert full.page_ids is None
+
+        await db_session.delete(deleted)
+        await db_session.commit()
+
+        delta = await self._status(db_session, project_id, since=full.cursor)
+        assert delta.is_delta is True
+        assert delta.page_ids == [kept.id]
+        assert delta.progress.total == 1
+
+
 # ---------------------------------------------------------------------------
 # Test Pages Endpoint
 # ---------------------------------------------------------------------------
@@ -0,0 +1,157 @@
+"""Tests for the onboarding batch summary endpoint.
+
+Tests cover:
+- GROUP BY batch counts match the per-page computation they replaced
+- Batches whose pages have no keyword or content rows count as zero
+- Pages outside onboarding, or with no batch, are ignored
+- A project with no batches returns an empty list
+"""
+
+import uuid
+from typing import Any
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.api.v1.projects import list_onboarding_batches
+from app.models.crawled_page import CrawledPage
+from app.models.page_content import PageContent
+from app.models.page_keywords import PageKeywords
+from app.models.project import Project
+
+
+@pytest.fixture
+async def project(db_session: AsyncSession) -> Project:
+    """Create a test project."""
+    project = Project(
+        name=f"Batch Test {uuid.uuid4().hex[:8]}",
+        site_url="https://batches.example.com",
+    )
+    db_session.add(project)
+    await db_session.flush()
+    return project
+
+
+async def _add_page(
+    db: AsyncSession,
+    project: Project,
+    batch: int | None,
+    status: str = "completed",
+    keyword: str | None = None,
+    approved: bool | None = None,
+    source: str = "onboarding",
+) -> None:
+    page = CrawledPage(
+        project_id=project.id,
+        normalized_url=f"https://batches.example.com/{uuid.uuid4().hex}",
+        source=source,
+        status=status,
+        onboarding_batch=batch,
+    )
+    db.add(page)
+    await db.flush()
+    if keyword is not None:
+        db.add(PageKeywords(crawled_page_id=page.id, primary_keyword=keyword))
+    if approved is not None:
+        db.add(PageContent(crawled_page_id=page.id, is_approved=approved))
+    await db.flush()
+
+
+async def _per_page_summaries(
+    db: AsyncSession, project_id: str
+) -> list[dict[str, Any]]:
+    """The previous implementation: load every page and aggregate in Python."""
+    pages = (
+        (
+            await db.execute(
+                select(CrawledPage)
+                .where(
+                    CrawledPage.project_id == project_id,
+                    CrawledPage.source == "onboarding",
+                    CrawledPage.onboarding_batch.isnot(None),
+                )
+                .options(
+                    selectinload(CrawledPage.keywords),
+                    selectinload(CrawledPage.page_content),
+                )
+            )
+        )
+        .scalars()
+        .all()
+    )
+    batches: dict[int, list[CrawledPage]] = {}
+    for page in pages:
+        batches.setdefault(page.onboarding_batch, []).append(page)
+
+    summaries = []
+    for batch_num in sorted(batches):
+        batch_pages = batches[batch_num]
+        if not all(p.status == "completed" for p in batch_pages):
+            pipeline_status = "crawling"
+        elif not all(p.keywords and p.keywords.primary_keyword for p in batch_pages):
+            pipeline_status = "keywords"
+        elif not all(
+            p.page_content and p.page_content.is_approved for p in batch_pages
+        ):
+            pipeline_status = "content"
+        else:
+            pipeline_status = "complete"
+        summaries.append(
+            {
+                "batch": batch_num,
+                "total_pages": len(batch_pages),
+                "completed_pages": sum(
+                    1
+                    for p in batch_pages
+                    if p.page_content and p.page_content.is_approved
+                ),
+                "pipeline_status": pipeline_status,
+                "created_at": min(p.created_at for p in batch_pages).isoformat(),
+            }
+        )
+    return summaries
+
+
+class TestListOnboardingBatches:
+    async def test_matches_per_page_computation(
+        self, db_session: AsyncSession, project: Project
+    ) -> None:
+        # Batch 1: every page has keywords and approved content
+        for _ in range(2):
+            await _add_page(db_session, project, 1, keyword="dog beds", approved=True)
+        # Batch 2: one page has an empty keyword, one unapproved content
+        await _add_page(db_session, project, 2, keyword="cat toys", approved=True)
+        await _add_page(db_session, project, 2, keyword="", approved=False)
+        # Batch 3: keywords done, content partly approved
+        await _add_page(db_session, project, 3, keyword="leashes", approved=True)
+        await _add_page(db_session, project, 3, keyword="collars", approved=False)
+        # Batch 4: still crawling
+        await _add_page(db_session, project, 4, status="pending")
+        await _add_page(db_session, project, 4, keyword="bowls", approved=True)
+        # Batch 5: crawled, but no keyword or content rows at all
+        await _add_page(db_session, project, 5)
+        # Ignored: no batch, or not an onboarding page
+        await _add_page(db_session, project, None, keyword="x", approved=True)
+        await _add_page(db_session, project, 1, source="cluster", status="pending")
+
+        summaries = await list_onboarding_batches(project.id, db=db_session)
+
+        assert summaries == await _per_page_summaries(db_session, project.id)
+        assert [(s["batch"], s["pipeline_status"]) for s in summaries] == [
+            (1, "complete"),
+            (2, "keywords"),
+            (3, "content"),
+            (4, "crawling"),
+            (5, "keywords"),
+        ]
+        assert [s["completed_pages"] for s in summaries] == [2, 1, 1, 1, 0]
+        assert [s["total_pages"] for s in summaries] == [2, 2, 2, 2, 1]
+
+    async def test_project_without_batches_is_empty(
+        self, db_session: AsyncSession, project: Project
+    ) -> None:
+        await _add_page(db_session, project, None)
+
+        assert await list_onboarding_batches(project.id, db=db_session) == []
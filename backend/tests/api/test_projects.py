@@ -163,6 +163,62 @@ class TestListProjects:
         assert "Project Alpha" in names
         assert "Project Beta" in names
 
+    @pytest.mark.asyncio
+    async def test_list_projects_keyset_pagination(self, async_client: AsyncClient) -> None:
+        """Should page through all projects with next_cursor, without duplicates."""
+        for name in ("Page A", "Page B", "Page C"):
+            created = await async_client.post(
+                "/api/v1/projects",
+                json={"name": name, "site_url": "https://pages.example.com"},
+            )
+            assert created.status_code == 201
+
+        full = (await async_client.get("/api/v1/projects?sort=name&order=asc")).json()
+        expected_ids = [p["id"] for p in full["items"]]
+
+        seen_ids: list[str] = []
+        cursor = None
+        while True:
+            params = {"sort": "name", "order": "asc", "limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = await async_client.get("/api/v1/projects", params=params)
+            assert response.status_code == 200
+            page = response.json()
+            assert page["total"] == full["total"]
+            assert len(page["items"]) <= 2
+            seen_ids.extend(p["id"] for p in page["items"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen_ids == expected_ids
+
+    @pytest.mark.asyncio
+    async def test_list_projects_invalid_cursor(self, async_client: AsyncClient) -> None:
+        """Should return 400 for a malformed cursor."""
+        response = await async_client.get(
+            "/api/v1/projects", params={"limit": 2, "cursor": "not-a-cursor"}
+        )
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_list_projects_includes_computed_fields(
+        self, async_client: AsyncClient
+    ) -> None:
+        """Computed fields come from the aggregated list query."""
+        created = await async_client.post(
+            "/api/v1/projects",
+            json={"name": "Counts Project", "site_url": "https://counts.example.com"},
+        )
+        project_id = created.json()["id"]
+
+        data = (await async_client.get("/api/v1/projects")).json()
+        item = next(p for p in data["items"] if p["id"] == project_id)
+        assert item["has_brand_config"] is False
+        assert item["uploaded_files_count"] == 0
+        assert item["brand_config_status"] == "pending"
+
 
 class TestCreateProject:
     """Tests for POST /api/v1/projects endpoint."""
@@ -2284,3 +2340,69 @@ class TestTogglePriority:
         assert data["ai_reasoning"] == "Good keyword match"
         assert data["search_volume"] == 5000
         assert data["difficulty_score"] == 35
+
+
+class TestProjectListCacheInvalidation:
+    """Writes to list-affecting models invalidate the cached list pages."""
+
+    @staticmethod
+    def _version() -> int:
+        from app.services import project as project_service
+
+        return project_service._list_cache_version
+
+    @pytest.mark.asyncio
+    async def test_orm_writes_invalidate(self, db_session: Any) -> None:
+        from app.models.project import Project
+
+        before = self._version()
+        project = Project(name="Cache A", site_url="https://cache.example.com")
+        db_session.add(project)
+        await db_session.flush()
+        assert self._version() > before
+
+        before = self._version()
+        project.name = "Cache A2"
+        await db_session.flush()
+        assert self._version() > before
+
+        # Invalidated again once the transaction ends
+        before = self._version()
+        await db_session.rollback()
+        assert self._version() == before + 1
+        await db_session.rollback()
+        assert self._version() == before + 1
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_invalidates(self, db_session: Any) -> None:
+        from sqlalchemy import update
+
+        from app.models.project import Project
+
+        before = self._version()
+        await db_session.execute(
+            update(Project).where(Project.id == str(uuid.uuid4())).values(name="x")
+        )
+        assert self._version() > before
+
+    @pytest.mark.asyncio
+    async def test_unrelated_writes_do_not_invalidate(self, db_session: Any) -> None:
+        from sqlalchemy import select
+
+        from app.models.crawled_page import CrawledPage
+        from app.models.project import Project
+
+        project = Project(name="Cache B", site_url="https://cache.example.com")
+        db_session.add(project)
+        await db_session.commit()
+
+        before = self._version()
+        await db_session.execute(select(Project))
+        db_session.add(
+            CrawledPage(
+                project_id=project.id,
+                normalized_url="https://cache.example.com/a",
+            )
+        )
+        await db_session.commit()
+        assert self._version() == before
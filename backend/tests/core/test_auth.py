@@ -0,0 +1,137 @@
+"""Tests for session validation caching in the auth dependency.
+
+Tests the auth module:
+- Validated sessions are served from cache without re-querying
+- Unknown and expired sessions are negatively cached, briefly
+- Cache entries never outlive the session's expiresAt
+- invalidate_session forces a fresh lookup
+"""
+
+import time
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.core import auth
+from app.core.auth import SessionCache, UserInfo, get_current_user, invalidate_session
+
+USER = UserInfo(id="u1", email="u1@example.com", name="User One")
+
+
+def _request(session_id: str) -> Request:
+    headers = [(b"authorization", f"Bearer {session_id}".encode())]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+@pytest.fixture(autouse=True)
+def _settings():
+    settings = MagicMock(
+        auth_required=True,
+        auth_session_cache_ttl_seconds=60.0,
+        auth_session_negative_ttl_seconds=5.0,
+        auth_session_cache_max_entries=100,
+        auth_session_cache_redis=False,
+    )
+    auth._session_cache = None
+    with patch("app.core.auth.get_settings", return_value=settings):
+        yield settings
+    auth._session_cache = None
+
+
+class TestGetCurrentUserCache:
+    @pytest.mark.asyncio
+    async def test_valid_session_cached(self) -> None:
+        expires = datetime.now(UTC) + timedelta(hours=1)
+        lookup = AsyncMock(return_value=(USER, expires))
+        with patch("app.core.auth._lookup_session", lookup):
+            assert await get_current_user(_request("s1")) == USER
+            assert await get_current_user(_request("s1")) == USER
+        assert lookup.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_session_negatively_cached(self) -> None:
+        lookup = AsyncMock(return_value=None)
+        with patch("app.core.auth._lookup_session", lookup):
+            for _ in range(3):
+                with pytest.raises(HTTPException) as exc_info:
+                    await get_current_user(_request("missing"))
+                assert exc_info.value.status_code == 401
+        assert lookup.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_session_negatively_cached(self) -> None:
+        expired = datetime.now(UTC) - timedelta(seconds=1)
+        lookup = AsyncMock(return_value=(USER, expired))
+        with patch("app.core.auth._lookup_session", lookup):
+            for _ in range(2):
+                with pytest.raises(HTTPException) as exc_info:
+                    await get_current_user(_request("old"))
+                assert exc_info.value.detail == "Session expired"
+        assert lookup.await_count == 1
+        entry = auth.get_session_cache().get("old")
+        assert entry is not None
+        assert entry.user is None
+
+    @pytest.mark.asyncio
+    async def test_negative_entry_expires_after_negative_ttl(
+        self, _settings: MagicMock
+    ) -> None:
+        _settings.auth_session_negative_ttl_seconds = 0.01
+        expires = datetime.now(UTC) + timedelta(hours=1)
+        lookup = AsyncMock(side_effect=[None, (USER, expires)])
+        with patch("app.core.auth._lookup_session", lookup):
+            with pytest.raises(HTTPException):
+                await get_current_user(_request("new"))
+            time.sleep(0.02)
+            # A session created right after the miss is accepted promptly
+            assert await get_current_user(_request("new")) == USER
+        assert lookup.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_session_forces_lookup(self) -> None:
+        expires = datetime.now(UTC) + timedelta(hours=1)
+        lookup = AsyncMock(return_value=(USER, expires))
+        with patch("app.core.auth._lookup_session", lookup):
+            await get_current_user(_request("s2"))
+            await invalidate_session("s2")
+            await get_current_user(_request("s2"))
+        assert lookup.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_auth_disabled_skips_lookup(self, _settings: MagicMock) -> None:
+        _settings.auth_required = False
+        lookup = AsyncMock()
+        with patch("app.core.auth._lookup_session", lookup):
+            user = await get_current_user(_request("anything"))
+        assert user.id == "dev-user"
+        lookup.assert_not_awaited()
+
+
+class TestSessionCache:
+    def test_ttl_capped_by_session_expiry(self) -> None:
+        cache = SessionCache(max_entries=10)
+        soon = datetime.now(UTC) + timedelta(seconds=2)
+        cache.put("s", USER, soon, ttl=60)
+        entry = cache.get("s")
+        assert entry is not None
+        assert entry.cache_expires_at - time.monotonic() <= 2
+
+    def test_already_expired_session_not_cached(self) -> None:
+        cache = SessionCache(max_entries=10)
+        expired = datetime.now(UTC) - timedelta(seconds=1)
+        cache.put("s", USER, expired, ttl=60)
+        assert cache.get("s") is None
+        # Negative entries for expired sessions are kept for their own TTL
+        cache.put("s", None, expired, ttl=5)
+        assert cache.get("s") is not None
+
+    def test_lru_eviction(self) -> None:
+        cache = SessionCache(max_entries=2)
+        for sid in ("a", "b", "c"):
+            cache.put(sid, USER, None, ttl=60)
+        assert cache.get("a") is None
+        assert cache.get("c") is not None
+        assert len(cache) == 2
@@ -0,0 +1,51 @@
+"""Tests for status polling helpers (ETag and delta cursors)."""
+
+from datetime import UTC, datetime
+
+from starlette.requests import Request
+
+from app.core.polling import DELTA_OVERLAP, delta_floor, latest, make_etag, not_modified
+
+
+def _request(if_none_match: str | None = None) -> Request:
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+class TestMakeEtag:
+    def test_stable_and_weak(self) -> None:
+        assert make_etag("a", 1, None) == make_etag("a", 1, None)
+        assert make_etag("a", 1).startswith('W/"')
+
+    def test_changes_with_parts(self) -> None:
+        assert make_etag("a", 1) != make_etag("a", 2)
+
+
+class TestNotModified:
+    def test_no_header(self) -> None:
+        assert not_modified(_request(), make_etag("x")) is None
+
+    def test_matching_header_returns_304(self) -> None:
+        etag = make_etag("x")
+        response = not_modified(_request(f'"other", {etag}'), etag)
+        assert response is not None
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+
+    def test_mismatch(self) -> None:
+        assert not_modified(_request('W/"stale"'), make_etag("x")) is None
+
+
+class TestDeltaHelpers:
+    def test_delta_floor_applies_overlap(self) -> None:
+        since = datetime(2026, 1, 1, tzinfo=UTC)
+        assert delta_floor(since) == since - DELTA_OVERLAP
+        assert delta_floor(None) is None
+
+    def test_latest_ignores_none(self) -> None:
+        a = datetime(2026, 1, 1, tzinfo=UTC)
+        b = datetime(2026, 1, 2, tzinfo=UTC)
+        assert latest(None, a, b, None) == b
+        assert latest(None) is None
@@ -0,0 +1,139 @@
+"""Tests for WebSocket outbound queues and fan-out.
+
+Tests the websocket module:
+- OutboundQueue coalesces keyed messages and drops oldest coalescable on overflow
+- Broadcasts only enqueue, so a stalled client never delays other subscribers
+- Progress updates for the same crawl coalesce to the latest state
+- Overflowing clients are disconnected and counted in backpressure stats
+"""
+
+import asyncio
+import json
+from typing import Any
+
+import pytest
+
+from app.core.websocket import ConnectionManager, OutboundQueue
+
+
+class FakeWebSocket:
+    """Minimal stand-in for a Starlette WebSocket."""
+
+    def __init__(self, stalled: bool = False) -> None:
+        self.sent: list[dict[str, Any]] = []
+        self.closed = False
+        self._release = asyncio.Event()
+        if not stalled:
+            self._release.set()
+        self.client = None
+
+    async def accept(self) -> None:
+        return None
+
+    async def send_text(self, data: str) -> None:
+        await self._release.wait()
+        self.sent.append(json.loads(data))
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        self.closed = True
+
+    def release(self) -> None:
+        self._release.set()
+
+
+async def _subscribe(
+    manager: ConnectionManager, ws: FakeWebSocket, project_id: str
+) -> str:
+    conn = await manager.connect(ws)  # type: ignore[arg-type]
+    manager._subscribe_connection(conn.connection_id, project_id)
+    return conn.connection_id
+
+
+class TestOutboundQueue:
+    """Test queue coalescing and overflow policy."""
+
+    @pytest.mark.asyncio
+    async def test_coalesces_same_key_in_place(self) -> None:
+        queue = OutboundQueue(maxsize=10)
+        queue.put({"n": 1}, coalesce_key="progress:p:c")
+        queue.put({"other": True})
+        queue.put({"n": 2}, coalesce_key="progress:p:c")
+
+        assert len(queue) == 2
+        assert queue.coalesced == 1
+        assert await queue.get() == {"n": 2}
+        assert await queue.get() == {"other": True}
+
+    @pytest.mark.asyncio
+    async def test_overflow_drops_oldest_coalescable(self) -> None:
+        queue = OutboundQueue(maxsize=2)
+        queue.put({"event": "a"})
+        queue.put({"n": 1}, coalesce_key="k1")
+        assert queue.put({"event": "b"}) is True
+
+        assert queue.dropped == 1
+        assert await queue.get() == {"event": "a"}
+        assert await queue.get() == {"event": "b"}
+
+    def test_overflow_without_coalescable_rejects(self) -> None:
+        queue = OutboundQueue(maxsize=1)
+        queue.put({"event": "a"})
+        assert queue.put({"event": "b"}) is False
+        assert queue.dropped == 1
+        assert queue.max_depth == 1
+
+
+class TestFanOut:
+    """Test broadcast fan-out through per-connection writers."""
+
+    @pytest.mark.asyncio
+    async def test_stalled_client_does_not_block_others(self) -> None:
+        manager = ConnectionManager()
+        slow = FakeWebSocket(stalled=True)
+        fast = FakeWebSocket()
+        await _subscribe(manager, slow, "p1")
+        await _subscribe(manager, fast, "p1")
+
+        queued = await asyncio.wait_for(
+            manager.broadcast_project_update("p1", "status_changed", {"s": 1}),
+            timeout=1.0,
+        )
+        await manager.flush(timeout=0.2)
+
+        assert queued == 2
+        assert any(m["type"] == "project_update" for m in fast.sent)
+        assert slow.sent == []
+
+        slow.release()
+        await manager.flush(timeout=1.0)
+        assert any(m["type"] == "project_update" for m in slow.sent)
+
+    @pytest.mark.asyncio
+    async def test_progress_updates_coalesce_for_slow_client(self) -> None:
+        manager = ConnectionManager()
+        ws = FakeWebSocket(stalled=True)
+        await _subscribe(manager, ws, "p1")
+
+        for i in range(5):
+            await manager.broadcast_progress_update("p1", "c1", {"done": i})
+        ws.release()
+        await manager.flush(timeout=1.0)
+
+        progress = [m for m in ws.sent if m["type"] == "progress_update"]
+        assert [m["progress"]["done"] for m in progress] == [4]
+        assert manager.backpressure_stats()["coalesced"] == 4
+
+    @pytest.mark.asyncio
+    async def test_overflowing_client_is_disconnected(self) -> None:
+        manager = ConnectionManager()
+        manager.OUTBOUND_QUEUE_SIZE = 3
+        ws = FakeWebSocket(stalled=True)
+        conn_id = await _subscribe(manager, ws, "p1")
+
+        for i in range(5):
+            await manager.broadcast_project_update("p1", "event", {"i": i})
+
+        assert conn_id not in manager._connections
+        assert ws.closed is True
+        assert manager.backpressure_stats()["overflow_disconnects"] == 1
+        assert "p1" not in manager._project_connections
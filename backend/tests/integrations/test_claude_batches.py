@@ -0,0 +1,264 @@
+"""Unit tests for ClaudeClient Message Batches mode.
+
+Tests cover:
+- Submit, poll and result download map back to per-item results and callbacks
+- Errored and expired batch items become unsuccessful results
+- Large request lists are split into several batches
+- Batches that do not end within max_wait are canceled
+- Server errors on batch calls are retried, honoring Retry-After
+
+Uses a local fake of the Message Batches API (httpx.MockTransport).
+"""
+
+import json
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.integrations import claude
+from app.integrations.claude import (
+    ANTHROPIC_API_URL,
+    BatchRequest,
+    ClaudeClient,
+    ClaudeError,
+    CompletionResult,
+    _parse_retry_after,
+)
+
+
+class FakeBatchAPI:
+    """In-memory Message Batches endpoint."""
+
+    def __init__(self, polls_until_ended: int = 1, never_end: bool = False) -> None:
+        self.polls_until_ended = polls_until_ended
+        self.never_end = never_end
+        self.batches: dict[str, dict[str, Any]] = {}
+        self.canceled: list[str] = []
+        self.fail_next_submit_with: int | None = None
+
+    def result_for(self, custom_id: str, params: dict[str, Any]) -> dict[str, Any]:
+        if custom_id.startswith("bad"):
+            return {
+                "type": "errored",
+                "error": {
+                    "type": "error",
+                    "error": {"type": "invalid_request_error", "message": "too long"},
+                },
+            }
+        if custom_id.startswith("late"):
+            return {"type": "expired"}
+        prompt = params["messages"][0]["content"]
+        return {
+            "type": "succeeded",
+            "message": {
+                "id": f"msg_{custom_id}",
+                "model": params["model"],
+                "content": [{"type": "text", "text": prompt.upper()}],
+                "stop_reason": "end_turn",
+                "usage": {"input_tokens": 3, "output_tokens": 5},
+            },
+        }
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if request.method == "POST" and path == "/v1/messages/batches":
+            if self.fail_next_submit_with is not None:
+                status, self.fail_next_submit_with = self.fail_next_submit_with, None
+                return httpx.Response(status)
+            batch_id = f"msgbatch_{len(self.batches)}"
+            self.batches[batch_id] = {
+                "requests": json.loads(request.content)["requests"],
+                "polls": 0,
+            }
+            return httpx.Response(
+                200, json={"id": batch_id, "processing_status": "in_progress"}
+            )
+
+        batch_id = path.split("/")[4]
+        batch = self.batches[batch_id]
+        if path.endswith("/cancel"):
+            self.canceled.append(batch_id)
+            return httpx.Response(200, json={"id": batch_id})
+        if path.endswith("/results"):
+            lines = [
+                json.dumps(
+                    {
+                        "custom_id": item["custom_id"],
+                        "result": self.result_for(item["custom_id"], item["params"]),
+                    }
+                )
+                for item in batch["requests"]
+            ]
+            return httpx.Response(200, text="\n".join(lines))
+
+        batch["polls"] += 1
+        ended = not self.never_end and batch["polls"] >= self.polls_until_ended
+        return httpx.Response(
+            200,
+            json={
+                "id": batch_id,
+                "processing_status": "ended" if ended else "in_progress",
+                "request_counts": {"succeeded": len(batch["requests"])},
+                "results_url": (
+                    f"{ANTHROPIC_API_URL}/v1/messages/batches/{batch_id}/results"
+                    if ended
+                    else None
+                ),
+            },
+        )
+
+
+def _client(api: FakeBatchAPI) -> ClaudeClient:
+    client = ClaudeClient(api_key="test-key", retry_delay=0.01)
+    client._client = httpx.AsyncClient(
+        base_url=ANTHROPIC_API_URL, transport=httpx.MockTransport(api.handler)
+    )
+    return client
+
+
+class TestCompleteBatch:
+    async def test_results_map_back_to_items_and_callbacks(self) -> None:
+        api = FakeBatchAPI(polls_until_ended=3)
+        client = _client(api)
+        seen: list[str] = []
+
+        async def on_result(custom_id: str, result: CompletionResult) -> None:
+            seen.append(custom_id)
+
+        results = await client.complete_batch(
+            [
+                BatchRequest(custom_id="a", user_prompt="hello", system_prompt="sys"),
+                BatchRequest(custom_id="bad-1", user_prompt="x" * 10),
+                BatchRequest(custom_id="late-1", user_prompt="slow"),
+            ],
+            on_result,
+            poll_interval=0,
+        )
+        await client.close()
+
+        assert sorted(seen) == ["a", "bad-1", "late-1"]
+        assert results["a"].success is True
+        assert results["a"].text == "HELLO"
+        assert results["a"].output_tokens == 5
+        assert results["bad-1"].success is False
+        assert "too long" in (results["bad-1"].error or "")
+        assert results["late-1"].error == "Batch request expired"
+
+        (batch,) = api.batches.values()
+        assert batch["polls"] == 3
+        params = batch["requests"][0]["params"]
+        assert params["system"] == "sys"
+        assert params["model"] == client.model
+
+    async def test_splits_requests_into_batches(self) -> None:
+        api = FakeBatchAPI()
+        client = _client(api)
+        requests = [
+            BatchRequest(custom_id=f"r{i}", user_prompt=f"p{i}") for i in range(5)
+        ]
+
+        with patch.object(claude, "MESSAGE_BATCH_MAX_REQUESTS", 2):
+            results = await client.complete_batch(requests, poll_interval=0)
+        await client.close()
+
+        assert [len(b["requests"]) for b in api.batches.values()] == [2, 2, 1]
+        assert {cid: r.text for cid, r in results.items()} == {
+            f"r{i}": f"P{i}" for i in range(5)
+        }
+
+    async def test_unfinished_batch_is_canceled(self) -> None:
+        api = FakeBatchAPI(never_end=True)
+        client = _client(api)
+
+        results = await client.complete_batch(
+            [BatchRequest(custom_id="a", user_prompt="hello")],
+            poll_interval=0.01,
+            max_wait=0,
+        )
+        await client.close()
+
+        assert api.canceled == ["msgbatch_0"]
+        assert results["a"].success is False
+        assert "did not finish" in (results["a"].error or "")
+
+    async def test_server_error_on_submit_is_retried(self) -> None:
+        api = FakeBatchAPI()
+        api.fail_next_submit_with = 529
+        client = _client(api)
+
+        with patch(
+            "app.integrations.claude.asyncio.sleep", new_callable=AsyncMock
+        ) as sleep:
+            results = await client.complete_batch(
+                [BatchRequest(custom_id="a", user_prompt="hi")], poll_interval=0
+            )
+        await client.close()
+
+        assert results["a"].text == "HI"
+        sleep.assert_any_await(0.01)
+
+
+class TestBatchRetries:
+    def _client(self, responses: list[httpx.Response]) -> tuple[ClaudeClient, list]:
+        calls: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return responses[min(len(calls), len(responses)) - 1]
+
+        client = ClaudeClient(api_key="test-key", max_retries=2, retry_delay=0.01)
+        client._client = httpx.AsyncClient(
+            base_url=ANTHROPIC_API_URL, transport=httpx.MockTransport(handler)
+        )
+        return client, calls
+
+    async def test_max_retries_counts_retries_not_attempts(self) -> None:
+        client, calls = self._client([httpx.Response(503)])
+
+        with (
+            patch("app.integrations.claude.asyncio.sleep", new_callable=AsyncMock),
+            pytest.raises(ClaudeError) as exc_info,
+        ):
+            await client._batch_api_request("GET", "/v1/messages/batches/x")
+        await client.close()
+
+        assert exc_info.value.status_code == 503
+        assert len(calls) == 3
+
+    async def test_retry_after_header_sets_delay(self) -> None:
+        retry_at = datetime.now(UTC) + timedelta(seconds=30)
+        client, _ = self._client(
+            [
+                httpx.Response(429, headers={"retry-after": "7"}),
+                httpx.Response(429, headers={"retry-after": format_datetime(retry_at)}),
+                httpx.Response(529, headers={"retry-after": "soon"}),
+                httpx.Response(200, json={"id": "x"}),
+            ]
+        )
+        client._max_retries = 3
+
+        with patch(
+            "app.integrations.claude.asyncio.sleep", new_callable=AsyncMock
+        ) as sleep:
+            response = await client._batch_api_request("GET", "/v1/messages/batches/x")
+        await client.close()
+
+        assert response.status_code == 200
+        delays = [call.args[0] for call in sleep.await_args_list]
+        assert delays[0] == 7.0
+        assert 25 < delays[1] <= 30
+        # Malformed header falls back to exponential backoff
+        assert delays[2] == 0.01 * 2**2
+
+    def test_parse_retry_after(self) -> None:
+        past = format_datetime(datetime.now(UTC) - timedelta(minutes=5))
+        assert _parse_retry_after(None) is None
+        assert _parse_retry_after("") is None
+        assert _parse_retry_after("garbage") is None
+        assert _parse_retry_after("nan") is None
+        assert _parse_retry_after("1.5") == 1.5
+        assert _parse_retry_after(past) == 0.0
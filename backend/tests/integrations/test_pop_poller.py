@@ -0,0 +1,176 @@
+"""Tests for the multiplexed POP task poller.
+
+Tests POPTaskPoller behavior:
+- Many outstanding tasks are resolved by one shared runner
+- Pending tasks back off adaptively
+- The global request budget caps status requests
+- 429 responses pause the poller instead of failing the task
+- Timeouts raise POPTimeoutError
+"""
+
+import asyncio
+from collections import Counter
+
+import pytest
+
+from app.integrations.pop import (
+    POPTaskPoller,
+    POPTaskResult,
+    POPTaskStatus,
+    POPTimeoutError,
+)
+
+
+class FakeStatusSource:
+    """Returns PENDING for the first N polls of each task, then SUCCESS."""
+
+    def __init__(self, pending_polls: int = 2) -> None:
+        self.pending_polls = pending_polls
+        self.calls: Counter[str] = Counter()
+        self.rate_limit_next = 0
+
+    async def __call__(self, task_id: str) -> POPTaskResult:
+        self.calls[task_id] += 1
+        if self.rate_limit_next > 0:
+            self.rate_limit_next -= 1
+            return POPTaskResult(
+                success=False,
+                task_id=task_id,
+                error="Rate limit exceeded",
+                rate_limited=True,
+                retry_after=0.02,
+            )
+        if self.calls[task_id] <= self.pending_polls:
+            return POPTaskResult(
+                success=True, task_id=task_id, status=POPTaskStatus.PROCESSING
+            )
+        return POPTaskResult(
+            success=True,
+            task_id=task_id,
+            status=POPTaskStatus.SUCCESS,
+            data={"task": task_id},
+        )
+
+
+def _make_poller(
+    source: FakeStatusSource,
+    requests_per_second: float = 0,
+    timeout: float = 5.0,
+    backoff_factor: float = 1.0,
+) -> POPTaskPoller:
+    return POPTaskPoller(
+        fetch_status=source,
+        poll_interval=0.01,
+        timeout=timeout,
+        max_interval=0.05,
+        backoff_factor=backoff_factor,
+        requests_per_second=requests_per_second,
+        max_concurrency=10,
+    )
+
+
+class TestPOPTaskPoller:
+    """Test shared polling of outstanding POP tasks."""
+
+    @pytest.mark.asyncio
+    async def test_resolves_many_tasks_with_one_runner(self) -> None:
+        source = FakeStatusSource(pending_polls=2)
+        poller = _make_poller(source)
+
+        results = await asyncio.gather(
+            *(poller.wait_for(f"task-{i}") for i in range(25))
+        )
+
+        assert all(r.status == POPTaskStatus.SUCCESS for r in results)
+        assert [r.data["task"] for r in results] == [f"task-{i}" for i in range(25)]
+        assert all(count == 3 for count in source.calls.values())
+        assert poller.outstanding == 0
+
+    @pytest.mark.asyncio
+    async def test_duplicate_waiters_share_one_registration(self) -> None:
+        source = FakeStatusSource(pending_polls=1)
+        poller = _make_poller(source)
+
+        first, second = await asyncio.gather(
+            poller.wait_for("same"), poller.wait_for("same")
+        )
+
+        assert first is second
+        assert source.calls["same"] == 2
+
+    @pytest.mark.asyncio
+    async def test_backoff_grows_interval_up_to_max(self) -> None:
+        source = FakeStatusSource(pending_polls=3)
+        poller = _make_poller(source, backoff_factor=2.0)
+
+        await poller.wait_for("slow")
+
+        # 0.01 → 0.02 → 0.04 → capped 0.05; four polls total
+        assert source.calls["slow"] == 4
+
+    @pytest.mark.asyncio
+    async def test_request_budget_limits_poll_rate(self) -> None:
+        source = FakeStatusSource(pending_polls=0)
+        poller = _make_poller(source, requests_per_second=50)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await asyncio.gather(*(poller.wait_for(f"t{i}") for i in range(100)))
+        elapsed = loop.time() - start
+
+        # Burst of 50, then 50 more at 50/s ≈ 1s
+        assert elapsed >= 0.8
+        assert poller.stats()["total_polls"] == 100
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_pauses_instead_of_failing(self) -> None:
+        source = FakeStatusSource(pending_polls=0)
+        source.rate_limit_next = 2
+        poller = _make_poller(source)
+
+        result = await poller.wait_for("limited")
+
+        assert result.success is True
+        assert result.status == POPTaskStatus.SUCCESS
+        assert poller.stats()["rate_limited_polls"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_poll_resolves_with_error_result(self) -> None:
+        async def failing(task_id: str) -> POPTaskResult:
+            return POPTaskResult(success=False, task_id=task_id, error="boom")
+
+        poller = POPTaskPoller(
+            fetch_status=failing,
+            poll_interval=0.01,
+            timeout=1.0,
+            max_interval=0.05,
+            backoff_factor=1.5,
+            requests_per_second=0,
+            max_concurrency=5,
+        )
+
+        result = await poller.wait_for("bad")
+
+        assert result.success is False
+        assert result.error == "boom"
+
+    @pytest.mark.asyncio
+    async def test_timeout_raises(self) -> None:
+        source = FakeStatusSource(pending_polls=10_000)
+        poller = _make_poller(source, timeout=0.1)
+
+        with pytest.raises(POPTimeoutError):
+            await poller.wait_for("never")
+        assert poller.outstanding == 0
+
+    @pytest.mark.asyncio
+    async def test_close_fails_outstanding_waiters(self) -> None:
+        source = FakeStatusSource(pending_polls=10_000)
+        poller = _make_poller(source)
+
+        waiter = asyncio.create_task(poller.wait_for("open"))
+        await asyncio.sleep(0.03)
+        await poller.close()
+
+        with pytest.raises(Exception, match="closed"):
+            await waiter
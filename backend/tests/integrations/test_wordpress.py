@@ -0,0 +1,96 @@
+"""Unit tests for the WordPress REST client.
+
+Tests cover:
+- Pagination fetches every page reported by X-WP-TotalPages, in page order
+- Remaining pages are fetched concurrently under WP_PAGE_CONCURRENCY
+- Retry on 429 honors Retry-After
+
+Uses httpx.MockTransport in place of a WordPress site.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import httpx
+
+from app.integrations import wordpress
+from app.integrations.wordpress import WordPressClient
+
+
+def _post(post_id: int, title: str) -> dict:
+    return {
+        "id": post_id,
+        "title": {"rendered": title},
+        "content": {"rendered": "<p>one two</p>"},
+        "link": f"https://blog.test/{post_id}",
+    }
+
+
+def _client(handler) -> WordPressClient:
+    client = WordPressClient("https://blog.test", "user", "pass")
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+class TestPagination:
+    async def test_fetches_all_pages_concurrently_in_order(self) -> None:
+        in_flight = {"now": 0, "max": 0}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            page = int(request.url.params["page"])
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            # Later pages answer first to check results stay in page order
+            await asyncio.sleep(0.01 * (6 - page))
+            in_flight["now"] -= 1
+            return httpx.Response(
+                200,
+                json=[_post(page * 10 + i, f"Post {page}-{i}") for i in range(2)],
+                headers={"X-WP-TotalPages": "5"},
+            )
+
+        client = _client(handler)
+        with patch.object(wordpress, "WP_PAGE_CONCURRENCY", 2):
+            posts, total = await client.fetch_all_posts()
+        await client.close()
+
+        assert total == 10
+        assert [p.id for p in posts] == [10, 11, 20, 21, 30, 31, 40, 41, 50, 51]
+        assert in_flight["max"] == 2
+
+    async def test_multi_term_filter_applies_client_side(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert "search" not in request.url.params
+            return httpx.Response(
+                200,
+                json=[_post(1, "Best Coffee"), _post(2, "Tea Guide"), _post(3, "Misc")],
+                headers={"X-WP-TotalPages": "1"},
+            )
+
+        client = _client(handler)
+        posts, total = await client.fetch_all_posts(title_filter=["coffee", "tea"])
+        await client.close()
+
+        assert total == 3
+        assert [p.id for p in posts] == [1, 2]
+
+
+class TestRetry:
+    async def test_429_honors_retry_after(self) -> None:
+        calls = {"n": 0}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls["n"] += 1
+            if calls["n"] == 1:
+                return httpx.Response(429, headers={"Retry-After": "7"})
+            return httpx.Response(200, json=[], headers={"X-WP-TotalPages": "1"})
+
+        client = _client(handler)
+        with patch(
+            "app.integrations.wordpress.asyncio.sleep", new_callable=AsyncMock
+        ) as sleep:
+            posts, _ = await client.fetch_all_posts()
+        await client.close()
+
+        assert posts == []
+        sleep.assert_awaited_once_with(7.0)
@@ -0,0 +1,265 @@
+"""Tests for the reddit_project_counters triggers from migration 0038.
+
+The triggers are PL/pgSQL, so these tests need a PostgreSQL database: set
+TEST_POSTGRES_URL (postgresql+asyncpg://...) to run them. Each run works in
+a throwaway schema.
+
+Tests cover:
+- Counters match COUNT(*) after single-row and multi-row inserts
+- Status updates move comments in and out of the draft count
+- Deletes, including cascades from a post, decrement the counters
+- Deleting a project removes its counter row without errors
+"""
+
+import importlib.util
+import os
+import uuid
+from collections.abc import AsyncGenerator
+from datetime import UTC, datetime
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+from sqlalchemy import delete, func, insert, select, text, update
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+from app.core.database import Base
+from app.models.project import Project
+from app.models.reddit_comment import RedditComment
+from app.models.reddit_post import RedditPost
+from app.models.reddit_project_counter import RedditProjectCounter
+
+POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+
+pytestmark = pytest.mark.skipif(
+    not POSTGRES_URL, reason="TEST_POSTGRES_URL is not set (needs PostgreSQL)"
+)
+
+TABLES = ["projects", "reddit_accounts", "reddit_posts", "reddit_comments"]
+
+
+def _load_migration() -> ModuleType:
+    path = (
+        Path(__file__).parents[2]
+        / "alembic"
+        / "versions"
+        / "0038_create_reddit_project_counters.py"
+    )
+    spec = importlib.util.spec_from_file_location("migration_0038", path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+async def pg_conn() -> AsyncGenerator[AsyncConnection, None]:
+    """Connection to a fresh schema with the Reddit tables and 0038 triggers."""
+    assert POSTGRES_URL is not None
+    schema = f"counters_{uuid.uuid4().hex[:8]}"
+    engine = create_async_engine(POSTGRES_URL)
+    migration = _load_migration()
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text(f"CREATE SCHEMA {schema}"))
+            await conn.execute(text(f"SET search_path TO {schema}"))
+            await conn.run_sync(
+                lambda sync_conn: Base.metadata.create_all(
+                    sync_conn,
+                    tables=[
+                        Base.metadata.tables[name]
+                        for name in [*TABLES, "reddit_project_counters"]
+                    ],
+                )
+            )
+            # conftest strips now() server defaults from the shared metadata
+            # for SQLite; the triggers rely on this one
+            await conn.execute(
+                text(
+                    "ALTER TABLE reddit_project_counters "
+                    "ALTER COLUMN updated_at SET DEFAULT now()"
+                )
+            )
+            await conn.execute(text(migration.POSTS_FUNCTION))
+            await conn.execute(text(migration.COMMENTS_FUNCTION))
+            for trigger in migration.TRIGGERS:
+                await conn.execute(text(trigger))
+            await conn.commit()
+            try:
+                yield conn
+            finally:
+                await conn.rollback()
+                await conn.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+                await conn.commit()
+    finally:
+        await engine.dispose()
+
+
+async def _add_project(conn: AsyncConnection) -> str:
+    project_id = str(uuid.uuid4())
+    await conn.execute(
+        insert(Project).values(
+            id=project_id, name="Counters", site_url="https://c.example.com"
+        )
+    )
+    return project_id
+
+
+async def _add_posts(conn: AsyncConnection, project_id: str, count: int) -> list[str]:
+    ids = [str(uuid.uuid4()) for _ in range(count)]
+    await conn.execute(
+        insert(RedditPost).values(
+            [
+                {
+                    "id": post_id,
+                    "project_id": project_id,
+                    "subreddit": "r/test",
+                    "title": "Post",
+                    "url": f"https://reddit.com/r/test/{post_id}",
+                    "discovered_at": datetime.now(UTC),
+                }
+                for post_id in ids
+            ]
+        )
+    )
+    return ids
+
+
+async def _add_comments(
+    conn: AsyncConnection, project_id: str, post_id: str, statuses: list[str]
+) -> list[str]:
+    ids = [str(uuid.uuid4()) for _ in statuses]
+    await conn.execute(
+        insert(RedditComment).values(
+            [
+                {
+                    "id": comment_id,
+                    "post_id": post_id,
+                    "project_id": project_id,
+                    "body": "Comment",
+                    "original_body": "Comment",
+                    "status": status,
+                }
+                for comment_id, status in zip(ids, statuses, strict=True)
+            ]
+        )
+    )
+    return ids
+
+
+async def _expected(conn: AsyncConnection, project_id: str) -> dict[str, Any]:
+    async def count(stmt: Any) -> int:
+        return (await conn.execute(stmt)).scalar_one()
+
+    comments = select(func.count()).where(RedditComment.project_id == project_id)
+    return {
+        "post_count": await count(
+            select(func.count()).where(RedditPost.project_id == project_id)
+        ),
+        "comment_count": await count(comments),
+        "draft_count": await count(comments.where(RedditComment.status == "draft")),
+    }
+
+
+async def _counters(conn: AsyncConnection, project_id: str) -> dict[str, Any] | None:
+    row = (
+        await conn.execute(
+            select(
+                RedditProjectCounter.post_count,
+                RedditProjectCounter.comment_count,
+                RedditProjectCounter.draft_count,
+            ).where(RedditProjectCounter.project_id == project_id)
+        )
+    ).one_or_none()
+    return dict(row._mapping) if row is not None else None
+
+
+async def _assert_counters_match(conn: AsyncConnection, project_id: str) -> None:
+    assert await _counters(conn, project_id) == await _expected(conn, project_id)
+
+
+class TestRedditProjectCounterTriggers:
+    async def test_inserts_are_counted(self, pg_conn: AsyncConnection) -> None:
+        project_id = await _add_project(pg_conn)
+        other_id = await _add_project(pg_conn)
+
+        post_ids = await _add_posts(pg_conn, project_id, 3)
+        await _add_posts(pg_conn, other_id, 1)
+        await _add_comments(pg_conn, project_id, post_ids[0], ["draft", "approved"])
+        await _add_comments(pg_conn, project_id, post_ids[1], ["draft"])
+
+        assert await _counters(pg_conn, project_id) == {
+            "post_count": 3,
+            "comment_count": 3,
+            "draft_count": 2,
+        }
+        await _assert_counters_match(pg_conn, project_id)
+        await _assert_counters_match(pg_conn, other_id)
+
+    async def test_status_updates_move_draft_count(
+        self, pg_conn: AsyncConnection
+    ) -> None:
+        project_id = await _add_project(pg_conn)
+        (post_id,) = await _add_posts(pg_conn, project_id, 1)
+        comment_ids = await _add_comments(
+            pg_conn, project_id, post_id, ["draft", "draft", "draft"]
+        )
+
+        await pg_conn.execute(
+            update(RedditComment)
+            .where(RedditComment.id.in_(comment_ids[:2]))
+            .values(status="approved")
+        )
+        await _assert_counters_match(pg_conn, project_id)
+
+        await pg_conn.execute(
+            update(RedditComment)
+            .where(RedditComment.id == comment_ids[0])
+            .values(status="draft")
+        )
+        # Updates that leave the status alone change nothing
+        await pg_conn.execute(
+            update(RedditComment)
+            .where(RedditComment.project_id == project_id)
+            .values(body="Edited")
+        )
+
+        assert (await _counters(pg_conn, project_id) or {})["draft_count"] == 2
+        await _assert_counters_match(pg_conn, project_id)
+
+    async def test_deletes_and_cascades_decrement(
+        self, pg_conn: AsyncConnection
+    ) -> None:
+        project_id = await _add_project(pg_conn)
+        post_ids = await _add_posts(pg_conn, project_id, 3)
+        comment_ids = await _add_comments(
+            pg_conn, project_id, post_ids[0], ["draft", "approved"]
+        )
+        await _add_comments(pg_conn, project_id, post_ids[1], ["draft", "draft"])
+
+        await pg_conn.execute(
+            delete(RedditComment).where(RedditComment.id == comment_ids[0])
+        )
+        await _assert_counters_match(pg_conn, project_id)
+
+        # Deleting a post cascades to its comments
+        await pg_conn.execute(delete(RedditPost).where(RedditPost.id == post_ids[1]))
+
+        assert await _counters(pg_conn, project_id) == {
+            "post_count": 2,
+            "comment_count": 1,
+            "draft_count": 0,
+        }
+        await _assert_counters_match(pg_conn, project_id)
+
+    async def test_project_delete_drops_counter_row(
+        self, pg_conn: AsyncConnection
+    ) -> None:
+        project_id = await _add_project(pg_conn)
+        (post_id,) = await _add_posts(pg_conn, project_id, 1)
+        await _add_comments(pg_conn, project_id, post_id, ["draft"])
+
+        await pg_conn.execute(delete(Project).where(Project.id == project_id))
+
+        assert await _counters(pg_conn, project_id) is None
@@ -0,0 +1,162 @@
+"""Tests for the precompiled bible trigger matcher.
+
+Tests the bible_matcher module:
+- Aho-Corasick and reverse-index matching agree with the naive
+  bidirectional substring scan
+- Minimum trigger length and bible ordering are preserved
+- Compiled matchers are reused by content and rebuilt when triggers change
+- Per-project cache entries are invalidated explicitly, and bible writes
+  invalidate them only once their transaction commits
+"""
+
+import random
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.bible_matcher import (
+    BibleMatcher,
+    clear_matcher_caches,
+    get_compiled_matcher,
+    get_project_matcher,
+    invalidate_project_matcher,
+    invalidate_project_matcher_on_commit,
+    set_project_matcher,
+)
+from app.services.content_generation import _match_bibles_substring
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    clear_matcher_caches()
+    yield
+    clear_matcher_caches()
+
+
+def _naive_positions(
+    trigger_lists: list[list[str]], keywords: list[str], min_len: int = 1
+) -> list[int]:
+    matched = []
+    for position, triggers in enumerate(trigger_lists):
+        for trigger in triggers:
+            t = trigger.strip().lower()
+            if not t or len(t) < min_len:
+                continue
+            if any(t in kw or kw in t for kw in keywords):
+                matched.append(position)
+                break
+    return matched
+
+
+class TestBibleMatcher:
+    def test_trigger_in_keyword(self) -> None:
+        matcher = BibleMatcher([["tattoo"], ["piercing"]])
+        assert matcher.match_positions(["best tattoo aftercare"]) == [0]
+
+    def test_keyword_in_trigger(self) -> None:
+        matcher = BibleMatcher([["tattoo aftercare lotion"], ["piercing"]])
+        assert matcher.match_positions(["aftercare"]) == [0]
+
+    def test_case_and_whitespace_normalized(self) -> None:
+        matcher = BibleMatcher([["  Tattoo  "]])
+        assert matcher.match_positions(["tattoo ink"]) == [0]
+
+    def test_min_trigger_length(self) -> None:
+        matcher = BibleMatcher([["ink"], ["uv"]], min_trigger_length=3)
+        assert matcher.match_positions(["uv ink lamp"]) == [0]
+
+    def test_empty_keyword_matches_every_bible_with_triggers(self) -> None:
+        matcher = BibleMatcher([["a"], [], ["b"]])
+        assert matcher.match_positions([""]) == [0, 2]
+
+    def test_shared_trigger_matches_all_owners_in_order(self) -> None:
+        matcher = BibleMatcher([["ink"], ["other"], ["ink", "needle"]])
+        assert matcher.match_positions(["ink cartridges"]) == [0, 2]
+        assert matcher.trigger_count == 3
+
+    def test_no_triggers(self) -> None:
+        assert BibleMatcher([[], []]).match_positions(["anything"]) == []
+
+    def test_randomized_equivalence_with_naive_scan(self) -> None:
+        rng = random.Random(1234)
+        alphabet = "abc "
+        for _ in range(200):
+            trigger_lists = [
+                [
+                    "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 5)))
+                    for _ in range(rng.randint(0, 4))
+                ]
+                for _ in range(rng.randint(0, 6))
+            ]
+            keywords = [
+                "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 8))).strip()
+                for _ in range(rng.randint(1, 3))
+            ]
+            for min_len in (1, 3):
+                matcher = BibleMatcher(trigger_lists, min_trigger_length=min_len)
+                assert matcher.match_positions(keywords) == _naive_positions(
+                    trigger_lists, keywords, min_len
+                ), (trigger_lists, keywords, min_len)
+
+
+class TestMatcherCaches:
+    def test_compiled_matcher_reused_for_same_triggers(self) -> None:
+        bibles = [SimpleNamespace(trigger_keywords=["tattoo"])]
+        first = get_compiled_matcher(bibles)
+        again = get_compiled_matcher([SimpleNamespace(trigger_keywords=["tattoo"])])
+        assert first is again
+
+    def test_compiled_matcher_rebuilt_when_triggers_change(self) -> None:
+        bible = SimpleNamespace(trigger_keywords=["tattoo"])
+        first = get_compiled_matcher([bible])
+        bible.trigger_keywords = ["piercing"]
+        second = get_compiled_matcher([bible])
+        assert first is not second
+        assert second.match_positions(["ear piercing"]) == [0]
+
+    def test_project_matcher_invalidation(self) -> None:
+        bibles = [SimpleNamespace(id="b1", trigger_keywords=["tattoo"])]
+        set_project_matcher("p1", bibles)
+        entry = get_project_matcher("p1")
+        assert entry is not None
+        assert entry.bible_ids == ["b1"]
+
+        invalidate_project_matcher("p1")
+        assert get_project_matcher("p1") is None
+
+    async def test_invalidation_waits_for_commit(
+        self, db_session: AsyncSession
+    ) -> None:
+        bibles = [SimpleNamespace(id="b1", trigger_keywords=["tattoo"])]
+        set_project_matcher("p1", bibles)
+
+        invalidate_project_matcher_on_commit(db_session, "p1")
+        assert get_project_matcher("p1") is not None
+
+        await db_session.commit()
+        assert get_project_matcher("p1") is None
+
+    async def test_rollback_keeps_cached_matcher(
+        self, db_session: AsyncSession
+    ) -> None:
+        bibles = [SimpleNamespace(id="b1", trigger_keywords=["tattoo"])]
+        set_project_matcher("p1", bibles)
+
+        # Callers register after their writes, inside an open transaction
+        await db_session.execute(text("SELECT 1"))
+        invalidate_project_matcher_on_commit(db_session, "p1")
+        await db_session.rollback()
+        await db_session.commit()
+
+        assert get_project_matcher("p1") is not None
+
+    def test_substring_matching_returns_bibles_in_order(self) -> None:
+        bibles = [
+            SimpleNamespace(name="A", trigger_keywords=["aftercare"]),
+            SimpleNamespace(name="B", trigger_keywords=["ink"]),
+            SimpleNamespace(name="C", trigger_keywords=["tattoo"]),
+        ]
+        matched = _match_bibles_substring(bibles, "Tattoo Aftercare")
+        assert [b.name for b in matched] == ["A", "C"]
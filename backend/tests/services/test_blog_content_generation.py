@@ -5,9 +5,13 @@ Tests cover:
 - Quality checks: clean content passes, problematic content fails, handles None fields
 - Skip-if-complete logic: already complete posts are skipped
 - Pipeline result aggregation: succeeded/failed/skipped counts
+- Trend research: shared per-keyword cache, single query for concurrent posts,
+  bounded in-process cache
 """
 
+import asyncio
 import json
+from datetime import UTC, datetime, timedelta
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -15,13 +19,15 @@ import pytest
 
 from app.models.blog import BlogPost, ContentStatus
 from app.services.blog_content_generation import (
+    BLOG_CONTENT_FIELDS,
     BLOG_CONTENT_KEYS,
     BlogPipelinePostResult,
     BlogPipelineResult,
     _humanize_content,
     _parse_blog_content_json,
-    _run_blog_quality_checks,
+    clear_trend_cache,
 )
+from app.services.content_quality import QualityResult, run_blog_quality_checks
 
 
 # ---------------------------------------------------------------------------
@@ -46,6 +52,16 @@ def _make_blog_post(**kwargs: Any) -> Any:
     return _FakeBlogPost(**kwargs)
 
 
+def _run_blog_quality_checks(post: Any, brand_config: dict[str, Any]) -> QualityResult:
+    """Gather a post's non-empty fields as the pipeline does and check them."""
+    fields = {
+        name: value
+        for name in BLOG_CONTENT_FIELDS
+        if (value := getattr(post, name, None))
+    }
+    return run_blog_quality_checks(fields, brand_config)
+
+
 # ---------------------------------------------------------------------------
 # _parse_blog_content_json Tests
 # ---------------------------------------------------------------------------
@@ -130,7 +146,7 @@ class TestParseBlogContentJson:
 
 
 # ---------------------------------------------------------------------------
-# _run_blog_quality_checks Tests
+# run_blog_quality_checks Tests
 # ---------------------------------------------------------------------------
 
 
@@ -358,11 +374,14 @@ class TestHumanizeContent:
 class TestPerplexityTrendResearch:
     """Tests for Perplexity trend research integration."""
 
-    @pytest.mark.asyncio
-    async def test_trend_research_returns_data(self) -> None:
-        """Mocked Perplexity returns trend data dict."""
-        from app.services.blog_content_generation import _fetch_trend_context
+    @pytest.fixture(autouse=True)
+    def _clear_trend_cache(self):
+        clear_trend_cache()
+        yield
+        clear_trend_cache()
 
+    @staticmethod
+    def _perplexity_client() -> AsyncMock:
         mock_completion = MagicMock()
         mock_completion.success = True
         mock_completion.text = "Boot care trends: conditioning is up 20% in 2026."
@@ -374,11 +393,18 @@ class TestPerplexityTrendResearch:
         mock_client = AsyncMock()
         mock_client.available = True
         mock_client.research_query = AsyncMock(return_value=mock_completion)
-        mock_client.close = AsyncMock()
+        return mock_client
+
+    @pytest.mark.asyncio
+    async def test_trend_research_returns_data(self) -> None:
+        """Mocked Perplexity returns trend data dict."""
+        from app.services.blog_content_generation import _fetch_trend_context
+
+        mock_client = self._perplexity_client()
 
         with patch(
-            "app.integrations.perplexity.PerplexityClient",
-            return_value=mock_client,
+            "app.integrations.perplexity.get_perplexity",
+            AsyncMock(return_value=mock_client),
         ):
             result = await _fetch_trend_context("boot care", {})
 
@@ -396,11 +422,10 @@ class TestPerplexityTrendResearch:
         mock_client = AsyncMock()
         mock_client.available = True
         mock_client.research_query = AsyncMock(side_effect=RuntimeError("API down"))
-        mock_client.close = AsyncMock()
 
         with patch(
-            "app.integrations.perplexity.PerplexityClient",
-            return_value=mock_client,
+            "app.integrations.perplexity.get_perplexity",
+            AsyncMock(return_value=mock_client),
         ):
             result = await _fetch_trend_context("boot care", {})
 
@@ -415,9 +440,91 @@ class TestPerplexityTrendResearch:
         mock_client.available = False
 
         with patch(
-            "app.integrations.perplexity.PerplexityClient",
-            return_value=mock_client,
+            "app.integrations.perplexity.get_perplexity",
+            AsyncMock(return_value=mock_client),
         ):
             result = await _fetch_trend_context("boot care", {})
 
         assert result is None
+
+    @pytest.mark.asyncio
+    async def test_same_keyword_is_researched_once(self) -> None:
+        """Posts sharing a normalized keyword reuse one Perplexity query."""
+        from app.services.blog_content_generation import _fetch_trend_context
+
+        mock_client = self._perplexity_client()
+
+        with patch(
+            "app.integrations.perplexity.get_perplexity",
+            AsyncMock(return_value=mock_client),
+        ):
+            first, second = await asyncio.gather(
+                _fetch_trend_context("boot care", {}),
+                _fetch_trend_context("Boot  Care", {}),
+            )
+            third = await _fetch_trend_context("boot care ", {})
+
+        assert mock_client.research_query.await_count == 1
+        assert first == second == third
+
+    @pytest.mark.asyncio
+    async def test_failed_research_is_not_cached(self) -> None:
+        """A failed lookup is retried on the next call."""
+        from app.services.blog_content_generation import _fetch_trend_context
+
+        mock_client = self._perplexity_client()
+        ok_result = mock_client.research_query.return_value
+        mock_client.research_query = AsyncMock(
+            side_effect=[RuntimeError("API down"), ok_result]
+        )
+
+        with patch(
+            "app.integrations.perplexity.get_perplexity",
+            AsyncMock(return_value=mock_client),
+        ):
+            assert await _fetch_trend_context("boot care", {}) is None
+            assert await _fetch_trend_context("boot care", {}) is not None
+
+    @pytest.mark.asyncio
+    async def test_fresh_stored_research_is_reused(self) -> None:
+        """A post's saved research for the same keyword skips Perplexity."""
+        from app.services.blog_content_generation import _fetch_trend_context
+
+        mock_client = self._perplexity_client()
+        stored = {
+            "trends": "Stored trends",
+            "citations": [],
+            "fetched_at": datetime.now(UTC).isoformat(),
+            "keyword": "boot care",
+        }
+        stale = {
+            **stored,
+            "fetched_at": (datetime.now(UTC) - timedelta(days=30)).isoformat(),
+        }
+
+        with patch(
+            "app.integrations.perplexity.get_perplexity",
+            AsyncMock(return_value=mock_client),
+        ):
+            reused = await _fetch_trend_context("Boot Care", {}, stored=stored)
+            other = await _fetch_trend_context("boot polish", {}, stored=stored)
+            refreshed = await _fetch_trend_context("boot care", {}, stored=stale)
+
+        assert reused is stored
+        assert other is not stored
+        assert refreshed is not stale
+        assert mock_client.research_query.await_count == 2
+
+    def test_in_process_cache_is_bounded(self) -> None:
+        """Expired entries are pruned and the oldest evicted at the cap."""
+        from app.services import blog_content_generation as blog
+
+        with patch.object(blog, "TREND_CACHE_MAX_ENTRIES", 2):
+            blog._trend_cache_remember("expired", {"trends": "a"}, ttl=-1)
+            blog._trend_cache_remember("first", {"trends": "b"}, ttl=60)
+            blog._trend_cache_remember("second", {"trends": "c"}, ttl=60)
+            assert list(blog._trend_cache) == ["first", "second"]
+
+            blog._trend_cache_remember("third", {"trends": "d"}, ttl=60)
+
+        assert list(blog._trend_cache) == ["second", "third"]
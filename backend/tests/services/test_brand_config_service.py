@@ -3,11 +3,14 @@
 Tests the full brand config generation flow including:
 - Research phase (Perplexity, Crawl4AI, document retrieval)
 - Synthesis phase (sequential Claude calls for 10 sections)
+- Synthesis scheduling (sections start as soon as their dependencies finish)
 - Status tracking throughout generation
 - Graceful handling of external service failures
 """
 
+import asyncio
 import json
+import re
 import uuid
 from typing import Any
 from unittest.mock import MagicMock
@@ -16,11 +19,13 @@ import pytest
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.integrations.claude import CompletionResult
 from app.models.brand_config import BrandConfig
 from app.models.project import Project
 from app.models.project_file import ProjectFile
 from app.services.brand_config import (
     GENERATION_STEPS,
+    SECTION_PROMPTS,
     BrandConfigService,
     GenerationStatus,
     GenerationStatusValue,
@@ -851,6 +856,106 @@ class TestSynthesisPhase:
         assert callback_calls[-1] == ("ai_prompt_snippet", 9)
 
 
+class TimedClaudeClient:
+    """Claude stand-in that records section start/finish order.
+
+    Sections listed in slow_sections take longer, so tests can check that
+    independent sections do not wait for them.
+    """
+
+    model = "test-model"
+    _api_key = "test-key"
+
+    def __init__(self, slow_sections: list[str] | None = None) -> None:
+        self._slow_sections = slow_sections or []
+        self.events: list[tuple[str, str]] = []
+        self.prompts: dict[str, str] = {}
+
+    @property
+    def available(self) -> bool:
+        return True
+
+    async def complete(self, user_prompt: str, **kwargs: Any) -> CompletionResult:
+        match = re.search(r"Generate the (.+) section now", user_prompt)
+        assert match is not None
+        section = match.group(1).replace(" ", "_")
+        self.prompts[section] = user_prompt
+        self.events.append(("start", section))
+        await asyncio.sleep(0.05 if section in self._slow_sections else 0.001)
+        self.events.append(("end", section))
+        return CompletionResult(success=True, text=json.dumps({"section": section}))
+
+
+class TestSynthesisScheduling:
+    """Tests for dependency-driven section scheduling in _synthesis_phase."""
+
+    async def test_section_starts_when_its_dependencies_finish(self) -> None:
+        """voice_characteristics does not wait for unrelated slow sections."""
+        claude = TimedClaudeClient(
+            slow_sections=["trust_elements", "competitor_context"]
+        )
+
+        result = await BrandConfigService._synthesis_phase(
+            project_id="test-project-id",
+            research_context=ResearchContext(perplexity_research="Research..."),
+            claude=claude,  # type: ignore[arg-type]
+        )
+
+        events = claude.events
+        assert events.index(("start", "voice_characteristics")) < events.index(
+            ("end", "trust_elements")
+        )
+        assert events.index(("end", "voice_dimensions")) < events.index(
+            ("start", "voice_characteristics")
+        )
+        # ai_prompt_snippet summarizes everything, so it runs last
+        assert events[-2:] == [
+            ("start", "ai_prompt_snippet"),
+            ("end", "ai_prompt_snippet"),
+        ]
+        assert list(result) == [s for s in GENERATION_STEPS if s in SECTION_PROMPTS]
+
+    async def test_section_context_contains_only_its_dependencies(self) -> None:
+        """Each prompt includes just the sections it depends on."""
+        claude = TimedClaudeClient()
+
+        await BrandConfigService._synthesis_phase(
+            project_id="test-project-id",
+            research_context=ResearchContext(perplexity_research="Research..."),
+            claude=claude,  # type: ignore[arg-type]
+        )
+
+        prompt = claude.prompts["voice_characteristics"]
+        assert "## voice_dimensions" in prompt
+        assert "## brand_foundation" not in prompt
+        first_prompt = claude.prompts["brand_foundation"]
+        assert "Previously Generated Sections" not in first_prompt
+        for section in GENERATION_STEPS:
+            if section in SECTION_PROMPTS and section != "ai_prompt_snippet":
+                assert f"## {section}" in claude.prompts["ai_prompt_snippet"]
+
+    async def test_progress_reported_once_per_section(self) -> None:
+        """The status callback runs once per section with increasing counts."""
+        claude = TimedClaudeClient(slow_sections=["trust_elements"])
+        callback_calls: list[tuple[str, int]] = []
+
+        async def status_callback(step_name: str, step_index: int) -> None:
+            callback_calls.append((step_name, step_index))
+
+        await BrandConfigService._synthesis_phase(
+            project_id="test-project-id",
+            research_context=ResearchContext(perplexity_research="Research..."),
+            claude=claude,  # type: ignore[arg-type]
+            update_status_callback=status_callback,
+        )
+
+        assert len(callback_calls) == len(SECTION_PROMPTS)
+        assert callback_calls[0] == ("brand_foundation", 0)
+        assert callback_calls[-1] == ("ai_prompt_snippet", len(SECTION_PROMPTS) - 1)
+        counts = [index for _, index in callback_calls]
+        assert counts == sorted(counts)
+
+
 class TestStatusUpdates:
     """Tests for generation status tracking."""
 
@@ -0,0 +1,247 @@
+"""Tests for stage scheduling in run_content_pipeline.
+
+Tests cover:
+- A page starts writing as soon as its own brief is ready, without waiting
+  for slower briefs of other pages
+- The write stage is limited by CONTENT_GENERATION_CONCURRENCY while briefs
+  run concurrently
+- Every page is marked generating_brief before any page is admitted
+"""
+
+import asyncio
+import uuid
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import db_manager
+from app.models.crawled_page import CrawledPage
+from app.models.page_content import ContentStatus, PageContent
+from app.models.page_keywords import PageKeywords
+from app.models.project import Project
+from app.services.content_generation import run_content_pipeline
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+async def project(db_session: AsyncSession) -> Project:
+    """Create a test project."""
+    project = Project(
+        name=f"Pipeline Stage Test {uuid.uuid4().hex[:8]}",
+        site_url=f"https://pipeline-stage-{uuid.uuid4().hex[:8]}.example.com",
+    )
+    db_session.add(project)
+    await db_session.commit()
+    await db_session.refresh(project)
+    return project
+
+
+async def _add_approved_page(
+    db: AsyncSession, project: Project, keyword: str
+) -> CrawledPage:
+    page = CrawledPage(
+        project_id=project.id,
+        normalized_url=f"{project.site_url}/{keyword.replace(' ', '-')}",
+        status="completed",
+    )
+    db.add(page)
+    await db.flush()
+    db.add(
+        PageKeywords(
+            crawled_page_id=page.id,
+            primary_keyword=keyword,
+            is_approved=True,
+        )
+    )
+    await db.commit()
+    return page
+
+
+def _outline_result() -> MagicMock:
+    result = MagicMock()
+    result.success = True
+    result.error = None
+    result.outline_json = {"section_details": []}
+    return result
+
+
+def _brief_result() -> MagicMock:
+    result = MagicMock()
+    result.success = True
+    result.content_brief = None
+    result.error = None
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Stage scheduling
+# ---------------------------------------------------------------------------
+
+
+class TestPipelineStages:
+    """Pages flow through brief → write independently."""
+
+    @pytest.mark.asyncio
+    async def test_fast_page_writes_while_slow_brief_pending(
+        self,
+        db_session: AsyncSession,
+        project: Project,
+        mock_db_manager,
+    ) -> None:
+        """A slow POP brief does not hold back writing for other pages."""
+        await _add_approved_page(db_session, project, "slow boots")
+        await _add_approved_page(db_session, project, "fast boots")
+
+        release_slow_brief = asyncio.Event()
+        events: list[tuple[str, str]] = []
+
+        async def fake_fetch_brief(**kwargs: Any) -> MagicMock:
+            if kwargs["keyword"] == "slow boots":
+                await release_slow_brief.wait()
+            events.append(("brief", kwargs["keyword"]))
+            return _brief_result()
+
+        async def fake_generate_outline(**kwargs: Any) -> MagicMock:
+            events.append(("write", kwargs["keyword"]))
+            # With a barrier between briefs and writing this never runs
+            # before the slow brief finishes, and the test times out
+            release_slow_brief.set()
+            return _outline_result()
+
+        with (
+            patch(
+                "app.services.content_generation.fetch_content_brief",
+                side_effect=fake_fetch_brief,
+            ),
+            patch(
+                "app.services.content_generation.generate_outline",
+                side_effect=fake_generate_outline,
+            ),
+            patch("app.services.content_generation._auto_link_planning", AsyncMock()),
+        ):
+            result = await asyncio.wait_for(
+                run_content_pipeline(project_id=project.id, outline_first=True),
+                timeout=5,
+            )
+
+        assert result.succeeded == 2
+        assert events == [
+            ("brief", "fast boots"),
+            ("write", "fast boots"),
+            ("brief", "slow boots"),
+            ("write", "slow boots"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_write_stage_respects_its_limit(
+        self,
+        db_session: AsyncSession,
+        project: Project,
+        mock_db_manager,
+    ) -> None:
+        """Writes never exceed content_generation_concurrency."""
+        for i in range(4):
+            await _add_approved_page(db_session, project, f"boots {i}")
+
+        writes = {"now": 0, "max": 0}
+        briefs = {"now": 0, "max": 0}
+
+        async def fake_fetch_brief(**kwargs: Any) -> MagicMock:
+            briefs["now"] += 1
+            briefs["max"] = max(briefs["max"], briefs["now"])
+            await asyncio.sleep(0.01)
+            briefs["now"] -= 1
+            return _brief_result()
+
+        async def fake_generate_outline(**kwargs: Any) -> MagicMock:
+            writes["now"] += 1
+            writes["max"] = max(writes["max"], writes["now"])
+            await asyncio.sleep(0.01)
+            writes["now"] -= 1
+            return _outline_result()
+
+        settings = MagicMock(
+            content_brief_concurrency=4,
+            content_generation_concurrency=1,
+            content_quality_concurrency=1,
+        )
+        with (
+            patch(
+                "app.services.content_generation.get_settings",
+                return_value=settings,
+            ),
+            patch(
+                "app.services.content_generation.fetch_content_brief",
+                side_effect=fake_fetch_brief,
+            ),
+            patch(
+                "app.services.content_generation.generate_outline",
+                side_effect=fake_generate_outline,
+            ),
+            patch("app.services.content_generation._auto_link_planning", AsyncMock()),
+        ):
+            result = await run_content_pipeline(
+                project_id=project.id, outline_first=True
+            )
+
+        assert result.succeeded == 4
+        assert writes["max"] == 1
+        assert briefs["max"] > 1
+
+    @pytest.mark.asyncio
+    async def test_all_pages_marked_generating_brief_upfront(
+        self,
+        db_session: AsyncSession,
+        project: Project,
+        mock_db_manager,
+    ) -> None:
+        """Pages not yet admitted already report generating_brief."""
+        pages = [
+            await _add_approved_page(db_session, project, f"shoes {i}")
+            for i in range(5)
+        ]
+        seen_statuses: list[list[str]] = []
+
+        async def fake_fetch_brief(**kwargs: Any) -> MagicMock:
+            if not seen_statuses:
+                async with db_manager.session_factory() as db:
+                    rows = await db.execute(
+                        select(PageContent.status).where(
+                            PageContent.crawled_page_id.in_([p.id for p in pages])
+                        )
+                    )
+                    seen_statuses.append(list(rows.scalars()))
+            return _brief_result()
+
+        settings = MagicMock(
+            content_brief_concurrency=1,
+            content_generation_concurrency=1,
+            content_quality_concurrency=1,
+        )
+        with (
+            patch(
+                "app.services.content_generation.get_settings",
+                return_value=settings,
+            ),
+            patch(
+                "app.services.content_generation.fetch_content_brief",
+                side_effect=fake_fetch_brief,
+            ),
+            patch(
+                "app.services.content_generation.generate_outline",
+                return_value=_outline_result(),
+            ),
+            patch("app.services.content_generation._auto_link_planning", AsyncMock()),
+        ):
+            result = await run_content_pipeline(
+                project_id=project.id, outline_first=True
+            )
+
+        assert result.succeeded == 5
+        assert seen_statuses == [[ContentStatus.GENERATING_BRIEF.value] * 5]
@@ -6,10 +6,12 @@ Tests cover:
 - Invalid label rejection
 - Label count validation (2-5 labels per page)
 - Validation helpers
+- Message Batches mode for label assignment, its wait limit and fallback
 
 Note: Tests mock the Claude client to avoid API calls.
 """
 
+import asyncio
 import json
 import uuid
 from typing import Any
@@ -17,7 +19,8 @@ from typing import Any
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.integrations.claude import CompletionResult
+from app.core.config import get_settings
+from app.integrations.claude import BatchRequest, CompletionResult
 from app.models.crawled_page import CrawledPage, CrawlStatus
 from app.models.project import Project
 from app.services.label_taxonomy import (
@@ -26,7 +29,10 @@ from app.services.label_taxonomy import (
     GeneratedTaxonomy,
     LabelTaxonomyService,
     TaxonomyLabel,
+    build_batch_user_prompt,
     get_project_taxonomy_labels,
+    parse_batch_assignments,
+    run_batched_assignment,
     validate_labels,
     validate_page_labels,
 )
@@ -158,6 +164,48 @@ class MockClaudeClient:
             )
 
 
+
+class BatchingClaudeClient(MockClaudeClient):
+    """Mock client that also answers Message Batches."""
+
+    def __init__(self, db: AsyncSession, batch_error: str | None = None) -> None:
+        super().__init__()
+        self._db = db
+        self._batch_error = batch_error
+        self.batch_calls: list[list[BatchRequest]] = []
+        self.max_waits: list[float | None] = []
+        self.in_transaction: list[bool] = []
+
+    async def complete_batch(
+        self, requests: list[BatchRequest], *, max_wait: float | None = None
+    ) -> dict[str, CompletionResult]:
+        self.batch_calls.append(requests)
+        self.max_waits.append(max_wait)
+        self.in_transaction.append(self._db.in_transaction())
+        if self._batch_error:
+            return {
+                request.custom_id: CompletionResult(
+                    success=False, error=self._batch_error
+                )
+                for request in requests
+            }
+        return {
+            request.custom_id: CompletionResult(
+                success=True,
+                text=json.dumps(
+                    {
+                        "assignments": [
+                            {"item": item, "labels": ["blog-post", "about-us"]}
+                            for item in range(
+                                1, request.user_prompt.count("ITEM ") + 1
+                            )
+                        ]
+                    }
+                ),
+            )
+            for request in requests
+        }
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
@@ -747,3 +795,159 @@ class TestValidationResultErrorMessages:
 
         assert result.valid is True
         assert result.error_messages == []
+
+
+class TestBatchedAssignment:
+    """Tests for multi-page batched label assignment helpers."""
+
+    VALID = {"coffee", "tea", "storage"}
+
+    def test_batch_prompt_sends_taxonomy_once(self) -> None:
+        prompt = build_batch_user_prompt(
+            "Assign labels to each page.", "- coffee: Coffee", ["PAGE: a", "PAGE: b"]
+        )
+        assert prompt.count("TAXONOMY:") == 1
+        assert "ITEM 1\nPAGE: a" in prompt
+        assert "ITEM 2\nPAGE: b" in prompt
+
+    def test_parse_keeps_only_valid_items(self) -> None:
+        text = json.dumps(
+            {
+                "assignments": [
+                    {"item": 1, "labels": ["coffee", "tea"]},
+                    {"item": 2, "labels": ["made-up"]},
+                    {"item": 3, "labels": ["Storage "]},
+                    {"item": 9, "labels": ["coffee"]},
+                    {"item": 4, "labels": ["tea"]},
+                    {"item": 4, "labels": ["coffee"]},
+                ]
+            }
+        )
+        results = parse_batch_assignments(f"```json\n{text}\n```", 4, self.VALID)
+        # Item 2 has no valid label, 9 is out of range, 4 is ambiguous
+        assert sorted(results) == [0, 2]
+        assert results[0]["labels"] == ["coffee", "tea"]
+
+    def test_parse_malformed_response_returns_nothing(self) -> None:
+        assert parse_batch_assignments("not json", 2, self.VALID) == {}
+        assert parse_batch_assignments('{"labels": ["coffee"]}', 2, self.VALID) == {}
+
+    async def test_missing_items_retried_individually(self) -> None:
+        batches: list[list[str]] = []
+        singles: list[str] = []
+
+        async def assign_batch(batch: list[str]) -> dict[int, str]:
+            batches.append(batch)
+            # Drop the second item of every batch
+            return {i: f"batch:{item}" for i, item in enumerate(batch) if i != 1}
+
+        async def assign_single(item: str) -> str:
+            singles.append(item)
+            return f"single:{item}"
+
+        results = await run_batched_assignment(
+            ["a", "b", "c", "d", "e"], assign_batch, assign_single, batch_size=3
+        )
+
+        assert batches == [["a", "b", "c"], ["d", "e"]]
+        assert sorted(singles) == ["b", "e"]
+        assert results == ["batch:a", "single:b", "batch:c", "batch:d", "single:e"]
+
+    async def test_failed_batch_falls_back_and_respects_concurrency(self) -> None:
+        in_flight = {"now": 0, "max": 0}
+
+        async def assign_batch(batch: list[int]) -> dict[int, int]:
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            if batch[0] == 0:
+                raise RuntimeError("boom")
+            return dict(enumerate(batch))
+
+        async def assign_single(item: int) -> int:
+            return -item
+
+        results = await run_batched_assignment(
+            list(range(8)), assign_batch, assign_single, batch_size=2, concurrency=2
+        )
+
+        assert results == [0, -1, 2, 3, 4, 5, 6, 7]
+        assert in_flight["max"] == 2
+
+    @staticmethod
+    async def _add_blog_pages(db: AsyncSession, project: Project, count: int) -> None:
+        for i in range(count):
+            db.add(
+                CrawledPage(
+                    id=str(uuid.uuid4()),
+                    project_id=project.id,
+                    normalized_url=f"https://example.com/blog/post-{i}",
+                    status=CrawlStatus.COMPLETED.value,
+                    title=f"Post {i}",
+                )
+            )
+        await db.commit()
+
+    async def test_message_batch_mode_submits_all_batches_at_once(
+        self,
+        db_session: AsyncSession,
+        test_project_with_taxonomy: Project,
+    ) -> None:
+        await self._add_blog_pages(db_session, test_project_with_taxonomy, 3)
+        client = BatchingClaudeClient(db_session)
+        service = LabelTaxonomyService(client)  # type: ignore[arg-type]
+
+        assignments = await service.assign_labels(
+            db_session,
+            test_project_with_taxonomy.id,
+            batch_size=2,
+            use_message_batches=True,
+        )
+
+        assert [a.success for a in assignments] == [True, True, True]
+        # One Message Batch carries the 2-page group; the leftover single
+        # page goes through an interactive request
+        assert [len(call) for call in client.batch_calls] == [1]
+        assert len(client.complete_calls) == 1
+
+    async def test_message_batch_wait_holds_no_transaction(
+        self,
+        db_session: AsyncSession,
+        test_project_with_taxonomy: Project,
+    ) -> None:
+        await self._add_blog_pages(db_session, test_project_with_taxonomy, 2)
+        client = BatchingClaudeClient(db_session)
+        service = LabelTaxonomyService(client)  # type: ignore[arg-type]
+
+        await service.assign_labels(
+            db_session,
+            test_project_with_taxonomy.id,
+            batch_size=2,
+            use_message_batches=True,
+        )
+
+        assert client.in_transaction == [False]
+        assert client.max_waits == [get_settings().label_assignment_batch_max_wait]
+        assert get_settings().label_assignment_batch_max_wait < (
+            get_settings().claude_batch_max_wait
+        )
+
+    async def test_unfinished_message_batch_falls_back_to_interactive(
+        self,
+        db_session: AsyncSession,
+        test_project_with_taxonomy: Project,
+    ) -> None:
+        await self._add_blog_pages(db_session, test_project_with_taxonomy, 2)
+        client = BatchingClaudeClient(db_session, batch_error="Batch canceled")
+        service = LabelTaxonomyService(client)  # type: ignore[arg-type]
+
+        assignments = await service.assign_labels(
+            db_session,
+            test_project_with_taxonomy.id,
+            batch_size=2,
+            use_message_batches=True,
+        )
+
+        assert [a.success for a in assignments] == [True, True]
+        assert len(client.complete_calls) == 2
@@ -0,0 +1,107 @@
+"""Tests for set-based CrawledPage bridging.
+
+Tests cover:
+- Existing pages are reused and missing pages created in bulk
+- Duplicate URLs in one call map to a single CrawledPage
+- Lookups are limited to the given source unless match_any_source is set
+"""
+
+import uuid
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.crawled_page import CrawledPage
+from app.models.project import Project
+from app.services.page_bridge import BridgePage, bridge_crawled_pages
+
+
+@pytest.fixture
+async def project(db_session: AsyncSession) -> Project:
+    """Create a test project."""
+    project = Project(
+        name=f"Bridge Test {uuid.uuid4().hex[:8]}",
+        site_url="https://bridge.example.com",
+    )
+    db_session.add(project)
+    await db_session.flush()
+    return project
+
+
+async def _page_count(db: AsyncSession, project_id: str) -> int:
+    result = await db.execute(
+        select(func.count())
+        .select_from(CrawledPage)
+        .where(CrawledPage.project_id == project_id)
+    )
+    return result.scalar_one()
+
+
+class TestBridgeCrawledPages:
+    """Tests for bridge_crawled_pages."""
+
+    async def test_reuses_existing_and_creates_missing(
+        self, db_session: AsyncSession, project: Project
+    ) -> None:
+        existing = CrawledPage(
+            project_id=project.id,
+            normalized_url="blog/existing",
+            source="blog",
+            status="completed",
+        )
+        db_session.add(existing)
+        await db_session.flush()
+
+        url_to_id = await bridge_crawled_pages(
+            db_session,
+            project.id,
+            [
+                BridgePage(normalized_url="blog/existing"),
+                BridgePage(normalized_url="blog/new", title="New", word_count=12),
+                BridgePage(normalized_url="blog/new", title="Duplicate"),
+            ],
+            source="blog",
+        )
+
+        assert set(url_to_id) == {"blog/existing", "blog/new"}
+        assert url_to_id["blog/existing"] == existing.id
+        assert await _page_count(db_session, project.id) == 2
+
+        created = await db_session.get(CrawledPage, url_to_id["blog/new"])
+        assert created is not None
+        assert created.source == "blog"
+        assert created.status == "completed"
+        assert created.title == "New"
+        assert created.word_count == 12
+
+    async def test_source_filter(
+        self, db_session: AsyncSession, project: Project
+    ) -> None:
+        onboarding = CrawledPage(
+            project_id=project.id,
+            normalized_url="/boots",
+            source="onboarding",
+            status="completed",
+        )
+        db_session.add(onboarding)
+        await db_session.flush()
+        pages = [BridgePage(normalized_url="/boots", category="collection")]
+
+        reused = await bridge_crawled_pages(
+            db_session, project.id, pages, source="cluster", match_any_source=True
+        )
+        assert reused["/boots"] == onboarding.id
+
+        separate = await bridge_crawled_pages(
+            db_session, project.id, pages, source="cluster"
+        )
+        assert separate["/boots"] != onboarding.id
+        assert await _page_count(db_session, project.id) == 2
+
+    async def test_empty_input(
+        self, db_session: AsyncSession, project: Project
+    ) -> None:
+        assert (
+            await bridge_crawled_pages(db_session, project.id, [], source="blog") == {}
+        )
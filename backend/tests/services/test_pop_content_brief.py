@@ -7,10 +7,13 @@ Tests cover:
 - Caching returns existing brief without API call
 - force_refresh bypasses cache and updates existing brief
 - Error handling returns failure result
+- Shared keyword-level brief cache: normalization, hits, single-flight
+- Partial 3-step responses are marked and kept out of the shared cache
 """
 
+import asyncio
 from typing import Any
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -20,6 +23,7 @@ from app.models.content_brief import ContentBrief
 from app.models.crawled_page import CrawledPage
 from app.models.project import Project
 from app.services.pop_content_brief import (
+    POP_STEPS_COMPLETED_KEY,
     ContentBriefResult,
     _parse_competitors,
     _parse_heading_targets,
@@ -29,7 +33,11 @@ from app.services.pop_content_brief import (
     _parse_related_questions,
     _parse_related_searches,
     _parse_word_count_range,
+    _run_real_3step_flow,
+    brief_cache_key,
     fetch_content_brief,
+    normalize_brief_keyword,
+    run_3step_flow_with_shared_cache,
 )
 
 
@@ -617,3 +625,271 @@ class TestFetchContentBriefErrorHandling:
 
         assert result.success is False
         assert result.error is not None
+
+
+# ---------------------------------------------------------------------------
+# Shared keyword-level brief cache
+# ---------------------------------------------------------------------------
+
+
+class TestBriefCacheKey:
+    """Tests for shared cache keyword normalization and keys."""
+
+    def test_normalizes_case_punctuation_and_whitespace(self) -> None:
+        assert normalize_brief_keyword("  Best Dog Beds!! ") == "best dog beds"
+        assert normalize_brief_keyword("best   dog\tbeds") == "best dog beds"
+
+    def test_keeps_intra_word_hyphens(self) -> None:
+        assert normalize_brief_keyword("Non-Slip Dog Bowls") == "non-slip dog bowls"
+
+    def test_key_ignores_keyword_formatting(self) -> None:
+        assert brief_cache_key("Best Dog Beds") == brief_cache_key("best dog beds?")
+
+    def test_key_depends_on_location(self) -> None:
+        assert brief_cache_key("dog beds", "United States") != brief_cache_key(
+            "dog beds", "Canada"
+        )
+
+
+COMPLETE_RESPONSE = {"prepareId": "p", POP_STEPS_COMPLETED_KEY: 3}
+
+
+class TestSharedBriefCacheFlow:
+    """Tests for run_3step_flow_with_shared_cache with DB helpers patched."""
+
+    @pytest.fixture(autouse=True)
+    def cache_settings(self) -> Any:
+        settings = MagicMock(pop_brief_cache_enabled=True, pop_brief_cache_ttl_days=14)
+        with patch(
+            "app.services.pop_content_brief.get_settings", return_value=settings
+        ):
+            yield settings
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_pop_and_counts_hit(self) -> None:
+        entry = MagicMock(
+            response_data={"lsaPhrases": [{"phrase": "x"}]},
+            pop_task_id="task-1",
+            hit_count=2,
+        )
+        with (
+            patch(
+                "app.services.pop_content_brief._get_shared_brief",
+                AsyncMock(return_value=entry),
+            ),
+            patch(
+                "app.services.pop_content_brief._run_real_3step_flow",
+                AsyncMock(),
+            ) as run_flow,
+        ):
+            data, task_id, hit = await run_3step_flow_with_shared_cache(
+                db=MagicMock(),
+                pop_client=MagicMock(),
+                keyword="Dog Beds",
+                target_url="https://a.example.com/dog-beds",
+            )
+
+        assert hit is True
+        assert task_id == "task-1"
+        assert data == {"lsaPhrases": [{"phrase": "x"}]}
+        assert entry.hit_count == 3
+        run_flow.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_miss_runs_pop_and_stores(self) -> None:
+        with (
+            patch(
+                "app.services.pop_content_brief._get_shared_brief",
+                AsyncMock(return_value=None),
+            ),
+            patch(
+                "app.services.pop_content_brief._run_real_3step_flow",
+                AsyncMock(return_value=(dict(COMPLETE_RESPONSE), "task-2")),
+            ),
+            patch(
+                "app.services.pop_content_brief._store_shared_brief",
+                AsyncMock(),
+            ) as store,
+        ):
+            data, task_id, hit = await run_3step_flow_with_shared_cache(
+                db=MagicMock(),
+                pop_client=MagicMock(),
+                keyword="dog beds",
+                target_url="https://b.example.com/beds",
+            )
+
+        assert hit is False
+        assert task_id == "task-2"
+        assert data == COMPLETE_RESPONSE
+        store.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_partial_response_is_not_stored(self) -> None:
+        partial = {"prepareId": "p", POP_STEPS_COMPLETED_KEY: 1}
+        with (
+            patch(
+                "app.services.pop_content_brief._get_shared_brief",
+                AsyncMock(return_value=None),
+            ),
+            patch(
+                "app.services.pop_content_brief._run_real_3step_flow",
+                AsyncMock(return_value=(dict(partial), "task-5")),
+            ),
+            patch(
+                "app.services.pop_content_brief._store_shared_brief",
+                AsyncMock(),
+            ) as store,
+        ):
+            data, task_id, hit = await run_3step_flow_with_shared_cache(
+                db=MagicMock(),
+                pop_client=MagicMock(),
+                keyword="dog beds",
+                target_url="https://b.example.com/beds",
+            )
+
+        # The caller still gets the partial brief; other projects don't
+        assert hit is False
+        assert task_id == "task-5"
+        assert data == partial
+        store.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_force_refresh_bypasses_lookup(self) -> None:
+        with (
+            patch(
+                "app.services.pop_content_brief._get_shared_brief",
+                AsyncMock(),
+            ) as lookup,
+            patch(
+                "app.services.pop_content_brief._run_real_3step_flow",
+                AsyncMock(return_value=({}, "task-3")),
+            ),
+            patch(
+                "app.services.pop_content_brief._store_shared_brief",
+                AsyncMock(),
+            ),
+        ):
+            _, _, hit = await run_3step_flow_with_shared_cache(
+                db=MagicMock(),
+                pop_client=MagicMock(),
+                keyword="dog beds",
+                target_url="/beds",
+                force_refresh=True,
+            )
+
+        assert hit is False
+        lookup.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_same_keyword_runs_one_report(self) -> None:
+        calls = 0
+
+        async def slow_flow(*args: Any, **kwargs: Any) -> tuple[dict[str, Any], str]:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"prepareId": "shared"}, "task-4"
+
+        with (
+            patch(
+                "app.services.pop_content_brief._get_shared_brief",
+                AsyncMock(return_value=None),
+            ),
+            patch(
+                "app.services.pop_content_brief._run_real_3step_flow",
+                side_effect=slow_flow,
+            ),
+            patch(
+                "app.services.pop_content_brief._store_shared_brief",
+                AsyncMock(),
+            ),
+        ):
+            results = await asyncio.gather(
+                *(
+                    run_3step_flow_with_shared_cache(
+                        db=MagicMock(),
+                        pop_client=MagicMock(),
+                        keyword="Dog Beds",
+                        target_url=f"/page-{i}",
+                    )
+                    for i in range(3)
+                )
+            )
+
+        assert calls == 1
+        assert [r[0] for r in results] == [{"prepareId": "shared"}] * 3
+        assert sorted(r[2] for r in results) == [False, True, True]
+
+
+def _three_step_client() -> MagicMock:
+    """POP client mock whose three steps all succeed."""
+    client = MagicMock()
+    client.create_report_task = AsyncMock(
+        return_value=POPTaskResult(success=True, task_id="terms-1")
+    )
+    client.poll_for_result = AsyncMock(
+        side_effect=[
+            POPTaskResult(
+                success=True,
+                status=POPTaskStatus.SUCCESS,
+                data={"prepareId": "prep-1", "lsaPhrases": [], "variations": []},
+            ),
+            POPTaskResult(
+                success=True,
+                status=POPTaskStatus.SUCCESS,
+                data={"report": {"competitors": []}},
+            ),
+        ]
+    )
+    client.create_report = AsyncMock(
+        return_value=POPTaskResult(
+            success=True, task_id="report-1", data={"reportId": "rep-1"}
+        )
+    )
+    client.get_custom_recommendations = AsyncMock(
+        return_value=POPTaskResult(
+            success=True, data={"recommendations": {"exactKeyword": []}}
+        )
+    )
+    return client
+
+
+class TestRun3StepFlowCompleteness:
+    """_run_real_3step_flow records how many POP steps returned data."""
+
+    @pytest.mark.asyncio
+    async def test_full_flow_completes_three_steps(self) -> None:
+        data, task_id = await _run_real_3step_flow(
+            _three_step_client(), "dog beds", "https://a.example.com/beds"
+        )
+
+        assert task_id == "terms-1"
+        assert data[POP_STEPS_COMPLETED_KEY] == 3
+        assert "competitors" in data
+        assert "exactKeyword" in data
+
+    @pytest.mark.asyncio
+    async def test_create_report_failure_stops_after_step_one(self) -> None:
+        client = _three_step_client()
+        client.create_report.return_value = POPTaskResult(success=False, error="boom")
+
+        data, _ = await _run_real_3step_flow(
+            client, "dog beds", "https://a.example.com/beds"
+        )
+
+        assert data[POP_STEPS_COMPLETED_KEY] == 1
+        assert "competitors" not in data
+
+    @pytest.mark.asyncio
+    async def test_recommendations_failure_stops_after_step_two(self) -> None:
+        client = _three_step_client()
+        client.get_custom_recommendations.return_value = POPTaskResult(
+            success=False, error="boom"
+        )
+
+        data, _ = await _run_real_3step_flow(
+            client, "dog beds", "https://a.example.com/beds"
+        )
+
+        assert data[POP_STEPS_COMPLETED_KEY] == 2
+        assert "competitors" in data
@@ -0,0 +1,255 @@
+"""Tests for the local TF-IDF topical similarity index.
+
+Tests cover:
+- Tokenizing and weighting page text (HTML, headings, primary keyword)
+- Top-k nearest neighbours, candidate filtering and incremental updates
+- sync_topical_index re-tokenizes only new or changed pages
+- The per-project index cache evicts the least recently used project
+- Similarity edge weights in select_targets_onboarding and
+  select_targets_wp_with_collections
+- Label-overlap filler edges for pages without enough similar neighbours
+"""
+
+import uuid
+from typing import Any
+from unittest.mock import patch
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.crawled_page import CrawledPage
+from app.models.page_keywords import PageKeywords
+from app.models.project import Project
+from app.services.link_planning import select_targets_onboarding, similarity_adjacency
+from app.services.topical_similarity import (
+    TopicalIndex,
+    clear_topical_indexes,
+    get_topical_index,
+    page_terms,
+    sync_topical_index,
+    tokenize,
+)
+from app.services.wordpress_linker import select_targets_wp_with_collections
+
+TEXTS = {
+    "boots": "Leather hiking boots with waterproof leather uppers for trail hiking",
+    "trail": "Trail hiking boots and hiking socks for long trail walks",
+    "espresso": "Espresso machines brew espresso shots with crema and steamed milk",
+    "grinder": "Burr coffee grinder for espresso and pour over coffee beans",
+}
+
+
+def _index(texts: dict[str, str] = TEXTS) -> TopicalIndex:
+    index = TopicalIndex()
+    for page_id, text in texts.items():
+        index.upsert(page_id, page_terms(text))
+    return index
+
+
+def _page(page_id: str, **extra: Any) -> dict[str, Any]:
+    return {
+        "page_id": page_id,
+        "keyword": page_id,
+        "url": f"/{page_id}",
+        "labels": [],
+        "is_priority": False,
+        **extra,
+    }
+
+
+class TestPageTerms:
+    def test_strips_html_and_stopwords(self) -> None:
+        assert tokenize("<p>The <b>Best</b> hiking boots for 2025</p>") == [
+            "hiking",
+            "boots",
+        ]
+
+    def test_headings_and_keyword_are_boosted(self) -> None:
+        terms = page_terms(
+            "boots boots",
+            headings={"h2": ["Waterproof boots"]},
+            primary_keyword="waterproof boots",
+        )
+        # body 2 + heading 2 + keyword 3
+        assert terms["boots"] == 7
+        assert terms["waterproof"] == 5
+
+
+class TestTopicalIndex:
+    def test_top_k_ranks_related_pages_first(self) -> None:
+        index = _index()
+
+        hits = index.top_k("boots", 3)
+
+        assert hits[0][0] == "trail"
+        assert 0.0 < hits[0][1] <= 1.0
+        # Pages with no shared terms are never returned
+        assert "espresso" not in dict(hits)
+
+    def test_candidates_restrict_results(self) -> None:
+        index = _index()
+
+        hits = index.top_k("espresso", 3, candidates={"boots", "trail"})
+
+        assert hits == []
+        assert index.top_k("espresso", 3, candidates={"grinder"})[0][0] == "grinder"
+
+    def test_similarity_is_symmetric_cosine(self) -> None:
+        index = _index()
+
+        assert index.similarity("boots", "trail") == index.similarity("trail", "boots")
+        assert abs(index.similarity("boots", "boots") - 1.0) < 1e-9
+        assert index.similarity("boots", "missing") == 0.0
+
+    def test_upsert_and_remove_update_neighbours(self) -> None:
+        index = _index()
+
+        index.upsert("trail", page_terms("Espresso cups and espresso saucers"))
+        assert index.top_k("espresso", 1)[0][0] == "trail"
+
+        index.remove("trail")
+        assert "trail" not in index
+        assert len(index) == 3
+        assert "trail" not in dict(index.top_k("espresso", 3))
+
+
+class TestSyncTopicalIndex:
+    async def test_reindexes_only_changed_pages(self, db_session: AsyncSession) -> None:
+        clear_topical_indexes()
+        project = Project(
+            name=f"Similarity {uuid.uuid4().hex[:8]}",
+            site_url="https://similarity.example.com",
+        )
+        db_session.add(project)
+        await db_session.flush()
+
+        pages = []
+        for key, text in TEXTS.items():
+            page = CrawledPage(
+                project_id=project.id,
+                normalized_url=f"/{key}",
+                body_content=text,
+                status="completed",
+            )
+            db_session.add(page)
+            pages.append(page)
+        await db_session.flush()
+        db_session.add(
+            PageKeywords(crawled_page_id=pages[0].id, primary_keyword="hiking boots")
+        )
+        await db_session.flush()
+        page_ids = [p.id for p in pages]
+
+        with patch(
+            "app.services.topical_similarity.page_terms", wraps=page_terms
+        ) as tokenized:
+            index = await sync_topical_index(db_session, project.id, page_ids)
+            assert tokenized.call_count == 4
+
+            await sync_topical_index(db_session, project.id, page_ids)
+            assert tokenized.call_count == 4
+
+            pages[2].body_content = "Hiking trail boots"
+            pages[2].updated_at = pages[2].updated_at.replace(year=2099)
+            await db_session.flush()
+            await sync_topical_index(db_session, project.id, page_ids)
+            assert tokenized.call_count == 5
+
+        assert len(index) == 4
+        assert index.top_k(pages[2].id, 1)[0][0] in {pages[0].id, pages[1].id}
+
+
+class TestTopicalIndexCache:
+    def test_least_recently_used_project_is_evicted(self) -> None:
+        clear_topical_indexes()
+        with patch("app.services.topical_similarity.MAX_CACHED_INDEXES", 2):
+            first = get_topical_index("p1")
+            get_topical_index("p2")
+            assert get_topical_index("p1") is first
+
+            get_topical_index("p3")
+
+            assert get_topical_index("p1") is first
+            assert get_topical_index("p2") is not first
+        clear_topical_indexes()
+
+
+class TestSimilarityTargetSelection:
+    def test_onboarding_prefers_most_similar_pages(self) -> None:
+        index = _index()
+        graph = {
+            "pages": [_page(pid) for pid in TEXTS],
+            "edges": [],
+        }
+        budgets = dict.fromkeys(TEXTS, 1)
+
+        result = select_targets_onboarding(graph, budgets, similarity_index=index)
+
+        assert result["boots"][0]["page_id"] == "trail"
+        assert result["espresso"][0]["page_id"] == "grinder"
+        assert result["boots"][0]["similarity"] > 0
+        assert result["boots"][0]["label_overlap"] == 0
+
+    def test_onboarding_pads_pages_without_text_by_labels(self) -> None:
+        index = _index()
+        graph = {
+            "pages": [
+                *(_page(pid) for pid in TEXTS),
+                _page("bare", labels=["coffee"]),
+                _page("labelled", labels=["coffee"]),
+            ],
+            "edges": [],
+        }
+        budgets = {"bare": 1}
+
+        result = select_targets_onboarding(graph, budgets, similarity_index=index)
+
+        assert [t["page_id"] for t in result["bare"]] == ["labelled"]
+
+    def test_wp_selection_queries_collections_and_posts_separately(self) -> None:
+        index = _index()
+        graph = {
+            "pages": [
+                _page("boots", source="collection"),
+                _page("espresso", source="collection"),
+                _page("trail", source="wordpress"),
+                _page("grinder", source="wordpress"),
+            ],
+            "edges": [],
+        }
+        budgets = {"trail": 2, "grinder": 2}
+
+        result = select_targets_wp_with_collections(
+            graph, budgets, similarity_index=index
+        )
+
+        assert set(result) == {"trail", "grinder"}
+        assert result["trail"][0]["page_id"] == "boots"
+        assert result["trail"][0]["source"] == "collection"
+        assert result["grinder"][0]["page_id"] == "espresso"
+        assert result["grinder"][1]["source"] == "wordpress"
+
+    def test_label_fillers_rank_by_overlap_then_page_id(self) -> None:
+        index = _index()
+        labels = {
+            "bare": ["coffee", "beans", "milk"],
+            "z-both": ["coffee", "beans"],
+            "a-one": ["milk"],
+            "b-one": ["coffee"],
+            "c-none": [],
+            "d-none": ["tea"],
+        }
+        pages = [
+            *(_page(pid) for pid in TEXTS),
+            *(_page(pid, labels=page_labels) for pid, page_labels in labels.items()),
+        ]
+        pool = {p["page_id"] for p in pages}
+
+        adjacency = similarity_adjacency(pages, {"bare": 1}, index, [pool])
+
+        # Budget 1 asks for 4 candidates; "bare" has no text, so all are fillers
+        assert adjacency["bare"] == {
+            "z-both": 2.0,
+            "a-one": 1.0,
+            "b-one": 1.0,
+            "boots": 0.0,
+        }
@@ -0,0 +1,193 @@
+"""Tests for the WordPress export step.
+
+Tests cover:
+- Posts unchanged since import or the last push are skipped
+- Changed posts are pushed and their pushed hash recorded
+- Progress reports pushed and skipped counts
+- Explicit page_ids and force push unchanged posts
+- Title filters match LIKE wildcards literally
+"""
+
+import hashlib
+import uuid
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.crawled_page import CrawledPage
+from app.models.page_content import PageContent
+from app.models.project import Project
+from app.services.wordpress_linker import _wp_progress, step7_export
+
+
+def _md5(value: str | None) -> str | None:
+    if value is None:
+        return None
+    return hashlib.md5(value.encode(), usedforsecurity=False).hexdigest()
+
+
+@pytest.fixture(autouse=True)
+async def sqlite_md5(db_session: AsyncSession) -> None:
+    """Give the SQLite test database PostgreSQL's md5(text)."""
+    conn = await db_session.connection()
+    await conn.run_sync(
+        lambda sync_conn: sync_conn.connection.dbapi_connection.create_function(
+            "md5", 1, _md5
+        )
+    )
+
+
+@pytest.fixture
+async def project(db_session: AsyncSession) -> Project:
+    """Create a test project."""
+    project = Project(
+        name=f"WP Export Test {uuid.uuid4().hex[:8]}",
+        site_url="https://wp-export.example.com",
+    )
+    db_session.add(project)
+    await db_session.flush()
+    return project
+
+
+@pytest.fixture
+def wp_client() -> Iterator[MagicMock]:
+    client = MagicMock()
+    client.update_post_content = AsyncMock()
+    client.close = AsyncMock()
+    with patch("app.services.wordpress_linker.WordPressClient", return_value=client):
+        yield client
+
+
+async def _add_post(
+    db: AsyncSession,
+    project: Project,
+    wp_id: int,
+    content: str,
+    imported: str | None = None,
+    title: str = "Post",
+) -> PageContent:
+    page = CrawledPage(
+        project_id=project.id,
+        normalized_url=f"https://wp-export.example.com/?p={wp_id}",
+        raw_url=str(wp_id),
+        source="wordpress",
+        status="completed",
+        title=title,
+    )
+    db.add(page)
+    await db.flush()
+    page_content = PageContent(
+        crawled_page_id=page.id,
+        bottom_description=content,
+        wp_imported_hash=_md5(imported),
+    )
+    db.add(page_content)
+    await db.flush()
+    return page_content
+
+
+async def _export(
+    db: AsyncSession, project: Project, **kwargs: Any
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    job_id = f"job-{uuid.uuid4().hex[:8]}"
+    result = await step7_export(
+        db,
+        project.id,
+        "https://wp-export.example.com",
+        "user",
+        "app-password",
+        job_id,
+        **kwargs,
+    )
+    return result, _wp_progress[job_id]
+
+
+def _pushed_ids(wp_client: MagicMock) -> list[int]:
+    return sorted(call.args[0] for call in wp_client.update_post_content.call_args_list)
+
+
+class TestStep7Export:
+    async def test_unchanged_posts_are_skipped(
+        self, db_session: AsyncSession, project: Project, wp_client: MagicMock
+    ) -> None:
+        await _add_post(db_session, project, 1, "<p>same</p>", imported="<p>same</p>")
+        await _add_post(db_session, project, 2, "<p>new</p>", imported="<p>old</p>")
+        await _add_post(db_session, project, 3, "<p>no hash</p>")
+
+        result, progress = await _export(db_session, project)
+
+        assert _pushed_ids(wp_client) == [2, 3]
+        assert result == {
+            "exported": 2,
+            "failed": 0,
+            "skipped_unchanged": 1,
+            "total": 2,
+        }
+        assert progress["status"] == "complete"
+        assert progress["current"] == 2
+        assert progress["total"] == 2
+        assert progress["skipped_unchanged"] == 1
+
+    async def test_pushed_hash_is_recorded(
+        self, db_session: AsyncSession, project: Project, wp_client: MagicMock
+    ) -> None:
+        content = await _add_post(
+            db_session, project, 1, "<p>new</p>", imported="<p>old</p>"
+        )
+
+        await _export(db_session, project)
+        pushed_hash = (
+            await db_session.execute(
+                select(PageContent.wp_pushed_hash).where(PageContent.id == content.id)
+            )
+        ).scalar_one()
+        assert pushed_hash == _md5("<p>new</p>")
+
+        # The next export sees WordPress already has this version
+        wp_client.update_post_content.reset_mock()
+        result, _ = await _export(db_session, project)
+
+        assert _pushed_ids(wp_client) == []
+        assert result["skipped_unchanged"] == 1
+
+    async def test_requested_page_ids_are_always_pushed(
+        self, db_session: AsyncSession, project: Project, wp_client: MagicMock
+    ) -> None:
+        content = await _add_post(
+            db_session, project, 1, "<p>same</p>", imported="<p>same</p>"
+        )
+        await _add_post(db_session, project, 2, "<p>same</p>", imported="<p>same</p>")
+
+        result, _ = await _export(
+            db_session, project, page_ids=[content.crawled_page_id]
+        )
+
+        assert _pushed_ids(wp_client) == [1]
+        assert result["skipped_unchanged"] == 0
+
+    async def test_force_pushes_unchanged_posts(
+        self, db_session: AsyncSession, project: Project, wp_client: MagicMock
+    ) -> None:
+        await _add_post(db_session, project, 1, "<p>same</p>", imported="<p>same</p>")
+        await _add_post(db_session, project, 2, "<p>new</p>", imported="<p>old</p>")
+
+        result, _ = await _export(db_session, project, force=True)
+
+        assert _pushed_ids(wp_client) == [1, 2]
+        assert result["skipped_unchanged"] == 0
+
+    async def test_title_filter_matches_wildcards_literally(
+        self, db_session: AsyncSession, project: Project, wp_client: MagicMock
+    ) -> None:
+        await _add_post(db_session, project, 1, "<p>a</p>", title="dog_beds guide")
+        await _add_post(db_session, project, 2, "<p>b</p>", title="dog-beds guide")
+        await _add_post(db_session, project, 3, "<p>c</p>", title="100% wool")
+        await _add_post(db_session, project, 4, "<p>d</p>", title="100 wool")
+
+        await _export(db_session, project, title_filter=["dog_b", "100%"])
+
+        assert _pushed_ids(wp_client) == [1, 3]
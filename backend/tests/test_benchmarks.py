@@ -0,0 +1,117 @@
+"""Tests for the hot-path benchmark suite.
+
+Tests cover:
+- Synthetic fixtures are deterministic and shaped like production data
+- Every benchmark case runs at a small size
+- Regression detection against a baseline (time, memory, noise floor)
+- The CLI records a baseline and fails when a case regresses
+"""
+
+import json
+from pathlib import Path
+
+from benchmarks import fixtures
+from benchmarks.cases import CASES, LABEL_GRAPH_MAX_SIZE
+from benchmarks.runner import Measurement, compare, main
+
+SMALL = 20
+
+
+class TestFixtures:
+    def test_fixtures_are_deterministic(self) -> None:
+        fixtures.pages.cache_clear()
+        first = fixtures.pages(SMALL)
+        fixtures.pages.cache_clear()
+
+        assert fixtures.pages(SMALL) == first
+        assert fixtures.generated_titles(SMALL) == fixtures.generated_titles(SMALL)
+        assert fixtures.pages(SMALL + 1)[0] != first[0]
+
+    def test_content_mentions_planned_anchors(self) -> None:
+        html = fixtures.content_html(SMALL)
+        links = fixtures.link_plans(SMALL)
+
+        mentioned = [
+            link
+            for link in links
+            if link["anchor_text"] in html[link["source_page_id"]]
+        ]
+        assert len(mentioned) > len(links) // 2
+
+    def test_article_records_reference_blog_parents(self) -> None:
+        records = fixtures.bulk_records(SMALL, "article")
+
+        parents = {r["id"] for r in records if "__parentId" not in r}
+        children = [r for r in records if "__parentId" in r]
+        assert len(children) == SMALL
+        assert all(child["__parentId"] in parents for child in children)
+
+
+class TestCases:
+    def test_every_case_runs_at_small_size(self) -> None:
+        for case in CASES:
+            run = case.setup(SMALL)
+            assert run() is not None, case.name
+
+    def test_label_graph_case_is_capped(self) -> None:
+        (labels,) = [c for c in CASES if c.name.endswith("[labels]")]
+
+        assert labels.supports(LABEL_GRAPH_MAX_SIZE)
+        assert not labels.supports(10_000)
+
+
+def _measurement(seconds: float, peak_bytes: int = 1000) -> Measurement:
+    return Measurement(
+        case="case", size=100, seconds=seconds, peak_bytes=peak_bytes, repeats=1
+    )
+
+
+class TestCompare:
+    def test_within_threshold_passes(self) -> None:
+        result = compare(_measurement(0.12), {"seconds": 0.1, "peak_bytes": 1000})
+
+        assert not result.regressed
+        assert result.time_ratio is not None
+        assert round(result.time_ratio, 2) == 1.2
+
+    def test_slower_beyond_threshold_regresses(self) -> None:
+        result = compare(_measurement(0.2), {"seconds": 0.1, "peak_bytes": 1000})
+
+        assert result.regressed
+
+    def test_memory_growth_regresses(self) -> None:
+        result = compare(
+            _measurement(0.1, peak_bytes=1500), {"seconds": 0.1, "peak_bytes": 1000}
+        )
+
+        assert result.regressed
+
+    def test_timings_below_noise_floor_never_regress(self) -> None:
+        result = compare(_measurement(0.002), {"seconds": 0.0005, "peak_bytes": 1000})
+
+        assert not result.regressed
+
+    def test_missing_baseline_is_new(self) -> None:
+        result = compare(_measurement(1.0), None)
+
+        assert not result.regressed
+        assert result.time_ratio is None
+
+
+class TestMain:
+    def test_update_baseline_then_compare(self, tmp_path: Path) -> None:
+        baseline = tmp_path / "baseline.json"
+        args = ["--sizes", str(SMALL), "--cases", "_parse_bulk_results"]
+        args += ["--baseline", str(baseline)]
+
+        assert main([*args, "--update-baseline"]) == 0
+        recorded = json.loads(baseline.read_text())["results"]
+        assert list(recorded) == ["_parse_bulk_results"]
+        assert list(recorded["_parse_bulk_results"]) == [str(SMALL)]
+
+        assert main(args) == 0
+
+        # A baseline far below the measured memory fails the run
+        recorded["_parse_bulk_results"][str(SMALL)]["peak_bytes"] = 1
+        baseline.write_text(json.dumps({"results": recorded}))
+        assert main(args) == 1
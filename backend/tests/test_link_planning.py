@@ -7,6 +7,8 @@ Tests cover:
 - Onboarding graph: pages below threshold (1 shared label) have no edges
 - Onboarding graph: pages with no labels have no edges
 - Both modes: only pages with complete content and approved keywords included
+- Blog graph: bridge CrawledPages are created once and reused on rebuild
+- Campaign blog planning: one post failing does not stop the others
 - calculate_budget: word count → link budget clamped to 3-5
 - select_targets_cluster: parent/child targeting with hierarchy rules
 - select_targets_onboarding: label overlap + priority bonus + diversity penalty
@@ -23,6 +25,7 @@ from uuid import uuid4
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.blog import BlogCampaign, BlogPost
 from app.models.content_brief import ContentBrief
 from app.models.crawled_page import CrawledPage
 from app.models.keyword_cluster import ClusterPage, KeywordCluster
@@ -33,7 +36,9 @@ from app.services.link_planning import (
     MAX_ANCHOR_REUSE,
     AnchorTextSelector,
     SiloLinkPlanner,
+    _blog_link_progress,
     calculate_budget,
+    run_campaign_blog_link_planning,
     select_targets_cluster,
     select_targets_onboarding,
 )
@@ -692,6 +697,124 @@ class TestGraphFiltering:
         assert cp_b1.id not in page_ids
 
 
+# ---------------------------------------------------------------------------
+# Tests: blog graph + campaign blog link planning
+# ---------------------------------------------------------------------------
+
+
+def _make_blog_campaign(
+    db: AsyncSession, project_id: str, cluster_id: str, post_count: int
+) -> tuple[BlogCampaign, list[BlogPost]]:
+    """Create a campaign with approved blog posts that have content."""
+    campaign = BlogCampaign(
+        id=str(uuid4()),
+        project_id=project_id,
+        cluster_id=cluster_id,
+        name="Hiking Blog",
+    )
+    db.add(campaign)
+    posts = []
+    for i in range(post_count):
+        post = BlogPost(
+            id=str(uuid4()),
+            campaign_id=campaign.id,
+            primary_keyword=f"hiking tip {i}",
+            url_slug=f"blog/hiking-tip-{i}",
+            content="<p>Some hiking content.</p>",
+            is_approved=True,
+        )
+        db.add(post)
+        posts.append(post)
+    return campaign, posts
+
+
+class TestBuildBlogGraph:
+    """Tests for SiloLinkPlanner.build_blog_graph bridge records."""
+
+    @pytest.mark.asyncio
+    async def test_bridge_pages_created_once_and_reused(
+        self, db_session: AsyncSession
+    ):
+        """Rebuilding the graph reuses existing bridge CrawledPages."""
+        project = _make_project(db_session)
+        cluster = _make_cluster(db_session, project.id)
+        campaign, posts = _make_blog_campaign(db_session, project.id, cluster.id, 3)
+        await db_session.flush()
+
+        planner = SiloLinkPlanner()
+        first = await planner.build_blog_graph(campaign.id, db_session)
+        second = await planner.build_blog_graph(campaign.id, db_session)
+
+        first_map = {bp["post_id"]: bp["crawled_page_id"] for bp in first["blog_posts"]}
+        second_map = {
+            bp["post_id"]: bp["crawled_page_id"] for bp in second["blog_posts"]
+        }
+        assert set(first_map) == {p.id for p in posts}
+        assert first_map == second_map
+        assert len(set(first_map.values())) == 3
+
+
+class TestCampaignBlogLinkPlanning:
+    """Tests for run_campaign_blog_link_planning."""
+
+    @pytest.mark.asyncio
+    async def test_failing_post_does_not_stop_others(
+        self, db_session: AsyncSession, mock_db_manager
+    ):
+        """Graph is built once; a post whose injection raises is reported alone."""
+        project = _make_project(db_session)
+        cluster = _make_cluster(db_session, project.id)
+        campaign, posts = _make_blog_campaign(db_session, project.id, cluster.id, 3)
+        await db_session.commit()
+
+        async def fake_inject(blog_post_id, *args, **kwargs):
+            if blog_post_id == posts[1].id:
+                raise RuntimeError("injection failed")
+            return {"status": "complete", "links_planned": 1}
+
+        with (
+            patch.object(
+                SiloLinkPlanner,
+                "build_blog_graph",
+                autospec=True,
+                side_effect=SiloLinkPlanner.build_blog_graph,
+            ) as build_graph,
+            patch(
+                "app.services.link_planning._inject_blog_post_links",
+                side_effect=fake_inject,
+            ),
+        ):
+            result = await run_campaign_blog_link_planning(
+                campaign.id, [p.id for p in posts]
+            )
+
+        assert build_graph.call_count == 1
+        assert result["completed"] == 2
+        assert result["failed"] == 1
+        assert result["posts"][posts[1].id]["error"] == "injection failed"
+
+    @pytest.mark.asyncio
+    async def test_graph_failure_marks_every_post_failed(
+        self, db_session: AsyncSession, mock_db_manager
+    ):
+        """A failure before injection ends every post's progress as failed."""
+        post_ids = ["post-a", "post-b"]
+
+        with patch.object(
+            SiloLinkPlanner,
+            "build_blog_graph",
+            side_effect=RuntimeError("graph failed"),
+        ):
+            result = await run_campaign_blog_link_planning("campaign-1", post_ids)
+
+        assert result["completed"] == 0
+        assert result["failed"] == 2
+        for post_id in post_ids:
+            assert result["posts"][post_id]["error"] == "graph failed"
+            assert _blog_link_progress[post_id]["status"] == "failed"
+            assert _blog_link_progress[post_id]["error"] == "graph failed"
+
+
 # ---------------------------------------------------------------------------
 # Tests: calculate_budget (S9-016)
 # ---------------------------------------------------------------------------
@@ -0,0 +1,205 @@
+"""Tests for the load harness fakes, metrics and report.
+
+Tests cover:
+- The production integration clients run unchanged against the fakes
+- Fault injection (503s, 429s with Retry-After) and offline routing
+- Fault profile overrides from the CLI spec
+- Percentiles and event-loop lag sampling
+- Report building and formatting from project runs
+"""
+
+import asyncio
+import json
+import time
+from typing import Any
+
+import httpx
+import pytest
+
+from app.integrations.claude import ClaudeClient
+from app.integrations.crawl4ai import Crawl4AIClient
+from app.integrations.dataforseo import DataForSEOClient
+from app.integrations.pop import POPClient
+from app.services.content_extraction import extract_content_from_html
+from app.services.pop_content_brief import _run_real_3step_flow
+from loadtest.driver import STAGES, ProjectRun
+from loadtest.fakes import (
+    CRAWL4AI_URL,
+    POP_URL,
+    FakeClaude,
+    FaultProfile,
+    build_fakes,
+    route_httpx,
+)
+from loadtest.metrics import LoopLagMonitor, distribution, percentile
+from loadtest.runner import build_report, format_report
+
+PAGE_URL = "https://store-0.example.com/collections/waterproof-hiking-boots-3"
+
+
+class TestFakesWithClients:
+    async def test_crawl4ai_page_extracts(self) -> None:
+        router = build_fakes()
+        with route_httpx(router):
+            client = Crawl4AIClient(api_url=CRAWL4AI_URL, max_retries=1)
+            result = await client.crawl(PAGE_URL)
+            await client.close()
+
+        assert result.success
+        extracted = extract_content_from_html(result.html, result.markdown)
+        assert extracted.headings["h1"] == ["Waterproof Hiking Boots"]
+        assert extracted.product_count
+        assert router.stats()["services"]["crawl4ai"]["requests"] == 1
+
+    async def test_claude_writes_copy_for_keyword(self) -> None:
+        router = build_fakes()
+        with route_httpx(router):
+            client = ClaudeClient(api_key="test")
+            result = await client.complete(
+                user_prompt='Write collection copy for the keyword "hiking boots".',
+                system_prompt="You are a copywriter.",
+            )
+            await client.close()
+
+        assert result.success
+        copy = json.loads(result.text or "")
+        assert set(copy) == {
+            "page_title",
+            "meta_description",
+            "top_description",
+            "bottom_description",
+        }
+        assert "hiking boots" in copy["bottom_description"]
+
+    async def test_dataforseo_returns_volumes(self) -> None:
+        router = build_fakes()
+        with route_httpx(router):
+            client = DataForSEOClient(api_login="test", api_password="test")
+            result = await client.get_keyword_volume(["hiking boots", "trail shoes"])
+            await client.close()
+
+        assert result.success
+        assert [k.keyword for k in result.keywords] == ["hiking boots", "trail shoes"]
+        assert all(k.search_volume for k in result.keywords)
+
+    async def test_pop_three_step_flow_waits_for_tasks(self) -> None:
+        router = build_fakes(pop_task_seconds=0.1)
+        with route_httpx(router):
+            client = POPClient(api_key="test", api_url=POP_URL, task_poll_interval=0.05)
+            data, task_id = await _run_real_3step_flow(client, "hiking boots", PAGE_URL)
+            await client.close()
+
+        assert task_id
+        assert data
+        routes = router.stats()["services"]["pop"]["routes"]
+        assert routes["POST /api/expose/get-terms/"] == 1
+        assert routes["POST /api/expose/create-report/"] == 1
+
+
+class TestFaults:
+    async def _get(
+        self, profile: FaultProfile
+    ) -> tuple[httpx.Response, dict[str, Any]]:
+        router = build_fakes({"serpapi": profile})
+        with route_httpx(router):
+            async with httpx.AsyncClient() as client:
+                response = await client.get("https://serpapi.com/search?q=boots")
+        return response, router.stats()["services"]["serpapi"]
+
+    async def test_error_rate_returns_503(self) -> None:
+        response, stats = await self._get(FaultProfile(error_rate=1.0))
+
+        assert response.status_code == 503
+        assert stats["errors"] == 1
+
+    async def test_rate_limit_returns_429_with_retry_after(self) -> None:
+        response, stats = await self._get(
+            FaultProfile(rate_limit_rate=1.0, retry_after_s=2)
+        )
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "2"
+        assert stats["rate_limited"] == 1
+
+    async def test_unknown_host_is_blocked_and_counted(self) -> None:
+        router = build_fakes()
+        with route_httpx(router):
+            async with httpx.AsyncClient() as client:
+                with pytest.raises(httpx.ConnectError):
+                    await client.get("https://api.example.org/")
+
+        assert router.stats()["unrouted_hosts"] == {"api.example.org": 1}
+
+    def test_profile_update_parses_spec(self) -> None:
+        profile = FaultProfile()
+        profile.update("latency_ms=800, error_rate=0.02")
+
+        assert profile.latency_ms == 800
+        assert profile.error_rate == 0.02
+        with pytest.raises(ValueError, match="Unknown fault setting"):
+            profile.update("latency=5")
+
+    def test_claude_batch_assignments_cover_every_item(self) -> None:
+        prompt = (
+            "TAXONOMY:\n- boots: Boots\n- jackets: Jackets\n\n"
+            "ITEM 0\nURL: /collections/hiking-boots\n"
+            "ITEM 1\nURL: /collections/rain-jackets\n"
+        )
+        reply = json.loads(FakeClaude().reply("BATCH MODE", prompt))
+
+        assert [(a["item"], a["labels"]) for a in reply["assignments"]] == [
+            (0, ["boots"]),
+            (1, ["jackets"]),
+        ]
+
+
+class TestMetrics:
+    def test_percentile_and_distribution(self) -> None:
+        samples = [float(n) for n in range(1, 101)]
+
+        assert percentile(samples, 50) == 50
+        assert percentile(samples, 99) == 99
+        assert percentile([], 50) == 0
+        assert distribution(samples) == {
+            "count": 100,
+            "p50": 50,
+            "p99": 99,
+            "max": 100,
+        }
+
+    async def test_loop_lag_monitor_samples_blocking_work(self) -> None:
+        monitor = LoopLagMonitor(interval=0.01)
+        monitor.start()
+        await asyncio.sleep(0.05)
+        # Block the loop so the next wake-up is late
+        asyncio.get_running_loop().call_soon(time.sleep, 0.05)
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+
+        summary = monitor.summary()
+        assert summary["count"] >= 3
+        assert summary["max"] >= 30
+
+
+class TestReport:
+    def test_report_counts_throughput_and_failures(self) -> None:
+        done = ProjectRun(index=0, pages=10, project_id="p0")
+        done.stage_seconds = dict.fromkeys(STAGES, 1.0)
+        failed = ProjectRun(index=1, pages=10, project_id="p1")
+        failed.stage_seconds = {"create": 0.5}
+        failed.failed_stage, failed.error = "crawl", "StageFailedError: boom"
+
+        report = build_report(
+            [done, failed], 60.0, build_fakes(), LoopLagMonitor(), {"projects": 2}
+        )
+
+        assert report["throughput"]["projects_completed"] == 1
+        assert report["throughput"]["pages_per_minute"] == 10
+        assert report["stages_seconds"]["create"]["count"] == 2
+        assert report["stages_seconds"]["crawl"]["count"] == 1
+        assert report["failures"] == [
+            {"project": 1, "stage": "crawl", "error": "StageFailedError: boom"}
+        ]
+        text = format_report(report)
+        assert text.startswith("1/2 projects in 60.0s")
+        assert "FAILED project 1 at crawl" in text
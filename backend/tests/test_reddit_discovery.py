@@ -12,7 +12,8 @@ Covers:
   PATCH status, bulk action
 """
 
-from datetime import UTC, datetime
+import asyncio
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
@@ -32,12 +33,21 @@ from app.services.reddit_discovery import (
     DiscoveryProgress,
     IntentResult,
     ScoringResult,
+    _build_post_upsert,
     _deduplicate_posts,
     _determine_filter_status,
+    _load_rejected_evaluations,
+    _merge_duplicate_rows,
+    _rejected_cache_field,
+    _remember_rejected_evaluations,
+    _reusable_scoring,
+    _scoring_input_hash,
     classify_intent,
     get_discovery_progress,
     is_discovery_active,
     is_excluded_post,
+    search_keywords_concurrently,
+    store_discovered_posts,
     MARKETING_SUBREDDITS,
     PROMOTIONAL_KEYWORDS,
 )
@@ -205,6 +215,67 @@ class TestSerpAPIRateLimiting:
         await client.close()
 
 
+class TestConcurrentSearch:
+    """Tests for the concurrent SERP search phase."""
+
+    @staticmethod
+    def _fake_serpapi(delays: dict[str, float] | None = None):
+        calls: list[tuple[str, tuple[str, ...]]] = []
+        in_flight = {"now": 0, "max": 0}
+
+        async def search(keyword, subreddits=None, time_range=None):
+            scope = tuple(subreddits or ())
+            calls.append((keyword, scope))
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep((delays or {}).get(keyword, 0.01))
+            in_flight["now"] -= 1
+            if keyword == "broken":
+                raise RuntimeError("boom")
+            sub = scope[0] if scope else "all"
+            return [_make_serp_result(url=f"https://reddit.com/r/{sub}/{keyword}")]
+
+        return MagicMock(search=search), calls, in_flight
+
+    async def test_fans_out_under_concurrency_limit(self) -> None:
+        serpapi, calls, in_flight = self._fake_serpapi()
+        progress = DiscoveryProgress(status="searching")
+        posts = await search_keywords_concurrently(
+            serpapi, ["a", "b", "c"], ["Sub1", "Sub2"], "7d", progress, concurrency=2
+        )
+        assert len(calls) == 9
+        assert in_flight["max"] == 2
+        assert progress.keywords_searched == 3
+        assert progress.total_posts_found == 9
+        # Keyword order, broad before scoped, regardless of completion order
+        assert [p.url for p in posts[:3]] == [
+            "https://reddit.com/r/all/a",
+            "https://reddit.com/r/Sub1/a",
+            "https://reddit.com/r/Sub2/a",
+        ]
+        assert all(p.search_keyword == p.url.rsplit("/", 1)[1] for p in posts)
+
+    async def test_duplicate_searches_hit_cache(self) -> None:
+        serpapi, calls, _ = self._fake_serpapi()
+        progress = DiscoveryProgress(status="searching")
+        posts = await search_keywords_concurrently(
+            serpapi, ["a", "a"], [], "7d", progress, concurrency=4
+        )
+        assert calls == [("a", ())]
+        assert len(posts) == 2
+        assert progress.keywords_searched == 2
+
+    async def test_failed_search_counts_as_searched(self) -> None:
+        serpapi, _, _ = self._fake_serpapi(delays={"slow": 0.05})
+        progress = DiscoveryProgress(status="searching")
+        posts = await search_keywords_concurrently(
+            serpapi, ["slow", "broken"], [], "7d", progress, concurrency=2
+        )
+        assert [p.search_keyword for p in posts] == ["slow"]
+        assert progress.keywords_searched == 2
+        assert progress.total_posts_found == 1
+
+
 # ===========================================================================
 # Intent Classification Tests
 # ===========================================================================
@@ -384,6 +455,229 @@ class TestFilterStatusDetermination:
         assert _determine_filter_status(10) == "relevant"
 
 
+class _FakeUpsertSession:
+    """Records executed statements; fails any statement with more rows than allowed."""
+
+    def __init__(self, fail_rows_over: int | None = None, bad_url: str | None = None):
+        self.row_counts: list[int] = []
+        self.fail_rows_over = fail_rows_over
+        self.bad_url = bad_url
+        self.commit = AsyncMock()
+
+    def begin_nested(self):
+        session = self
+
+        class _Savepoint:
+            async def __aenter__(self):
+                return session
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return _Savepoint()
+
+    async def execute(self, stmt):
+        params = stmt.compile().params
+        rows = sum(1 for key in params if key.startswith("url"))
+        if self.fail_rows_over is not None and rows > self.fail_rows_over:
+            raise RuntimeError("chunk failed")
+        if self.bad_url is not None and self.bad_url in params.values():
+            raise RuntimeError("bad row")
+        self.row_counts.append(rows)
+
+
+def _store_inputs(urls: list[str]):
+    posts = [_make_serp_result(url=url) for url in urls]
+    intents = [IntentResult(intents=["research"]) for _ in urls]
+    scores = [
+        ScoringResult(score=8, reasoning="ok", intent="research", filter_status="relevant")
+        for _ in urls
+    ]
+    return posts, intents, scores
+
+
+class TestBulkUpsert:
+    """Tests for the chunked multi-row upsert in store_discovered_posts."""
+
+    def test_upsert_statement_is_multi_row(self) -> None:
+        from sqlalchemy.dialects import postgresql
+
+        rows = [
+            {"project_id": "p", "url": f"https://reddit.com/{i}", "filter_status": "relevant"}
+            for i in range(3)
+        ]
+        sql = str(_build_post_upsert(rows).compile(dialect=postgresql.dialect()))
+        assert sql.count("ON CONFLICT") == 1
+        assert "CASE WHEN" in sql
+
+    def test_merge_duplicate_rows_follows_upsert_rules(self) -> None:
+        rows = [
+            {"project_id": "p", "url": "u", "keyword": "first", "title": "a", "filter_status": "relevant"},
+            {"project_id": "p", "url": "u", "keyword": "second", "title": "b", "filter_status": "low_relevance"},
+            {"project_id": "p", "url": "v", "keyword": "k", "title": "c", "filter_status": "low_relevance"},
+        ]
+        merged = _merge_duplicate_rows(rows)
+        assert len(merged) == 2
+        row, count = merged[0]
+        assert count == 2
+        assert row["keyword"] == "first"
+        assert row["title"] == "b"
+        # 'relevant' is not overwritable, so the later low_relevance is ignored
+        assert row["filter_status"] == "relevant"
+
+    @pytest.mark.asyncio
+    async def test_store_uses_one_statement_per_chunk(self) -> None:
+        db = _FakeUpsertSession()
+        posts, intents, scores = _store_inputs([f"https://reddit.com/r/x/{i}" for i in range(5)])
+        with patch("app.services.reddit_discovery._UPSERT_CHUNK_SIZE", 2):
+            stored = await store_discovered_posts("p", posts, intents, scores, [], db)
+        assert stored == 5
+        assert db.row_counts == [2, 2, 1]
+        db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_falls_back_to_rows(self) -> None:
+        urls = [f"https://reddit.com/r/x/{i}" for i in range(3)]
+        db = _FakeUpsertSession(fail_rows_over=1, bad_url=urls[1])
+        posts, intents, scores = _store_inputs(urls)
+        stored = await store_discovered_posts("p", posts, intents, scores, [], db)
+        assert stored == 2
+        assert db.row_counts == [1, 1]
+
+
+def _stored_row(post: SerpResult, evaluation: dict, age_days: float = 1):
+    return MagicMock(
+        url=post.url,
+        title=post.title,
+        snippet=post.snippet,
+        ai_evaluation=evaluation,
+        created_at=datetime.now(UTC) - timedelta(days=age_days),
+    )
+
+
+class TestIncrementalScoring:
+    """Tests for reusing stored evaluations of unchanged posts."""
+
+    MAX_AGE = timedelta(days=14)
+
+    def _hash(self, post: SerpResult, brand: str = "Acme") -> str:
+        return _scoring_input_hash(post, brand, "desc", ["b", "a"])
+
+    def test_input_hash_ignores_competitor_order(self) -> None:
+        post = _make_serp_result()
+        assert self._hash(post) == _scoring_input_hash(post, "Acme", "desc", ["a", "b"])
+        assert self._hash(post) != self._hash(post, brand="Other")
+
+    def test_reuses_matching_evaluation(self) -> None:
+        post = _make_serp_result()
+        input_hash = self._hash(post)
+        row = _stored_row(
+            post, {"score": 6, "reasoning": "meh", "intent": "research", "input_hash": input_hash}
+        )
+        result = _reusable_scoring(post, row, input_hash, self.MAX_AGE, datetime.now(UTC))
+        assert result is not None
+        assert result.score == 6.0
+        assert result.filter_status == "low_relevance"
+        assert result.scored_at == row.created_at
+
+    def test_changed_inputs_are_rescored(self) -> None:
+        post = _make_serp_result()
+        row = _stored_row(post, {"score": 9, "input_hash": self._hash(post, brand="Old")})
+        now = datetime.now(UTC)
+        assert _reusable_scoring(post, row, self._hash(post), self.MAX_AGE, now) is None
+
+    def test_legacy_row_compares_title_and_snippet(self) -> None:
+        post = _make_serp_result()
+        now = datetime.now(UTC)
+        row = _stored_row(post, {"score": 9})
+        assert _reusable_scoring(post, row, self._hash(post), self.MAX_AGE, now) is not None
+        row.snippet = "edited"
+        assert _reusable_scoring(post, row, self._hash(post), self.MAX_AGE, now) is None
+
+    def test_stale_or_unscored_rows_are_rescored(self) -> None:
+        post = _make_serp_result()
+        input_hash = self._hash(post)
+        now = datetime.now(UTC)
+        stale = _stored_row(post, {"score": 9, "input_hash": input_hash}, age_days=30)
+        assert _reusable_scoring(post, stale, input_hash, self.MAX_AGE, now) is None
+        # scored_at takes precedence over the row's created_at
+        stale.ai_evaluation["scored_at"] = now.isoformat()
+        assert _reusable_scoring(post, stale, input_hash, self.MAX_AGE, now) is not None
+        unscored = _stored_row(post, {"error": "timeout"})
+        assert _reusable_scoring(post, unscored, input_hash, self.MAX_AGE, now) is None
+
+
+class TestRejectedEvaluationCache:
+    """Tests for caching evaluations of posts discarded below the threshold."""
+
+    MAX_AGE = timedelta(days=14)
+
+    def _scored(self, score: float, error: str | None = None) -> ScoringResult:
+        return ScoringResult(
+            score=score,
+            reasoning="r",
+            intent="general",
+            filter_status=_determine_filter_status(score),
+            error=error,
+            input_hash=f"hash-{score}",
+        )
+
+    async def test_discarded_posts_are_reused(self, mock_redis_manager) -> None:
+        low = _make_serp_result(url="https://www.reddit.com/r/a/comments/1/low/")
+        kept = _make_serp_result(url="https://www.reddit.com/r/a/comments/2/kept/")
+        failed = _make_serp_result(url="https://www.reddit.com/r/a/comments/3/err/")
+        now = datetime.now(UTC)
+
+        await _remember_rejected_evaluations(
+            "p1",
+            {},
+            [low, kept, failed],
+            [self._scored(2), self._scored(8), self._scored(0, error="timeout")],
+            self.MAX_AGE,
+            now,
+        )
+        cached = await _load_rejected_evaluations("p1")
+
+        assert set(cached) == {_rejected_cache_field(low.url)}
+        row = MagicMock(title=None, snippet=None, created_at=None)
+        row.ai_evaluation = cached[_rejected_cache_field(low.url)]
+        reused = _reusable_scoring(low, row, "hash-2", self.MAX_AGE, now)
+        assert reused is not None
+        assert reused.score == 2.0
+        assert reused.filter_status is None
+        assert _reusable_scoring(low, row, "changed", self.MAX_AGE, now) is None
+        assert await _load_rejected_evaluations("other-project") == {}
+
+    async def test_stale_entries_are_dropped(self, mock_redis_manager) -> None:
+        now = datetime.now(UTC)
+        stale_at = (now - timedelta(days=30)).isoformat()
+        cached = {
+            "old": {"score": 1, "input_hash": "h", "scored_at": stale_at},
+            "recent": {"score": 1, "input_hash": "h", "scored_at": now.isoformat()},
+            "broken": {"score": 1},
+        }
+        post = _make_serp_result()
+
+        await _remember_rejected_evaluations(
+            "p1", cached, [post], [self._scored(3)], self.MAX_AGE, now
+        )
+
+        assert set(await _load_rejected_evaluations("p1")) == {
+            "recent",
+            _rejected_cache_field(post.url),
+        }
+
+    async def test_redis_unavailable_disables_cache(
+        self, mock_redis_unavailable
+    ) -> None:
+        post = _make_serp_result()
+        now = datetime.now(UTC)
+        await _remember_rejected_evaluations(
+            "p1", {}, [post], [self._scored(1)], self.MAX_AGE, now
+        )
+        assert await _load_rejected_evaluations("p1") == {}
+
+
 class TestDiscoveryProgress:
     """Test in-memory progress tracking."""
 